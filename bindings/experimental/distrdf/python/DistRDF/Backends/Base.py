@@ -170,12 +170,16 @@ class BaseBackend(ABC):
             analysis.
         shared_libraries (list): List of shared libraries needed for the
             analysis.
+        precompile_headers (bool): Whether the workers compile the headers
+            into a library that they reuse across tasks, see
+            `distribute_headers`.
     """
 
     initialization = staticmethod(lambda: None)
 
     headers = set()
     shared_libraries = set()
+    precompile_headers = False
 
     @classmethod
     def register_initialization(cls, fun, *args, **kwargs):
@@ -242,7 +246,7 @@ class BaseBackend(ABC):
 
         self.distribute_unique_paths(files_to_distribute)
 
-    def distribute_headers(self, headers_paths):
+    def distribute_headers(self, headers_paths, precompile=False):
         """
         Includes the C++ headers to be declared before execution.
 
@@ -251,6 +255,11 @@ class BaseBackend(ABC):
                 list, set...) containing the paths to all necessary C++ headers
                 as strings. This function accepts both paths to the headers
                 themselves and paths to directories containing the headers.
+            precompile (bool): If True, each worker compiles the headers once
+                into a library with `cppyy.precompile` and loads it in later
+                tasks, instead of parsing the headers in every task. This pays
+                off when the headers take long to parse and the workers run
+                many tasks.
         """
         headers_to_distribute = set()
 
@@ -270,6 +279,8 @@ class BaseBackend(ABC):
 
         # Finally, add everything to the includes set
         self.headers.update(headers_to_distribute)
+        if precompile:
+            self.precompile_headers = True
 
     def distribute_shared_libraries(self, shared_libraries_paths):
         """
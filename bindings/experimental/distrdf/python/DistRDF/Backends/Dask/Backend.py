@@ -119,7 +119,8 @@ class DaskBackend(Base.BaseBackend):
     def dask_mapper(current_range: Tuple, 
                     headers: List[str], 
                     shared_libraries: List[str],
-                    mapper: Callable) -> Callable:
+                    mapper: Callable,
+                    precompile_headers: bool = False) -> Callable:
         """
         Gets the paths to the file(s) in the current executor, then
         declares the headers found.
@@ -134,6 +135,9 @@ class DaskBackend(Base.BaseBackend):
 
             mapper (function): The map function to be executed on each executor.
 
+            precompile_headers (bool): Whether to compile the headers into a
+                library in the worker local directory, reused by later tasks.
+
         Returns:
             function: The map function to be executed on each executor,
             complete with all headers needed for the analysis.
@@ -146,7 +150,8 @@ class DaskBackend(Base.BaseBackend):
             os.path.join(localdir, os.path.basename(filepath))
             for filepath in headers
         ]
-        Utils.declare_headers(headers_on_executor)
+        precompile_dir = os.path.join(localdir, "distrdf_precompiled") if precompile_headers else None
+        Utils.declare_headers(headers_on_executor, precompile_dir)
 
         # Get and declare shared libraries on each worker
         shared_libs_on_ex = [
@@ -185,7 +190,7 @@ class DaskBackend(Base.BaseBackend):
         dmapper = dask.delayed(DaskBackend.dask_mapper)
         dreducer = dask.delayed(reducer)
 
-        mergeables_lists = [dmapper(range, self.headers, self.shared_libraries, mapper) for range in ranges]
+        mergeables_lists = [dmapper(range, self.headers, self.shared_libraries, mapper, self.precompile_headers) for range in ranges]
 
         while len(mergeables_lists) > 1:
             mergeables_lists.append(
@@ -238,7 +243,7 @@ class DaskBackend(Base.BaseBackend):
         """
         # Set up Dask mapper
         dmapper = dask.delayed(DaskBackend.dask_mapper)
-        mergeables_lists = [dmapper(range, self.headers, self.shared_libraries, mapper) for range in ranges]
+        mergeables_lists = [dmapper(range, self.headers, self.shared_libraries, mapper, self.precompile_headers) for range in ranges]
 
         # Compute the delayed tasks to get Dask futures that can be passed to the as_completed method
         future_tasks = self.client.compute(mergeables_lists)
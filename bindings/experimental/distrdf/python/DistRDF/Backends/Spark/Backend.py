@@ -12,6 +12,7 @@
 from __future__ import annotations
 
 import ntpath  # Filename from path (should be platform-independent)
+import os
 import warnings
 
 from DistRDF import DataFrame
@@ -99,6 +100,7 @@ class SparkBackend(Base.BaseBackend):
         # SparkContext. This would cause the errors described in SPARK-5063.
         headers = self.headers
         shared_libraries = self.shared_libraries
+        precompile_headers = self.precompile_headers
 
         def spark_mapper(current_range):
             """
@@ -118,7 +120,10 @@ class SparkBackend(Base.BaseBackend):
                 pyspark.SparkFiles.get(ntpath.basename(filepath))
                 for filepath in headers
             ]
-            Utils.declare_headers(headers_on_executor)
+            precompile_dir = None
+            if precompile_headers:
+                precompile_dir = os.path.join(pyspark.SparkFiles.getRootDirectory(), "distrdf_precompiled")
+            Utils.declare_headers(headers_on_executor, precompile_dir)
 
             # Get and declare shared libraries on each worker
             shared_libs_on_ex = [
@@ -15,7 +15,7 @@ import logging
 import os
 
 from functools import singledispatch
-from typing import Iterable, Set, Tuple
+from typing import Iterable, Optional, Set, Tuple
 
 import ROOT
 from ROOT._pythonization._rdataframe import AsNumpyResult, _clone_asnumpyresult
@@ -45,19 +45,32 @@ def extend_include_path(include_path: str) -> None:
     logger.debug("ROOT include paths:\n{}".format(root_includepath))
 
 
-def declare_headers(headers_to_include: Iterable[str]) -> None:
+def declare_headers(headers_to_include: Iterable[str], precompile_dir: Optional[str] = None) -> None:
     """
     Declares all required headers using the ROOT's C++ Interpreter.
 
     Args:
         headers_to_include (list): This list should consist of all
             necessary C++ headers as strings.
+        precompile_dir (str, optional): If given, the headers are compiled
+            into a library in this directory with `cppyy.precompile`, which is
+            reused instead of parsing the headers as long as they do not
+            change. If that fails, the headers are declared as usual.
     """
+    headers_to_include = list(headers_to_include)
+    for header in headers_to_include:
+        # Add the header directory to ROOT's include path
+        extend_include_path(os.path.dirname(header))
+
+    if precompile_dir is not None and headers_to_include:
+        import cppyy
+        try:
+            cppyy.precompile(sorted(headers_to_include), precompile_dir)
+            return
+        except Exception as e:
+            logger.warning("Precompiling the headers failed, declaring them instead: {}".format(e))
+
     for header in headers_to_include:
-        # Retrieve header directory
-        header_dir = os.path.dirname(header)
-        # Add directory to ROOT's include path
-        extend_include_path(header_dir)
         # Create C++ include code
         include_code = "#include \"{}\"\n".format(header)
         try:
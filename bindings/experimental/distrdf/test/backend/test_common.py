@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 import DistRDF
@@ -58,6 +60,14 @@ class DeclareHeadersTest(unittest.TestCase):
         Utils.declare_headers(["test_headers/header4.hxx"])
         self.assertEqual(ROOT.b(1), True)
 
+    def test_precompiled_header_declare(self):
+        """'declare_headers' compiling the headers into a library first."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Utils.declare_headers(["test_headers/header5.hxx"], precompile_dir=tmpdir)
+
+            self.assertEqual(ROOT.precompiled_square(3), 9)
+            self.assertTrue(any(f.endswith("_h." + ROOT.gSystem.GetSoExt()) for f in os.listdir(tmpdir)))
+
 
 class InitializationTest(unittest.TestCase):
     """Check the initialize method"""
@@ -0,0 +1,8 @@
+#ifndef HEADER_5
+#define HEADER_5
+
+int precompiled_square(int x) {
+	return x * x;
+}
+
+#endif
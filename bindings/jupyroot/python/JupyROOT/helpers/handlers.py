@@ -12,8 +12,7 @@
 # For the list of contributors see $ROOTSYS/README/CREDITS.                    #
 ################################################################################
 
-from threading import Thread
-from time import sleep as timeSleep
+from threading import Event, Thread
 from sys import platform
 from os import path
 import queue
@@ -32,6 +31,10 @@ class IOHandler(object):
     ''
     >>> h.GetStreamsDicts()
     (None, None)
+    >>> h.Take()
+    ('', '')
+    >>> h.Wait(0)
+    False
     >>> del h
     '''
     def __init__(self):
@@ -46,6 +49,16 @@ class IOHandler(object):
     def Poll(self):
         _lib.JupyROOTExecutorHandler_Poll()
 
+    def Wait(self, timeout = None):
+        '''Block until there is captured output, the capture ends or the
+        timeout (in seconds) expires. Returns whether there is output.'''
+        return _lib.JupyROOTExecutorHandler_Wait(-1. if timeout is None else timeout)
+
+    def Take(self):
+        '''Return the captured stdout and stderr and remove them from the
+        buffers, atomically with respect to the capture.'''
+        return _lib.JupyROOTExecutorHandler_Take()
+
     def InitCapture(self):
         _lib.JupyROOTExecutorHandler_InitCapture()
 
@@ -65,12 +78,20 @@ class IOHandler(object):
        errDict = {'name': 'stderr', 'text': err} if err != "" else None
        return outDict,errDict
 
+    def TakeStreamsDicts(self):
+       out, err = self.Take()
+       outDict = {'name': 'stdout', 'text': out} if out != "" else None
+       errDict = {'name': 'stderr', 'text': err} if err != "" else None
+       return outDict,errDict
+
 class Poller(Thread):
     def __init__(self):
         Thread.__init__(self, group=None, target=None, name="JupyROOT Poller Thread")
         self.daemon = True
         self.poll = True
         self.is_running = False
+        self.idle = Event()
+        self.idle.set()
         self.queue = queue.Queue()
 
     def run(self):
@@ -79,8 +100,11 @@ class Poller(Thread):
             if work_item is not None:
                 function, argument = work_item
                 self.is_running = True
-                function(argument)
-                self.is_running = False
+                try:
+                    function(argument)
+                finally:
+                    self.is_running = False
+                    self.idle.set()
             else:
                 self.poll = False
 
@@ -124,11 +148,11 @@ class Runner(object):
 
     def AsyncRun(self, argument):
         self.poller.is_running = True
+        self.poller.idle.clear()
         self.poller.queue.put((self.Run, argument))
 
     def Wait(self):
-        while self.poller.is_running:
-            timeSleep(.1)
+        self.poller.idle.wait()
 
     def HasFinished(self):
         return not self.poller.is_running
@@ -161,6 +185,7 @@ class JupyROOTExecutor(Runner):
 
 def display_drawables(displayFunction):
     drawers = helpers.utils.GetDrawers()
+    helpers.utils.RenderPngImages(drawers)
     for drawer in drawers:
         for dobj in drawer.GetDrawableObjects():
             displayFunction(dobj)
@@ -171,16 +196,18 @@ class JupyROOTDisplayer(Runner):
        super(JupyROOTDisplayer, self).__init__(display_drawables, poller)
 
 def RunAsyncAndPrint(executor, code, ioHandler, printFunction, displayFunction, silent = False, timeout = 0.1):
+    '''Run the code and pass the output to printFunction as it arrives, at
+    most every timeout seconds. printFunction takes the output from the
+    ioHandler, the remaining output is left there at the end.'''
     ioHandler.Clear()
     ioHandler.InitCapture()
     executor.AsyncRun(code)
-    while not executor.HasFinished():
-        ioHandler.Poll()
-        if not silent:
+    while not silent and not executor.HasFinished():
+        # Wakes up on output, otherwise to check whether the code is done
+        if ioHandler.Wait(timeout):
             printFunction(ioHandler)
-            ioHandler.Clear()
-        if executor.HasFinished(): break
-        timeSleep(.1)
+            # Rate limiting, which ends early if the code is done
+            executor.poller.idle.wait(timeout)
     executor.Wait()
     ioHandler.EndCapture()
 
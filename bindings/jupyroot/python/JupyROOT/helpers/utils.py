@@ -19,6 +19,7 @@ import os
 import sys
 import select
 import tempfile
+import threading
 import itertools
 import re
 import fnmatch
@@ -40,6 +41,11 @@ cppMIME = 'text/x-c++src'
 # Keep display handle for canvases to be able update them
 _canvasHandles = {}
 
+# In compact mode: comms to the displays of canvases, which receive their
+# updates, and the JSON of the canvases as last sent to them
+_canvasComms = {}
+_canvasJsons = {}
+
 _jsMagicHighlight = """
 Jupyter.CodeCell.options_default.highlight_modes['magic_{cppMIME}'] = {{'reg':[/^%%cpp/]}};
 console.log("JupyROOT - %%cpp magic configured");
@@ -60,7 +66,7 @@ function display_{jsDivId}(Core) {{
    let obj = Core.parse({jsonContent});
    Core.settings.HandleKeys = false;
    Core.draw("{jsDivId}", obj, "{jsDrawOptions}");
-}}
+{jsCommCode}}}
 
 function script_load_{jsDivId}(src, on_error) {{
     let script = document.createElement('script');
@@ -106,6 +112,30 @@ if (typeof requirejs !== 'undefined') {{
 </script>
 """
 
+# Receives the updates of a canvas in compact mode, either as a whole or as the
+# primitives which changed. Only available in the classic notebook, where the
+# kernel can be reached from the output.
+_jsCommCode = """
+   if (typeof Jupyter !== 'undefined' && Jupyter.notebook && Jupyter.notebook.kernel) {{
+      let comm = Jupyter.notebook.kernel.comm_manager.new_comm('jupyroot_canvas', {{ 'id': '{drawId}' }});
+      comm.on_msg(function(msg) {{
+         if (!document.getElementById("{jsDivId}")) {{ comm.close(); return; }}
+         let data = msg.content.data;
+         if (data.json) {{
+            obj = Core.parse(data.json);
+         }} else {{
+            let prims = obj.fPrimitives.arr || obj.fPrimitives;
+            data.patch.forEach(function(p) {{
+               prims[p[0]] = Core.parse(p[1]);
+               if (obj.fPrimitives.opt) obj.fPrimitives.opt[p[0]] = p[2];
+            }});
+         }}
+         Core.cleanup("{jsDivId}");
+         Core.draw("{jsDivId}", obj, "{jsDrawOptions}");
+      }});
+   }}
+"""
+
 TBufferJSONErrorMessage="The TBufferJSON class is necessary for JS visualisation to work and cannot be found. Did you enable the http module (-D http=ON for CMake)?"
 
 def TBufferJSONAvailable():
@@ -128,6 +158,7 @@ def RCanvasAvailable():
 
 _enableJSVis = False
 _enableJSVisDebug = False
+_enableJSVisCompact = False
 def enableJSVis():
     if not TBufferJSONAvailable():
        return
@@ -152,6 +183,28 @@ def disableJSVisDebug():
     _enableJSVis = False
     _enableJSVisDebug = False
 
+def enableJSVisCompact():
+    '''
+    Display canvases with JSROOT, sending binary contents (like bins of
+    histograms) base64 encoded. In the classic notebook, the updates of an
+    already displayed canvas are sent through a comm, limited to the primitives
+    which changed, instead of embedding the canvas again.
+    '''
+    if not TBufferJSONAvailable():
+       return
+    global _enableJSVis
+    global _enableJSVisCompact
+    _enableJSVis = True
+    _enableJSVisCompact = True
+
+def disableJSVisCompact():
+    global _enableJSVisCompact
+    _enableJSVisCompact = False
+    for comm in list(_canvasComms.values()):
+        comm.close()
+    _canvasComms.clear()
+    _canvasJsons.clear()
+
 def _getPlatform():
     return sys.platform
 
@@ -293,13 +346,17 @@ def invokeAclic(cell):
     else:
         processCppCode(".L %s+" %fileName)
 
-def produceCanvasJson(canvas):
+def produceCanvasJson(canvas, compact = False):
 
    if canvas.IsUpdated() and not canvas.IsDrawn():
        canvas.Draw()
 
+   # Arrays compressed with base64 coding (kBase64) or suppression of zeros and
+   # repeated values (kSameSuppression), without spaces (kNoSpaces)
+   compression = 33 if compact else 23
+
    if TWebCanvasAvailable():
-       return ROOT.TWebCanvas.CreateCanvasJSON(canvas, 3)
+       return ROOT.TWebCanvas.CreateCanvasJSON(canvas, compression if compact else 3)
 
    # Add extra primitives to canvas with custom colors, palette, gStyle
 
@@ -335,7 +392,7 @@ def produceCanvasJson(canvas):
 
    ROOT.TColor.DefinedColors()
 
-   canvas_json = ROOT.TBufferJSON.ConvertToJSON(canvas, 23)
+   canvas_json = ROOT.TBufferJSON.ConvertToJSON(canvas, compression)
 
    # Cleanup primitives after conversion
    if style is not None: prim.Remove(style)
@@ -344,17 +401,171 @@ def produceCanvasJson(canvas):
 
    return canvas_json
 
+def _splitCanvasJson(canvasJson):
+   '''
+   Split the JSON of a canvas into its primitives, their draw options and the
+   rest of the canvas, all serialized. Works for the JSON of TBufferJSON (with
+   a TList of primitives) and of TWebCanvas (with a list of snapshots).
+   '''
+   import json
+   canvas = json.loads(canvasJson)
+   prims = canvas.get('fPrimitives')
+   opts = None
+   if isinstance(prims, dict):
+      opts = prims.pop('opt', None)
+      prims = prims.pop('arr', None)
+   else:
+      canvas.pop('fPrimitives', None)
+   if not isinstance(prims, list):
+      return None
+   dump = lambda o: json.dumps(o, separators=(',', ':'), sort_keys=True)
+   return dump(canvas), [dump(p) for p in prims], opts
+
+def _canvasPatch(oldJson, newJson):
+   '''
+   Return the primitives of a canvas which changed between two of its JSON
+   serializations, as a list of [index, JSON, draw option], or None if the
+   canvas has to be sent as a whole.
+
+   >>> old = '{"_typename":"TCanvas","fPrimitives":{"_typename":"TList","arr":[{"a":1},{"b":2}],"opt":["",""]}}'
+   >>> new = '{"_typename":"TCanvas","fPrimitives":{"_typename":"TList","arr":[{"a":1},{"b":3}],"opt":["","same"]}}'
+   >>> _canvasPatch(old, new)
+   [[1, '{"b":3}', 'same']]
+   >>> _canvasPatch(old, new.replace('TCanvas', 'TPad')) is None
+   True
+   '''
+   # References between objects are resolved over the whole JSON, which
+   # prevents replacing single primitives
+   if '"$ref"' in newJson:
+      return None
+   old = _splitCanvasJson(oldJson)
+   new = _splitCanvasJson(newJson)
+   if old is None or new is None or old[0] != new[0] or len(old[1]) != len(new[1]):
+      return None
+   oldOpts = old[2] or [""] * len(old[1])
+   newOpts = new[2] or [""] * len(new[1])
+   return [[i, newPrim, newOpts[i]] for i, (oldPrim, newPrim) in enumerate(zip(old[1], new[1]))
+           if oldPrim != newPrim or oldOpts[i] != newOpts[i]]
+
+def _registerCanvasComm(ip):
+   '''Accept the comms opened by the displays of canvases in compact mode.'''
+   kernel = getattr(ip, 'kernel', None)
+   if kernel is None or not hasattr(kernel, 'comm_manager'):
+      return
+
+   def openCanvasComm(comm, msg):
+      drawId = msg['content']['data'].get('id')
+      if not drawId:
+         return
+      # The most recent display of a canvas receives its updates
+      _canvasComms[drawId] = comm
+
+      def closeCanvasComm(msg):
+         if _canvasComms.get(drawId) is comm:
+            del _canvasComms[drawId]
+            _canvasJsons.pop(drawId, None)
+
+      comm.on_close(closeCanvasComm)
+
+   kernel.comm_manager.register_target('jupyroot_canvas', openCanvasComm)
+
+# Paints pads into images and encodes them as PNG, with the GIL released while
+# encoding. Both happen one after the other: painting uses global graphics state
+# (gPad, gVirtualPS), and TASImage::GetImageBuffer uses static export
+# parameters, so the encoding is also serialized with other Python threads.
+# Returns a list with the PNG data of each pad, None where it failed.
+_padsToPngCode = """
+#include "Python.h"
+#include "TImage.h"
+#include "TVirtualPad.h"
+#include <cstdlib>
+#include <memory>
+#include <mutex>
+#include <vector>
+
+PyObject *JupyROOTPadsToPng(const std::vector<TVirtualPad *> &pads)
+{
+   std::vector<std::unique_ptr<TImage>> images;
+   for (auto pad : pads) {
+      std::unique_ptr<TImage> image(TImage::Create());
+      if (image)
+         image->FromPad(pad);
+      images.emplace_back(std::move(image));
+   }
+
+   std::vector<char *> buffers(images.size(), nullptr);
+   std::vector<int> sizes(images.size(), 0);
+
+   static std::mutex encodeMutex;
+   Py_BEGIN_ALLOW_THREADS
+   {
+      std::lock_guard<std::mutex> lock(encodeMutex);
+      for (std::size_t i = 0; i < images.size(); ++i) {
+         if (images[i] && images[i]->IsValid())
+            images[i]->GetImageBuffer(&buffers[i], &sizes[i], TImage::kPng);
+      }
+   }
+   Py_END_ALLOW_THREADS
+
+   PyObject *result = PyList_New(images.size());
+   for (std::size_t i = 0; i < images.size(); ++i) {
+      PyObject *png = Py_None;
+      if (buffers[i]) {
+         png = PyBytes_FromStringAndSize(buffers[i], sizes[i]);
+         free(buffers[i]);
+      } else {
+         Py_INCREF(Py_None);
+      }
+      PyList_SET_ITEM(result, i, png);
+   }
+   return result;
+}
+"""
+
+_padsToPngAvailable = None
+
+def _padsToPng(pads):
+   '''Render the pads as PNG images in memory, returning the PNG data of
+   each of them or None where it was not possible.'''
+   global _padsToPngAvailable
+   if _padsToPngAvailable is None:
+      _padsToPngAvailable = bool(ROOT.gInterpreter.Declare(_padsToPngCode))
+   if not _padsToPngAvailable or not pads:
+      return [None] * len(pads)
+
+   padsVector = ROOT.std.vector['TVirtualPad*']()
+   for pad in pads:
+      padsVector.push_back(pad)
+   with _setIgnoreLevel(ROOT.kError):
+      return list(ROOT.JupyROOTPadsToPng(padsVector))
+
+def RenderPngImages(drawers):
+   '''
+   Render at once the PNG images of the canvases among the drawers which are
+   displayed as images, see _padsToPng.
+   '''
+   pngDrawers = [d for d in drawers if d.isCanvas and (_enableJSVisDebug or not _enableJSVis)]
+   for drawer, png in zip(pngDrawers, _padsToPng([d.drawableObject for d in pngDrawers])):
+      drawer.pngData = png
+
 transformers = []
 
 class StreamCapture(object):
+    '''
+    Capture the output of C++ code written to stdout and stderr, and forward
+    it to the notebook while the cell runs.
+    '''
+
+    # Minimum time between two updates of the output of a cell, in seconds
+    flushInterval = .1
+
     def __init__(self, ip=get_ipython()):
         # For the registration
         self.shell = ip
 
         self.ioHandler = handlers.IOHandler()
         self.flag = True
-        self.outString = ""
-        self.errString = ""
+        self.cellDone = threading.Event()
 
         self.poller = handlers.Poller()
         self.poller.start()
@@ -364,17 +575,25 @@ class StreamCapture(object):
         self.isFirstPostExecute = True
 
     def syncCapture(self, defout = ''):
-        self.outString = defout
-        self.errString = defout
-        waitTimes = [.01, .01, .02, .04, .06, .08, .1]
-        lenWaitTimes = 7
+        # With transformers, the output is processed as a whole at the end
+        if transformers:
+            return
 
-        iterIndex = 0
+        # Sleeps until there is output, no polling involved
         while self.flag:
-            self.ioHandler.Poll()
-            if not self.flag: return
-            waitTime = .1 if iterIndex >= lenWaitTimes else waitTimes[iterIndex]
-            time.sleep(waitTime)
+            if self.ioHandler.Wait():
+                self.flush()
+                # Rate limiting, which ends early when the cell is done
+                self.cellDone.wait(self.flushInterval)
+
+    def flush(self):
+        out, err = self.ioHandler.Take()
+        if out:
+            sys.stdout.write(out)
+            sys.stdout.flush()
+        if err:
+            sys.stderr.write(err)
+            sys.stderr.flush()
 
     def pre_execute(self):
         if self.isFirstPreExecute:
@@ -382,6 +601,7 @@ class StreamCapture(object):
             return 0
 
         self.flag = True
+        self.cellDone.clear()
         self.ioHandler.Clear()
         self.ioHandler.InitCapture()
         self.asyncCapturer.AsyncRun('')
@@ -392,17 +612,16 @@ class StreamCapture(object):
             self.isFirstPreExecute = False
             return 0
         self.flag = False
-        self.asyncCapturer.Wait()
-        self.ioHandler.Poll()
+        self.cellDone.set()
+        # Wakes up the capturer thread, which leaves the rest of the output
         self.ioHandler.EndCapture()
+        self.asyncCapturer.Wait()
 
         # Print for the notebook
-        out = self.ioHandler.GetStdout()
-        err = self.ioHandler.GetStderr()
         if not transformers:
-            sys.stdout.write(out)
-            sys.stderr.write(err)
+            self.flush()
         else:
+            out, err = self.ioHandler.Take()
             for t in transformers:
                 (out, err, otype) = t(out, err)
                 if otype == 'html':
@@ -447,6 +666,7 @@ def DrawGeometry():
 
 def DrawCanvases():
     drawers = GetCanvasDrawers()
+    RenderPngImages(drawers)
     for drawer in drawers:
         drawer.Draw()
 
@@ -483,6 +703,7 @@ class NotebookDrawer(object):
         self.drawableObject = theObject
         self.isRCanvas = False
         self.isCanvas = False
+        self.pngData = None
         self.drawableId = str(ROOT.AddressOf(theObject)[0])
         if hasattr(self.drawableObject,"ResolveSharedPtrs"):
             self.isRCanvas = True
@@ -542,12 +763,19 @@ class NotebookDrawer(object):
                     return False
         return True
 
-    def _getJsCode(self):
+    def _getJson(self):
         # produce JSON for the canvas
         if self.isRCanvas:
-            json = self.drawableObject.CreateJSON()
-        else:
-            json = produceCanvasJson(self.drawableObject).Data()
+            return self.drawableObject.CreateJSON()
+        return produceCanvasJson(self.drawableObject, _enableJSVisCompact).Data()
+
+    def _isCompact(self):
+        # compact mode, with incremental updates, is supported for TCanvas only
+        return _enableJSVisCompact and self.isCanvas
+
+    def _getJsCode(self, json = None):
+        if json is None:
+            json = self._getJson()
 
         divId = self._getUniqueDivId()
 
@@ -565,11 +793,18 @@ class NotebookDrawer(object):
             if self.drawableObject.GetHeight() > 0: height = self.drawableObject.GetHeight()
             options = ""
 
+        commCode = ""
+        if self._isCompact():
+            commCode = _jsCommCode.format(drawId = self._getDrawId(),
+                                          jsDrawOptions = options,
+                                          jsDivId = divId)
+
         thisJsCode = _jsCode.format(jsCanvasWidth = width,
                                     jsCanvasHeight = height,
                                     jsonContent = json,
                                     jsDrawOptions = options,
-                                    jsDivId = divId)
+                                    jsDivId = divId,
+                                    jsCommCode = commCode)
         return thisJsCode
 
     def _getJsDiv(self):
@@ -590,11 +825,32 @@ class NotebookDrawer(object):
             return self.drawableObject.IsUpdated()
         return False
 
+    def _commUpdate(self, name):
+        # Send the update of a displayed canvas through its comm, only the
+        # primitives which changed if possible
+        json = self._getJson()
+        lastJson = _canvasJsons.get(name)
+        if json != lastJson:
+            patch = _canvasPatch(lastJson, json) if lastJson else None
+            if patch is None:
+                _canvasComms[name].send({'json': json})
+            elif patch:
+                _canvasComms[name].send({'patch': patch})
+            _canvasJsons[name] = json
+        return 0
+
     def _jsDisplay(self):
         global _canvasHandles
         name = self._getDrawId()
         updated = self._getUpdated()
-        jsdiv = self._getJsDiv()
+        if self._isCompact() and name and updated and name in _canvasComms:
+            return self._commUpdate(name)
+        if self._isCompact() and name:
+            json = self._getJson()
+            _canvasJsons[name] = json
+            jsdiv = display.HTML(self._getJsCode(json))
+        else:
+            jsdiv = self._getJsDiv()
         if name and (name in _canvasHandles) and updated:
             _canvasHandles[name].update(jsdiv)
         elif name:
@@ -604,6 +860,13 @@ class NotebookDrawer(object):
         return 0
 
     def _getPngImage(self):
+        png = self.pngData
+        if png is None and self.isCanvas:
+            png = _padsToPng([self.drawableObject])[0]
+        if png is not None:
+            return display.Image(data=png, format='png', embed=True)
+
+        # Objects other than canvases go through a file
         ofile = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
         with _setIgnoreLevel(ROOT.kError):
             self.drawableObject.SaveAs(ofile.name)
@@ -662,6 +925,7 @@ def loadMagicsAndCapturers():
         extMgr.load_extension(extName)
     captures.append(StreamCapture())
     captures.append(CaptureDrawnPrimitives())
+    _registerCanvasComm(ip)
 
     for capture in captures: capture.register()
 
@@ -679,6 +943,8 @@ def enhanceROOTModule():
     ROOT.disableJSVis = disableJSVis
     ROOT.enableJSVisDebug = enableJSVisDebug
     ROOT.disableJSVisDebug = disableJSVisDebug
+    ROOT.enableJSVisCompact = enableJSVisCompact
+    ROOT.disableJSVisCompact = disableJSVisCompact
 
 def enableCppHighlighting():
     ipDispJs = display.display_javascript
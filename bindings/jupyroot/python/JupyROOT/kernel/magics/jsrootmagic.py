@@ -12,14 +12,14 @@
 # For the list of contributors see $ROOTSYS/README/CREDITS.                    #
 ################################################################################
 
-from JupyROOT.helpers.utils import enableJSVis, disableJSVis, enableJSVisDebug, TBufferJSONErrorMessage, TBufferJSONAvailable
+from JupyROOT.helpers.utils import enableJSVis, disableJSVis, enableJSVisDebug, enableJSVisCompact, disableJSVisCompact, TBufferJSONErrorMessage, TBufferJSONAvailable
 
 from metakernel import Magic, option
 
 class JSRootMagics(Magic):
     def __init__(self, kernel):
         super(JSRootMagics, self).__init__(kernel)
-    @option('arg', default="on", help='Enable or disable JavaScript visualisation. Possible values: on (default), off')
+    @option('arg', default="on", help='Enable or disable JavaScript visualisation. Possible values: on (default), off, compact')
 
     def line_jsroot(self, args):
         '''Change the visualisation of plots from images to interactive JavaScript objects.'''
@@ -27,7 +27,11 @@ class JSRootMagics(Magic):
            self.printErrorIfNeeded()
            enableJSVis()
         elif args == 'off':
+           disableJSVisCompact()
            disableJSVis()
+        elif args == 'compact':
+           self.printErrorIfNeeded()
+           enableJSVisCompact()
         elif args == 'debug':
            self.printErrorIfNeeded()
            enableJSVisDebug()
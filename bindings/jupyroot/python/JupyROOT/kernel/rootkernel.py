@@ -75,7 +75,7 @@ class ROOTKernel(MetaKernel):
         return self.completer._completeImpl(info['code'])
 
     def print_output(self, handler):
-        streamDicts = handler.GetStreamsDicts()
+        streamDicts = handler.TakeStreamsDicts()
         for streamDict in filter(lambda d: None != d, streamDicts):
             self.send_response(self.iopub_socket, 'stream', streamDict)
 
@@ -90,6 +90,7 @@ class ROOTKernel(MetaKernel):
                              code,
                              self.ioHandler,
                              self.print_output,
+                             self.Display,
                              silent,
                              .1)
 
@@ -14,7 +14,7 @@
 
 from IPython.core.magic import (Magics, magics_class, line_magic)
 from IPython.core.magic_arguments import (argument, magic_arguments, parse_argstring)
-from JupyROOT.helpers.utils import enableJSVis, disableJSVis, enableJSVisDebug
+from JupyROOT.helpers.utils import enableJSVis, disableJSVis, enableJSVisDebug, enableJSVisCompact, disableJSVisCompact
 
 @magics_class
 class JSRootMagics(Magics):
@@ -23,7 +23,7 @@ class JSRootMagics(Magics):
 
     @line_magic
     @magic_arguments()
-    @argument('arg', nargs="?", default="on", help='Enable or disable JavaScript visualisation. Possible values: on (default), off')
+    @argument('arg', nargs="?", default="on", help='Enable or disable JavaScript visualisation. Possible values: on (default), off, compact')
 
     def jsroot(self, line):
         '''Change the visualisation of plots from images to interactive JavaScript objects.'''
@@ -31,7 +31,10 @@ class JSRootMagics(Magics):
         if args.arg == 'on':
            enableJSVis()
         elif args.arg == 'off':
+           disableJSVisCompact()
            disableJSVis()
+        elif args.arg == 'compact':
+           enableJSVisCompact()
         elif args.arg == 'debug':
            enableJSVisDebug()
 
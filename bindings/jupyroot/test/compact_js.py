@@ -0,0 +1,159 @@
+import types
+import unittest
+
+import ROOT
+from JupyROOT.helpers import utils
+
+
+class FakeComm(object):
+    """
+    Stands for the comm opened by the display of a canvas, recording the
+    messages sent to it.
+    """
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+        self.close_callback = None
+
+    def send(self, data):
+        self.sent.append(data)
+
+    def on_close(self, callback):
+        self.close_callback = callback
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCommManager(object):
+    def __init__(self):
+        self.targets = {}
+
+    def register_target(self, name, callback):
+        self.targets[name] = callback
+
+
+class FakeIPython(object):
+    def __init__(self):
+        self.kernel = types.SimpleNamespace(comm_manager=FakeCommManager())
+
+
+class CompactJSVis(unittest.TestCase):
+    """
+    Tests for the compact JSROOT display of canvases, with base64 encoded
+    arrays and updates sent through a comm.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        if not hasattr(ROOT, "TBufferJSON"):
+            raise unittest.SkipTest("TBufferJSON is not available")
+
+    def setUp(self):
+        utils.enableJSVisCompact()
+
+    def tearDown(self):
+        utils.disableJSVisCompact()
+        utils.disableJSVis()
+
+    def make_canvas(self, name):
+        c = ROOT.TCanvas(name, name, 300, 200)
+        h = ROOT.TH1F("h_" + name, "h_" + name, 100, -5, 5)
+        h.FillRandom("gaus", 1000)
+        h.Draw()
+        c.Update()
+        # Keep the histogram alive as long as the canvas
+        c._hist = h
+        return c
+
+    def produce_buffer_json(self, canvas, compact):
+        # The JSON of TBufferJSON, which can be read back by ROOT, also when
+        # TWebCanvas is available
+        available = utils.TWebCanvasAvailable
+        utils.TWebCanvasAvailable = lambda: False
+        try:
+            return utils.produceCanvasJson(canvas, compact).Data()
+        finally:
+            utils.TWebCanvasAvailable = available
+
+    def test_round_trip(self):
+        c = self.make_canvas("compact_js_round_trip")
+        compact = self.produce_buffer_json(c, True)
+        self.assertIn('"b":"', compact)
+
+        canvas = ROOT.TBufferJSON.ConvertFromJSON(compact)
+        self.assertTrue(canvas)
+        self.assertEqual(canvas.ClassName(), "TCanvas")
+        h = canvas.GetListOfPrimitives().FindObject(c._hist.GetName())
+        self.assertTrue(h)
+        self.assertEqual(h.GetNbinsX(), c._hist.GetNbinsX())
+        for i in range(c._hist.GetNbinsX() + 2):
+            self.assertEqual(h.GetBinContent(i), c._hist.GetBinContent(i))
+
+    def test_canvas_patch(self):
+        c = self.make_canvas("compact_js_patch")
+        drawer = utils.NotebookDrawer(c)
+        self.assertTrue(drawer._isCompact())
+        name = drawer._getDrawId()
+
+        ip = FakeIPython()
+        utils._registerCanvasComm(ip)
+        open_comm = ip.kernel.comm_manager.targets["jupyroot_canvas"]
+        comm = FakeComm()
+        open_comm(comm, {"content": {"data": {"id": name}}})
+        self.assertIs(utils._canvasComms[name], comm)
+
+        old_json = drawer._getJson()
+        utils._canvasJsons[name] = old_json
+
+        # Nothing is sent as long as the canvas does not change
+        drawer._commUpdate(name)
+        self.assertEqual(comm.sent, [])
+
+        c._hist.Fill(0.5, 100)
+        c.Modified()
+        c.Update()
+        new_json = drawer._getJson()
+        self.assertNotEqual(new_json, old_json)
+        drawer._commUpdate(name)
+        self.assertEqual(len(comm.sent), 1)
+        self.assertEqual(utils._canvasJsons[name], new_json)
+
+        msg = comm.sent[0]
+        if "json" in msg:
+            self.assertEqual(msg["json"], new_json)
+        else:
+            # Applying the patch to the displayed canvas gives the new one
+            self.assertTrue(msg["patch"])
+            rest, prims, opts = utils._splitCanvasJson(old_json)
+            new_rest, new_prims, new_opts = utils._splitCanvasJson(new_json)
+            opts = opts or [""] * len(prims)
+            for index, prim, opt in msg["patch"]:
+                prims[index] = prim
+                opts[index] = opt
+            self.assertEqual(rest, new_rest)
+            self.assertEqual(prims, new_prims)
+            self.assertEqual(opts, new_opts or [""] * len(new_prims))
+
+        # Closing the display drops its comm and the canvas it shows
+        comm.close_callback({})
+        self.assertNotIn(name, utils._canvasComms)
+        self.assertNotIn(name, utils._canvasJsons)
+
+    def test_disable(self):
+        comm = FakeComm()
+        utils._canvasComms["compact_js_disable"] = comm
+        utils._canvasJsons["compact_js_disable"] = "{}"
+        utils.disableJSVisCompact()
+        self.assertTrue(comm.closed)
+        self.assertEqual(utils._canvasComms, {})
+        self.assertEqual(utils._canvasJsons, {})
+
+    def test_no_comm_manager(self):
+        # Outside of a kernel, no comm target is registered
+        utils._registerCanvasComm(object())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import threading
+import unittest
+
+import ROOT
+from JupyROOT.helpers import utils
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class PadsToPng(unittest.TestCase):
+    """
+    Tests for the rendering of canvases as PNG images in memory, which is used
+    when JSROOT is disabled.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        if not ROOT.TImage.Create():
+            raise unittest.SkipTest("TImage is not available")
+
+    def make_canvas(self, name):
+        c = ROOT.TCanvas(name, name, 300, 200)
+        h = ROOT.TH1F("h_" + name, "h_" + name, 10, 0, 10)
+        h.FillRandom("gaus", 100)
+        h.Draw()
+        c.Update()
+        # Keep the histogram alive as long as the canvas
+        c._hist = h
+        return c
+
+    def test_canvases(self):
+        canvases = [self.make_canvas("pads_to_png_{}".format(i)) for i in range(3)]
+        pngs = utils._padsToPng(canvases)
+        self.assertEqual(len(pngs), len(canvases))
+        for png in pngs:
+            self.assertIsInstance(png, bytes)
+            self.assertTrue(png.startswith(PNG_SIGNATURE))
+
+    def test_no_canvas(self):
+        self.assertEqual(utils._padsToPng([]), [])
+
+    def test_threads(self):
+        # Concurrent calls are serialized around the PNG encoding
+        canvases = [self.make_canvas("pads_to_png_thread_{}".format(i)) for i in range(4)]
+        results = [None] * len(canvases)
+
+        def render(i):
+            results[i] = utils._padsToPng([canvases[i]])[0]
+
+        threads = [threading.Thread(target=render, args=(i,)) for i in range(len(canvases))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for png in results:
+            self.assertTrue(png.startswith(PNG_SIGNATURE))
+
+    def test_fallback(self):
+        # Without in-memory rendering, the drawer goes through a file
+        c = self.make_canvas("pads_to_png_fallback")
+        available = utils._padsToPngAvailable
+        utils._padsToPngAvailable = False
+        try:
+            self.assertEqual(utils._padsToPng([c]), [None])
+            image = utils.NotebookDrawer(c)._getPngImage()
+        finally:
+            utils._padsToPngAvailable = available
+        self.assertTrue(image.data.startswith(PNG_SIGNATURE))
+
+    def test_drawer(self):
+        c = self.make_canvas("pads_to_png_drawer")
+        drawer = utils.NotebookDrawer(c)
+        utils.RenderPngImages([drawer])
+        self.assertTrue(drawer.pngData.startswith(PNG_SIGNATURE))
+        self.assertEqual(drawer._getPngImage().data, drawer.pngData)
+
+
+if __name__ == "__main__":
+    unittest.main()
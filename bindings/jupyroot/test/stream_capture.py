@@ -0,0 +1,65 @@
+import io
+import sys
+import unittest
+
+import ROOT
+from JupyROOT.helpers import utils
+
+ROOT.gInterpreter.Declare(r"""
+#include <cstdio>
+
+void JupyROOTStreamCaptureWrite(int nLines)
+{
+   for (int i = 0; i < nLines; ++i) {
+      std::printf("line %06d\n", i);
+      if (i % 1000 == 0)
+         std::fprintf(stderr, "error %06d\n", i);
+   }
+}
+""")
+
+
+class StreamCaptureOutput(unittest.TestCase):
+    """
+    Tests for the capture of the output of C++ code in the notebook, which is
+    read from the pipes while the code runs.
+    """
+
+    def run_cell(self, code):
+        capture = utils.StreamCapture(ip=None)
+        capture.isFirstPreExecute = False
+        capture.isFirstPostExecute = False
+
+        out = io.StringIO()
+        err = io.StringIO()
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = out, err
+        try:
+            capture.pre_execute()
+            code()
+            capture.post_execute()
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+        return out.getvalue(), err.getvalue()
+
+    def test_larger_than_pipe(self):
+        # More than the pipe buffer, even when enlarged to 1 MiB, but less than
+        # the capture buffers keep
+        n_lines = 200000
+        out, err = self.run_cell(lambda: ROOT.JupyROOTStreamCaptureWrite(n_lines))
+
+        expected_out = "".join("line {:06d}\n".format(i) for i in range(n_lines))
+        expected_err = "".join("error {:06d}\n".format(i) for i in range(0, n_lines, 1000))
+        self.assertGreater(len(expected_out), 64 * 1024)
+        self.assertEqual(len(out), len(expected_out))
+        self.assertEqual(out, expected_out)
+        self.assertEqual(err, expected_err)
+
+    def test_no_output(self):
+        out, err = self.run_cell(lambda: None)
+        self.assertEqual(out, "")
+        self.assertEqual(err, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -623,8 +623,18 @@ static PyObject* mp_call(CPPOverload* pymeth, PyObject* args, PyObject* kwds)
 
     CPPInstance* im_self = pymeth->fSelf;
 
-// get local handles to proxy internals
-    auto& methods = pymeth->fMethodInfo->fMethods;
+// get local handles to proxy internals; in the free-threaded build, methods may be
+// added or sorted by other threads, so work on a snapshot
+    CPPOverload::MethodInfo_t* info = pymeth->fMethodInfo;
+#ifdef Py_GIL_DISABLED
+    CPPOverload::Methods_t methods;
+    {
+        PyLockGuard lock(info->fLock);
+        methods = info->fMethods;
+    }
+#else
+    auto& methods = info->fMethods;
+#endif
 
     CPPOverload::Methods_t::size_type nMethods = methods.size();
 
@@ -652,12 +662,15 @@ static PyObject* mp_call(CPPOverload* pymeth, PyObject* args, PyObject* kwds)
     uint64_t sighash = HashSignature(args, nargsf);
 
 // look for known signatures ...
-    auto& dispatchMap = pymeth->fMethodInfo->fDispatchMap;
+    auto& dispatchMap = info->fDispatchMap;
     PyCallable* memoized_pc = nullptr;
-    for (const auto& p : dispatchMap) {
-        if (p.first == sighash) {
-            memoized_pc = p.second;
-            break;
+    {
+        PyLockGuard lock(info->fLock);
+        for (const auto& p : dispatchMap) {
+            if (p.first == sighash) {
+                memoized_pc = p.second;
+                break;
+            }
         }
     }
     if (memoized_pc) {
@@ -676,16 +689,24 @@ static PyObject* mp_call(CPPOverload* pymeth, PyObject* args, PyObject* kwds)
 
 // ... otherwise loop over all methods and find the one that does not fail
     if (!IsSorted(mflags)) {
-    // sorting is based on priority, which is not stored on the method as it is used
-    // only once, so copy the vector of methods into one where the priority can be
-    // stored during sorting
-        std::vector<std::pair<int, PyCallable*>> pm; pm.reserve(methods.size());
-        for (auto ptr : methods)
-            pm.emplace_back(ptr->GetPriority(), ptr);
-        std::stable_sort(pm.begin(), pm.end(), PriorityCmp);
-        for (CPPOverload::Methods_t::size_type i = 0; i < methods.size(); ++i)
-            methods[i] = pm[i].second;
-        pymeth->fMethodInfo->fFlags |= CallContext::kIsSorted;
+        PyLockGuard lock(info->fLock);
+        auto& allMethods = info->fMethods;
+        if (!IsSorted(info->fFlags)) {
+        // sorting is based on priority, which is not stored on the method as it is used
+        // only once, so copy the vector of methods into one where the priority can be
+        // stored during sorting
+            std::vector<std::pair<int, PyCallable*>> pm; pm.reserve(allMethods.size());
+            for (auto ptr : allMethods)
+                pm.emplace_back(ptr->GetPriority(), ptr);
+            std::stable_sort(pm.begin(), pm.end(), PriorityCmp);
+            for (CPPOverload::Methods_t::size_type i = 0; i < allMethods.size(); ++i)
+                allMethods[i] = pm[i].second;
+            info->fFlags |= CallContext::kIsSorted;
+        }
+#ifdef Py_GIL_DISABLED
+        methods = allMethods;
+        nMethods = methods.size();
+#endif
     }
 
     std::vector<Utility::PyError_t> errors;
@@ -698,18 +719,22 @@ static PyObject* mp_call(CPPOverload* pymeth, PyObject* args, PyObject* kwds)
 
             PyObject* result = methods[i]->Call(im_self, args, nargsf, kwds, &ctxt);
             if (result != 0) {
-            // success: update the dispatch map for subsequent calls
-                if (!memoized_pc)
-                    dispatchMap.push_back(std::make_pair(sighash, methods[i]));
-                else {
+            // success: update the dispatch map for subsequent calls; another thread may
+            // have added the signature in the meantime, so always look it up
+                {
+                    PyLockGuard lock(info->fLock);
+                    bool bUpdated = false;
                 // debatable: apparently there are two methods that map onto the same sighash
                 // and preferring the latest may result in "ping pong."
                     for (auto& p : dispatchMap) {
                         if (p.first == sighash) {
                             p.second = methods[i];
+                            bUpdated = true;
                             break;
                         }
                     }
+                    if (!bUpdated)
+                        dispatchMap.push_back(std::make_pair(sighash, methods[i]));
                 }
 
             // clear collected errors
@@ -1086,6 +1111,7 @@ void CPyCppyy::CPPOverload::Set(const std::string& name, std::vector<PyCallable*
 void CPyCppyy::CPPOverload::AdoptMethod(PyCallable* pc)
 {
 // Fill in the data of a freshly created method proxy.
+    PyLockGuard lock(fMethodInfo->fLock);
     fMethodInfo->fMethods.push_back(pc);
     fMethodInfo->fFlags &= ~CallContext::kIsSorted;
 }
@@ -1093,13 +1119,20 @@ void CPyCppyy::CPPOverload::AdoptMethod(PyCallable* pc)
 //----------------------------------------------------------------------------
 void CPyCppyy::CPPOverload::MergeOverload(CPPOverload* meth)
 {
-    if (!HasMethods()) // if fresh method being filled: also copy flags
-        fMethodInfo->fFlags = meth->fMethodInfo->fFlags;
-    fMethodInfo->fMethods.insert(fMethodInfo->fMethods.end(),
-        meth->fMethodInfo->fMethods.begin(), meth->fMethodInfo->fMethods.end());
+    Methods_t merged;
+    uint32_t flags;
+    {
+        PyLockGuard lock(meth->fMethodInfo->fLock);
+        merged.swap(meth->fMethodInfo->fMethods);
+        flags = meth->fMethodInfo->fFlags;
+        meth->fMethodInfo->fDispatchMap.clear();
+    }
+
+    PyLockGuard lock(fMethodInfo->fLock);
+    if (fMethodInfo->fMethods.empty()) // if fresh method being filled: also copy flags
+        fMethodInfo->fFlags = flags;
+    fMethodInfo->fMethods.insert(fMethodInfo->fMethods.end(), merged.begin(), merged.end());
     fMethodInfo->fFlags &= ~CallContext::kIsSorted;
-    meth->fMethodInfo->fDispatchMap.clear();
-    meth->fMethodInfo->fMethods.clear();
 }
 
 //----------------------------------------------------------------------------
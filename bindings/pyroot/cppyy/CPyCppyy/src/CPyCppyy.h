@@ -358,6 +358,12 @@ void _Py_SET_TYPE(PyObject *ob, PyTypeObject *type) { ob->ob_type = type; }
 #define Py_SET_TYPE(ob, type) _Py_SET_TYPE((PyObject*)(ob), type)
 #endif
 
+#if PY_VERSION_HEX < 0x030900A4 && !defined(Py_SET_REFCNT)
+static inline
+void _Py_SET_REFCNT(PyObject *ob, Py_ssize_t refcnt) { ob->ob_refcnt = refcnt; }
+#define Py_SET_REFCNT(ob, refcnt) _Py_SET_REFCNT((PyObject*)(ob), refcnt)
+#endif
+
 // py39 gained several faster (through vector call) equivalent method call API
 #if PY_VERSION_HEX < 0x03090000
 static inline PyObject* PyObject_CallMethodNoArgs(PyObject* obj, PyObject* name) {
@@ -369,6 +375,39 @@ static inline PyObject* PyObject_CallMethodOneArg(PyObject* obj, PyObject* name,
 }
 #endif
 
+// free-threaded (no-GIL) Python: shared state is protected by fine-grained locks,
+// which are no-ops if the GIL is enabled; critical sections lock a Python object
+#ifndef Py_BEGIN_CRITICAL_SECTION
+#define Py_BEGIN_CRITICAL_SECTION(op) {
+#define Py_END_CRITICAL_SECTION() }
+#endif
+
+namespace CPyCppyy {
+
+#ifdef Py_GIL_DISABLED
+typedef PyMutex PyLock_t;
+
+class PyLockGuard {
+public:
+    PyLockGuard(PyLock_t& lock) : fLock(lock) { PyMutex_Lock(&fLock); }
+    ~PyLockGuard() { PyMutex_Unlock(&fLock); }
+    PyLockGuard(const PyLockGuard&) = delete;
+    PyLockGuard& operator=(const PyLockGuard&) = delete;
+
+private:
+    PyLock_t& fLock;
+};
+#else
+struct PyLock_t {};
+
+class PyLockGuard {
+public:
+    PyLockGuard(PyLock_t&) {}
+};
+#endif
+
+} // namespace CPyCppyy
+
 // C++ version of the cppyy API
 #include "Cppyy.h"
 
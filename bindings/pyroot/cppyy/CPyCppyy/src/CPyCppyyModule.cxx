@@ -237,6 +237,7 @@ namespace CPyCppyy {
     PyObject* gIllException  = nullptr;
     PyObject* gAbrtException = nullptr;
     std::map<std::string, std::vector<PyObject*>> gPythonizations;
+    PyLock_t gPythonizationsLock{};
     std::set<Cppyy::TCppType_t> gPinnedTypes;
     std::ostringstream gCapturedError;
     std::streambuf* gOldErrorBuffer = nullptr;
@@ -824,6 +825,7 @@ static PyObject* AddPythonization(PyObject*, PyObject* args)
     }
 
     Py_INCREF(pythonizor);
+    PyLockGuard lock(gPythonizationsLock);
     gPythonizations[scope].push_back(pythonizor);
 
     Py_RETURN_NONE;
@@ -838,6 +840,7 @@ static PyObject* RemovePythonization(PyObject*, PyObject* args)
     if (!PyArg_ParseTuple(args, const_cast<char*>("Os"), &pythonizor, &scope))
         return nullptr;
 
+    PyLockGuard lock(gPythonizationsLock);
     auto p1 = gPythonizations.find(scope);
     if (p1 != gPythonizations.end()) {
         auto p2 = std::find(p1->second.begin(), p1->second.end(), pythonizor);
@@ -1091,6 +1094,13 @@ extern "C" void initlibcppyy()
     if (!gThisModule)
         CPYCPPYY_INIT_ERROR;
 
+#ifdef Py_GIL_DISABLED
+// shared state is protected by per-object critical sections and locks; calls into
+// the interpreter (lookups, JIT) are serialized by the backend
+    Cppyy::EnableThreadSafety();
+    PyUnstable_Module_SetGIL(gThisModule, Py_MOD_GIL_NOT_USED);
+#endif
+
 // keep gThisModule, but do not increase its reference count even as it is borrowed,
 // or a self-referencing cycle would be created
 
@@ -40,8 +40,8 @@ struct InitCPyCppyy_NoneType_t {
     // create a CPyCppyy NoneType (for references that went dodo) from NoneType
         memset(&CPyCppyy_NoneType, 0, sizeof(CPyCppyy_NoneType));
 
-        ((PyObject&)CPyCppyy_NoneType).ob_type    = &PyType_Type;
-        ((PyObject&)CPyCppyy_NoneType).ob_refcnt  = 1;
+        Py_SET_TYPE(&CPyCppyy_NoneType, &PyType_Type);
+        Py_SET_REFCNT(&CPyCppyy_NoneType, 1);
         ((PyVarObject&)CPyCppyy_NoneType).ob_size = 0;
 
         CPyCppyy_NoneType.tp_name        = const_cast<char*>("CPyCppyy_NoneType");
@@ -82,6 +82,9 @@ struct InitCPyCppyy_NoneType_t {
 
 } // unnamed namespace
 
+// Protects the setup of CPyCppyy_NoneType from a nullified object
+static CPyCppyy::PyLock_t gNoneTypeLock{};
+
 // Memory regulation hooks
 CPyCppyy::MemHook_t CPyCppyy::MemoryRegulator::registerHook   = nullptr;
 CPyCppyy::MemHook_t CPyCppyy::MemoryRegulator::unregisterHook = nullptr;
@@ -115,28 +118,38 @@ bool CPyCppyy::MemoryRegulator::RecursiveRemove(
         return false;
     }
 
-// see whether we're tracking this object
+// see whether we're tracking this object, and if so, erase it from tracking; the
+// table of a class is protected by a critical section on the class
+    CPPInstance* pyobj = nullptr;
+    Py_BEGIN_CRITICAL_SECTION(pyscope);
     CppToPyMap_t::iterator ppo = cppobjs->find(cppobj);
-
     if (ppo != cppobjs->end()) {
-    // get the tracked object
-        CPPInstance* pyobj = (CPPInstance*)ppo->second;
-
-    // erase the object from tracking
+        pyobj = (CPPInstance*)ppo->second;
         pyobj->fFlags &= ~CPPInstance::kIsRegulated;
         cppobjs->erase(ppo);
+    }
+    Py_END_CRITICAL_SECTION();
 
+    if (pyobj) {
     // nullify the object
-        if (!CPyCppyy_NoneType.tp_traverse) {
-        // take a reference as we're copying its function pointers
-            Py_INCREF(Py_TYPE(pyobj));
-
-        // all object that arrive here are expected to be of the same type ("instance")
-            CPyCppyy_NoneType.tp_traverse   = Py_TYPE(pyobj)->tp_traverse;
-            CPyCppyy_NoneType.tp_clear      = Py_TYPE(pyobj)->tp_clear;
-            CPyCppyy_NoneType.tp_free       = Py_TYPE(pyobj)->tp_free;
-            CPyCppyy_NoneType.tp_flags     |= Py_TYPE(pyobj)->tp_flags;
-        } else if (CPyCppyy_NoneType.tp_traverse != Py_TYPE(pyobj)->tp_traverse) {
+        bool expectedType = true;
+        {
+            PyLockGuard lock(gNoneTypeLock);
+            if (!CPyCppyy_NoneType.tp_traverse) {
+            // take a reference as we're copying its function pointers
+                Py_INCREF(Py_TYPE(pyobj));
+
+            // all object that arrive here are expected to be of the same type ("instance")
+                CPyCppyy_NoneType.tp_traverse   = Py_TYPE(pyobj)->tp_traverse;
+                CPyCppyy_NoneType.tp_clear      = Py_TYPE(pyobj)->tp_clear;
+                CPyCppyy_NoneType.tp_free       = Py_TYPE(pyobj)->tp_free;
+                CPyCppyy_NoneType.tp_flags     |= Py_TYPE(pyobj)->tp_flags;
+            } else if (CPyCppyy_NoneType.tp_traverse != Py_TYPE(pyobj)->tp_traverse) {
+                expectedType = false;
+            }
+        }
+
+        if (!expectedType) {
         // TODO: SystemError?
             std::cerr << "in CPyCppyy::MemoryRegulater, unexpected object of type: "
                       << Py_TYPE(pyobj)->tp_name << std::endl;
@@ -147,10 +160,10 @@ bool CPyCppyy::MemoryRegulator::RecursiveRemove(
         }
 
     // notify any other weak referents by playing dead
-        Py_ssize_t refcnt = ((PyObject*)pyobj)->ob_refcnt;
-        ((PyObject*)pyobj)->ob_refcnt = 0;
+        Py_ssize_t refcnt = Py_REFCNT(pyobj);
+        Py_SET_REFCNT(pyobj, 0);
         PyObject_ClearWeakRefs((PyObject*)pyobj);
-        ((PyObject*)pyobj)->ob_refcnt = refcnt;
+        Py_SET_REFCNT(pyobj, refcnt);
 
     // cleanup object internals
         pyobj->CppOwns();              // held object is out of scope now anyway
@@ -159,7 +172,7 @@ bool CPyCppyy::MemoryRegulator::RecursiveRemove(
     // reset type object
         Py_INCREF((PyObject*)(void*)&CPyCppyy_NoneType);
         Py_DECREF(Py_TYPE(pyobj));
-        ((PyObject*)pyobj)->ob_type = &CPyCppyy_NoneType;
+        Py_SET_TYPE(pyobj, &CPyCppyy_NoneType);
 
         Py_DECREF(pyscope);
         return true;
@@ -189,6 +202,7 @@ bool CPyCppyy::MemoryRegulator::RegisterPyObject(
 
 // if an address was already associated with a different object, then stop following
 // the old and force insert the new proxy for following
+    Py_BEGIN_CRITICAL_SECTION(Py_TYPE(pyobj));
     const auto& res = cppobjs->insert(std::make_pair(cppobj, (PyObject*)pyobj));
     if (!res.second) {
         ((CPPInstance*)res.first->second)->fFlags &= ~CPPInstance::kIsRegulated;
@@ -196,6 +210,7 @@ bool CPyCppyy::MemoryRegulator::RegisterPyObject(
     }
 
     pyobj->fFlags |= CPPInstance::kIsRegulated;
+    Py_END_CRITICAL_SECTION();
     return true;
 }
 
@@ -220,12 +235,15 @@ bool CPyCppyy::MemoryRegulator::UnregisterPyObject(CPPInstance* pyobj, PyObject*
         return false;
 
 // erase if tracked
+    bool erased = false;
+    Py_BEGIN_CRITICAL_SECTION(pyclass);
     if (cppobjs->erase(cppobj)) {
         pyobj->fFlags &= ~CPPInstance::kIsRegulated;
-        return true;
+        erased = true;
     }
+    Py_END_CRITICAL_SECTION();
 
-    return false;
+    return erased;
 }
 
 //-----------------------------------------------------------------------------
@@ -239,13 +257,18 @@ PyObject* CPyCppyy::MemoryRegulator::RetrievePyObject(Cppyy::TCppObject_t cppobj
     if (!cppobjs)
         return nullptr;
 
+// take the reference while the table is locked, so that the object can not be
+// unregistered and deallocated by another thread in the meantime
+    PyObject* pyobj = nullptr;
+    Py_BEGIN_CRITICAL_SECTION(pyclass);
     CppToPyMap_t::iterator ppo = cppobjs->find(cppobj);
     if (ppo != cppobjs->end()) {
-        Py_INCREF(ppo->second);
-        return ppo->second;
+        pyobj = ppo->second;
+        Py_INCREF(pyobj);
     }
+    Py_END_CRITICAL_SECTION();
 
-    return nullptr;
+    return pyobj;
 }
 
 
@@ -27,6 +27,7 @@
 namespace CPyCppyy {
     extern PyObject* gThisModule;
     extern std::map<std::string, std::vector<PyObject*>> gPythonizations;
+    extern PyLock_t gPythonizationsLock;
 }
 
 namespace {
@@ -547,7 +548,7 @@ static PyObject* vector_iter(PyObject* v) {
 
 // tell the iterator code to set a life line if this container is a temporary
     vi->vi_flags = vectoriterobject::kDefault;
-    if (v->ob_refcnt <= 2 || (((CPPInstance*)v)->fFlags & CPPInstance::kIsValue))
+    if (Py_REFCNT(v) <= 2 || (((CPPInstance*)v)->fFlags & CPPInstance::kIsValue))
         vi->vi_flags = vectoriterobject::kNeedLifeLine;
 
     PyObject* pyvalue_type = PyObject_GetAttr((PyObject*)Py_TYPE(v), PyStrings::gValueType);
@@ -1573,8 +1574,20 @@ namespace CPyCppyy {
 }
 
 static inline
-bool run_pythonizors(PyObject* pyclass, PyObject* pyname, const std::vector<PyObject*>& v)
+bool run_pythonizors(PyObject* pyclass, PyObject* pyname, const std::string& scope)
 {
+// take a snapshot of the registered pythonizors, so that they run without holding the
+// lock (pythonizors are free to add or remove pythonizors)
+    std::vector<PyObject*> v;
+    {
+        PyLockGuard lock(gPythonizationsLock);
+        auto p = gPythonizations.find(scope);
+        if (p == gPythonizations.end())
+            return true;
+        v = p->second;
+        for (auto pythonizor : v) Py_INCREF(pythonizor);
+    }
+
     PyObject* args = PyTuple_New(2);
     Py_INCREF(pyclass); PyTuple_SET_ITEM(args, 0, pyclass);
     Py_INCREF(pyname);  PyTuple_SET_ITEM(args, 1, pyname);
@@ -1589,6 +1602,7 @@ bool run_pythonizors(PyObject* pyclass, PyObject* pyname, const std::vector<PyOb
         Py_DECREF(result);
     }
     Py_DECREF(args);
+    for (auto pythonizor : v) Py_DECREF(pythonizor);
 
     return pstatus;
 }
@@ -1965,20 +1979,14 @@ bool CPyCppyy::Pythonize(PyObject* pyclass, const std::string& name)
     bool pstatus = true;
     std::string outer_scope = TypeManip::extract_namespace(name);
     if (!outer_scope.empty()) {
-        auto p = gPythonizations.find(outer_scope);
-        if (p != gPythonizations.end()) {
-            PyObject* subname = CPyCppyy_PyText_FromString(
-                name.substr(outer_scope.size()+2, std::string::npos).c_str());
-            pstatus = run_pythonizors(pyclass, subname, p->second);
-            Py_DECREF(subname);
-        }
+        PyObject* subname = CPyCppyy_PyText_FromString(
+            name.substr(outer_scope.size()+2, std::string::npos).c_str());
+        pstatus = run_pythonizors(pyclass, subname, outer_scope);
+        Py_DECREF(subname);
     }
 
-    if (pstatus) {
-        auto p = gPythonizations.find("");
-        if (p != gPythonizations.end())
-            pstatus = run_pythonizors(pyclass, pyname, p->second);
-    }
+    if (pstatus)
+        pstatus = run_pythonizors(pyclass, pyname, "");
 
     Py_DECREF(pyname);
 
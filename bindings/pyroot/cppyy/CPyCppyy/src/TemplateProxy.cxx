@@ -451,18 +451,26 @@ static inline void UpdateDispatchMap(TemplateProxy* pytmpl, bool use_targs, uint
 {
 // Memoize a method in the dispatch map after successful call; replace old if need be (may be
 // with the same CPPOverload, just with more methods).
+    const std::string key = use_targs ? targs2str(pytmpl) : "";
+    CPPOverload* old = nullptr;
     bool bInserted = false;
-    auto& v = pytmpl->fTI->fDispatchMap[use_targs ? targs2str(pytmpl) : ""];
 
     Py_INCREF(pymeth);
-    for (auto& p : v) {
-        if (p.first == sighash) {
-            Py_DECREF(p.second);
-            p.second = pymeth;
-            bInserted = true;
+    {
+        PyLockGuard lock(pytmpl->fTI->fLock);
+        auto& v = pytmpl->fTI->fDispatchMap[key];
+        for (auto& p : v) {
+            if (p.first == sighash) {
+                old = p.second;
+                p.second = pymeth;
+                bInserted = true;
+                break;
+            }
         }
+        if (!bInserted) v.push_back(std::make_pair(sighash, pymeth));
     }
-    if (!bInserted) v.push_back(std::make_pair(sighash, pymeth));
+// release outside of the lock, as deallocation may run arbitrary code
+    Py_XDECREF(old);
 }
 
 static inline PyObject* SelectAndForward(TemplateProxy* pytmpl, CPPOverload* pymeth,
@@ -568,11 +576,15 @@ static PyObject* tpp_call(TemplateProxy* pytmpl, PyObject* args, PyObject* kwds)
     CPPOverload* ol = nullptr;
     if (!pytmpl->fTemplateArgs) {
     // look for known signatures ...
-        auto& v = pytmpl->fTI->fDispatchMap[""];
-        for (const auto& p : v) {
-            if (p.first == sighash) {
-                ol = p.second;
-                break;
+        {
+            PyLockGuard lock(pytmpl->fTI->fLock);
+            auto& v = pytmpl->fTI->fDispatchMap[""];
+            for (const auto& p : v) {
+                if (p.first == sighash) {
+                    ol = p.second;
+                    Py_INCREF(ol);    // the entry may be replaced by another thread
+                    break;
+                }
             }
         }
 
@@ -585,6 +597,7 @@ static PyObject* tpp_call(TemplateProxy* pytmpl, PyObject* args, PyObject* kwds)
                 result = CPyCppyy_tp_call(pymeth, args, nargsf, kwds);
                 Py_DECREF(pymeth); pymeth = nullptr;
             }
+            Py_DECREF(ol);
             if (result)
                 return result;
         }
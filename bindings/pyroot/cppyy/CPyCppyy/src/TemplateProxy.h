@@ -40,6 +40,7 @@ public:
 
     TP_DispatchMap_t fDispatchMap;
     PyObject* fDoc;
+    PyLock_t  fLock{};            // protects fDispatchMap
 };
 
 typedef std::shared_ptr<TemplateInfo> TP_TInfo_t;
@@ -33,11 +33,14 @@
 // Standard
 #include <assert.h>
 #include <algorithm>     // for std::count, std::remove
+#include <atomic>
 #include <climits>
+#include <deque>
 #include <stdexcept>
 #include <map>
 #include <new>
 #include <set>
+#include <shared_mutex>
 #include <sstream>
 #include <signal.h>
 #include <stdlib.h>      // for getenv
@@ -60,7 +63,8 @@ static inline size_t CALL_NARGS(size_t nargs) {
 }
 
 // data for life time management ---------------------------------------------
-typedef std::vector<TClassRef> ClassRefs_t;
+// a deque keeps references to its elements valid when new scopes are appended
+typedef std::deque<TClassRef> ClassRefs_t;
 static ClassRefs_t g_classrefs(1);
 static const ClassRefs_t::size_type GLOBAL_HANDLE = 1;
 static const ClassRefs_t::size_type STD_HANDLE = GLOBAL_HANDLE + 1;
@@ -68,10 +72,36 @@ static const ClassRefs_t::size_type STD_HANDLE = GLOBAL_HANDLE + 1;
 typedef std::map<std::string, ClassRefs_t::size_type> Name2ClassRefIndex_t;
 static Name2ClassRefIndex_t g_name2classrefidx;
 
+// protects g_classrefs and g_name2classrefidx, which are shared by all threads if
+// the GIL is disabled; never held while calling into the interpreter. It is only
+// taken after Cppyy::EnableThreadSafety(), as the GIL serializes all accesses
+// otherwise, and lookups take it shared.
+static std::shared_mutex g_classrefs_mutex;
+static std::atomic<bool> g_classrefs_locking{false};
+
 namespace {
 
+class ClassRefsReadLock {
+    bool fLocked;
+public:
+    ClassRefsReadLock() : fLocked(g_classrefs_locking.load(std::memory_order_acquire)) {
+        if (fLocked) g_classrefs_mutex.lock_shared();
+    }
+    ~ClassRefsReadLock() { if (fLocked) g_classrefs_mutex.unlock_shared(); }
+};
+
+class ClassRefsWriteLock {
+    bool fLocked;
+public:
+    ClassRefsWriteLock() : fLocked(g_classrefs_locking.load(std::memory_order_acquire)) {
+        if (fLocked) g_classrefs_mutex.lock();
+    }
+    ~ClassRefsWriteLock() { if (fLocked) g_classrefs_mutex.unlock(); }
+};
+
 static inline Cppyy::TCppType_t find_memoized(const std::string& name)
 {
+    ClassRefsReadLock lock;
     auto icr = g_name2classrefidx.find(name);
     if (icr != g_name2classrefidx.end())
         return (Cppyy::TCppType_t)icr->second;
@@ -329,6 +359,7 @@ public:
 static inline
 TClassRef& type_from_handle(Cppyy::TCppScope_t scope)
 {
+    ClassRefsReadLock lock;
     assert((ClassRefs_t::size_type)scope < g_classrefs.size());
     return g_classrefs[(ClassRefs_t::size_type)scope];
 }
@@ -396,6 +427,14 @@ std::string Cppyy::ToString(TCppType_t klass, TCppObject_t obj)
     return "";
 }
 
+void Cppyy::EnableThreadSafety()
+{
+// make the interpreter lock gInterpreterMutex effective, as required when calling
+// into the interpreter from several threads at once (e.g. free-threaded Python)
+    ROOT::EnableThreadSafety();
+    g_classrefs_locking.store(true, std::memory_order_release);
+}
+
 
 // name to opaque C++ scope representation -----------------------------------
 std::string Cppyy::ResolveName(const std::string& cppitem_name)
@@ -538,12 +577,18 @@ Cppyy::TCppScope_t Cppyy::GetScope(const std::string& sname)
     bool b_scope_name_missclassified = is_missclassified_stl(scope_name);
     if (b_scope_name_missclassified) {
         result = find_memoized("std::"+scope_name);
-        if (result) g_name2classrefidx["std::"+scope_name] = (ClassRefs_t::size_type)result;
+        if (result) {
+            ClassRefsWriteLock lock;
+            g_name2classrefidx["std::"+scope_name] = (ClassRefs_t::size_type)result;
+        }
     }
     bool b_sname_missclassified = bHasAlias ? is_missclassified_stl(sname) : false;
     if (b_sname_missclassified) {
         if (!result) result = find_memoized("std::"+sname);
-        if (result) g_name2classrefidx["std::"+sname] = (ClassRefs_t::size_type)result;
+        if (result) {
+            ClassRefsWriteLock lock;
+            g_name2classrefidx["std::"+sname] = (ClassRefs_t::size_type)result;
+        }
     }
 
     if (result) return result;
@@ -555,11 +600,17 @@ Cppyy::TCppScope_t Cppyy::GetScope(const std::string& sname)
     if (!cr.GetClass())
         return (TCppScope_t)0;
 
-// memoize found/created TClass
+// memoize found/created TClass; another thread may have done so in the meantime
+    TClassRef newref(scope_name.c_str());
+    ClassRefsWriteLock lock;
+    auto icr = g_name2classrefidx.find(scope_name);
+    if (icr != g_name2classrefidx.end())
+        return (TCppScope_t)icr->second;
+
     ClassRefs_t::size_type sz = g_classrefs.size();
     g_name2classrefidx[scope_name] = sz;
     if (bHasAlias) g_name2classrefidx[sname] = sz;
-    g_classrefs.push_back(TClassRef(scope_name.c_str()));
+    g_classrefs.push_back(newref);
 
 // TODO: make ROOT/meta NOT remove std :/
     if (b_scope_name_missclassified)
@@ -626,9 +677,9 @@ Cppyy::TCppType_t Cppyy::GetActualClass(TCppType_t klass, TCppObject_t obj)
 
     TClass* clActual = cr->GetActualClass((void*)obj);
     if (clActual && clActual != cr.GetClass()) {
-        auto itt = g_name2classrefidx.find(clActual->GetName());
-        if (itt != g_name2classrefidx.end())
-            return (TCppType_t)itt->second;
+        TCppType_t result = find_memoized(clActual->GetName());
+        if (result)
+            return result;
         return (TCppType_t)GetScope(clActual->GetName());
     }
 
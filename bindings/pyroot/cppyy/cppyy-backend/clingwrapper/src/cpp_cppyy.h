@@ -29,6 +29,8 @@ namespace Cppyy {
     bool Compile(const std::string& code, bool silent = false);
     RPY_EXPORTED
     std::string ToString(TCppType_t klass, TCppObject_t obj);
+    RPY_EXPORTED
+    void EnableThreadSafety();
 
 // name to opaque C++ scope representation -----------------------------------
     RPY_EXPORTED
@@ -0,0 +1,91 @@
+"""Start-up benchmarks of PyROOT/cppyy, based on the ROOT.tracing instrumentation.
+
+Every scenario runs in new processes with PYROOT_TRACE set, so that besides the
+wall time, the time spent per category of event (import, lookup, autoload, pcm,
+wrapper JIT, ...) is known. Medians over the repetitions are compared to the
+baseline in startup_baseline.json, which is recorded with --save-baseline on a
+known-good build; a scenario regresses if its wall time exceeds the baseline by
+more than the tolerance factor.
+
+    python bench_startup.py [--repetitions N] [--tolerance F] [--save-baseline]
+"""
+
+import argparse, json, os, statistics, subprocess, sys, tempfile, time
+
+currpath = os.path.dirname(os.path.abspath(__file__))
+baseline_file = os.path.join(currpath, 'startup_baseline.json')
+
+scenarios = {
+    'import':    'import ROOT',
+    'setup':     'import ROOT; ROOT.gROOT',
+    'class':     'import ROOT; ROOT.TH1D("h", "h", 10, 0, 1)',
+    'namespace': 'import ROOT; ROOT.Math.gaussian_pdf(1.)',
+    'rdf':       'import ROOT; ROOT.RDataFrame(1).Count().GetValue()',
+    'cppdef':    'import ROOT, cppyy; cppyy.cppdef("int startup_f(int i) { return i; }"); cppyy.gbl.startup_f(1)',
+}
+
+
+def run_once(code):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        trace_file = os.path.join(tmpdir, 'trace.json')
+        env = dict(os.environ, PYROOT_TRACE=trace_file)
+        tpre = time.perf_counter()
+        subprocess.check_call([sys.executable, '-c', code], env=env)
+        tpost = time.perf_counter()
+        with open(trace_file) as f:
+            events = json.load(f)['traceEvents']
+
+    result = {'wall': tpost - tpre}
+    for e in events:    # nested events are counted in their own category too
+        result[e['cat']] = result.get(e['cat'], 0.) + e['dur']*1e-6
+    return result
+
+
+def run_scenario(code, repetitions):
+    runs = [run_once(code) for i in range(repetitions)]
+    keys = set(k for r in runs for k in r)
+    return {k: statistics.median(r.get(k, 0.) for r in runs) for k in sorted(keys)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PyROOT/cppyy start-up benchmarks')
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--tolerance', type=float, default=1.25,
+                        help='allowed ratio of the wall time to the baseline')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='record the results as the new baseline')
+    parser.add_argument('scenario', nargs='*', default=sorted(scenarios))
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(baseline_file) and not args.save_baseline:
+        with open(baseline_file) as f:
+            baseline = json.load(f)
+
+    results, regressions = {}, []
+    for name in args.scenario:
+        print('running:', name)
+        res = run_scenario(scenarios[name], args.repetitions)
+        results[name] = res
+        for k, v in res.items():
+            ref = baseline.get(name, {}).get(k)
+            print('  %-14s %8.3f s%s' % (k, v, ref is not None and ' (baseline: %.3f s)' % ref or ''))
+        ref = baseline.get(name, {}).get('wall')
+        if ref is not None and res['wall'] > ref*args.tolerance:
+            regressions.append(name)
+
+    if args.save_baseline:
+        with open(baseline_file, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print('baseline written to', baseline_file)
+    elif not baseline:
+        print('no baseline found, record one with --save-baseline')
+
+    if regressions:
+        print('REGRESSIONS:', ', '.join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+import cppyy, sys, sysconfig, time
+from concurrent.futures import ThreadPoolExecutor
+
+# Scaling of C++ calls made concurrently from Python threads. With a regular
+# (GIL) build the total time stays roughly constant with the number of threads,
+# with a free-threaded build (python3.13t and later) it should go down.
+
+NCALLS    = 2000000
+NTHREADS  = (1, 2, 4, 8)
+
+cppyy.cppdef("""
+    double gwork(double d) { return d*d; }
+
+    class MyWork {
+    public:
+        double mwork(double d) { return d+1.; }
+    };
+
+    template<typename T>
+    T twork(T t) { return t; }
+""")
+
+
+def run_global(n):
+    f = cppyy.gbl.gwork
+    for i in range(n):
+        f(1.)
+
+def run_member(n):
+    inst = cppyy.gbl.MyWork()      # one instance per thread
+    for i in range(n):
+        inst.mwork(1.)
+
+def run_template(n):
+    f = cppyy.gbl.twork
+    for i in range(n):
+        f(1.)
+
+
+def benchit(what, callf):
+    print("running:", what)
+    callf(1000)                    # warmup, e.g. for template instantiation
+    t1 = None
+    for nthreads in NTHREADS:
+        n = NCALLS//nthreads
+        with ThreadPoolExecutor(max_workers=nthreads) as pool:
+            tpre = time.perf_counter()
+            for f in [pool.submit(callf, n) for i in range(nthreads)]:
+                f.result()
+            tpost = time.perf_counter()
+        if t1 is None:
+            t1 = tpost - tpre
+        print("  %d thread(s): %.3f s (speedup: %.2fx)" % (nthreads, tpost - tpre, t1/(tpost - tpre)))
+
+
+gil_disabled = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+gil_enabled  = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+print("free-threaded build:", gil_disabled, "(GIL enabled: %s)" % gil_enabled)
+
+benchit("global function", run_global)
+benchit("member function", run_member)
+benchit("template function", run_template)
@@ -48,6 +48,8 @@ __all__ = [
     'add_library_path',       # add a path to search for headers
     'add_autoload_map',       # explicitly include an autoload map
     'set_debug',              # enable/disable debug output
+    'vectorize',              # apply a C++ function over numpy arrays
+    'precompile',             # compile headers into a library, load it
     ]
 
 from ._version import __version__
@@ -422,6 +424,16 @@ def typeid(tt):
         _typeids[tt] = tid
         return tid
 
+def vectorize(func, signature=None, nthreads=1, chunksize=65536):
+    """Returns a callable that applies C++ function <func> element-wise to numpy arrays."""
+    from ._vectorize import vectorize as _vectorize
+    return _vectorize(func, signature, nthreads, chunksize)
+
+def precompile(headers, out_dir, name=None, force=False):
+    """Compiles header files <headers> into a library in <out_dir> (if outdated) and loads it."""
+    from ._precompile import precompile as _precompile
+    return _precompile(headers, out_dir, name, force)
+
 def multi(*bases):      # after six, see also _typemap.py
     """Resolve metaclasses for multiple inheritance."""
   # contruct a "no conflict" meta class; the '_meta' is needed by convention
@@ -0,0 +1,138 @@
+""" Ahead-of-time compilation of C++ headers into a library with dictionary.
+
+The headers are collected in an umbrella header, which is compiled with ACLiC
+into a shared library with its dictionary and, with runtime C++ modules, into a
+C++ module. Later calls load the library and import the module instead of
+parsing the headers again. ACLiC records the headers (including the indirectly
+included ones) that the library depends on, and rebuilds it if any changed.
+"""
+
+import hashlib, os, threading
+
+import cppyy
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+__all__ = [
+    'precompile',
+    ]
+
+
+def _uses_cxxmodules():
+    return 'runtime_cxxmodules' in str(cppyy.gbl.gROOT.GetConfigFeatures()).split()
+
+
+def _write_if_changed(fname, content):
+  # a rewrite of the umbrella header would trigger a rebuild
+    try:
+        with open(fname) as f:
+            if f.read() == content:
+                return
+    except (IOError, OSError):
+        pass
+    with open(fname, 'w') as f:
+        f.write(content)
+
+
+class _DirLock(object):
+    """Serializes builds into the same directory from several processes."""
+
+    def __init__(self, fname):
+        self._fname = fname
+        self._fd = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self._fd = os.open(self._fname, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, tp, val, trace):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+_loaded = {}       # umbrella header -> library
+
+# serializes builds from several threads (e.g. of a Dask worker), which share the
+# process-wide ACLiC settings
+_build_lock = threading.Lock()
+
+
+def precompile(headers, out_dir, name=None, force=False):
+    """Compile C++ headers <headers> into a library in <out_dir> and load it.
+
+    The library is only built if it does not exist yet or if any of the headers
+    it depends on has changed since, or with 'force'. The declarations from the
+    headers are available afterwards as after cppyy.include() of each header.
+    With runtime C++ modules, the parsed headers are stored in a C++ module that
+    is loaded instead of parsing the headers; otherwise, the headers are still
+    parsed, but the code of their functions comes precompiled from the library.
+    The name of the library defaults to a hash of the header paths. Returns the
+    path of the library.
+    """
+
+    if isinstance(headers, str):
+        headers = [headers]
+    paths = [os.path.isfile(h) and os.path.abspath(h) or h for h in headers]
+    if not paths:
+        raise ValueError('no headers given to precompile')
+
+    if name is None:
+        name = 'cppyy_precompiled_' + hashlib.sha1('\n'.join(paths).encode()).hexdigest()[:16]
+
+    out_dir = os.path.abspath(out_dir)
+    if not os.path.isdir(out_dir):
+        os.makedirs(out_dir)
+
+    umbrella = os.path.join(out_dir, name+'.h')
+    if umbrella in _loaded and not force:
+        return _loaded[umbrella]
+
+    guard = '__CPPYY_PRECOMPILED_%s_H' % name.upper()
+    _write_if_changed(umbrella, '// generated by cppyy.precompile, do not edit\n' +
+        '#ifndef %s\n#define %s\n' % (guard, guard) +
+        ''.join('#include "%s"\n' % p for p in paths) +
+        '#endif\n')
+
+    gbl = cppyy.gbl
+    libname = name+'_h'
+    library = os.path.join(out_dir, libname+'.'+gbl.gSystem.GetSoExt())
+
+    modules = _uses_cxxmodules()
+    if modules:
+      # names as generated by ACLiC, see TSystem::CompileMacro
+        modname = libname+'_ACLiC_dict'
+        if modname[:3] == 'lib':
+            modname = modname[3:]
+        modulemap = modname+'.modulemap'
+
+    with _build_lock, _DirLock(os.path.join(out_dir, name+'.lock')):
+        if modules and os.path.exists(os.path.join(out_dir, modulemap)):
+            gbl.gInterpreter.RegisterPrebuiltModulePath(out_dir, modulemap)
+
+        gEnv = gbl.gEnv
+        linklibs = gEnv.GetValue('ACLiC.LinkLibs', 1)
+        if modules:     # ACLiC only builds a C++ module alongside a rootmap
+            gEnv.SetValue('ACLiC.LinkLibs', linklibs | 2)
+
+      # build directly into out_dir ('-' for a flat build directory), independent
+      # of the current directory and of ACLiC.BuildDir
+        try:
+            ok = gbl.gSystem.CompileMacro(umbrella, force and 'kOsf-' or 'kOs-', '', out_dir)
+        finally:
+            gEnv.SetValue('ACLiC.LinkLibs', linklibs)
+
+    if not ok:
+        raise ImportError('Failed to precompile header files %s' % ', '.join('"%s"' % p for p in paths))
+
+  # with modules, the include becomes an import of the prebuilt module
+    cppyy.include(umbrella)
+
+    _loaded[umbrella] = library
+    return library
@@ -0,0 +1,273 @@
+""" Vectorized calls of C++ functions over NumPy arrays.
+
+A C++ loop over the elements of the (broadcast) input arrays is generated and
+JIT-compiled once per function and combination of argument types, so that the
+per-element cost is that of the C++ call, not that of a cppyy dispatch.
+"""
+
+import itertools
+
+import cppyy
+
+__all__ = [
+    'vectorize',
+    ]
+
+
+_cpp_types = {
+    ('b', 1) : 'bool',
+    ('i', 1) : 'int8_t',
+    ('i', 2) : 'int16_t',
+    ('i', 4) : 'int32_t',
+    ('i', 8) : 'int64_t',
+    ('u', 1) : 'uint8_t',
+    ('u', 2) : 'uint16_t',
+    ('u', 4) : 'uint32_t',
+    ('u', 8) : 'uint64_t',
+    ('f', 4) : 'float',
+    ('f', 8) : 'double',
+    }
+
+_counter = itertools.count()
+_rtypes  = {}      # (name, class, signature, argument types) -> (call name, return typestr)
+_loops   = {}      # (call name, output type) -> JIT-ed loop
+
+_helpers_declared = False
+def _declare_helpers():
+    global _helpers_declared
+    if _helpers_declared:
+        return
+    cppyy.cppdef("""namespace __cppyy_internal { namespace vectorize {
+    template<typename T>
+    std::string typestr() {
+        using U = typename std::decay<T>::type;
+        if (std::is_same<U, bool>::value) return "b1";
+        if (std::is_floating_point<U>::value) return "f" + std::to_string(sizeof(U));
+        if (std::is_integral<U>::value) return (std::is_signed<U>::value ? "i" : "u") + std::to_string(sizeof(U));
+        return "";
+    }
+
+    template<>
+    inline std::string typestr<void>() { return "v"; }
+}}""")
+    _helpers_declared = True
+
+
+def _namespace():
+  # no attribute access on gbl, as the name would be mangled inside a class
+    return getattr(cppyy.gbl, '__cppyy_internal').vectorize
+
+
+def _cpp_type(dtype):
+    try:
+        return _cpp_types[(dtype.kind, dtype.itemsize)]
+    except KeyError:
+        raise TypeError("unsupported array type %s for a vectorized C++ call" % str(dtype))
+
+
+def _resolve(func):
+    """Return the C++ name of the function and the bound instance, if any."""
+    if isinstance(func, str):
+        return func, None
+
+    self = getattr(func, 'im_self', None)
+    if self is not None and not isinstance(self, type):
+        return func.__name__, self
+
+    scope = getattr(func, 'im_class', None)
+    if scope is None or not hasattr(func, '__name__'):
+        raise TypeError("can not determine the C++ name of %s; pass it as a string instead" % str(func))
+    scope_name = scope.__cpp_name__
+    if scope_name and scope_name != '::':
+        return scope_name + '::' + func.__name__, None
+    return func.__name__, None
+
+
+class Vectorized(object):
+    """Callable that applies a C++ function element-wise over NumPy arrays."""
+
+    def __init__(self, func, signature=None, nthreads=1, chunksize=65536):
+        self.__name__, self._self = _resolve(func)
+        if self._self is not None:
+            self._class = type(self._self).__cpp_name__
+            self._addr  = cppyy.addressof(self._self)
+        else:
+            self._class = 'void'
+            self._addr  = 0
+        if isinstance(signature, str):
+            signature = tuple(s.strip() for s in signature.split(',') if s.strip())
+        self._signature = signature and tuple(signature) or None
+        self._nthreads  = nthreads
+        self._chunksize = chunksize
+
+    def __repr__(self):
+        return '<cppyy.vectorize of %s>' % self.__name__
+
+    def _call_name(self, argtypes):
+        key = (self.__name__, self._class, self._signature, argtypes)
+        try:
+            return _rtypes[key]
+        except KeyError:
+            pass
+
+        _declare_helpers()
+
+        n = next(_counter)
+        params = ', '.join('const %s& a%d' % (t, i) for i, t in enumerate(argtypes))
+        if self._signature is not None:
+            args = ', '.join('static_cast<%s>(a%d)' % (t, i) for i, t in enumerate(self._signature))
+        else:
+            args = ', '.join('a%d' % i for i in range(len(argtypes)))
+        if self._self is not None:
+            expr = 'self->%s(%s)' % (self.__name__, args)
+        else:
+            expr = '%s(%s)' % (self.__name__, args)
+
+        call = 'call_%d' % n
+        code = """namespace __cppyy_internal { namespace vectorize {
+    inline auto %(call)s(%(cls)s* self%(sep)s%(params)s) -> decltype(%(expr)s) { return %(expr)s; }
+    std::string %(call)s_rtype() { return typestr<decltype(%(call)s(nullptr%(sep)s%(declvals)s))>(); }
+}}""" % {'call' : call, 'cls' : self._class, 'sep' : argtypes and ', ' or '', 'params' : params, 'expr' : expr,
+         'declvals' : ', '.join('std::declval<const %s&>()' % t for t in argtypes)}
+        try:
+            cppyy.cppdef(code)
+        except SyntaxError:
+            raise TypeError("no viable C++ call %s for argument types (%s)" % (expr, ', '.join(argtypes)))
+
+        typestr = str(getattr(_namespace(), call+'_rtype')())
+        if not typestr:
+            raise TypeError("return type of %s is not an arithmetic type" % expr)
+
+        _rtypes[key] = (call, typestr)
+        return call, typestr
+
+    def _loop(self, call, argtypes, outtype):
+        key = (call, outtype)
+        try:
+            return _loops[key]
+        except KeyError:
+            pass
+
+        nargs = len(argtypes)
+        params = ''.join(', std::uintptr_t p%d, std::ptrdiff_t s%d' % (i, i) for i in range(nargs))
+        elems  = ', '.join('*reinterpret_cast<const %s*>(reinterpret_cast<const char*>(p%d) + i*s%d)' % (t, i, i)
+                           for i, t in enumerate(argtypes))
+        sep = nargs and ', ' or ''
+        if outtype is None:
+            stmt = '%s(self%s%s);' % (call, sep, elems)
+        else:
+            stmt = '*reinterpret_cast<%s*>(reinterpret_cast<char*>(out) + i*sout) = static_cast<%s>(%s(self%s%s));' %\
+                   (outtype, outtype, call, sep, elems)
+
+        code = """namespace __cppyy_internal { namespace vectorize {
+    void %(call)s_loop_%(n)d(std::size_t begin, std::size_t end, std::uintptr_t pself,
+                        std::uintptr_t out, std::ptrdiff_t sout%(params)s) {
+        %(cls)s* self = reinterpret_cast<%(cls)s*>(pself);
+        for (std::size_t i = begin; i < end; ++i) {
+            %(stmt)s
+        }
+    }
+}}""" % {'call' : call, 'n' : len(_loops), 'params' : params, 'cls' : self._class, 'stmt' : stmt}
+        try:
+            cppyy.cppdef(code)
+        except SyntaxError:
+            raise TypeError("failed to generate the vectorized loop for %s" % self.__name__)
+
+        loop = getattr(_namespace(), '%s_loop_%d' % (call, len(_loops)))
+        loop.__release_gil__ = True      # allows chunks to run in parallel threads
+        _loops[key] = loop
+        return loop
+
+    def __call__(self, *args, **kwds):
+        import numpy as np
+
+        out = kwds.pop('out', None)
+        nthreads = kwds.pop('nthreads', self._nthreads)
+        if kwds:
+            raise TypeError("unexpected keyword argument(s): %s" % ', '.join(kwds))
+        if self._signature is not None and len(self._signature) != len(args):
+            raise TypeError("%s expects %d argument(s) (%d given)" % (self.__name__, len(self._signature), len(args)))
+
+        arrays = [np.asarray(a) for a in args]
+        arrays = [a if a.dtype.isnative else a.astype(a.dtype.newbyteorder('=')) for a in arrays]
+        if arrays:
+            arrays = np.broadcast_arrays(*arrays)
+            shape = arrays[0].shape
+        else:
+            shape = ()
+        size = int(np.prod(shape))
+
+      # flatten to a single loop: 1-dim arrays can be strided, higher dimensions
+      # need contiguous data unless the values are all broadcast
+        ptrs = []
+        for a in arrays:
+            if a.ndim == 0:
+                stride = 0
+            elif a.ndim == 1:
+                stride = a.strides[0]
+            elif not any(a.strides):
+                stride = 0
+            else:
+                a = np.ascontiguousarray(a)
+                stride = a.itemsize
+            ptrs.append((a, stride))
+
+        argtypes = tuple(_cpp_type(a.dtype) for a in arrays)
+        call, typestr = self._call_name(argtypes)
+
+        if typestr == 'v':
+            if out is not None:
+                raise TypeError("%s does not return a value" % self.__name__)
+            outtype, outaddr, outstride, result = None, 0, 0, None
+        else:
+            if out is None:
+                out = np.empty(shape, dtype=np.dtype(typestr))
+            elif out.shape != shape:
+                raise ValueError("output array has shape %s, expected %s" % (out.shape, shape))
+            if out.ndim > 1 and not out.flags.c_contiguous:
+                raise ValueError("multi-dimensional output arrays must be C-contiguous")
+            if not out.flags.writeable:
+                raise ValueError("output array is read-only")
+            outtype = _cpp_type(out.dtype)
+            outaddr = out.__array_interface__['data'][0]
+            outstride = out.ndim == 1 and out.strides[0] or out.itemsize
+            result = out
+
+        loop = self._loop(call, argtypes, outtype)
+
+        cargs = []
+        for a, stride in ptrs:
+            cargs += [a.__array_interface__['data'][0], stride]
+
+        if nthreads is None or nthreads < 1:
+            import os
+            nthreads = os.cpu_count() or 1
+
+        if nthreads == 1 or size <= self._chunksize:
+            loop(0, size, self._addr, outaddr, outstride, *cargs)
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            chunks = [(b, min(b+self._chunksize, size)) for b in range(0, size, self._chunksize)]
+            with ThreadPoolExecutor(max_workers=nthreads) as pool:
+                for f in [pool.submit(loop, b, e, self._addr, outaddr, outstride, *cargs) for b, e in chunks]:
+                    f.result()
+
+        if result is not None and result.ndim == 0:
+            return result[()]
+        return result
+
+
+def vectorize(func, signature=None, nthreads=1, chunksize=65536):
+    """Return a callable that applies C++ function <func> element-wise to NumPy arrays.
+
+    The function can be given as a cppyy function, a bound method, or as its fully
+    qualified C++ name. Arguments are broadcast against each other as in NumPy and
+    the result is written into a new array, or into the array passed as 'out'. A C++
+    loop is JIT-compiled and cached per combination of argument and output types,
+    with C++ overload resolution selecting the function to call. Use 'signature'
+    (e.g. "double, double") to convert the elements to the given C++ types before
+    the call instead. With 'nthreads' other than 1 (None: all cores), the loop runs
+    in chunks of 'chunksize' elements in parallel threads, with the GIL released;
+    this requires the C++ function to be thread-safe.
+    """
+    return Vectorized(func, signature, nthreads, chunksize)
@@ -22,9 +22,18 @@ environ["CPPYY_NO_ROOT_FILTER"] = "1"
 # Do setup specific to AddressSanitizer environments
 from . import _asan
 
-import cppyy
+# Optional tracing of the start-up (PYROOT_TRACE environment variable)
+from . import _tracing
+
+_tracing._enable_from_environment()
+
+with _tracing.span("import", "import cppyy"):
+    import cppyy
+_tracing._enable_interpreter()
 import sys, importlib
-import libROOTPythonizations
+
+with _tracing.span("import", "import libROOTPythonizations"):
+    import libROOTPythonizations
 
 # Build cache of commonly used python strings (the cache is python intern, so
 # all strings are shared python-wide, not just in PyROOT).
@@ -36,7 +45,8 @@ for s in ["Branch", "FitFCN", "ROOT", "SetBranchAddress", "SetFCN", "_TClass__Dy
 # Trigger the addition of the pythonizations
 from ._pythonization import _register_pythonizations
 
-_register_pythonizations()
+with _tracing.span("import", "register pythonizations"):
+    _register_pythonizations()
 
 # Check if we are in the IPython shell
 import builtins
@@ -201,3 +211,5 @@ def cleanup():
 
 
 atexit.register(cleanup)
+
+_tracing._finish_import()
@@ -14,6 +14,7 @@ from ._application import PyROOTApplication
 from ._numbadeclare import _NumbaDeclareDecorator
 
 from ._pythonization import pythonization
+from . import _tracing
 
 
 class PyROOTConfiguration(object):
@@ -118,6 +119,9 @@ class ROOTFacade(types.ModuleType):
         # @pythonization decorator
         self.pythonization = pythonization
 
+        # Tracing of the time spent in lookups, pythonizations, autoloading, JIT...
+        self.tracing = _tracing
+
         self._is_ipython = is_ipython
 
         # Redirect lookups to temporary helper methods
@@ -320,9 +324,10 @@ class ROOTFacade(types.ModuleType):
     def VecOps(self):
         ns = self._fallback_getattr("VecOps")
         try:
-            from ._pythonization._rvec import _AsRVec
+            from ._pythonization._rvec import _AsRVec, _Vectorize
 
             ns.AsRVec = _AsRVec
+            ns.Vectorize = _Vectorize
         except:
             raise Exception("Failed to pythonize the namespace VecOps")
         del type(self).VecOps
@@ -387,16 +392,10 @@ class ROOTFacade(types.ModuleType):
         from ._pythonization import _tmva
 
         ns = self._fallback_getattr("TMVA")
-        hasRDF = "dataframe" in gROOT.GetConfigFeatures()
-        if hasRDF:
-            try:
-                from ._pythonization._tmva import inject_rbatchgenerator, _AsRTensor, SaveXGBoost
-
-                inject_rbatchgenerator(ns)
-                ns.Experimental.AsRTensor = _AsRTensor
-                ns.Experimental.SaveXGBoost = SaveXGBoost
-            except:
-                raise Exception("Failed to pythonize the namespace TMVA")
+        try:
+            _tmva.pythonize_tmva_namespace(ns)
+        except:
+            raise Exception("Failed to pythonize the namespace TMVA")
         del type(self).TMVA
         return ns
 
@@ -13,12 +13,14 @@ import inspect
 import pkgutil
 import re
 import sys
+import time
 import traceback
 
 import cppyy
 gbl_namespace = cppyy.gbl
 
 from ._generic import pythonize_generic
+from .. import _tracing
 
 
 def pythonization(class_name, ns='::', is_prefix=False):
@@ -75,8 +77,8 @@ def pythonization(class_name, ns='::', is_prefix=False):
     def pythonization_impl(user_pythonizor):
         '''
         The real decorator. Accepts a user-provided function and decorates it.
-        An inner function - a wrapper of the user function - is registered in
-        cppyy as a pythonizor.
+        The function is added to the registry of pythonizors, which is looked
+        up by a single dispatcher function registered in cppyy.
 
         Args:
             user_pythonizor (function): user-provided function to be decorated.
@@ -98,30 +100,7 @@ def pythonization(class_name, ns='::', is_prefix=False):
         # registered a pythonizor for it, the pythonizor would never be executed
         _find_used_classes(ns, passes_filter, user_pythonizor, npars)
 
-        def cppyy_pythonizor(klass, name):
-            '''
-            Wrapper function with the parameters that cppyy requires for a
-            pythonizor function (class proxy and class name). It invokes the
-            user function only if the current class - a candidate for being
-            pythonized - matches the `target` argument of the decorator.
-
-            Args:
-                klass (class type): cppyy proxy of the class that is the
-                    current candidate to be pythonized.
-                name (string): name of the class that is the current candidate
-                    to be pythonized.
-            '''
-
-            fqn = klass.__cpp_name__
-
-            # Add pretty printing (done on all classes)
-            pythonize_generic(klass, fqn)
-
-            if passes_filter(name):
-                _invoke(user_pythonizor, npars, klass, fqn)
-
-        # Register pythonizor in its namespace
-        cppyy.py.add_pythonization(cppyy_pythonizor, ns)
+        _registry.add(ns, target, is_prefix, user_pythonizor, npars)
 
         # Return the original user function.
         # We don't want to modify the user function, we just use the decorator
@@ -132,6 +111,172 @@ def pythonization(class_name, ns='::', is_prefix=False):
 
     return pythonization_impl
 
+
+class _PrefixTrie(object):
+    '''
+    Trie of class name prefixes. Every node is a pair of a dictionary with
+    the child nodes, indexed by character, and the list of entries whose
+    prefix ends at that node.
+    '''
+
+    def __init__(self):
+        self._root = ({}, [])
+
+    def add(self, prefix, entry):
+        node = self._root
+        for c in prefix:
+            node = node[0].setdefault(c, ({}, []))
+        node[1].append(entry)
+
+    def matches(self, name):
+        '''
+        Returns the entries of all the prefixes of `name`.
+        '''
+        node = self._root
+        result = list(node[1])
+        for c in name:
+            node = node[0].get(c)
+            if node is None:
+                break
+            result.extend(node[1])
+        return result
+
+
+class _PythonizorRegistry(object):
+    '''
+    Registry of the pythonizors, indexed by namespace. Within a namespace,
+    pythonizors of single classes are looked up by exact name in a dictionary,
+    and pythonizors of prefixes in a trie, so that the time needed to find the
+    pythonizors of a class does not grow with the number of pythonizors.
+
+    A single dispatcher function is registered in cppyy for all classes. Like
+    cppyy does for the pythonizors registered per scope, it runs the
+    pythonizors of the namespace of the class first, with the class name
+    without namespace, and then the ones of the global namespace, with the
+    fully-qualified class name.
+    '''
+
+    def __init__(self):
+        self._exact = {}
+        self._prefixes = {}
+        self._num_entries = 0
+        self._dispatcher_registered = False
+        self.reset_stats()
+
+    def reset_stats(self):
+        '''
+        Resets the counters of pythonization_stats().
+        '''
+        self.stats = {"classes": 0, "pythonizor_calls": 0, "time": 0.0}
+
+    def add(self, ns, target, is_prefix, user_pythonizor, npars):
+        # The index keeps the pythonizors of a class in registration order
+        entry = (self._num_entries, user_pythonizor, npars)
+        self._num_entries += 1
+
+        if is_prefix:
+            trie = self._prefixes.setdefault(ns, _PrefixTrie())
+            for prefix in target:
+                trie.add(prefix, entry)
+        else:
+            exact = self._exact.setdefault(ns, {})
+            for name in target:
+                exact.setdefault(name, []).append(entry)
+
+        if not self._dispatcher_registered:
+            cppyy.py.add_pythonization(self._dispatch, '')
+            self._dispatcher_registered = True
+
+    def _matches(self, ns, name):
+        entries = list(self._exact.get(ns, {}).get(name, ()))
+        trie = self._prefixes.get(ns)
+        if trie is not None:
+            entries.extend(trie.matches(name))
+        # A pythonizor whose targets match a class more than once runs once
+        return sorted(set(entries), key=lambda entry: entry[0])
+
+    def _dispatch(self, klass, name):
+        '''
+        Pythonizor function registered in cppyy, which is called for every
+        class proxy that is created.
+
+        Args:
+            klass (class type): cppyy proxy of the class that is the
+                current candidate to be pythonized.
+            name (string): fully-qualified name of the class that is the
+                current candidate to be pythonized.
+        '''
+
+        start = time.perf_counter_ns()
+
+        fqn = klass.__cpp_name__
+
+        # Add pretty printing (done on all classes)
+        pythonize_generic(klass, fqn)
+
+        entries = []
+        outer_scope = _extract_namespace(name)
+        if outer_scope:
+            entries += self._matches(outer_scope, name[len(outer_scope) + 2:])
+        entries += self._matches('', name)
+
+        try:
+            for _, user_pythonizor, npars in entries:
+                _invoke(user_pythonizor, npars, klass, fqn)
+        finally:
+            self.stats["classes"] += 1
+            self.stats["pythonizor_calls"] += len(entries)
+            end = time.perf_counter_ns()
+            self.stats["time"] += (end - start) * 1e-9
+            _tracing.record("pythonization", fqn, start, end)
+
+
+_registry = _PythonizorRegistry()
+
+
+def pythonization_stats(reset=False):
+    '''
+    Returns the number of classes that were pythonized, the number of calls of
+    pythonizor functions and the total time in seconds spent pythonizing
+    classes when their proxies were created.
+
+    Args:
+        reset (boolean): if True, the counters are reset after being read.
+
+    Returns:
+        dict: with keys "classes", "pythonizor_calls" and "time".
+    '''
+
+    stats = dict(_registry.stats)
+    if reset:
+        _registry.reset_stats()
+    return stats
+
+
+def _extract_namespace(name):
+    '''
+    Returns the namespace of a fully-qualified class name, or an empty string
+    for the global namespace. The template arguments are skipped, following
+    what cppyy does to find the pythonizors registered for a scope.
+
+    Args:
+        name (string): fully-qualified class name.
+
+    Returns:
+        string: the namespace of the class.
+    '''
+
+    tpl_open = 0
+    for pos in range(len(name) - 1, 0, -1):
+        c = name[pos]
+        if c == '>':
+            tpl_open -= 1
+        elif c == '<' and name[pos + 1] != '<':
+            tpl_open += 1
+        elif tpl_open == 0 and c == ':' and name[pos - 1] == ':':
+            return name[:pos - 1]
+    return ''
+
 def _check_target(target):
     '''
     Helper function to check the type of the `class name` argument specified by
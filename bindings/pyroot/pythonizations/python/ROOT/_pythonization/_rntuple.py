@@ -0,0 +1,424 @@
+################################################################################
+# Copyright (C) 1995-2026, Rene Brun and Fons Rademakers.                      #
+# All rights reserved.                                                         #
+#                                                                              #
+# For the licensing terms see $ROOTSYS/LICENSE.                                #
+# For the list of contributors see $ROOTSYS/README/CREDITS.                    #
+################################################################################
+
+r'''
+/**
+\class ROOT::Experimental::RNTupleReader
+\brief \parblock \endparblock
+\htmlonly
+<div class="pyrootbox">
+\endhtmlonly
+## PyROOT
+
+The fields of an RNTuple can be read into NumPy arrays with `arrays()`, which
+returns a dictionary with the field names as keys:
+\code{.py}
+reader = ROOT.Experimental.RNTupleReader.Open("ntpl", "data.root")
+arrays = reader.arrays(["pt", "jet_eta"], entry_range=(0, 100000))
+arrays["pt"]                          # NumPy array with one value per entry
+offsets, content = arrays["jet_eta"]  # the items of entry i are content[offsets[i]:offsets[i + 1]]
+\endcode
+
+Fields of fundamental type are returned as NumPy arrays of the same type.
+Collections of a fundamental type, i.e. `std::vector` and `RVec` fields, are
+returned as a pair of an array of offsets, with one more element than the
+number of entries, and an array with the items of all the entries. Sub-fields
+of records can be read as well, by their qualified name (e.g. `"point.x"`).
+Without a list of fields, all the top-level fields with a supported type are
+read. The optional entry range is a pair of the first entry and the entry after
+the last one.
+
+Large RNTuples can be read in chunks of a given number of entries with
+`iterate()`, which yields a dictionary of arrays per chunk. By default, every
+chunk is a cluster of the RNTuple:
+\code{.py}
+for chunk in reader.iterate(["pt", "jet_eta"], step=100000):
+    train(chunk["pt"], *chunk["jet_eta"])
+\endcode
+
+The values are read in C++ cluster by cluster, with bulk reads straight into
+the memory of the arrays. If implicit multi-threading was enabled with
+`ROOT.EnableImplicitMT()` before the RNTuple was opened, the pages of each
+cluster are decompressed in parallel. Fields of other types can be read with
+the RNTupleReader views or with RDataFrame.
+\htmlonly
+</div>
+\endhtmlonly
+*/
+'''
+
+import bisect
+
+import cppyy
+
+from . import pythonization
+from ._ttree import CollectionArrays
+
+
+# On-disk type names of the fields that can be read into NumPy arrays
+_numpy_types = {
+    "bool": "bool",
+    "char": "int8",
+    "std::int8_t": "int8",
+    "std::uint8_t": "uint8",
+    "std::int16_t": "int16",
+    "std::uint16_t": "uint16",
+    "std::int32_t": "int32",
+    "std::uint32_t": "uint32",
+    "std::int64_t": "int64",
+    "std::uint64_t": "uint64",
+    "float": "float32",
+    "double": "float64",
+}
+
+_collection_types = ("std::vector<", "ROOT::VecOps::RVec<")
+
+_array_readers_code = """
+#include <ROOT/RNTupleReader.hxx>
+#include <ROOT/RNTupleView.hxx>
+#include <ROOT/RVec.hxx>
+
+#include <algorithm>
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace ROOT {
+namespace Internal {
+namespace PyROOT {
+
+/// Maps entry numbers to the cluster indexes used by the bulk reads, which are confined to a single cluster
+class RNTupleArrayReaderBase {
+protected:
+   /// First entry and id of every cluster, ordered by entry
+   std::vector<std::pair<ROOT::Experimental::NTupleSize_t, ROOT::Experimental::DescriptorId_t>> fClusters;
+   /// Requests all the values of a bulk
+   std::unique_ptr<bool[]> fMask;
+   std::size_t fMaskSize = 0;
+
+   explicit RNTupleArrayReaderBase(ROOT::Experimental::RNTupleReader &reader)
+   {
+      for (const auto &cluster : reader.GetDescriptor().GetClusterIterable())
+         fClusters.emplace_back(cluster.GetFirstEntryIndex(), cluster.GetId());
+      std::sort(fClusters.begin(), fClusters.end());
+   }
+
+   ROOT::Experimental::RClusterIndex GetClusterIndex(ROOT::Experimental::NTupleSize_t entry) const
+   {
+      auto itr = std::upper_bound(fClusters.begin(), fClusters.end(), entry,
+                                  [](ROOT::Experimental::NTupleSize_t e, const auto &c) { return e < c.first; });
+      --itr;
+      return ROOT::Experimental::RClusterIndex(itr->second, entry - itr->first);
+   }
+
+   const bool *GetMask(std::size_t size)
+   {
+      if (size > fMaskSize) {
+         fMask = std::make_unique<bool[]>(size);
+         std::fill(fMask.get(), fMask.get() + size, true);
+         fMaskSize = size;
+      }
+      return fMask.get();
+   }
+};
+
+/// Reads a field of the fundamental type T into an array, with bulk reads into the memory of the array
+template <typename T>
+class RNTupleArrayReader : public RNTupleArrayReaderBase {
+   ROOT::Experimental::RNTupleView<T, false> fView;
+   ROOT::Experimental::RFieldBase::RBulk fBulk;
+
+public:
+   RNTupleArrayReader(ROOT::Experimental::RNTupleReader &reader, const std::string &fieldName)
+      : RNTupleArrayReaderBase(reader),
+        fView(reader.GetView<T>(fieldName)),
+        fBulk(const_cast<ROOT::Experimental::RField<T> &>(fView.GetField()).CreateBulk())
+   {
+   }
+
+   /// Reads the values of the entries [first, last), which belong to the same cluster, into the array `to`
+   void Read(ROOT::Experimental::NTupleSize_t first, ROOT::Experimental::NTupleSize_t last, void *to)
+   {
+      const std::size_t size = last - first;
+      fBulk.AdoptBuffer(to, size);
+      fBulk.ReadBulk(GetClusterIndex(first), GetMask(size), size);
+   }
+};
+
+/// Reads a collection of the fundamental type T into an array of offsets and an array of items. The collection is
+/// read as RVec<T>, which has the same on-disk representation as std::vector<T> and whose bulk read places the items
+/// of all the entries next to each other.
+template <typename T>
+class RNTupleCollectionArrayReader : public RNTupleArrayReaderBase {
+   ROOT::Experimental::RNTupleView<ROOT::RVec<T>, false> fView;
+   ROOT::Experimental::RFieldBase::RBulk fBulk;
+   const T *fItems = nullptr;
+   std::size_t fNItems = 0;
+
+public:
+   RNTupleCollectionArrayReader(ROOT::Experimental::RNTupleReader &reader, const std::string &fieldName)
+      : RNTupleArrayReaderBase(reader),
+        fView(reader.GetView<ROOT::RVec<T>>(fieldName)),
+        fBulk(const_cast<ROOT::Experimental::RField<ROOT::RVec<T>> &>(fView.GetField()).CreateBulk())
+   {
+   }
+
+   /// Reads the collections of the entries [first, last), which belong to the same cluster. The end offset of every
+   /// collection, counted from `firstOffset`, is written to the array `offsets`. Returns the number of items, which
+   /// are copied by CopyItems().
+   std::size_t ReadCollections(ROOT::Experimental::NTupleSize_t first, ROOT::Experimental::NTupleSize_t last,
+                               void *offsets, std::int64_t firstOffset)
+   {
+      const std::size_t size = last - first;
+      auto values = static_cast<const ROOT::RVec<T> *>(fBulk.ReadBulk(GetClusterIndex(first), GetMask(size), size));
+      auto typedOffsets = static_cast<std::int64_t *>(offsets);
+      fItems = values[0].data();
+      fNItems = 0;
+      for (std::size_t i = 0; i < size; ++i) {
+         fNItems += values[i].size();
+         typedOffsets[i] = firstOffset + fNItems;
+      }
+      return fNItems;
+   }
+
+   /// Copies the items read by the last call to ReadCollections() to the array `to`
+   void CopyItems(void *to) const { std::copy(fItems, fItems + fNItems, static_cast<T *>(to)); }
+};
+
+} // namespace PyROOT
+} // namespace Internal
+} // namespace ROOT
+"""
+
+_array_readers_declared = False
+
+
+def _declare_array_readers():
+    global _array_readers_declared
+    if not _array_readers_declared:
+        cppyy.cppdef(_array_readers_code)
+        _array_readers_declared = True
+
+
+def _field_type(desc, name):
+    """
+    Returns the C++ type of the values of field `name` and whether the field is
+    a collection of such values. Raises if the field can not be read into
+    NumPy arrays.
+    """
+    ns = cppyy.gbl.ROOT.Experimental
+    field_id = desc.FindFieldId(name)
+    if field_id == ns.kInvalidDescriptorId:
+        raise ValueError("no field named '{}' in RNTuple '{}'".format(name, desc.GetName()))
+
+    # Only fields with one value per entry can be read, i.e. top-level fields
+    # and the sub-fields of top-level records
+    field = desc.GetFieldDescriptor(field_id)
+    parent_id = field.GetParentId()
+    while parent_id != desc.GetFieldZeroId():
+        parent = desc.GetFieldDescriptor(parent_id)
+        if parent.GetStructure() != ns.ENTupleStructure.kRecord:
+            raise TypeError("field '{}' is part of the collection '{}', which has to be read instead".format(
+                name, desc.GetQualifiedFieldName(parent_id)))
+        parent_id = parent.GetParentId()
+
+    type_name = str(field.GetTypeName())
+    if type_name in _numpy_types:
+        return type_name, False
+    if type_name.startswith(_collection_types):
+        item_type = str(desc.GetFieldDescriptor(field.GetLinkIds()[0]).GetTypeName())
+        if item_type in _numpy_types:
+            return item_type, True
+    raise TypeError("field '{}' of type '{}' can not be read into NumPy arrays, only fundamental types and "
+                    "collections of fundamental types are supported".format(name, type_name))
+
+
+class _FieldReader(object):
+    """Reads the values of a field, cluster by cluster, into NumPy arrays."""
+
+    def __init__(self, reader, name, cpp_type, is_collection):
+        import numpy
+
+        self._dtype = numpy.dtype(_numpy_types[cpp_type])
+        self._is_collection = is_collection
+        ns = cppyy.gbl.ROOT.Internal.PyROOT
+        if is_collection:
+            klass = ns.RNTupleCollectionArrayReader[cpp_type]
+            klass.ReadCollections.__release_gil__ = True
+            klass.CopyItems.__release_gil__ = True
+        else:
+            klass = ns.RNTupleArrayReader[cpp_type]
+            klass.Read.__release_gil__ = True
+        self._reader = klass(reader, name)
+
+    def start(self, nentries):
+        import numpy
+
+        self._pos = 0
+        if self._is_collection:
+            self._offsets = numpy.empty(nentries + 1, dtype=numpy.int64)
+            self._offsets[0] = 0
+            self._contents = []
+            self._nitems = 0
+        else:
+            self._values = numpy.empty(nentries, dtype=self._dtype)
+
+    def read(self, first, last):
+        # [first, last) is a non-empty range within a cluster
+        if self._is_collection:
+            nitems = self._reader.ReadCollections(first, last, self._offsets[self._pos + 1:], self._nitems)
+            content = self._new_array(nitems)
+            if nitems:
+                self._reader.CopyItems(content)
+            self._contents.append(content)
+            self._nitems += nitems
+        else:
+            self._reader.Read(first, last, self._values[self._pos:])
+        self._pos += last - first
+
+    def finish(self):
+        import numpy
+
+        if not self._is_collection:
+            return self._values
+        if len(self._contents) == 1:
+            content = self._contents[0]
+        elif self._contents:
+            content = numpy.concatenate(self._contents)
+        else:
+            content = self._new_array(0)
+        return CollectionArrays(self._offsets, content)
+
+    def _new_array(self, size):
+        import numpy
+
+        return numpy.empty(size, dtype=self._dtype)
+
+
+def _make_field_readers(reader, fields):
+    # Early check for numpy
+    try:
+        import numpy
+    except:
+        raise ImportError("Failed to import numpy during call of RNTupleReader.arrays.")
+
+    if isinstance(fields, str):
+        raise TypeError("The fields argument requires a list of strings")
+
+    desc = reader.GetDescriptor()
+    if fields is None:
+        types = {}
+        for field in desc.GetTopLevelFields():
+            name = str(field.GetFieldName())
+            try:
+                types[name] = _field_type(desc, name)
+            except TypeError:
+                pass
+    else:
+        types = {name: _field_type(desc, name) for name in fields}
+
+    _declare_array_readers()
+    return {name: _FieldReader(reader, name, *types[name]) for name in types}
+
+
+def _cluster_starts(reader):
+    return sorted(cluster.GetFirstEntryIndex() for cluster in reader.GetDescriptor().GetClusterIterable())
+
+
+def _entry_range(reader, entry_range):
+    nentries = reader.GetNEntries()
+    if entry_range is None:
+        return 0, nentries
+    first, last = entry_range
+    if last is None:
+        last = nentries
+    if not 0 <= first <= last <= nentries:
+        raise ValueError("invalid entry range ({}, {}) for an RNTuple with {} entries".format(first, last, nentries))
+    return first, last
+
+
+def _read_arrays(field_readers, cluster_starts, first, last):
+    # The fields are read cluster by cluster, so that every cluster is loaded
+    # and decompressed only once
+    for field_reader in field_readers.values():
+        field_reader.start(last - first)
+    boundaries = cluster_starts[bisect.bisect_right(cluster_starts, first) : bisect.bisect_left(cluster_starts, last)]
+    for begin, end in zip([first] + boundaries, boundaries + [last]):
+        if begin == end:
+            continue
+        for field_reader in field_readers.values():
+            field_reader.read(begin, end)
+    return {name: field_reader.finish() for name, field_reader in field_readers.items()}
+
+
+def _RNTupleReader_arrays(self, fields=None, entry_range=None):
+    """
+    Reads fields of the RNTuple into NumPy arrays.
+
+    Parameters:
+        fields: names of the fields to read. By default, all the top-level
+            fields with a supported type are read.
+        entry_range: pair of the first entry and the entry after the last one
+            to read. By default, all the entries are read.
+
+    Returns:
+        dict: the field names as keys, and as values NumPy arrays for fields of
+            fundamental type and CollectionArrays (pairs of offsets and content
+            arrays) for collections.
+    """
+    field_readers = _make_field_readers(self, fields)
+    first, last = _entry_range(self, entry_range)
+    return _read_arrays(field_readers, _cluster_starts(self), first, last)
+
+
+def _RNTupleReader_iterate(self, fields=None, step=None, entry_range=None):
+    """
+    Reads fields of the RNTuple into NumPy arrays, in chunks of entries.
+
+    Parameters:
+        fields: names of the fields to read. By default, all the top-level
+            fields with a supported type are read.
+        step: number of entries per chunk. By default, every chunk is a
+            cluster of the RNTuple.
+        entry_range: pair of the first entry and the entry after the last one
+            to read. By default, all the entries are read.
+
+    Returns:
+        generator: yields a dictionary of arrays, as returned by arrays(), per
+            chunk.
+    """
+    if step is not None and step <= 0:
+        raise ValueError("The step has to be a positive number of entries")
+
+    field_readers = _make_field_readers(self, fields)
+    first, last = _entry_range(self, entry_range)
+    cluster_starts = _cluster_starts(self)
+    if step is None:
+        boundaries = [start for start in cluster_starts if first < start < last]
+    else:
+        boundaries = list(range(first + step, last, step))
+
+    def chunks():
+        if first == last:
+            return
+        for begin, end in zip([first] + boundaries, boundaries + [last]):
+            yield _read_arrays(field_readers, cluster_starts, begin, end)
+
+    return chunks()
+
+
+@pythonization("RNTupleReader", ns="ROOT::Experimental")
+def pythonize_rntuplereader(klass):
+    # Parameters:
+    # klass: class to be pythonized
+
+    # Bulk reads into NumPy arrays
+    klass.arrays = _RNTupleReader_arrays
+    klass.iterate = _RNTupleReader_iterate
@@ -0,0 +1,416 @@
+################################################################################
+# Copyright (C) 1995-2026, Rene Brun and Fons Rademakers.                      #
+# All rights reserved.                                                         #
+#                                                                              #
+# For the licensing terms see $ROOTSYS/LICENSE.                                #
+# For the list of contributors see $ROOTSYS/README/CREDITS.                    #
+################################################################################
+
+r'''
+/**
+\class ROOT::Experimental::RNTupleWriter
+\brief \parblock \endparblock
+\htmlonly
+<div class="pyrootbox">
+\endhtmlonly
+## PyROOT
+
+Batches of entries can be filled into an RNTupleWriter, or into an
+RNTupleFillContext of an RNTupleParallelWriter, from NumPy arrays with
+`fill_arrays()`. It takes a dictionary with the names of the top-level fields
+as keys and an array per field, in the format returned by
+`RNTupleReader.arrays()`: a NumPy array for fields of fundamental type, and a
+pair of an array of offsets and an array of items for `std::vector` and `RVec`
+fields. The items of entry i are `content[offsets[i]:offsets[i + 1]]`.
+\code{.py}
+model = ROOT.Experimental.RNTupleModel.CreateBare()
+model.MakeField["float"]("pt")
+model.MakeField["std::vector<float>"]("jet_eta")
+writer = ROOT.Experimental.RNTupleWriter.Recreate(ROOT.std.move(model), "ntpl", "data.root")
+
+writer.fill_arrays({"pt": pt, "jet_eta": (offsets, eta)})
+\endcode
+
+Arrays of another type than the one of the field are converted. An Arrow
+table or record batch can be given instead of the dictionary, with primitive
+and list columns without nulls.
+
+The entries are filled in C++ with the GIL released, so that several Python
+threads can fill their own RNTupleFillContext of an RNTupleParallelWriter in
+parallel. `RNTupleWriter.write_table()` does this for a complete table: it
+creates the model from the types of the arrays and writes the RNTuple, in
+parallel if a number of threads is given:
+\code{.py}
+ROOT.Experimental.RNTupleWriter.write_table({"pt": pt, "jet_eta": (offsets, eta)}, "ntpl", "data.root", nthreads=4)
+\endcode
+
+When writing in parallel, the entries written by different threads may be
+interleaved in the RNTuple by cluster.
+\htmlonly
+</div>
+\endhtmlonly
+*/
+'''
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import cppyy
+
+from . import pythonization
+from ._rntuple import CollectionArrays, _collection_types, _numpy_types
+
+
+# C++ types of the fields created for NumPy arrays
+_cpp_types = {
+    "bool": "bool",
+    "int8": "std::int8_t",
+    "uint8": "std::uint8_t",
+    "int16": "std::int16_t",
+    "uint16": "std::uint16_t",
+    "int32": "std::int32_t",
+    "uint32": "std::uint32_t",
+    "int64": "std::int64_t",
+    "uint64": "std::uint64_t",
+    "float32": "float",
+    "float64": "double",
+}
+
+_array_fillers_code = """
+#include <ROOT/REntry.hxx>
+#include <ROOT/RNTupleFillContext.hxx>
+#include <ROOT/RNTupleWriter.hxx>
+
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace ROOT {
+namespace Internal {
+namespace PyROOT {
+
+/// Sets the value of a top-level field in an entry from the values of all the entries in arrays
+class RNTupleArrayColumnBase {
+public:
+   virtual ~RNTupleArrayColumnBase() = default;
+   /// Sets the value of the field to the one of entry `i`
+   virtual void SetValue(std::size_t i) = 0;
+};
+
+/// Column of a field of the fundamental type T
+template <typename T>
+class RNTupleArrayColumn final : public RNTupleArrayColumnBase {
+   const T *fValues;
+   std::shared_ptr<T> fValue;
+
+public:
+   RNTupleArrayColumn(const ROOT::Experimental::REntry &entry, const std::string &fieldName, const void *values)
+      : fValues(static_cast<const T *>(values)), fValue(entry.GetPtr<T>(fieldName))
+   {
+   }
+
+   void SetValue(std::size_t i) final { *fValue = fValues[i]; }
+};
+
+/// Column of a collection field, given by the offsets of the items of every entry and the items
+template <typename ContainerT>
+class RNTupleCollectionArrayColumn final : public RNTupleArrayColumnBase {
+   using Item_t = typename ContainerT::value_type;
+
+   const std::int64_t *fOffsets;
+   const Item_t *fItems;
+   std::shared_ptr<ContainerT> fValue;
+
+public:
+   RNTupleCollectionArrayColumn(const ROOT::Experimental::REntry &entry, const std::string &fieldName,
+                                const void *offsets, const void *items)
+      : fOffsets(static_cast<const std::int64_t *>(offsets)),
+        fItems(static_cast<const Item_t *>(items)),
+        fValue(entry.GetPtr<ContainerT>(fieldName))
+   {
+   }
+
+   void SetValue(std::size_t i) final { fValue->assign(fItems + fOffsets[i], fItems + fOffsets[i + 1]); }
+};
+
+/// Fills the entries given by arrays with the values of the top-level fields into an RNTupleWriter or an
+/// RNTupleFillContext
+template <typename WriterT>
+class RNTupleArrayFiller {
+   WriterT &fWriter;
+   std::unique_ptr<ROOT::Experimental::REntry> fEntry;
+   std::vector<std::unique_ptr<RNTupleArrayColumnBase>> fColumns;
+
+public:
+   explicit RNTupleArrayFiller(WriterT &writer) : fWriter(writer), fEntry(writer.CreateEntry()) {}
+
+   /// Returns the names and the type names of the top-level fields
+   std::vector<std::pair<std::string, std::string>> GetFields() const
+   {
+      std::vector<std::pair<std::string, std::string>> fields;
+      for (const auto &value : *fEntry)
+         fields.emplace_back(value.GetField().GetFieldName(), value.GetField().GetTypeName());
+      return fields;
+   }
+
+   template <typename T>
+   void AddColumn(const std::string &fieldName, const void *values)
+   {
+      fColumns.emplace_back(std::make_unique<RNTupleArrayColumn<T>>(*fEntry, fieldName, values));
+   }
+
+   template <typename ContainerT>
+   void AddCollectionColumn(const std::string &fieldName, const void *offsets, const void *items)
+   {
+      fColumns.emplace_back(
+         std::make_unique<RNTupleCollectionArrayColumn<ContainerT>>(*fEntry, fieldName, offsets, items));
+   }
+
+   /// Fills the entries [first, last) of the arrays
+   void Fill(std::size_t first, std::size_t last)
+   {
+      for (auto i = first; i < last; ++i) {
+         for (auto &column : fColumns)
+            column->SetValue(i);
+         fWriter.Fill(*fEntry);
+      }
+   }
+
+   void CommitCluster() { fWriter.CommitCluster(); }
+};
+
+} // namespace PyROOT
+} // namespace Internal
+} // namespace ROOT
+"""
+
+_array_fillers_declared = False
+_array_fillers_lock = threading.Lock()
+
+
+def _declare_array_fillers():
+    global _array_fillers_declared
+    # Writers can be filled from several threads, but the code can only be
+    # declared once
+    with _array_fillers_lock:
+        if not _array_fillers_declared:
+            cppyy.cppdef(_array_fillers_code)
+            _array_fillers_declared = True
+
+
+def _filler_class(writer_type):
+    """
+    Returns the C++ class that fills entries into a writer of type
+    `writer_type`, instantiating it if needed.
+    """
+    _declare_array_fillers()
+    with _array_fillers_lock:
+        klass = cppyy.gbl.ROOT.Internal.PyROOT.RNTupleArrayFiller[writer_type]
+        klass.Fill.__release_gil__ = True
+        klass.CommitCluster.__release_gil__ = True
+    return klass
+
+
+def _arrow_columns(data):
+    # Columns of an Arrow table or record batch, as NumPy arrays
+    import numpy
+    import pyarrow
+
+    columns = {}
+    for name in data.column_names:
+        column = data.column(name)
+        if isinstance(column, pyarrow.ChunkedArray):
+            column = column.combine_chunks()
+        if column.null_count:
+            raise ValueError("The Arrow column '{}' has null values, which can not be written".format(name))
+        if pyarrow.types.is_list(column.type) or pyarrow.types.is_large_list(column.type):
+            offsets = numpy.asarray(column.offsets, dtype=numpy.int64)
+            content = column.flatten().to_numpy(zero_copy_only=False)
+            columns[name] = CollectionArrays(offsets - offsets[0], content)
+        else:
+            columns[name] = column.to_numpy(zero_copy_only=False)
+    return columns
+
+
+def _columns(data):
+    """
+    Returns the columns of a dictionary of arrays, or of an Arrow table or
+    record batch, as a dictionary of NumPy arrays and CollectionArrays, and the
+    number of entries.
+    """
+    import numpy
+
+    if type(data).__module__.startswith("pyarrow"):
+        data = _arrow_columns(data)
+
+    columns = {}
+    nentries = None
+    for name, values in data.items():
+        if isinstance(values, (tuple, list)):
+            offsets, content = values
+            offsets = numpy.asarray(offsets)
+            content = numpy.asarray(content)
+            if offsets.ndim != 1 or len(offsets) == 0:
+                raise ValueError("The offsets of column '{}' have to be a non-empty one-dimensional array".format(name))
+            if offsets[0] < 0 or offsets[-1] > len(content) or (numpy.diff(offsets) < 0).any():
+                raise ValueError("The offsets of column '{}' do not match its content".format(name))
+            values = CollectionArrays(offsets, content)
+            size = len(offsets) - 1
+        else:
+            values = numpy.asarray(values)
+            if values.ndim != 1:
+                raise ValueError("The array of column '{}' has to be one-dimensional".format(name))
+            size = len(values)
+        if nentries is None:
+            nentries = size
+        elif size != nentries:
+            raise ValueError("The columns have different numbers of entries ({} and {})".format(nentries, size))
+        columns[name] = values
+    return columns, nentries or 0
+
+
+def _make_filler(writer, klass, columns):
+    """
+    Returns a C++ filler of class `klass` of entries from the columns into
+    `writer`, and the arrays it reads from, which have to be kept alive while
+    filling.
+    """
+    import numpy
+
+    filler = klass(writer)
+
+    fields = {str(field.first): str(field.second) for field in filler.GetFields()}
+    for name in columns:
+        if name not in fields:
+            raise ValueError("no top-level field named '{}' in the model".format(name))
+    for name in fields:
+        if name not in columns:
+            raise ValueError("no array for the field '{}'".format(name))
+
+    arrays = []
+    for name, type_name in fields.items():
+        values = columns[name]
+        item_type = type_name[type_name.find("<") + 1 : -1] if type_name.startswith(_collection_types) else None
+        if type_name in _numpy_types and not isinstance(values, CollectionArrays):
+            values = numpy.ascontiguousarray(values, dtype=_numpy_types[type_name])
+            arrays.append(values)
+            if len(values):
+                filler.AddColumn[type_name](name, values)
+        elif item_type in _numpy_types and isinstance(values, CollectionArrays):
+            offsets = numpy.ascontiguousarray(values.offsets, dtype=numpy.int64)
+            content = numpy.ascontiguousarray(values.content, dtype=_numpy_types[item_type])
+            arrays.extend((offsets, content))
+            filler.AddCollectionColumn[type_name](name, offsets, content if len(content) else cppyy.nullptr)
+        else:
+            raise TypeError("field '{}' of type '{}' can not be filled from {}".format(
+                name, type_name, isinstance(values, CollectionArrays) and "offsets and content arrays" or "an array"))
+    return filler, arrays
+
+
+def _fill_arrays(writer, writer_type, data):
+    columns, nentries = _columns(data)
+    filler, arrays = _make_filler(writer, _filler_class(writer_type), columns)
+    if nentries:
+        filler.Fill(0, nentries)
+
+
+def _make_fill_arrays(writer_type):
+    def fill_arrays(self, data):
+        """
+        Fills entries from arrays with the values of the top-level fields.
+
+        Parameters:
+            data: dictionary with the field names as keys and, as values, NumPy
+                arrays for fields of fundamental type and pairs of offsets and
+                content arrays for collections; or an Arrow table or record
+                batch.
+        """
+        _fill_arrays(self, writer_type, data)
+
+    return fill_arrays
+
+
+def _field_type_name(values):
+    try:
+        if isinstance(values, CollectionArrays):
+            return "std::vector<{}>".format(_cpp_types[values.content.dtype.name])
+        return _cpp_types[values.dtype.name]
+    except KeyError:
+        raise TypeError("arrays of type {} can not be written to an RNTuple".format(
+            (values.content if isinstance(values, CollectionArrays) else values).dtype))
+
+
+def _RNTupleWriter_write_table(data, ntuple_name, storage, options=None, nthreads=1):
+    """
+    Writes a new RNTuple with the columns of a table.
+
+    The model of the RNTuple has a field per column, of the type of the NumPy
+    array or of std::vector of the type of the content array for collections.
+
+    Parameters:
+        data: dictionary with the field names as keys and, as values, NumPy
+            arrays or pairs of offsets and content arrays for collections; or
+            an Arrow table or record batch.
+        ntuple_name: name of the RNTuple.
+        storage: path of the file, which is recreated.
+        options: RNTupleWriteOptions.
+        nthreads: number of threads filling the entries in parallel, with an
+            RNTupleParallelWriter. The order of the entries is only kept with
+            a single thread.
+    """
+    if nthreads < 1:
+        raise ValueError("The number of threads has to be positive")
+
+    columns, nentries = _columns(data)
+    ns = cppyy.gbl.ROOT.Experimental
+    model = ns.RNTupleModel.CreateBare()
+    for name, values in columns.items():
+        model.MakeField[_field_type_name(values)](name)
+    if options is None:
+        options = ns.RNTupleWriteOptions()
+
+    if nthreads == 1:
+        writer = ns.RNTupleWriter.Recreate(cppyy.gbl.std.move(model), ntuple_name, storage, options)
+        _fill_arrays(writer, "ROOT::Experimental::RNTupleWriter", columns)
+        return
+
+    writer = ns.RNTupleParallelWriter.Recreate(cppyy.gbl.std.move(model), ntuple_name, storage, options)
+    # Declared and instantiated before the threads start, which would
+    # otherwise all do it at the same time
+    klass = _filler_class("ROOT::Experimental::RNTupleFillContext")
+
+    def fill(first, last):
+        # The fill context commits its last cluster when destroyed, which has
+        # to happen before the parallel writer is destroyed
+        context = writer.CreateFillContext()
+        filler, arrays = _make_filler(context, klass, columns)
+        filler.Fill(first, last)
+        filler.CommitCluster()
+
+    bounds = [nentries * i // nthreads for i in range(nthreads + 1)]
+    with ThreadPoolExecutor(nthreads) as executor:
+        for result in [executor.submit(fill, first, last) for first, last in zip(bounds[:-1], bounds[1:]) if first < last]:
+            result.result()
+
+
+@pythonization("RNTupleWriter", ns="ROOT::Experimental")
+def pythonize_rntuplewriter(klass, name):
+    # Parameters:
+    # klass: class to be pythonized
+    # name: string containing the name of the class
+
+    # Filling of batches of entries from NumPy arrays
+    klass.fill_arrays = _make_fill_arrays(name)
+    klass.write_table = staticmethod(_RNTupleWriter_write_table)
+
+
+@pythonization("RNTupleFillContext", ns="ROOT::Experimental")
+def pythonize_rntuplefillcontext(klass, name):
+    # Parameters:
+    # klass: class to be pythonized
+    # name: string containing the name of the class
+
+    # Filling of batches of entries from NumPy arrays
+    klass.fill_arrays = _make_fill_arrays(name)
@@ -129,3 +129,70 @@ class RooAbsReal(object):
         if normalizationSet:
             self._getVal_normSet = normalizationSet
         return self._getVal(normalizationSet) if normalizationSet else self._getVal()
+
+    def evaluate_numpy(self, data, normSet=None):
+        """Evaluate the function for many values of its variables at once,
+        using the vectorized computation of the RooFit::Evaluator.
+
+        Args:
+            data (dict): Dictionary with variable names as keys and numpy
+                         arrays of equal length as values. The arrays are
+                         used without copying them if they are C-contiguous
+                         and of type float64. The variables that are not in
+                         the dictionary keep their current value.
+            normSet (RooArgSet, or list/tuple/set of RooAbsArgs):
+                Normalization set, for example the observables of a pdf.
+                `None` means no normalization, like for getVal().
+
+        Returns:
+            numpy.ndarray: The function values, one for each entry in the
+                           input arrays.
+
+        Note:
+            The computation graph is compiled once for a given normalization
+            set and set of input variables, and reused for the next calls.
+        """
+        import ROOT
+        import numpy as np
+
+        if isinstance(normSet, (set, list, tuple)):
+            normSet = ROOT.RooArgSet(normSet)
+        if normSet is None:
+            normSet = ROOT.RooArgSet()
+
+        arrays = {name: np.ascontiguousarray(arr, dtype=np.float64) for name, arr in data.items()}
+        sizes = {len(arr) for arr in arrays.values()}
+        if len(sizes) > 1:
+            raise ValueError("All arrays passed to evaluate_numpy() need to have the same length.")
+        n_entries = sizes.pop() if sizes else 1
+
+        variable_names = {var.GetName() for var in self.getVariables()}
+        unknown = [name for name in arrays if name not in variable_names]
+        if unknown:
+            raise ValueError(
+                "{0} does not depend on the variable(s) {1} passed to evaluate_numpy().".format(self.GetName(), unknown)
+            )
+
+        # The compiled computation graph and the evaluator are cached, because
+        # creating them is much more expensive than evaluating a batch
+        key = (tuple(sorted(arg.GetName() for arg in normSet)), tuple(sorted(arrays)))
+        cache = getattr(self, "_evaluate_numpy_cache", None)
+        if cache is None or cache[0] != key:
+            ROOT.gInterpreter.Declare('#include "RooFit/Evaluator.h"\n#include "RooFit/Detail/NormalizationHelpers.h"')
+            compiled = ROOT.RooFit.Detail.compileForNormSet["RooAbsReal"](self, normSet)
+            evaluator = ROOT.RooFit.Evaluator(compiled.get())
+            cache = (key, compiled, evaluator)
+            self._evaluate_numpy_cache = cache
+
+        evaluator = cache[2]
+        for name, arr in arrays.items():
+            evaluator.setInput(name, ROOT.std.span["const double"](arr, len(arr)), False)
+
+        result = evaluator.run()
+
+        # The memory of the results belongs to the evaluator, so it is copied
+        out = np.array(np.frombuffer(result.data(), dtype=np.float64, count=result.size()))
+        if len(out) == 1 and n_entries != 1:
+            # The function doesn't depend on any of the input arrays
+            out = np.full(n_entries, out[0])
+        return out
@@ -73,15 +73,16 @@ class RooDataHist(object):
     def __len__(self):
         return self.numEntries()
 
-    def _to_array(self, buffer):
+    def _to_array(self, buffer, copy=True):
         # Helper to create a numpy array from a raw array pointer.
         #
-        # Note: The data is copied.
-        #
         # Args:
         #     buffer (cppyy.LowLevelView):
         #         The pointer to the beginning of the array data, usually
         #         obtained from a C++ function that returns a `double *`.
+        #     copy (bool):
+        #         If False, the returned array is a read-only view on the
+        #         memory of the RooDataHist.
         #
         # Returns:
         #     numpy.ndarray
@@ -92,7 +93,9 @@ class RooDataHist(object):
         # doesn't work).
         if not buffer:
             return None
-        a = np.copy(np.frombuffer(buffer, dtype=np.float64, count=len(self)))
+        a = np.frombuffer(buffer, dtype=np.float64, count=len(self))
+        if copy:
+            a = np.copy(a)
         return a.reshape(self.shape)
 
     def _var_is_category(self):
@@ -202,6 +205,10 @@ class RooDataHist(object):
 
         datahist = ROOT.RooDataHist(name, title, variables, binning_name)
 
+        # The bins of the RooDataHist are ordered like the elements of a
+        # C-contiguous array with one dimension per variable
+        hist_weights = np.ascontiguousarray(np.ravel(hist_weights), dtype=np.float64)
+
         if len(datahist) != len(hist_weights):
             raise ValueError("Length of hist_weights array doesn't match the size of the RooDataHist.")
 
@@ -210,26 +217,30 @@ class RooDataHist(object):
                 raise ValueError(
                     "Your input histogram has non-integer weights! You must also provide weights_squared_sum to provide the complete information to RooDataHist.from_numpy()."
                 )
+            sumw2_span = ROOT.std.span["const double"]()
         else:
+            weights_squared_sum = np.ascontiguousarray(np.ravel(weights_squared_sum), dtype=np.float64)
             if len(datahist) != len(weights_squared_sum):
                 raise ValueError("Length of weights_squared_sum array doesn't match the size of the RooDataHist.")
+            sumw2_span = ROOT.std.span["const double"](weights_squared_sum, len(weights_squared_sum))
 
-        for i_bin in range(len(datahist)):
-            if not weights_squared_sum is None:
-                # some reverse-computation that can't be avoided with the current C++ RooDataHist interface
-                wgt_err = np.sqrt(weights_squared_sum[i_bin])
-            else:
-                wgt_err = -1
-
-            datahist.set(i_bin, hist_weights[i_bin], wgt_err)
+        # Fill all bins at once in C++
+        datahist.setWeights(ROOT.std.span["const double"](hist_weights, len(hist_weights)), sumw2_span)
 
         return datahist
 
-    def to_numpy(self):
+    def to_numpy(self, copy=True):
         r"""Converts the weights and bin edges of a RooDataHist to numpy arrays.
 
         Note: The output structure was inspired by numpy.histogramdd.
 
+        Args:
+            copy (bool): If False, the weights are not copied and a read-only
+                         view on the bin storage of the RooDataHist is
+                         returned. Use with caution, as the view is only valid
+                         as long as the RooDataHist exists, and it reflects
+                         later changes of the bin contents.
+
         Returns:
             weight (numpy.ndarray): The weights for each histrogram bin.
             bin_edges (list): A list of `n_dim` arrays describing the bin edges
@@ -253,4 +264,4 @@ class RooDataHist(object):
                     np.copy(np.frombuffer(binning.array(), dtype=np.float64, count=binning.numBoundaries()))
                 )
 
-        return self._to_array(self.weightArray()), bin_edges
+        return self._to_array(self.weightArray(), copy=copy), bin_edges
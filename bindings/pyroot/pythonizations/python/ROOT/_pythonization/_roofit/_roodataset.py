@@ -56,7 +56,7 @@ class RooDataSet(object):
         return self._plotOnXY(*args, **kwargs)
 
     @staticmethod
-    def from_numpy(data, variables, name=None, title=None, weight_name=None):
+    def from_numpy(data, variables, name=None, title=None, weight_name=None, copy=True):
         """Create a RooDataSet from a dictionary of numpy arrays.
         Args:
             data (dict): Dictionary with strings as keys and numpy arrays as
@@ -71,6 +71,18 @@ class RooDataSet(object):
                          empty string.
             weight_name (str): Key of the array in `data` that will be used for
                                the dataset weights.
+            copy (bool): If False, the RooDataSet uses the memory of the numpy
+                         arrays directly instead of copying them, if they are
+                         C-contiguous and of type float64 (int32 for
+                         categories). Other arrays are converted first. The
+                         arrays are kept alive by the Python object of the
+                         RooDataSet. Use with caution: the arrays must not be
+                         modified while the dataset is used, and if the C++
+                         dataset outlives its Python object, the memory is no
+                         longer guaranteed to be valid. The data is copied
+                         anyway if some entries are outside the variable
+                         ranges, or when the dataset gets modified or written
+                         to a file.
 
         Returns:
             RooDataSet
@@ -96,8 +108,6 @@ class RooDataSet(object):
             log.write(b, len(b))
             log.write("\n", 1)
 
-        range_mask = np.ones_like(list(data.values())[0], dtype=bool)
-
         def in_range(arr, variable):
             # For categories, we need to check whether the elements of the
             # array are in the set of category state indices
@@ -106,11 +116,19 @@ class RooDataSet(object):
 
             return (arr >= variable.getMin()) & (arr <= variable.getMax())
 
-        # Get a mask that filters out all entries that are outside the variable definition range
-        range_mask = np.logical_and.reduce([in_range(data[v.GetName()], v) for v in variables])
-        # If all entries are in the range, we don't need a mask
-        if range_mask.all():
-            range_mask = None
+        def all_in_range(arr, variable):
+            # Cheap check that doesn't allocate a mask for real-valued variables
+            if len(arr) == 0:
+                return True
+            if variable.isCategory():
+                return in_range(arr, variable).all()
+            return arr.min() >= variable.getMin() and arr.max() <= variable.getMax()
+
+        # Only compute the mask that filters out all entries that are outside
+        # the variable definition range if there are such entries
+        range_mask = None
+        if not all(all_in_range(data[v.GetName()], v) for v in variables):
+            range_mask = np.logical_and.reduce([in_range(data[v.GetName()], v) for v in variables])
 
         def select_range_and_change_type(arr, dtype):
             if range_mask is not None:
@@ -121,12 +139,21 @@ class RooDataSet(object):
             # the array is already contiguous, which is exactly what we want.
             return np.ascontiguousarray(arr)
 
-        def copy_to_dataset(store_list, np_type, c_type, type_size_in_bytes):
+        # Arrays that the dataset uses without copying. They are attached to
+        # the Python object of the dataset to keep them alive.
+        borrowed_arrays = []
+
+        def copy_to_dataset(store_list, np_type, c_type, type_size_in_bytes, cpp_type):
             for real in store_list:
-                vec = real.data()
                 arg = real.bufArg()
                 arr = select_range_and_change_type(data[arg.GetName()], np_type)
 
+                if not copy:
+                    real.setExternalBuffer(ROOT.std.span["const " + cpp_type](arr, len(arr)))
+                    borrowed_arrays.append(arr)
+                    continue
+
+                vec = real.data()
                 vec.resize(len(arr))
 
                 # The next part works because arr is guaranteed to be C-contiguous
@@ -136,8 +163,11 @@ class RooDataSet(object):
                 end = ctypes.cast(void_p, ctypes.POINTER(c_type))
                 ROOT.std.copy(beg, end, vec.begin())
 
-        copy_to_dataset(dataset.store().realStoreList(), np.float64, ctypes.c_double, 8)
-        copy_to_dataset(dataset.store().catStoreList(), np.int32, ctypes.c_int, 4)
+        copy_to_dataset(dataset.store().realStoreList(), np.float64, ctypes.c_double, 8, "double")
+        copy_to_dataset(dataset.store().catStoreList(), np.int32, ctypes.c_int, 4, "RooAbsCategory::value_type")
+
+        if borrowed_arrays:
+            dataset._numpy_buffers = borrowed_arrays
 
         dataset.store().recomputeSumWeight()
 
@@ -0,0 +1,49 @@
+################################################################################
+# Copyright (C) 1995-2024, Rene Brun and Fons Rademakers.                      #
+# All rights reserved.                                                         #
+#                                                                              #
+# For the licensing terms see $ROOTSYS/LICENSE.                                #
+# For the list of contributors see $ROOTSYS/README/CREDITS.                    #
+################################################################################
+
+from . import pythonization
+
+
+def _HypoTestInverterResult_to_numpy(self):
+    """
+    Return the scanned points as a dictionary of NumPy arrays, sorted by the
+    value of the scanned variable. The dictionary can directly be used to
+    create a pandas DataFrame, for example:
+
+        result = inverter.GetInterval()
+        df = pandas.DataFrame(result.to_numpy())
+
+    Returns:
+        dict: arrays with the keys "x", "cls", "cls_err", "clb", "clb_err",
+            "clsplusb" and "clsplusb_err".
+    """
+    import numpy as np
+
+    columns = {
+        "x": self.GetXValue,
+        "cls": self.CLs,
+        "cls_err": self.CLsError,
+        "clb": self.CLb,
+        "clb_err": self.CLbError,
+        "clsplusb": self.CLsplusb,
+        "clsplusb_err": self.CLsplusbError,
+    }
+
+    n = self.ArraySize()
+    table = {name: np.array([getter(i) for i in range(n)], dtype=np.float64) for name, getter in columns.items()}
+
+    order = np.argsort(table["x"], kind="stable")
+    return {name: values[order] for name, values in table.items()}
+
+
+@pythonization("HypoTestInverterResult", ns="RooStats")
+def pythonize_hypotestinverterresult(klass):
+    # Parameters:
+    # klass: class to be pythonized
+
+    klass.to_numpy = _HypoTestInverterResult_to_numpy
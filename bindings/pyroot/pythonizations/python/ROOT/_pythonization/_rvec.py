@@ -59,6 +59,30 @@ npy[0] = 42
 print(rvec) # { 42.000000, 2.0000000, 3.0000000 }
 \endcode
 
+### Vectorized calls of C++ functions
+
+Calling a C++ function element by element from Python pays the cost of a function call dispatch
+for every element. ROOT.VecOps.Vectorize instead generates and just-in-time compiles a C++ loop
+that calls the function over all the elements of Numpy arrays, similar to a Numpy ufunc. The
+arguments are broadcast against each other following the Numpy rules, and the function can be
+given as a C++ function or bound method accessed through ROOT, or as its fully qualified name.
+The loop is compiled once per combination of argument types and cached.
+
+\code{.py}
+gaus = ROOT.VecOps.Vectorize(ROOT.Math.gaussian_pdf)
+x = numpy.linspace(-5, 5, 1000000)
+y = gaus(x, 2., 0.5)    # numpy array with the values of gaussian_pdf(x[i], 2., 0.5)
+
+# write into an existing array and run in chunks on 4 threads
+gaus(x, 2., 0.5, out=y, nthreads=4)
+\endcode
+
+The elements are passed to the function as they are, letting C++ select the overload. A
+`signature` like `"double, double, double"` converts them to the given types before the call
+instead. The result is a Numpy array with the return type of the function, unless an `out`
+array is given, and only functions returning fundamental types are supported. Running on multiple
+threads (`nthreads`, or `nthreads=None` for all cores) requires the function to be thread-safe.
+
 \htmlonly
 </div>
 \endhtmlonly
@@ -138,6 +162,21 @@ def _AsRVec(arr):
     return out
 
 
+def _Vectorize(func, signature=None, nthreads=1, chunksize=65536):
+    r"""
+    Return a callable applying a C++ function element-wise to Numpy arrays.
+
+    \param[in] func C++ function, bound method or fully qualified function name
+    \param[in] signature optional C++ argument types the elements are converted to
+    \param[in] nthreads number of threads to run the loop on, or None for all cores
+    \param[in] chunksize number of elements processed per chunk when running on multiple threads
+
+    The C++ loop is just-in-time compiled per combination of argument types
+    with cppyy.vectorize, see its documentation for the details.
+    """
+    return cppyy.vectorize(func, signature, nthreads, chunksize)
+
+
 def get_array_interface(self):
     cppname = type(self).__cpp_name__
     for dtype in _array_interface_dtype_map:
@@ -10,57 +10,111 @@
 # For the list of contributors see $ROOTSYS/README/CREDITS.                    #
 ################################################################################
 
-import sys
-import cppyy
-from cppyy.gbl import gSystem
+import functools
+import importlib
 
 from .. import pythonization
 
-from libROOTPythonizations import gROOT
+# The TMVA pythonization modules are only imported when one of their classes
+# or functions is used for the first time, since this package is imported
+# together with the ROOT module. This dictionary maps the public names of
+# this package to the submodule that defines them.
+_lazy_attributes = {
+    "Factory": "_factory",
+    "DataLoader": "_dataloader",
+    "CrossValidation": "_crossvalidation",
+    "Compute": "_rbdt",
+    "CreateNumPyGenerators": "_batchgenerator",
+    "CreateTFDatasets": "_batchgenerator",
+    "CreatePyTorchGenerators": "_batchgenerator",
+    "RModel_GNN": "_gnn",
+    "RModel_GraphIndependent": "_gnn",
+    "DeclareSofieFunctor": "_sofie",
+    "DeclareSofieRVecFunctor": "_sofie",
+    "get_array_interface": "_rtensor",
+    "add_array_interface_property": "_rtensor",
+    "RTensorGetitem": "_rtensor",
+    "_AsRTensor": "_rtensor",
+    "SaveXGBoost": "_tree_inference",
+}
+
+
+def __getattr__(name):
+    if name not in _lazy_attributes:
+        raise AttributeError("module {} has no attribute {}".format(__name__, name))
+    module = importlib.import_module("." + _lazy_attributes[name], __name__)
+    attr = getattr(module, name)
+    globals()[name] = attr
+    return attr
+
+
+class _LazyFunction(object):
+    """
+    Stand-in for a function of a TMVA pythonization module, which is injected
+    in a TMVA namespace. The module is imported at the first call.
+    """
+
+    def __init__(self, name):
+        self.__name__ = name
+        self._func = None
+
+    def _resolve(self):
+        if self._func is None:
+            self._func = __getattr__(self.__name__)
+        return self._func
+
+    @property
+    def __doc__(self):
+        return self._resolve().__doc__
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        return "<function {}>".format(self.__name__)
 
-from ._factory import Factory
-from ._dataloader import DataLoader
-from ._crossvalidation import CrossValidation
 
-from ._rbdt import Compute, pythonize_rbdt
+@functools.lru_cache(maxsize=None)
+def _has_rdf():
+    from libROOTPythonizations import gROOT
+
+    return "dataframe" in gROOT.GetConfigFeatures()
 
-from ._batchgenerator import (
-    CreateNumPyGenerators,
-    CreateTFDatasets,
-    CreatePyTorchGenerators,
-)
 
 python_batchgenerator_functions = [
-    CreateNumPyGenerators,
-    CreateTFDatasets,
-    CreatePyTorchGenerators,
+    "CreateNumPyGenerators",
+    "CreateTFDatasets",
+    "CreatePyTorchGenerators",
 ]
 
 def inject_rbatchgenerator(ns):
-    for python_func in python_batchgenerator_functions:
-        func_name = python_func.__name__
-        setattr(ns.Experimental, func_name, python_func)
+    for func_name in python_batchgenerator_functions:
+        setattr(ns.Experimental, func_name, _LazyFunction(func_name))
 
     return ns
 
-from ._gnn import RModel_GNN, RModel_GraphIndependent
 
-hasRDF = "dataframe" in gROOT.GetConfigFeatures()
-if hasRDF:
-    from ._rtensor import get_array_interface, add_array_interface_property, RTensorGetitem, pythonize_rtensor, _AsRTensor
+def pythonize_tmva_namespace(ns):
+    """
+    Inject the Python functions of the TMVA pythonizations in the TMVA
+    namespace. Their modules are imported only when they are first called.
+    """
 
-#this should be available only when xgboost is there ?
-# We probably don't need a protection here since the code is run only when there is xgboost
-from ._tree_inference import SaveXGBoost
+    ns.Experimental.DeclareSofieFunctor = _LazyFunction("DeclareSofieFunctor")
+    ns.Experimental.DeclareSofieRVecFunctor = _LazyFunction("DeclareSofieRVecFunctor")
 
+    if _has_rdf():
+        inject_rbatchgenerator(ns)
+        ns.Experimental.AsRTensor = _LazyFunction("_AsRTensor")
+        #this should be available only when xgboost is there ?
+        # We probably don't need a protection here since the code is run only when there is xgboost
+        ns.Experimental.SaveXGBoost = _LazyFunction("SaveXGBoost")
+
+    return ns
 
-# list of python classes that are used to pythonize TMVA classes
-python_classes = [Factory, DataLoader, CrossValidation]
 
-# create a dictionary for convenient access to python classes
-python_classes_dict = dict()
-for python_class in python_classes:
-    python_classes_dict[python_class.__name__] = python_class
+# list of python classes that are used to pythonize TMVA classes
+python_classes = ["Factory", "DataLoader", "CrossValidation"]
 
 
 def get_defined_attributes(klass, consider_base_classes=False):
@@ -139,11 +193,11 @@ def pythonize_tmva(klass, name):
     ns_prefix = "TMVA::"
     name = name[len(ns_prefix) : len(name)]
 
-    if not name in python_classes_dict:
+    if not name in python_classes:
         print("Error - class ", name, "is not in the pythonization list")
         return
 
-    python_klass = python_classes_dict[name]
+    python_klass = __getattr__(name)
 
     # list of functions to pythonize, which are assumed to be all functions in
     # that are manually defined in the Python classes or their superclasses
@@ -177,3 +231,34 @@ def pythonize_tmva(klass, name):
         rebind_attribute(klass, python_klass, func_name)
 
     return
+
+
+@pythonization("RBDT", ns="TMVA::Experimental", is_prefix=True)
+def pythonize_rbdt(klass):
+    from ._rbdt import pythonize_rbdt
+
+    pythonize_rbdt(klass)
+
+
+@pythonization("RTensor<", ns="TMVA::Experimental", is_prefix=True)
+def pythonize_rtensor(klass, name):
+    if not _has_rdf():
+        return
+
+    from ._rtensor import pythonize_rtensor
+
+    pythonize_rtensor(klass, name)
+
+
+@pythonization("RModel_GNN", ns="TMVA::Experimental::SOFIE")
+def pythonize_gnn_parse(klass):
+    from ._gnn import pythonize_gnn_parse
+
+    pythonize_gnn_parse(klass)
+
+
+@pythonization("RModel_GraphIndependent", ns="TMVA::Experimental::SOFIE")
+def pythonize_graph_independent_parse(klass):
+    from ._gnn import pythonize_graph_independent_parse
+
+    pythonize_graph_independent_parse(klass)
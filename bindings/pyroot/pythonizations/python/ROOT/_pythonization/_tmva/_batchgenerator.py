@@ -125,6 +125,9 @@ class BaseGenerator:
         validation_split: float = 0.0,
         max_chunks: int = 0,
         shuffle: bool = True,
+        cache_chunks: bool = False,
+        cache_file: str = "",
+        cache_max_memory: int = 0,
     ):
         """Wrapper around the Cpp RBatchGenerator
 
@@ -159,6 +162,21 @@ class BaseGenerator:
             shuffle (bool):
                 Batches consist of random events and are shuffled every epoch.
                 Defaults to True.
+            cache_chunks (bool):
+                Keep the filtered chunks of the first epoch in memory, so that
+                later epochs only redo the shuffling and batching instead of
+                reading and filtering the files again. Defaults to False.
+            cache_file (str, optional):
+                Path of a local file in which the filtered chunks of the first
+                epoch are stored and memory-mapped in later epochs. Enables
+                the chunk caching. Useful if the filtered dataset does not
+                fit in memory. The file is removed when the generator is
+                destroyed.
+            cache_max_memory (int, optional):
+                Maximum number of bytes of filtered chunks kept in memory by
+                the chunk caching. Chunks that do not fit anymore are read
+                from the files again in every epoch. Defaults to 0, meaning
+                no limit.
         """
 
         try:
@@ -265,6 +283,9 @@ class BaseGenerator:
             max_chunks,
             self.num_columns,
             shuffle,
+            cache_chunks,
+            cache_file,
+            cache_max_memory,
         )
 
         atexit.register(self.DeActivate)
@@ -276,6 +297,33 @@ class BaseGenerator:
     def is_active(self):
         return self.generator.IsActive()
 
+    @property
+    def consumer_wait_time(self) -> float:
+        """Total time in seconds spent waiting for the loading thread to
+        publish a training batch"""
+        return self.generator.GetConsumerWaitTime()
+
+    @property
+    def consumer_waits(self) -> int:
+        """Number of training batch requests that had to wait for the
+        loading thread"""
+        return self.generator.GetNumConsumerWaits()
+
+    def ResetConsumerWaitTime(self):
+        """Reset consumer_wait_time and consumer_waits to zero"""
+        self.generator.ResetConsumerWaitTime()
+
+    @property
+    def cache_memory_usage(self) -> int:
+        """Number of bytes of filtered chunks kept in memory by the chunk
+        caching"""
+        return self.generator.GetCacheMemoryUsage()
+
+    @property
+    def cached_chunks(self) -> int:
+        """Number of chunks read from the chunk cache instead of the files"""
+        return self.generator.GetNumCachedChunks()
+
     def Activate(self):
         """Initialize the generator to be used for a loop"""
         self.generator.Activate()
@@ -512,6 +560,18 @@ class TrainRBatchGenerator:
     def weights_column(self) -> str:
         return self.base_generator.weights_column
 
+    @property
+    def consumer_wait_time(self) -> float:
+        return self.base_generator.consumer_wait_time
+
+    @property
+    def consumer_waits(self) -> int:
+        return self.base_generator.consumer_waits
+
+    def ResetConsumerWaitTime(self):
+        """Reset the consumer wait time metrics, e.g. at the start of an epoch"""
+        self.base_generator.ResetConsumerWaitTime()
+
     def __iter__(self):
         self._callable = self.__call__()
 
@@ -627,6 +687,9 @@ def CreateNumPyGenerators(
     validation_split: float = 0.0,
     max_chunks: int = 0,
     shuffle: bool = True,
+    cache_chunks: bool = False,
+    cache_file: str = "",
+    cache_max_memory: int = 0,
 ) -> Tuple[TrainRBatchGenerator, ValidationRBatchGenerator]:
     """
     Return two batch generators based on the given ROOT file and tree.
@@ -660,6 +723,15 @@ def CreateNumPyGenerators(
             If not given, the whole file is used
         shuffle (bool):
             randomize the training batches every epoch. Defaults to True
+        cache_chunks (bool):
+            Keep the filtered chunks of the first epoch in memory, and read
+            them from there in later epochs. Defaults to False
+        cache_file (str, optional):
+            Local file to store the filtered chunks of the first epoch in,
+            instead of keeping them in memory. Enables the chunk caching
+        cache_max_memory (int, optional):
+            Maximum number of bytes of filtered chunks kept in memory by the
+            chunk caching. No limit if 0
 
     Returns:
         Tuple[TrainRBatchGenerator, ValidationRBatchGenerator]:
@@ -683,6 +755,9 @@ def CreateNumPyGenerators(
         validation_split,
         max_chunks,
         shuffle,
+        cache_chunks,
+        cache_file,
+        cache_max_memory,
     )
 
     train_generator = TrainRBatchGenerator(
@@ -710,6 +785,9 @@ def CreateTFDatasets(
     validation_split: float = 0.0,
     max_chunks: int = 0,
     shuffle: bool = True,
+    cache_chunks: bool = False,
+    cache_file: str = "",
+    cache_max_memory: int = 0,
 ) -> Tuple[tf.data.Dataset, tf.data.Dataset]:
     """
     Return two Tensorflow Datasets based on the given ROOT file and tree
@@ -743,6 +821,15 @@ def CreateTFDatasets(
             If not given, the whole file is used
         shuffle (bool):
             randomize the training batches every epoch. Defaults to True
+        cache_chunks (bool):
+            Keep the filtered chunks of the first epoch in memory, and read
+            them from there in later epochs. Defaults to False
+        cache_file (str, optional):
+            Local file to store the filtered chunks of the first epoch in,
+            instead of keeping them in memory. Enables the chunk caching
+        cache_max_memory (int, optional):
+            Maximum number of bytes of filtered chunks kept in memory by the
+            chunk caching. No limit if 0
 
     Returns:
         Tuple[TrainRBatchGenerator, ValidationRBatchGenerator]:
@@ -768,6 +855,9 @@ def CreateTFDatasets(
         validation_split,
         max_chunks,
         shuffle,
+        cache_chunks,
+        cache_file,
+        cache_max_memory,
     )
 
     train_generator = TrainRBatchGenerator(
@@ -840,6 +930,9 @@ def CreatePyTorchGenerators(
     validation_split: float = 0.0,
     max_chunks: int = 0,
     shuffle: bool = True,
+    cache_chunks: bool = False,
+    cache_file: str = "",
+    cache_max_memory: int = 0,
 ) -> Tuple[TrainRBatchGenerator, ValidationRBatchGenerator]:
     """
     Return two Tensorflow Datasets based on the given ROOT file and tree
@@ -873,6 +966,15 @@ def CreatePyTorchGenerators(
             If not given, the whole file is used
         shuffle (bool):
             randomize the training batches every epoch. Defaults to True
+        cache_chunks (bool):
+            Keep the filtered chunks of the first epoch in memory, and read
+            them from there in later epochs. Defaults to False
+        cache_file (str, optional):
+            Local file to store the filtered chunks of the first epoch in,
+            instead of keeping them in memory. Enables the chunk caching
+        cache_max_memory (int, optional):
+            Maximum number of bytes of filtered chunks kept in memory by the
+            chunk caching. No limit if 0
 
     Returns:
         Tuple[TrainRBatchGenerator, ValidationRBatchGenerator]:
@@ -896,6 +998,9 @@ def CreatePyTorchGenerators(
         validation_split,
         max_chunks,
         shuffle,
+        cache_chunks,
+        cache_file,
+        cache_max_memory,
     )
 
     train_generator = TrainRBatchGenerator(
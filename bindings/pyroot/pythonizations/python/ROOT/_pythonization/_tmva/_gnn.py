@@ -10,7 +10,6 @@
 # For the list of contributors see $ROOTSYS/README/CREDITS.                    #
 ################################################################################
 
-from .. import pythonization
 import sys
 from cppyy import gbl as gbl_namespace
 
@@ -330,11 +329,9 @@ class RModel_GraphIndependent:
         return graph_independent_model
 
 
-@pythonization("RModel_GNN", ns="TMVA::Experimental::SOFIE")
 def pythonize_gnn_parse(klass):
     setattr(klass, "ParseFromMemory", RModel_GNN.ParseFromMemory)
 
-@pythonization("RModel_GraphIndependent", ns="TMVA::Experimental::SOFIE")
 def pythonize_graph_independent_parse(klass):
     setattr(klass, "ParseFromMemory", RModel_GraphIndependent.ParseFromMemory)
 
@@ -8,7 +8,6 @@
 # For the list of contributors see $ROOTSYS/README/CREDITS.                    #
 ################################################################################
 
-from .. import pythonization
 from cppyy import gbl as gbl_namespace
 
 
@@ -36,7 +35,6 @@ def Compute(self, x):
     return self._OriginalCompute(x)
 
 
-@pythonization("RBDT", ns="TMVA::Experimental", is_prefix=True)
 def pythonize_rbdt(klass):
     # Parameters:
     # klass: class to be pythonized
@@ -7,7 +7,6 @@
 # For the licensing terms see $ROOTSYS/LICENSE.                                #
 # For the list of contributors see $ROOTSYS/README/CREDITS.                    #
 ################################################################################
-from .. import pythonization
 from .._rvec import _array_interface_dtype_map, _get_cpp_type_from_numpy_type
 import cppyy
 import sys
@@ -94,7 +93,7 @@ def get_array_interface(self):
     # We set the pointer to 1 but the value itself is arbitrary and never accessed.
     pointer = cppyy.ll.addressof(self.GetData())
     if pointer == 0:
-        pointer == 1
+        pointer = 1
     return {
         "shape": tuple(s for s in shape),
         "strides": tuple(s * dtype_size for s in strides),
@@ -117,6 +116,116 @@ def add_array_interface_property(klass, name):
         klass.__array_interface__ = property(get_array_interface)
 
 
+class _RTensorMemory(object):
+    """
+    Exposes the memory of an RTensor through the array interface, and keeps
+    the RTensor alive as long as NumPy views on its memory exist.
+    """
+
+    __slots__ = ["tensor", "__array_interface__"]
+
+    def __init__(self, tensor):
+        self.tensor = tensor
+        self.__array_interface__ = get_array_interface(tensor)
+
+
+def _as_ndarray(tensor):
+    """
+    Return a NumPy array viewing the memory of the RTensor, without copying it.
+    """
+    import numpy as np
+
+    return np.asarray(_RTensorMemory(tensor))
+
+
+def RTensorArray(self, dtype=None, copy=None):
+    """
+    Implementation of the __array__ special function for RTensor, which
+    returns a view on the RTensor memory unless a copy is requested or
+    needed for the conversion to `dtype`.
+    """
+    import numpy as np
+
+    arr = _as_ndarray(self)
+    if copy:
+        return np.array(arr, dtype=dtype, copy=True)
+    if dtype is not None and np.dtype(dtype) != arr.dtype:
+        if copy is False:
+            raise ValueError("Unable to avoid a copy while converting the RTensor to {}".format(dtype))
+        return arr.astype(dtype)
+    return arr
+
+
+def RTensorArrayUfunc(self, ufunc, method, *inputs, **kwargs):
+    """
+    Implementation of the NumPy ufunc protocol for RTensor. The RTensor
+    inputs and outputs are replaced by views on their memory, so that e.g.
+    `np.multiply(t, 2, out=t)` works in place on the RTensor. If the outputs
+    are RTensors, they are returned, otherwise the results are NumPy arrays.
+    """
+    tensor_type = type(self)
+
+    def to_ndarray(x):
+        return _as_ndarray(x) if isinstance(x, tensor_type) else x
+
+    inputs = tuple(to_ndarray(x) for x in inputs)
+    out = kwargs.get("out", ())
+    if out:
+        kwargs["out"] = tuple(to_ndarray(x) for x in out)
+
+    result = getattr(ufunc, method)(*inputs, **kwargs)
+
+    if out:
+        return out[0] if len(out) == 1 else out
+    return result
+
+
+def _make_binary_operator(ufunc_name, reflected=False):
+    def binary_operator(self, other):
+        import numpy as np
+
+        ufunc = getattr(np, ufunc_name)
+        return ufunc(other, self) if reflected else ufunc(self, other)
+
+    return binary_operator
+
+
+def _make_inplace_operator(ufunc_name):
+    def inplace_operator(self, other):
+        import numpy as np
+
+        getattr(np, ufunc_name)(self, other, out=(self,))
+        return self
+
+    return inplace_operator
+
+
+_rtensor_operators = {
+    "add": "add",
+    "sub": "subtract",
+    "mul": "multiply",
+    "truediv": "true_divide",
+    "floordiv": "floor_divide",
+    "pow": "power",
+}
+
+
+def _is_simple_slice(idx, rank):
+    """
+    Check if the indices can be handled by RTensor::Slice, which supports a
+    single integer or a slice with step 1 for each dimension.
+    """
+    if len(idx) != rank:
+        return False
+    for x in idx:
+        if type(x) == slice:
+            if x.step not in (None, 1):
+                return False
+        elif not isinstance(x, int):
+            return False
+    return True
+
+
 def RTensorGetitem(self, idx):
     """
     Implementation of the __getitem__ special function for RTensor
@@ -125,52 +234,64 @@ def RTensorGetitem(self, idx):
         self: RTensor object
         idx: Indices passed to RTensor[indices] operator
     Returns:
-        New RTensor object if indices represent a slice or the requested element
+        The requested element, or a new RTensor object if the indices are
+        integers or slices with step 1 for each dimension. For any other
+        NumPy indexing (steps, negative steps, ellipsis, new axes, fewer
+        indices than dimensions, index arrays) a NumPy array viewing the
+        RTensor memory is returned, or a copy in case of index arrays.
     """
-    # Make single index iterable and convert to list
-    if not hasattr(idx, "__len__"):
-        idx = [idx]
-    idx = list(idx)
+    # Make single index iterable
+    if type(idx) != tuple:
+        idx = (idx,)
 
-    # Check shape
-    shape = self.GetShape()
-    if shape.size() != len(idx):
-        raise Exception("RTensor with rank {} got {} indices.".format(shape.size(), len(idx)))
+    shape = tuple(self.GetShape())
+
+    if not _is_simple_slice(idx, len(shape)):
+        if not hasattr(type(self), "__array_interface__"):
+            raise Exception("RTensor of this data type supports only integer indices and slices with step 1.")
+        # Extended slicing is done with NumPy
+        return _as_ndarray(self)[idx]
+
+    if not any(type(x) == slice for x in idx):
+        # Access to a single element directly in C++, without creating a NumPy view
+        idxVec = cppyy.gbl.std.vector("size_t")(len(idx))
+        for i, x in enumerate(idx):
+            if not -shape[i] <= x < shape[i]:
+                raise IndexError("index {} is out of bounds for axis {} with size {}".format(x, i, shape[i]))
+            idxVec[i] = x + shape[i] if x < 0 else x
+        return self(idxVec)
 
     # Convert negative indices and Nones
-    isSlice = False
+    idx = list(idx)
     for i, x in enumerate(idx):
         if type(x) == slice:
-            isSlice = True
-            start = 0 if x.start is None else x.start
-            stop = shape[i] if x.stop is None else x.stop
-            if stop < 0:
-                stop += shape[i]
-            if x.step != None:
-                raise Exception("RTensor does not support slices with step size unequal 1.")
+            start, stop, _ = x.indices(shape[i])
             idx[i] = slice(start, stop, None)
         else:
             if x < 0:
                 idx[i] += shape[i]
 
-    # If a slice is requested, return a new RTensor
-    if isSlice:
-        idxVec = cppyy.gbl.std.vector("vector<size_t>")(len(idx))
-        for i, x in enumerate(idx):
-            idxVec[i].resize(2)
-            if type(x) == slice:
-                idxVec[i][0] = x.start
-                idxVec[i][1] = x.stop
-            else:
-                idxVec[i][0] = x
-                idxVec[i][1] = x + 1
-        return self.Slice(idxVec)
-
-    # Otherwise, access element by array of indices
-    idxVec = cppyy.gbl.std.vector("size_t")(len(idx))
+    # Return a new RTensor for the slice
+    idxVec = cppyy.gbl.std.vector("vector<size_t>")(len(idx))
     for i, x in enumerate(idx):
-        idxVec[i] = x
-    return self(idxVec)
+        idxVec[i].resize(2)
+        if type(x) == slice:
+            idxVec[i][0] = x.start
+            idxVec[i][1] = x.stop
+        else:
+            idxVec[i][0] = x
+            idxVec[i][1] = x + 1
+    return self.Slice(idxVec)
+
+
+def RTensorSetitem(self, idx, value):
+    """
+    Implementation of the __setitem__ special function for RTensor, with
+    NumPy indexing and broadcasting semantics
+    """
+    if isinstance(value, type(self)):
+        value = _as_ndarray(value)
+    _as_ndarray(self)[idx] = value
 
 
 def RTensorInit(self, *args):
@@ -197,7 +318,6 @@ def RTensorInit(self, *args):
     return self._original_init_(*args)
 
 
-@pythonization("RTensor<", ns="TMVA::Experimental", is_prefix=True)
 def pythonize_rtensor(klass, name):
     # Parameters:
     # klass: class to be pythonized
@@ -207,6 +327,17 @@ def pythonize_rtensor(klass, name):
     add_array_interface_property(klass, name)
     # Get elements, including slices
     klass.__getitem__ = RTensorGetitem
+    if hasattr(klass, "__array_interface__"):
+        # Zero-copy conversion, ufuncs and arithmetic operators on the RTensor memory
+        klass.__array__ = RTensorArray
+        klass.__array_ufunc__ = RTensorArrayUfunc
+        for op, ufunc_name in _rtensor_operators.items():
+            setattr(klass, "__{}__".format(op), _make_binary_operator(ufunc_name))
+            setattr(klass, "__r{}__".format(op), _make_binary_operator(ufunc_name, reflected=True))
+            setattr(klass, "__i{}__".format(op), _make_inplace_operator(ufunc_name))
+        klass.__neg__ = lambda self: -_as_ndarray(self)
+        # Set elements with numpy indexing
+        klass.__setitem__ = RTensorSetitem
     # add initialization of RTensor (pythonization of constructor)
     klass._original_init_ = klass.__init__
     klass.__init__ = RTensorInit
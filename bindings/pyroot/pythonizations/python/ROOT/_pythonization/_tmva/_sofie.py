@@ -0,0 +1,109 @@
+################################################################################
+# Copyright (C) 1995-2024, Rene Brun and Fons Rademakers.                      #
+# All rights reserved.                                                         #
+#                                                                              #
+# For the licensing terms see $ROOTSYS/LICENSE.                                #
+# For the list of contributors see $ROOTSYS/README/CREDITS.                    #
+################################################################################
+
+import itertools
+import json
+
+import cppyy
+
+_functor_ids = itertools.count()
+
+
+def _session_name(session_type):
+    """Return the C++ name of a SOFIE Session, given either as string or as cppyy class."""
+    if isinstance(session_type, str):
+        return session_type
+    return session_type.__cpp_name__
+
+
+def _default_nslots(nslots):
+    # Sessions are created lazily, so reserving one per thread of the pool is cheap
+    if nslots is None:
+        return max(cppyy.gbl.ROOT.GetThreadPoolSize(), 1)
+    return nslots
+
+
+def _cpp_string_literal(value):
+    # A JSON string is also a valid C++ string literal, with backslashes and
+    # quotes escaped
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _declare_functor(expression):
+    cppyy.include("TMVA/SOFIEHelpers.hxx")
+    name = "_sofie_functor_{}".format(next(_functor_ids))
+    try:
+        cppyy.cppdef("auto {} = {};".format(name, expression))
+    except SyntaxError as e:
+        raise RuntimeError("Failed to declare the SOFIE functor {}:\n{}".format(expression, e))
+    return name
+
+
+def DeclareSofieFunctor(num_inputs, session_type, nslots=None, weights_file=""):
+    """
+    Declare a TMVA::Experimental::SofieFunctor for a SOFIE generated model
+    with `num_inputs` scalar inputs, and return its C++ name. The functor can
+    be used in RDataFrame expressions, passing the slot number as first
+    argument, for example:
+
+        functor = ROOT.TMVA.Experimental.DeclareSofieFunctor(7, "TMVA_SOFIE_Higgs::Session")
+        df.Define("DNN_Value", f"{functor}(rdfslot_, m_jj, m_jjj, m_lv, m_jlv, m_bb, m_wbb, m_wwbb)")
+
+    Args:
+        num_inputs (int): number of scalar inputs of the model.
+        session_type (str or cppyy class): the Session class generated by SOFIE.
+        nslots (int, optional): number of Sessions that can be used in parallel.
+            Defaults to the size of the ROOT thread pool. Sessions are only
+            created when a slot is used for the first time.
+        weights_file (str, optional): weights file of the generated model.
+
+    Returns:
+        str: name of the declared C++ functor.
+    """
+    return _declare_functor(
+        "TMVA::Experimental::SofieFunctor<{}, {}>({}, {})".format(
+            num_inputs, _session_name(session_type), _default_nslots(nslots), _cpp_string_literal(weights_file)
+        )
+    )
+
+
+def DeclareSofieRVecFunctor(session_type, input_size, batch_size=1, nslots=None, weights_file="", value_type="float"):
+    """
+    Declare a TMVA::Experimental::SofieRVecFunctor for a SOFIE generated model,
+    and return its C++ name. The functor takes a single RVec column, holding the
+    `input_size` inputs of one or more entries of the model, and returns an RVec
+    with their outputs. The data of the RVec is passed to the model without
+    copying it, in mini-batches of `batch_size` entries, for example:
+
+        functor = ROOT.TMVA.Experimental.DeclareSofieRVecFunctor("TMVA_SOFIE_Jet::Session", 4, batch_size=16)
+        df.Define("jet_features", "Concatenate(...)").Define("jet_score", f"{functor}(rdfslot_, jet_features)")
+
+    Args:
+        session_type (str or cppyy class): the Session class generated by SOFIE.
+        input_size (int): number of input values of a single entry of the model.
+        batch_size (int, optional): batch size the model was generated for.
+            Defaults to 1.
+        nslots (int, optional): number of Sessions that can be used in parallel.
+            Defaults to the size of the ROOT thread pool. Sessions are only
+            created when a slot is used for the first time.
+        weights_file (str, optional): weights file of the generated model.
+        value_type (str, optional): C++ type of the input values. Defaults to float.
+
+    Returns:
+        str: name of the declared C++ functor.
+    """
+    return _declare_functor(
+        "TMVA::Experimental::SofieRVecFunctor<{}, {}>({}, {}, {}, {})".format(
+            _session_name(session_type),
+            value_type,
+            _default_nslots(nslots),
+            input_size,
+            batch_size,
+            _cpp_string_literal(weights_file),
+        )
+    )
@@ -38,6 +38,32 @@ a tree as described above if performance is not an issue or when dealing with
 a small dataset. To read and process the entries of a tree in a much faster
 way, please use ROOT::RDataFrame.
 
+Branches can also be read into NumPy arrays with `arrays()`, which returns a
+dictionary with the branch names as keys, or in chunks of entries with
+`iterate()`, which yields such a dictionary per chunk:
+\code{.py}
+arrays = t.arrays(["pt", "jet_eta"], entry_start=0, entry_stop=100000)
+arrays["pt"]                          # NumPy array with one value per entry
+offsets, content = arrays["jet_eta"]  # the items of entry i are content[offsets[i]:offsets[i + 1]]
+
+for chunk in t.iterate(["pt", "jet_eta"], step_size=100000):
+    train(chunk["pt"], *chunk["jet_eta"])
+\endcode
+
+Branches with a single leaf of fundamental type (e.g. `pt/F`) are returned as
+NumPy arrays of the same type, with one row per entry for fixed-size arrays
+(e.g. `p[3]/D`). Variable-size arrays (e.g. `eta[njet]/F`) and `std::vector`
+branches of fundamental types are returned as a pair of an array of offsets,
+with one more element than the number of entries, and an array with the items
+of all the entries. Without a list of branches, all the top-level branches with
+a supported type are read. By default, `iterate()` yields a chunk per cluster.
+
+The values are decoded in C++ from whole baskets, which the TTreeCache of the
+tree prefetches for the selected branches. If implicit multi-threading is
+enabled with `ROOT.EnableImplicitMT()`, the branches are read, and their
+baskets decompressed, in parallel. Both methods are available for TChain too;
+branches of friend trees can not be read this way.
+
 Second, a couple of TTree methods have been modified to facilitate their use
 from Python: TTree::Branch and TTree::SetBranchAddress.
 
@@ -130,11 +156,16 @@ ds.SetBranchAddress('structb', ms)
 */
 """
 
+from collections import namedtuple
+
 from libROOTPythonizations import GetBranchAttr, BranchPyz
 from ._rvec import _array_interface_dtype_map, _get_cpp_type_from_numpy_type
 from . import pythonization
 
 
+CollectionArrays = namedtuple("CollectionArrays", ["offsets", "content"])
+
+
 # TTree iterator
 def _TTree__iter__(self):
     i = 0
@@ -280,6 +311,651 @@ def _TTree__getattr__(self, key):
     return out
 
 
+# NumPy types of the values of the leaf classes that can be read into arrays,
+# for signed and unsigned leaves
+_leaf_types = {
+    "TLeafO": ("bool", "bool"),
+    "TLeafB": ("int8", "uint8"),
+    "TLeafS": ("int16", "uint16"),
+    "TLeafI": ("int32", "uint32"),
+    "TLeafL": ("int64", "uint64"),
+    "TLeafG": ("int64", "uint64"),
+    "TLeafF": ("float32", "float32"),
+    "TLeafD": ("float64", "float64"),
+}
+
+# NumPy types of the items of the std::vector branches that can be read into
+# arrays
+_vector_item_types = {
+    "char": "int8",
+    "signed char": "int8",
+    "unsigned char": "uint8",
+    "short": "int16",
+    "unsigned short": "uint16",
+    "int": "int32",
+    "unsigned int": "uint32",
+    "long": "int64",
+    "unsigned long": "uint64",
+    "long long": "int64",
+    "unsigned long long": "uint64",
+    "Long64_t": "int64",
+    "ULong64_t": "uint64",
+    "float": "float32",
+    "double": "float64",
+}
+
+# C++ types of the values for the NumPy types, with the size of the values
+# stored in the baskets
+_basket_types = {
+    "bool": "Bool_t",
+    "int8": "Char_t",
+    "uint8": "UChar_t",
+    "int16": "Short_t",
+    "uint16": "UShort_t",
+    "int32": "Int_t",
+    "uint32": "UInt_t",
+    "int64": "Long64_t",
+    "uint64": "ULong64_t",
+    "float32": "Float_t",
+    "float64": "Double_t",
+}
+
+_array_readers_code = """
+#include <Bytes.h>
+#include <TBasket.h>
+#include <TBranch.h>
+#include <TBuffer.h>
+#include <TFile.h>
+#include <TMath.h>
+#include <TROOT.h>
+#include <TTree.h>
+#include <TTreeCache.h>
+#include <TTreeCacheUnzip.h>
+#include <ROOT/TIOFeatures.hxx>
+#ifdef R__USE_IMT
+#include <ROOT/TThreadExecutor.hxx>
+#endif
+
+#include <algorithm>
+#include <cstdint>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace ROOT {
+namespace Internal {
+namespace PyROOT {
+
+/// Reads the values of a branch basket by basket, by decoding the content of the baskets
+class TTreeBranchArrayReaderBase {
+protected:
+   std::string fBranchName;
+   TBranch *fBranch = nullptr;
+
+   /// Calls `f(basket, begin, end, dataEnd)` for every basket of the branch with entries in [first, last) of the
+   /// current tree. The entries [begin, end) of the basket are to be read, numbered from the first one of the
+   /// basket, and the serialized values end at the position `dataEnd` of the basket buffer.
+   template <typename F>
+   void ForEachBasket(Long64_t first, Long64_t last, F &&f)
+   {
+      const Long64_t *basketEntry = fBranch->GetBasketEntry();
+      const Int_t nBaskets = fBranch->GetWriteBasket() + 1;
+      for (auto i = std::max<Long64_t>(TMath::BinarySearch(nBaskets, basketEntry, first), 0);
+           i < nBaskets && basketEntry[i] < last; ++i) {
+         TBasket *basket = fBranch->GetBasket(i);
+         if (!basket)
+            throw std::runtime_error("failed to read basket " + std::to_string(i) + " of branch " + fBranchName);
+         const Long64_t begin = std::max(first, basketEntry[i]) - basketEntry[i];
+         const Long64_t end = std::min<Long64_t>(last - basketEntry[i], basket->GetNevBuf());
+         // Baskets that are not written yet only exist in memory, and their buffer ends with the last value
+         const Int_t dataEnd = fBranch->GetBasketBytes()[i] ? basket->GetLast() : basket->GetBufferRef()->Length();
+         f(*basket, begin, end, dataEnd);
+      }
+      // Free the baskets that were read, except the one of the current entry of the branch
+      fBranch->DropBaskets();
+   }
+
+   /// Returns the position of entry `i` in the buffer of the basket
+   static Int_t GetEntryBegin(TBasket &basket, Long64_t i)
+   {
+      const Int_t *entryOffset = basket.GetEntryOffset();
+      return entryOffset ? entryOffset[i] : basket.GetKeylen() + i * basket.GetNevBufSize();
+   }
+
+   /// Returns the position of the end of entry `i` in the buffer of the basket
+   static Int_t GetEntryEnd(TBasket &basket, Long64_t i, Int_t dataEnd)
+   {
+      return i + 1 < basket.GetNevBuf() ? GetEntryBegin(basket, i + 1) : dataEnd;
+   }
+
+   explicit TTreeBranchArrayReaderBase(const std::string &branchName) : fBranchName(branchName) {}
+
+public:
+   virtual ~TTreeBranchArrayReaderBase() = default;
+
+   TBranch *GetBranch() const { return fBranch; }
+
+   /// Looks up the branch in the current tree, e.g. after a TChain switched to the next tree
+   void SetTree(TTree &tree)
+   {
+      fBranch = tree.GetBranch(fBranchName.c_str());
+      if (!fBranch)
+         throw std::runtime_error("no branch named " + fBranchName + " in TTree " + tree.GetName());
+      if (fBranch->GetTree() != &tree)
+         throw std::runtime_error("branch " + fBranchName + " belongs to a friend of TTree " + tree.GetName() +
+                                  ", which can not be read into arrays");
+   }
+
+   /// Reads the values of the entries [first, last) of the current tree
+   virtual void Read(Long64_t first, Long64_t last) = 0;
+};
+
+/// Reads a branch with a leaf of fundamental type T, or with a fixed-size array of such values, into an array
+template <typename T>
+class TTreeBranchArrayReader final : public TTreeBranchArrayReaderBase {
+   const Int_t fLen;
+   T *fTo = nullptr;
+
+public:
+   TTreeBranchArrayReader(const std::string &branchName, Int_t len) : TTreeBranchArrayReaderBase(branchName), fLen(len)
+   {
+   }
+
+   /// Sets the array into which the next call to Read() writes the values
+   void SetBuffer(void *to) { fTo = static_cast<T *>(to); }
+
+   void Read(Long64_t first, Long64_t last) final
+   {
+      ForEachBasket(first, last, [this](TBasket &basket, Long64_t begin, Long64_t end, Int_t) {
+         char *buffer = basket.GetBufferRef()->Buffer();
+         for (auto i = begin; i < end; ++i) {
+            char *from = buffer + GetEntryBegin(basket, i);
+            for (Int_t k = 0; k < fLen; ++k)
+               frombuf(from, fTo++);
+         }
+      });
+   }
+};
+
+/// Reads a branch with a variable-size array of values of the fundamental type T, or a std::vector<T> branch, into
+/// an array of offsets and an array of items
+template <typename T>
+class TTreeBranchCollectionArrayReader final : public TTreeBranchArrayReaderBase {
+   static constexpr UInt_t kByteCountMask = 0x40000000;
+
+   const bool fIsStdVector;
+   std::int64_t *fOffsets = nullptr;
+   std::int64_t fNItems = 0;
+   std::vector<T> fItems;
+
+   /// Returns the number of items of an entry and moves `from` to its first item
+   Int_t ReadEntryHeader(char *&from, Int_t entryEnd, const char *buffer) const
+   {
+      if (!fIsStdVector)
+         return (buffer + entryEnd - from) / sizeof(T);
+      // A std::vector is streamed with its byte count and class version, followed by its size
+      UInt_t byteCount;
+      frombuf(from, &byteCount);
+      if (!(byteCount & kByteCountMask))
+         throw std::runtime_error("unexpected serialization of std::vector in branch " + fBranchName);
+      Version_t version;
+      frombuf(from, &version);
+      Int_t size;
+      frombuf(from, &size);
+      if (size < 0 || from + size * sizeof(T) > buffer + entryEnd)
+         throw std::runtime_error("unexpected serialization of std::vector in branch " + fBranchName);
+      return size;
+   }
+
+public:
+   TTreeBranchCollectionArrayReader(const std::string &branchName, bool isStdVector)
+      : TTreeBranchArrayReaderBase(branchName), fIsStdVector(isStdVector)
+   {
+   }
+
+   /// Sets the array into which the next call to Read() writes the end offset of the items of every entry,
+   /// counted from `firstOffset`
+   void SetOffsetsBuffer(void *offsets, std::int64_t firstOffset)
+   {
+      fOffsets = static_cast<std::int64_t *>(offsets);
+      fNItems = firstOffset;
+   }
+
+   void Read(Long64_t first, Long64_t last) final
+   {
+      fItems.clear();
+      ForEachBasket(first, last, [this](TBasket &basket, Long64_t begin, Long64_t end, Int_t dataEnd) {
+         char *buffer = basket.GetBufferRef()->Buffer();
+         for (auto i = begin; i < end; ++i) {
+            char *from = buffer + GetEntryBegin(basket, i);
+            const Int_t size = ReadEntryHeader(from, GetEntryEnd(basket, i, dataEnd), buffer);
+            const auto pos = fItems.size();
+            fItems.resize(pos + size);
+            for (Int_t k = 0; k < size; ++k)
+               frombuf(from, &fItems[pos + k]);
+            fNItems += size;
+            *fOffsets++ = fNItems;
+         }
+      });
+   }
+
+   /// Returns the number of items read by the last call to Read()
+   std::size_t GetNItems() const { return fItems.size(); }
+
+   /// Copies the items read by the last call to Read() to the array `to`
+   void CopyItems(void *to) const { std::copy(fItems.begin(), fItems.end(), static_cast<T *>(to)); }
+};
+
+/// Reads branches of a TTree or a TChain into arrays, cluster by cluster
+class TTreeArrayReader {
+   TTree &fTree;
+   std::vector<TTreeBranchArrayReaderBase *> fBranches;
+   Long64_t fEntryStop = 0;
+   TTree *fCurrentTree = nullptr;
+
+   // State of the TTreeCache before SetUpCache() changed it, which RestoreCache() brings back
+   TTreeCache *fCache = nullptr;
+   TTree *fCacheTree = nullptr;
+   std::vector<std::string> fCachedBranchNames;
+   Long64_t fCacheEntryMin = 0;
+   Long64_t fCacheEntryMax = 0;
+   bool fCacheIsLearning = false;
+
+   /// Adds the branches to the TTreeCache of the current tree, which then prefetches all their baskets of a cluster
+   /// at once, and limits the prefetching to the entries that are read
+   void SetUpCache(Long64_t first, Long64_t last)
+   {
+      TFile *file = fCurrentTree->GetCurrentFile();
+      // No cache without a file, or if the cache was disabled
+      TTreeCache *cache = file ? fCurrentTree->GetReadCache(file, true) : nullptr;
+      if (!cache)
+         return;
+      if (cache != fCache) {
+         // A TChain keeps its cache when it moves to the next tree, then only the state of the first tree is saved
+         fCache = cache;
+         fCacheTree = fCurrentTree;
+         fCachedBranchNames.clear();
+         if (auto branches = cache->GetCachedBranches()) {
+            for (auto branch : *branches)
+               fCachedBranchNames.emplace_back(branch->GetName());
+         }
+         fCacheEntryMin = cache->GetEntryMin();
+         fCacheEntryMax = cache->GetEntryMax();
+         fCacheIsLearning = cache->IsLearning();
+      }
+      for (auto branch : fBranches)
+         cache->AddBranch(branch->GetBranch(), true);
+      cache->StopLearningPhase();
+      cache->SetEntryRange(first, last);
+   }
+
+   bool ReadInParallel() const
+   {
+#ifdef R__USE_IMT
+      // As in TTree::GetEntry(). Generating the entry offsets of a basket reads another branch, which can not be
+      // done in parallel with reading that branch.
+      return fBranches.size() > 1 && ROOT::IsImplicitMTEnabled() && fCurrentTree->GetImplicitMT() &&
+             !TTreeCacheUnzip::IsParallelUnzip() &&
+             !fCurrentTree->GetIOFeatures().Test(ROOT::Experimental::EIOFeatures::kGenerateOffsetMap);
+#else
+      return false;
+#endif
+   }
+
+public:
+   explicit TTreeArrayReader(TTree &tree) : fTree(tree) {}
+
+   ~TTreeArrayReader() { RestoreCache(); }
+
+   /// Restores the branches, learning phase and entry range that the TTreeCache of the tree had before the first
+   /// read. Does nothing if the cache was deleted or replaced in the meantime, e.g. because the file was closed.
+   void RestoreCache()
+   {
+      TTreeCache *cache = fCache;
+      fCache = nullptr;
+      TTree *tree = fTree.GetTree();
+      TFile *file = tree ? tree->GetCurrentFile() : nullptr;
+      if (!cache || !file || tree->GetReadCache(file) != cache)
+         return;
+
+      // The branches can only be removed from the cache in the learning phase. StartLearningPhase() only resets
+      // their number, the list of cached branches is cleared too so that it does not show the ones that were read.
+      cache->StartLearningPhase();
+      const_cast<TObjArray *>(cache->GetCachedBranches())->Clear();
+      if (!fCacheIsLearning) {
+         for (const auto &name : fCachedBranchNames) {
+            if (auto branch = tree->GetBranch(name.c_str()))
+               cache->AddBranch(branch, false);
+         }
+         cache->StopLearningPhase();
+      }
+      // The entry range is reset when a TChain moves to another tree
+      if (tree == fCacheTree)
+         cache->SetEntryRange(fCacheEntryMin, fCacheEntryMax);
+      else
+         cache->SetEntryRange(0, tree->GetEntries());
+   }
+
+   void AddBranch(TTreeBranchArrayReaderBase &branch) { fBranches.push_back(&branch); }
+
+   /// Sets the entry after the last one that is going to be read
+   void SetEntryStop(Long64_t last)
+   {
+      fEntryStop = last;
+      // Look up the branches and set up the cache again with the first read
+      fCurrentTree = nullptr;
+   }
+
+   /// Returns the end of the clusters, and of the trees of a TChain, from `first` up to `last`. The entries in
+   /// between two boundaries are read together by Read().
+   std::vector<Long64_t> GetClusterBoundaries(Long64_t first, Long64_t last)
+   {
+      std::vector<Long64_t> boundaries;
+      auto entry = first;
+      while (entry < last) {
+         const Long64_t localEntry = fTree.LoadTree(entry);
+         if (localEntry < 0)
+            throw std::runtime_error("failed to load entry " + std::to_string(entry) + " of TTree " + fTree.GetName());
+         auto clusters = fTree.GetTree()->GetClusterIterator(localEntry);
+         clusters.Next();
+         const Long64_t next = entry - localEntry + clusters.GetNextEntry();
+         entry = next > entry ? std::min(next, last) : last;
+         boundaries.push_back(entry);
+      }
+      return boundaries;
+   }
+
+   /// Reads the entries [first, last), which belong to the same tree, of all the branches
+   void Read(Long64_t first, Long64_t last)
+   {
+      const Long64_t localFirst = fTree.LoadTree(first);
+      if (localFirst < 0)
+         throw std::runtime_error("failed to load entry " + std::to_string(first) + " of TTree " + fTree.GetName());
+      const Long64_t localLast = localFirst + (last - first);
+      if (fTree.GetTree() != fCurrentTree) {
+         fCurrentTree = fTree.GetTree();
+         for (auto branch : fBranches)
+            branch->SetTree(*fCurrentTree);
+         SetUpCache(localFirst, std::min(localFirst + (fEntryStop - first), fCurrentTree->GetEntries()));
+      }
+
+      if (!ReadInParallel()) {
+         for (auto branch : fBranches)
+            branch->Read(localFirst, localLast);
+         return;
+      }
+
+#ifdef R__USE_IMT
+      // Enable the locks for reading branches in parallel
+      ROOT::Internal::TParBranchProcessingRAII pbpRAII;
+      std::string error;
+      std::mutex errorMutex;
+      ROOT::TThreadExecutor pool;
+      pool.Foreach(
+         [&](TTreeBranchArrayReaderBase *branch) {
+            try {
+               branch->Read(localFirst, localLast);
+            } catch (const std::exception &e) {
+               std::lock_guard<std::mutex> lock(errorMutex);
+               error = e.what();
+            }
+         },
+         fBranches);
+      if (!error.empty())
+         throw std::runtime_error(error);
+#endif
+   }
+};
+
+} // namespace PyROOT
+} // namespace Internal
+} // namespace ROOT
+"""
+
+_array_readers_declared = False
+
+
+def _declare_array_readers():
+    global _array_readers_declared
+    if not _array_readers_declared:
+        import cppyy
+
+        cppyy.cppdef(_array_readers_code)
+        _array_readers_declared = True
+
+
+def _branch_type(tree, name):
+    """
+    Returns the NumPy type of the values of branch `name`, the number of
+    values per entry, or None for a variable number of values, and whether
+    the branch is a std::vector. Raises if the branch can not be read into
+    NumPy arrays.
+    """
+    branch = tree.GetBranch(name)
+    if not branch:
+        raise ValueError("no branch named '{}' in TTree '{}'".format(name, tree.GetName()))
+
+    branch_class = branch.IsA().GetName()
+    if branch_class == "TBranch" and branch.GetNleaves() == 1:
+        leaf = branch.GetListOfLeaves().At(0)
+        leaf_class = leaf.IsA().GetName()
+        if leaf_class in _leaf_types:
+            dtype = _leaf_types[leaf_class][bool(leaf.IsUnsigned())]
+            return dtype, None if leaf.GetLeafCount() else leaf.GetLenStatic(), False
+    elif branch_class == "TBranchElement" and branch.GetType() == 0 and branch.GetID() < 0:
+        # Unsplit top-level object branch
+        class_name = str(branch.GetClassName())
+        if class_name.startswith("vector<") and class_name.endswith(">"):
+            item_type = class_name[len("vector<") : -1].strip()
+            if item_type in _vector_item_types:
+                return _vector_item_types[item_type], None, True
+    raise TypeError("branch '{}' can not be read into NumPy arrays, only branches with a single leaf of fundamental "
+                    "type, or arrays of such values, and std::vector branches of fundamental types are "
+                    "supported".format(name))
+
+
+class _BranchReader(object):
+    """Reads the values of a branch, chunk by chunk, into NumPy arrays."""
+
+    def __init__(self, name, dtype, length, is_vector):
+        import cppyy
+        import numpy
+
+        self._dtype = numpy.dtype(dtype)
+        self._length = length
+        ns = cppyy.gbl.ROOT.Internal.PyROOT
+        if length is None:
+            klass = ns.TTreeBranchCollectionArrayReader[_basket_types[dtype]]
+            klass.CopyItems.__release_gil__ = True
+            self._reader = klass(name, is_vector)
+        else:
+            self._reader = ns.TTreeBranchArrayReader[_basket_types[dtype]](name, length)
+
+    def start(self, nentries):
+        import numpy
+
+        self._pos = 0
+        if self._length is None:
+            self._offsets = numpy.empty(nentries + 1, dtype=numpy.int64)
+            self._offsets[0] = 0
+            self._contents = []
+        elif self._length == 1:
+            self._values = numpy.empty(nentries, dtype=self._dtype)
+        else:
+            self._values = numpy.empty((nentries, self._length), dtype=self._dtype)
+
+    def prepare(self, first, last):
+        # Sets the arrays into which the C++ reader writes the entries
+        # [first, last), relative to the start of the arrays
+        if self._length is None:
+            self._reader.SetOffsetsBuffer(self._offsets[first + 1 :], int(self._offsets[first]))
+        else:
+            self._reader.SetBuffer(self._values[first:])
+
+    def collect(self):
+        # Takes the items of the last chunk from the C++ reader
+        if self._length is not None:
+            return
+        content = self._new_array(self._reader.GetNItems())
+        if len(content):
+            self._reader.CopyItems(content)
+        self._contents.append(content)
+
+    def finish(self):
+        import numpy
+
+        if self._length is not None:
+            return self._values
+        if len(self._contents) == 1:
+            content = self._contents[0]
+        elif self._contents:
+            content = numpy.concatenate(self._contents)
+        else:
+            content = self._new_array(0)
+        return CollectionArrays(self._offsets, content)
+
+    def _new_array(self, size):
+        import numpy
+
+        return numpy.empty(size, dtype=self._dtype)
+
+
+def _make_array_reader(tree, branches):
+    """
+    Returns the C++ reader of the branches and a reader of NumPy arrays per
+    branch.
+    """
+    # Early check for numpy
+    try:
+        import numpy
+    except:
+        raise ImportError("Failed to import numpy during call of TTree.arrays.")
+    import cppyy
+
+    if isinstance(branches, str):
+        raise TypeError("The branches argument requires a list of strings")
+
+    if branches is None:
+        types = {}
+        for branch in tree.GetListOfBranches():
+            name = str(branch.GetName())
+            try:
+                types[name] = _branch_type(tree, name)
+            except TypeError:
+                pass
+    else:
+        types = {name: _branch_type(tree, name) for name in branches}
+
+    _declare_array_readers()
+    klass = cppyy.gbl.ROOT.Internal.PyROOT.TTreeArrayReader
+    klass.Read.__release_gil__ = True
+    reader = klass(tree)
+    branch_readers = {name: _BranchReader(name, *types[name]) for name in types}
+    for branch_reader in branch_readers.values():
+        reader.AddBranch(branch_reader._reader)
+    return reader, branch_readers
+
+
+def _entry_range(tree, entry_start, entry_stop):
+    nentries = tree.GetEntries()
+    first = 0 if entry_start is None else entry_start
+    last = nentries if entry_stop is None else entry_stop
+    if not 0 <= first <= last <= nentries:
+        raise ValueError("invalid entry range ({}, {}) for a TTree with {} entries".format(first, last, nentries))
+    return first, last
+
+
+def _read_arrays(reader, branch_readers, first, last):
+    # The branches are read cluster by cluster, so that the TTreeCache reads
+    # the baskets of a cluster at once and every basket is decompressed once
+    for branch_reader in branch_readers.values():
+        branch_reader.start(last - first)
+    begin = first
+    for end in reader.GetClusterBoundaries(first, last):
+        for branch_reader in branch_readers.values():
+            branch_reader.prepare(begin - first, end - first)
+        reader.Read(begin, end)
+        for branch_reader in branch_readers.values():
+            branch_reader.collect()
+        begin = end
+    return {name: branch_reader.finish() for name, branch_reader in branch_readers.items()}
+
+
+def _TTree_arrays(self, branches=None, entry_start=None, entry_stop=None):
+    """
+    Reads branches of the tree into NumPy arrays.
+
+    Parameters:
+        branches: names of the branches to read. By default, all the top-level
+            branches with a supported type are read.
+        entry_start: first entry to read, by default the first entry.
+        entry_stop: entry after the last one to read, by default the number
+            of entries.
+
+    Returns:
+        dict: the branch names as keys, and as values NumPy arrays for
+            branches with a fixed number of values per entry and
+            CollectionArrays (pairs of offsets and content arrays) for
+            variable-size arrays and std::vector branches.
+
+    The branches are added to the TTreeCache of the tree, which prefetches
+    the requested entries only. The branches, learning phase and entry range
+    of the cache are restored once the arrays are read.
+    """
+    reader, branch_readers = _make_array_reader(self, branches)
+    first, last = _entry_range(self, entry_start, entry_stop)
+    reader.SetEntryStop(last)
+    try:
+        return _read_arrays(reader, branch_readers, first, last)
+    finally:
+        reader.RestoreCache()
+
+
+def _TTree_iterate(self, branches=None, step_size=None, entry_start=None, entry_stop=None):
+    """
+    Reads branches of the tree into NumPy arrays, in chunks of entries.
+
+    Parameters:
+        branches: names of the branches to read. By default, all the top-level
+            branches with a supported type are read.
+        step_size: number of entries per chunk. By default, every chunk is a
+            cluster of the tree.
+        entry_start: first entry to read, by default the first entry.
+        entry_stop: entry after the last one to read, by default the number
+            of entries.
+
+    Returns:
+        generator: yields a dictionary of arrays, as returned by arrays(), per
+            chunk.
+
+    As for arrays(), the TTreeCache of the tree is set up for the requested
+    branches and entries while iterating. Its previous state is restored
+    when the generator is exhausted, closed or garbage collected.
+    """
+    if step_size is not None and step_size <= 0:
+        raise ValueError("The step size has to be a positive number of entries")
+
+    reader, branch_readers = _make_array_reader(self, branches)
+    first, last = _entry_range(self, entry_start, entry_stop)
+
+    def chunks():
+        reader.SetEntryStop(last)
+        if step_size is None:
+            boundaries = list(reader.GetClusterBoundaries(first, last))
+        else:
+            boundaries = list(range(first + step_size, last, step_size)) + [last] if first < last else []
+        begin = first
+        try:
+            for end in boundaries:
+                yield _read_arrays(reader, branch_readers, begin, end)
+                begin = end
+        finally:
+            reader.RestoreCache()
+
+    return chunks()
+
+
 @pythonization("TTree")
 def pythonize_ttree(klass, name):
     # Parameters:
@@ -297,6 +973,10 @@ def pythonize_ttree(klass, name):
     # tree.branch syntax
     klass.__getattr__ = _TTree__getattr__
 
+    # Bulk reads into NumPy arrays
+    klass.arrays = _TTree_arrays
+    klass.iterate = _TTree_iterate
+
     # SetBranchAddress
     klass._OriginalSetBranchAddress = klass.SetBranchAddress
     klass.SetBranchAddress = _SetBranchAddress
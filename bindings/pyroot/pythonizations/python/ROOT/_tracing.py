@@ -0,0 +1,256 @@
+################################################################################
+# Copyright (C) 1995-2024, Rene Brun and Fons Rademakers.                      #
+# All rights reserved.                                                         #
+#                                                                              #
+# For the licensing terms see $ROOTSYS/LICENSE.                                #
+# For the list of contributors see $ROOTSYS/README/CREDITS.                    #
+################################################################################
+
+"""
+Tracing of the work done by PyROOT and the interpreter, to find out where the
+time of `import ROOT` and of the first uses of ROOT classes goes.
+
+The following events are recorded, with their start time and duration:
+
+    import        steps of `import ROOT` (cppyy, extension modules, facade)
+    setup         ROOTFacade._finalSetup, run on the first ROOT attribute lookup
+    lookup        lookups of names in the ROOT module (ROOTFacade._fallback_getattr)
+    pythonization pythonizors run on a new class proxy
+    cppyy         cppyy.include, cppyy.cppdef and cppyy.load_library calls
+    library       libraries loaded by the interpreter
+    pcm           PCM files (dictionary payloads) read by the interpreter
+    autoload      class autoloading, which may load libraries and PCMs
+    autoparse     header parsing on demand for a class
+    wrapper       JIT compilation of the call wrapper of a C++ function
+
+The events of the last five categories are recorded in C++ by the interpreter
+(see TInterpreter::SetTracing). Events nest: the time of an autoload is also
+part of the time of the lookup that triggered it.
+
+Tracing is enabled with `ROOT.tracing.enable()`, or for a whole process by
+setting the PYROOT_TRACE environment variable before importing ROOT. If the
+variable is a file name ending in ".json", the trace is written to that file
+at exit in the Chrome trace event format, which can be loaded into
+chrome://tracing or https://ui.perfetto.dev. Otherwise, a summary table is
+printed at exit.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+_enabled = False
+_events = []  # (category, name, start [ns], duration [ns], thread id)
+_lock = threading.Lock()
+_clock_offset = None  # Python clock minus interpreter clock [ns]
+_instrumented = False
+
+
+def _now():
+    return time.perf_counter_ns()
+
+
+def record(category, name, start, end=None):
+    """
+    Record an event of the given category, with start and end time in
+    nanoseconds on the clock of time.perf_counter_ns(). The end time defaults
+    to now. Nothing is recorded if tracing is disabled.
+    """
+    if not _enabled:
+        return
+    if end is None:
+        end = _now()
+    with _lock:
+        _events.append((category, name, start, end - start, threading.get_ident()))
+
+
+@contextmanager
+def span(category, name):
+    """Context manager recording its body as an event, if tracing is enabled."""
+    if not _enabled:
+        yield
+        return
+    start = _now()
+    try:
+        yield
+    finally:
+        record(category, name, start)
+
+
+def _traced(category, func, get_name):
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        start = _now()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(category, get_name(*args, **kwargs), start)
+
+    wrapper.__wrapped__ = func
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+def _enable_interpreter():
+    # The interpreter only exists once cppyy is imported
+    global _clock_offset
+    if "cppyy" not in sys.modules:
+        return
+    from cppyy.gbl import gInterpreter
+
+    if _clock_offset is None:
+        _clock_offset = _now() - gInterpreter.GetTraceTime()
+    gInterpreter.SetTracing(_enabled)
+
+
+def _instrument():
+    # Wrap the Python entry points, once, so that nothing is added to them
+    # unless tracing was requested
+    global _instrumented
+    if _instrumented or "ROOT._facade" not in sys.modules:
+        return
+    _instrumented = True
+
+    import cppyy
+    from ._facade import ROOTFacade
+
+    for name in ("include", "cppdef", "load_library"):
+        setattr(cppyy, name, _traced("cppyy", getattr(cppyy, name), lambda arg, *args, name=name: "{}({})".format(name, arg)))
+
+    ROOTFacade._finalSetup = _traced("setup", ROOTFacade._finalSetup, lambda self: "ROOT._finalSetup")
+    ROOTFacade._fallback_getattr = _traced("lookup", ROOTFacade._fallback_getattr, lambda self, name: name)
+
+    # After _finalSetup, lookups were already redirected to the original bound method
+    facade = sys.modules.get("ROOT")
+    if isinstance(facade, ROOTFacade) and getattr(ROOTFacade.__getattr__, "__func__", None) is ROOTFacade._fallback_getattr.__wrapped__:
+        ROOTFacade.__getattr__ = facade._fallback_getattr
+
+
+def enable():
+    """Start recording events."""
+    global _enabled
+    _enabled = True
+    _enable_interpreter()
+    _instrument()
+
+
+def disable():
+    """Stop recording events. The events recorded so far are kept."""
+    global _enabled
+    _collect()
+    _enabled = False
+    _enable_interpreter()
+
+
+def is_enabled():
+    return _enabled
+
+
+def _collect():
+    # Move the events recorded by the interpreter to the Python list
+    if _clock_offset is None or "cppyy" not in sys.modules:
+        return
+    from cppyy.gbl import gInterpreter
+
+    tid = threading.main_thread().ident
+    cpp_events = [
+        (str(e.fCategory), str(e.fName), e.fStart + _clock_offset, e.fDuration, tid)
+        for e in gInterpreter.TakeTraceEvents()
+    ]
+    with _lock:
+        _events.extend(cpp_events)
+
+
+def events():
+    """
+    Return the recorded events as a list of (category, name, start, duration)
+    tuples, ordered by start time. Times are in seconds, the start time being
+    relative to the first event.
+    """
+    _collect()
+    with _lock:
+        evts = sorted(_events, key=lambda e: e[2])
+    if not evts:
+        return []
+    t0 = evts[0][2]
+    return [(c, n, (s - t0) * 1e-9, d * 1e-9) for c, n, s, d, _ in evts]
+
+
+def reset():
+    """Forget the events recorded so far."""
+    _collect()
+    with _lock:
+        del _events[:]
+
+
+def save(file_name):
+    """Write the recorded events to a file, in the Chrome trace event format."""
+    _collect()
+    with _lock:
+        evts = sorted(_events, key=lambda e: e[2])
+    t0 = evts[0][2] if evts else 0
+    pid = os.getpid()
+    trace = {
+        "traceEvents": [
+            {"name": n, "cat": c, "ph": "X", "ts": (s - t0) / 1e3, "dur": d / 1e3, "pid": pid, "tid": tid}
+            for c, n, s, d, tid in evts
+        ],
+        "displayTimeUnit": "ms",
+    }
+    with open(file_name, "w") as f:
+        json.dump(trace, f)
+
+
+def summary(top=5):
+    """
+    Return a table with the number of events, their total and maximum duration
+    per category, and the `top` slowest events of each category.
+    """
+    per_category = {}
+    for c, n, _, d in events():
+        per_category.setdefault(c, []).append((d, n))
+
+    lines = ["{:<14} {:>7} {:>12} {:>10}".format("category", "count", "total [ms]", "max [ms]")]
+    for c, evts in sorted(per_category.items(), key=lambda item: -sum(d for d, _ in item[1])):
+        evts.sort(reverse=True)
+        lines.append("{:<14} {:>7} {:>12.2f} {:>10.2f}".format(c, len(evts), 1e3 * sum(d for d, _ in evts), 1e3 * evts[0][0]))
+        for d, n in evts[:top]:
+            lines.append("    {:>10.2f}  {}".format(1e3 * d, n))
+    return "\n".join(lines)
+
+
+_import_start = None
+
+
+def _write_at_exit(target):
+    disable()
+    if target.endswith(".json"):
+        save(target)
+    else:
+        print(summary(), file=sys.stderr)
+
+
+def _enable_from_environment():
+    # Called at the very beginning of `import ROOT`
+    global _enabled, _import_start
+    target = os.environ.get("PYROOT_TRACE")
+    if not target or target == "0":
+        return
+    _enabled = True
+    _import_start = _now()
+
+
+def _finish_import():
+    # Called at the end of `import ROOT`, after the other exit handlers were
+    # registered, so that the trace is written before they shut ROOT down
+    if _import_start is None:
+        return
+    record("import", "import ROOT", _import_start)
+    _instrument()
+    atexit.register(_write_at_exit, os.environ["PYROOT_TRACE"])
@@ -25,32 +25,72 @@
 #else
 #include <unistd.h>
 #endif
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <mutex>
 #include <string>
 #include <iostream>
+#include <utility>
+#ifndef _MSC_VER
+#include <cerrno>
+#include <poll.h>
+#include <thread>
+#endif
 #include "TInterpreter.h"
 
 //////////////////////////
 // MODULE FUNCTIONALITY //
 //////////////////////////
 
+// While capturing, the output written to the stdout and stderr file descriptors
+// goes to pipes. A reader thread wakes up when there is data in the pipes and
+// moves it to the buffers, from which the Python side takes it as soon as Wait
+// reports that there is some. Without the reader thread (on Windows, or if it
+// cannot be set up), Wait polls the pipes instead. The buffers are bounded:
+// output that does not fit in them is dropped and replaced by a note.
 class JupyROOTExecutorHandler {
 private:
+   struct CapturedStream {
+      std::string fContent;
+      std::size_t fDropped = 0;
+   };
+
    bool fCapturing = false;
-   std::string fStdoutpipe;
-   std::string fStderrpipe;
+   CapturedStream fStdout;
+   CapturedStream fStderr;
    int fStdout_pipe[2] = {0, 0};
    int fStderr_pipe[2] = {0, 0};
    int fSaved_stderr = 0;
    int fSaved_stdout = 0;
+   std::mutex fMutex;
+   std::condition_variable fCond;
+   // Whether the pipes are read by Poll, i.e. there is no reader thread
+   std::atomic<bool> fPolling{false};
+#ifndef _MSC_VER
+   int fControl_pipe[2] = {0, 0};
+   std::thread fReader;
+   std::mutex fPollMutex;
+
+   bool ReadPipe(int fd, CapturedStream &stream);
+   void ReaderLoop();
+#endif
+   void Append(CapturedStream &stream, const char *data, std::size_t size);
+   bool HasData() const;
+   std::string Take(CapturedStream &stream);
 
 public:
    JupyROOTExecutorHandler();
+   ~JupyROOTExecutorHandler();
    void Poll();
+   bool Wait(double timeout);
    void InitCapture();
    void EndCapture();
    void Clear();
-   std::string &GetStdout();
-   std::string &GetStderr();
+   std::string GetStdout();
+   std::string GetStderr();
+   std::pair<std::string, std::string> Take();
 };
 
 #ifndef F_LINUX_SPECIFIC_BASE
@@ -61,13 +101,55 @@ public:
 #endif
 
 constexpr long MAX_PIPE_SIZE = 1048575;
+constexpr std::size_t MAX_BUFFER_SIZE = 4 * 1024 * 1024;
 
 JupyROOTExecutorHandler::JupyROOTExecutorHandler() {}
 
+JupyROOTExecutorHandler::~JupyROOTExecutorHandler()
+{
+   EndCapture();
+}
+
+// Length of the content without a UTF-8 sequence that is not complete yet, which
+// is kept back until its remaining bytes arrive.
+static std::size_t CompleteUTF8Length(const std::string &content)
+{
+   const auto size = content.size();
+   for (std::size_t i = 1; i <= 3 && i <= size; ++i) {
+      const auto c = static_cast<unsigned char>(content[size - i]);
+      if ((c & 0xC0) == 0x80)
+         continue; // continuation byte
+      std::size_t expected = (c & 0xE0) == 0xC0 ? 2 : (c & 0xF0) == 0xE0 ? 3 : (c & 0xF8) == 0xF0 ? 4 : 1;
+      return expected > i ? size - i : size;
+   }
+   return size;
+}
+
+void JupyROOTExecutorHandler::Append(CapturedStream &stream, const char *data, std::size_t size)
+{
+   {
+      std::lock_guard<std::mutex> lock(fMutex);
+      const auto room = MAX_BUFFER_SIZE > stream.fContent.size() ? MAX_BUFFER_SIZE - stream.fContent.size() : 0;
+      const auto kept = std::min(room, size);
+      stream.fContent.append(data, kept);
+      stream.fDropped += size - kept;
+   }
+   fCond.notify_all();
+}
+
+bool JupyROOTExecutorHandler::HasData() const
+{
+   // With the capture ended, incomplete UTF-8 sequences are not held back anymore
+   if (!fCapturing)
+      return !fStdout.fContent.empty() || !fStderr.fContent.empty() || fStdout.fDropped || fStderr.fDropped;
+   return CompleteUTF8Length(fStdout.fContent) || CompleteUTF8Length(fStderr.fContent) || fStdout.fDropped ||
+          fStderr.fDropped;
+}
+
+#ifdef _MSC_VER
 static void PollImpl(FILE *stdStream, int *pipeHandle, std::string &pipeContent)
 {
    fflush(stdStream);
-#ifdef _MSC_VER
    char buffer[60000] = "";
    struct _stat st;
    _fstat(pipeHandle[0], &st);
@@ -75,23 +157,89 @@ static void PollImpl(FILE *stdStream, int *pipeHandle, std::string &pipeContent)
       _read(pipeHandle[0], buffer, 60000);
       pipeContent += buffer;
    }
+}
+
+void JupyROOTExecutorHandler::Poll()
+{
+   std::string out, err;
+   PollImpl(stdout, fStdout_pipe, out);
+   PollImpl(stderr, fStderr_pipe, err);
+   Append(fStdout, out.data(), out.size());
+   Append(fStderr, err.data(), err.size());
+}
 #else
-   int buf_read;
-   char ch;
+void JupyROOTExecutorHandler::Poll()
+{
+   fflush(stdout);
+   fflush(stderr);
+   // Without the reader thread, the pipes are read here. The lock keeps the
+   // chunks in order and the pipes open while they are read.
+   std::lock_guard<std::mutex> lock(fPollMutex);
+   if (fPolling) {
+      ReadPipe(fStdout_pipe[0], fStdout);
+      ReadPipe(fStderr_pipe[0], fStderr);
+   }
+}
+
+/// Read all the data available in the pipe; returns false at end of file.
+bool JupyROOTExecutorHandler::ReadPipe(int fd, CapturedStream &stream)
+{
+   char buffer[65536];
+   while (true) {
+      auto n = read(fd, buffer, sizeof(buffer));
+      if (n > 0)
+         Append(stream, buffer, n);
+      else if (n < 0 && errno == EINTR)
+         continue;
+      else
+         return n != 0;
+   }
+}
+
+void JupyROOTExecutorHandler::ReaderLoop()
+{
+   pollfd fds[3] = {{fStdout_pipe[0], POLLIN, 0}, {fStderr_pipe[0], POLLIN, 0}, {fControl_pipe[0], POLLIN, 0}};
+   CapturedStream *streams[2] = {&fStdout, &fStderr};
    while (true) {
-      buf_read = read(pipeHandle[0], &ch, 1);
-      if (buf_read == 1) {
-         pipeContent += ch;
-      } else
+      if (poll(fds, 3, -1) < 0) {
+         if (errno == EINTR)
+            continue;
+         break;
+      }
+      for (int i = 0; i < 2; ++i) {
+         if (fds[i].revents && !ReadPipe(fds[i].fd, *streams[i]))
+            fds[i].fd = -1; // closed, ignored by poll from now on
+      }
+      if (fds[2].revents)
          break;
    }
-#endif
+   // EndCapture closed the write ends before waking us up: get what is left
+   ReadPipe(fStdout_pipe[0], fStdout);
+   ReadPipe(fStderr_pipe[0], fStderr);
 }
+#endif
 
-void JupyROOTExecutorHandler::Poll()
+bool JupyROOTExecutorHandler::Wait(double timeout)
 {
-   PollImpl(stdout, fStdout_pipe, fStdoutpipe);
-   PollImpl(stderr, fStderr_pipe, fStderrpipe);
+   if (fPolling) {
+      // No reader thread, the pipes have to be polled
+      const auto end = std::chrono::steady_clock::now() + std::chrono::duration<double>(timeout);
+      while (true) {
+         if (fCapturing)
+            Poll();
+         std::unique_lock<std::mutex> lock(fMutex);
+         if (HasData() || !fCapturing || (timeout >= 0 && std::chrono::steady_clock::now() >= end))
+            return HasData();
+         fCond.wait_for(lock, std::chrono::milliseconds(10));
+      }
+   }
+   std::unique_lock<std::mutex> lock(fMutex);
+   auto ready = [this] { return HasData() || !fCapturing; };
+   if (timeout < 0)
+      fCond.wait(lock, ready);
+   else
+      fCond.wait_for(lock, std::chrono::duration<double>(timeout), ready);
+   return HasData();
 }
 
 static void InitCaptureImpl(int &savedStdStream, int *pipeHandle, int FILENO)
@@ -114,8 +262,25 @@ static void InitCaptureImpl(int &savedStdStream, int *pipeHandle, int FILENO)
 void JupyROOTExecutorHandler::InitCapture()
 {
    if (!fCapturing) {
+      fflush(stdout);
+      fflush(stderr);
       InitCaptureImpl(fSaved_stdout, fStdout_pipe, STDOUT_FILENO);
       InitCaptureImpl(fSaved_stderr, fStderr_pipe, STDERR_FILENO);
+#ifdef _MSC_VER
+      fPolling = true;
+#else
+      // Lines reach the pipe (and the notebook) as they are printed
+      setvbuf(stdout, nullptr, _IOLBF, BUFSIZ);
+      // Without the control pipe, the reader thread could not be stopped: fall
+      // back to polling the pipes
+      if (pipe(fControl_pipe) == 0) {
+         fReader = std::thread(&JupyROOTExecutorHandler::ReaderLoop, this);
+      } else {
+         std::lock_guard<std::mutex> pollLock(fPollMutex);
+         fPolling = true;
+      }
+#endif
+      std::lock_guard<std::mutex> lock(fMutex);
       fCapturing = true;
    }
 }
@@ -128,28 +293,75 @@ void JupyROOTExecutorHandler::EndCapture()
       dup2(fSaved_stderr, STDERR_FILENO);
       close(fSaved_stdout);
       close(fSaved_stderr);
-      close(fStdout_pipe[0]);
       close(fStdout_pipe[1]);
-      close(fStderr_pipe[0]);
       close(fStderr_pipe[1]);
-      fCapturing = false;
+#ifndef _MSC_VER
+      if (fReader.joinable()) {
+         const char stop = 0;
+         while (write(fControl_pipe[1], &stop, 1) < 0 && errno == EINTR) {
+         }
+         fReader.join();
+         close(fControl_pipe[0]);
+         close(fControl_pipe[1]);
+      } else {
+         // Get what is left, as the reader thread does before it ends
+         std::lock_guard<std::mutex> pollLock(fPollMutex);
+         ReadPipe(fStdout_pipe[0], fStdout);
+         ReadPipe(fStderr_pipe[0], fStderr);
+         fPolling = false;
+      }
+      setvbuf(stdout, nullptr, isatty(STDOUT_FILENO) ? _IOLBF : _IOFBF, BUFSIZ);
+#endif
+      close(fStdout_pipe[0]);
+      close(fStderr_pipe[0]);
+      fPolling = false;
+      {
+         std::lock_guard<std::mutex> lock(fMutex);
+         fCapturing = false;
+      }
+      fCond.notify_all();
    }
 }
 
 void JupyROOTExecutorHandler::Clear()
 {
-   fStdoutpipe = "";
-   fStderrpipe = "";
+   std::lock_guard<std::mutex> lock(fMutex);
+   fStdout = CapturedStream();
+   fStderr = CapturedStream();
 }
 
-std::string &JupyROOTExecutorHandler::GetStdout()
+std::string JupyROOTExecutorHandler::GetStdout()
 {
-   return fStdoutpipe;
+   std::lock_guard<std::mutex> lock(fMutex);
+   return fStdout.fContent;
 }
 
-std::string &JupyROOTExecutorHandler::GetStderr()
+std::string JupyROOTExecutorHandler::GetStderr()
 {
-   return fStderrpipe;
+   std::lock_guard<std::mutex> lock(fMutex);
+   return fStderr.fContent;
+}
+
+std::string JupyROOTExecutorHandler::Take(CapturedStream &stream)
+{
+   const auto length = fCapturing ? CompleteUTF8Length(stream.fContent) : stream.fContent.size();
+   std::string content = stream.fContent.substr(0, length);
+   stream.fContent.erase(0, length);
+   if (stream.fDropped) {
+      content += "\n[JupyROOT: " + std::to_string(stream.fDropped) +
+                 " bytes of output were dropped, the output buffer was full]\n";
+      stream.fDropped = 0;
+   }
+   return content;
+}
+
+/// Return the captured stdout and stderr and remove them from the buffers.
+std::pair<std::string, std::string> JupyROOTExecutorHandler::Take()
+{
+   std::lock_guard<std::mutex> lock(fMutex);
+   auto out = Take(fStdout);
+   auto err = Take(fStderr);
+   return {out, err};
 }
 
 JupyROOTExecutorHandler *JupyROOTExecutorHandler_ptr = nullptr;
@@ -244,16 +456,49 @@ PyObject *JupyROOTExecutorHandler_InitCapture(PyObject * /*self*/, PyObject * /*
    Py_RETURN_NONE;
 }
 
+PyObject *JupyROOTExecutorHandler_Wait(PyObject * /*self*/, PyObject *args)
+{
+   double timeout = -1.;
+   if (!PyArg_ParseTuple(args, "|d", &timeout))
+      return NULL;
+
+   bool hasData = false;
+   Py_BEGIN_ALLOW_THREADS
+   hasData = JupyROOTExecutorHandler_ptr->Wait(timeout);
+   Py_END_ALLOW_THREADS
+
+   return PyBool_FromLong(hasData);
+}
+
+static PyObject *CapturedToUnicode(const std::string &captured)
+{
+   return PyUnicode_DecodeUTF8(captured.data(), captured.size(), "replace");
+}
+
 PyObject *JupyROOTExecutorHandler_GetStdout(PyObject * /*self*/, PyObject * /*args*/)
 {
-   auto out = JupyROOTExecutorHandler_ptr->GetStdout().c_str();
-   return PyUnicode_FromString(out);
+   return CapturedToUnicode(JupyROOTExecutorHandler_ptr->GetStdout());
 }
 
 PyObject *JupyROOTExecutorHandler_GetStderr(PyObject * /*self*/, PyObject * /*args*/)
 {
-   auto err = JupyROOTExecutorHandler_ptr->GetStderr().c_str();
-   return PyUnicode_FromString(err);
+   return CapturedToUnicode(JupyROOTExecutorHandler_ptr->GetStderr());
+}
+
+PyObject *JupyROOTExecutorHandler_Take(PyObject * /*self*/, PyObject * /*args*/)
+{
+   auto streams = JupyROOTExecutorHandler_ptr->Take();
+   PyObject *out = CapturedToUnicode(streams.first);
+   PyObject *err = CapturedToUnicode(streams.second);
+   if (!out || !err) {
+      Py_XDECREF(out);
+      Py_XDECREF(err);
+      return NULL;
+   }
+   PyObject *result = PyTuple_Pack(2, out, err);
+   Py_DECREF(out);
+   Py_DECREF(err);
+   return result;
 }
 
 PyObject *JupyROOTExecutorHandler_Dtor(PyObject * /*self*/, PyObject * /*args*/)
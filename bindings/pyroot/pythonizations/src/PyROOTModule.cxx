@@ -96,6 +96,10 @@ static PyMethodDef gPyROOTMethods[] = {
     (char *)"End capture JupyROOTExecutorHandler"},
    {(char *)"JupyROOTExecutorHandler_InitCapture", (PyCFunction)JupyROOTExecutorHandler_InitCapture, METH_NOARGS,
     (char *)"Init capture JupyROOTExecutorHandler"},
+   {(char *)"JupyROOTExecutorHandler_Wait", (PyCFunction)JupyROOTExecutorHandler_Wait, METH_VARARGS,
+    (char *)"Wait for captured output in JupyROOTExecutorHandler"},
+   {(char *)"JupyROOTExecutorHandler_Take", (PyCFunction)JupyROOTExecutorHandler_Take, METH_NOARGS,
+    (char *)"Take captured stdout and stderr from JupyROOTExecutorHandler"},
    {(char *)"JupyROOTExecutorHandler_GetStdout", (PyCFunction)JupyROOTExecutorHandler_GetStdout, METH_NOARGS,
     (char *)"Get stdout JupyROOTExecutorHandler"},
    {(char *)"JupyROOTExecutorHandler_GetStderr", (PyCFunction)JupyROOTExecutorHandler_GetStderr, METH_NOARGS,
@@ -143,6 +147,12 @@ extern "C" PyObject *PyInit_libROOTPythonizations()
    if (!gRootModule)
       return nullptr;
 
+#ifdef Py_GIL_DISABLED
+   // without the GIL, calls into Cling from several threads rely on the interpreter lock
+   ROOT::EnableThreadSafety();
+   PyUnstable_Module_SetGIL(gRootModule, Py_MOD_GIL_NOT_USED);
+#endif
+
    // keep gRootModule, but do not increase its reference count even as it is borrowed,
    // or a self-referencing cycle would be created
 
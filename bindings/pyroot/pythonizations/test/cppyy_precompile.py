@@ -0,0 +1,101 @@
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+
+import cppyy
+import ROOT
+
+
+class Precompile(unittest.TestCase):
+    """
+    Tests for cppyy.precompile, which compiles C++ headers into a library that
+    is loaded instead of parsing the headers again.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.header = os.path.join(self.tmpdir.name, "precompile_test.h")
+        self.out_dir = os.path.join(self.tmpdir.name, "out")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_header(self, value):
+        with open(self.header, "w") as f:
+            f.write(
+                textwrap.dedent(
+                    """
+                    #ifndef PRECOMPILE_TEST_H
+                    #define PRECOMPILE_TEST_H
+                    struct PrecompileTest {{
+                        int Value() const {{ return {}; }}
+                    }};
+                    #endif
+                    """.format(value)
+                )
+            )
+
+    def run_precompile(self):
+        # Every build and load of the library happens in a new process
+        code = "import cppyy; cppyy.precompile({!r}, {!r}); print(cppyy.gbl.PrecompileTest().Value())"
+        return int(subprocess.check_output([sys.executable, "-c", code.format(self.header, self.out_dir)]))
+
+    def test_declarations(self):
+        self.write_header(1)
+        library = cppyy.precompile(self.header, self.out_dir, name="precompile_declarations")
+        self.assertTrue(os.path.exists(library))
+        self.assertEqual(cppyy.gbl.PrecompileTest().Value(), 1)
+        self.assertEqual(cppyy.precompile(self.header, self.out_dir, name="precompile_declarations"), library)
+
+    def test_reuse_and_rebuild(self):
+        self.write_header(1)
+        self.assertEqual(self.run_precompile(), 1)
+        libraries = [f for f in os.listdir(self.out_dir) if f.endswith("." + ROOT.gSystem.GetSoExt())]
+        self.assertEqual(len(libraries), 1)
+        library = os.path.join(self.out_dir, libraries[0])
+        mtime = os.path.getmtime(library)
+
+        # Unchanged header: the library is loaded as is
+        self.assertEqual(self.run_precompile(), 1)
+        self.assertEqual(os.path.getmtime(library), mtime)
+
+        # Changed header: the library is rebuilt (ACLiC compares modification
+        # times in seconds)
+        time.sleep(1.1)
+        self.write_header(2)
+        self.assertEqual(self.run_precompile(), 2)
+        self.assertGreater(os.path.getmtime(library), mtime)
+
+    def test_process_state(self):
+        """
+        The build neither changes the working directory nor the ACLiC settings,
+        which are shared by all threads, also if out_dir is below the working
+        directory.
+        """
+        self.write_header(3)
+        code = textwrap.dedent(
+            """
+            import os, cppyy
+            cwd = os.getcwd()
+            linklibs = cppyy.gbl.gEnv.GetValue("ACLiC.LinkLibs", 1)
+            cppyy.precompile({!r}, "out")
+            assert os.getcwd() == cwd
+            assert cppyy.gbl.gEnv.GetValue("ACLiC.LinkLibs", 1) == linklibs
+            print(cppyy.gbl.PrecompileTest().Value())
+            """.format(self.header)
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=self.tmpdir.name)
+        self.assertEqual(int(output), 3)
+        self.assertTrue(os.path.isdir(self.out_dir))
+
+    def test_missing_header(self):
+        with self.assertRaises(ImportError):
+            cppyy.precompile(os.path.join(self.tmpdir.name, "missing.h"), self.out_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
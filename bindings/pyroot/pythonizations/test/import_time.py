@@ -0,0 +1,87 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import unittest
+
+
+class ImportTime(unittest.TestCase):
+    """
+    Benchmark of the time needed to import ROOT and to access the TMVA
+    namespace for the first time. Every measurement is done in a new Python
+    process. Absolute times depend too much on the machine and the build, so
+    the lazy import of the TMVA pythonizations is compared with an eager
+    import of all of them, measured in the same way.
+    """
+
+    # Number of processes started for each measurement
+    repetitions = 5
+
+    # Verbose mode of the test
+    verbose = False
+
+    # Accessing ROOT.TMVA with the pythonization modules imported lazily, or
+    # eagerly as if they were imported together with the namespace
+    measure_code = """
+import importlib, json, time
+start = time.perf_counter()
+import ROOT
+import_root = time.perf_counter() - start
+start = time.perf_counter()
+ROOT.TMVA
+if {eager}:
+    from ROOT._pythonization._tmva import _lazy_attributes
+    for module in sorted(set(_lazy_attributes.values())):
+        try:
+            importlib.import_module("ROOT._pythonization._tmva." + module)
+        except ImportError:
+            pass
+print(json.dumps({{"import ROOT": import_root, "ROOT.TMVA": time.perf_counter() - start}}))
+"""
+
+    def run_python(self, code):
+        out = subprocess.check_output([sys.executable, "-c", code], env=os.environ.copy())
+        return json.loads(out.decode().strip().splitlines()[-1])
+
+    def test_tmva_submodules_are_lazy(self):
+        """
+        Importing ROOT and accessing the TMVA namespace must not import the
+        TMVA pythonization modules
+        """
+        code = """
+import json, sys
+import ROOT
+after_import = sorted(m for m in sys.modules if m.startswith("ROOT._pythonization._tmva."))
+ROOT.TMVA
+after_tmva = sorted(m for m in sys.modules if m.startswith("ROOT._pythonization._tmva."))
+print(json.dumps([after_import, after_tmva]))
+"""
+        after_import, after_tmva = self.run_python(code)
+        self.assertEqual(after_import, [])
+        self.assertEqual(after_tmva, [])
+
+    def test_import_time(self):
+        """
+        Time of the first `ROOT.TMVA` access, which must not be slower than
+        with the TMVA pythonization modules imported eagerly
+        """
+        lazy, eager = [], []
+        # Interleaved, so that a change of the load of the machine affects both
+        for _ in range(self.repetitions):
+            lazy.append(self.run_python(self.measure_code.format(eager=False)))
+            eager.append(self.run_python(self.measure_code.format(eager=True)))
+
+        lazy_tmva = statistics.median(m["ROOT.TMVA"] for m in lazy)
+        eager_tmva = statistics.median(m["ROOT.TMVA"] for m in eager)
+        if self.verbose:
+            print("import ROOT: {:.3f} s".format(statistics.median(m["import ROOT"] for m in lazy + eager)))
+            print("ROOT.TMVA: {:.3f} s lazy, {:.3f} s eager".format(lazy_tmva, eager_tmva))
+
+        # The lazy access does a subset of the work of the eager one, up to the
+        # noise of the measurement
+        self.assertLessEqual(lazy_tmva, 1.1 * eager_tmva + 0.05,
+                             "ROOT.TMVA took {:.3f} s, {:.3f} s with eager imports".format(lazy_tmva, eager_tmva))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import time
+import unittest
+
+import ROOT
+from ROOT._pythonization import pythonization_stats
+
+
+class PythonizationOverhead(unittest.TestCase):
+    """
+    Benchmark of the latency of the first access to many distinct classes,
+    which includes the lookup of their pythonizors, with a regression
+    threshold.
+    """
+
+    # Number of distinct classes that are accessed
+    num_classes = 1000
+
+    # Threshold in seconds for the time spent pythonizing all the classes. It
+    # can be scaled with the PYROOT_PYZ_OVERHEAD_SCALE environment variable,
+    # e.g. on slow or heavily loaded machines.
+    threshold = 1.0
+
+    # Verbose mode of the test
+    verbose = False
+
+    @classmethod
+    def setUpClass(cls):
+        code = "namespace PyzOverhead {\n"
+        code += "\n".join("class C{} {{}};".format(i) for i in range(cls.num_classes))
+        code += "\n}"
+        ROOT.gInterpreter.Declare(code)
+
+    def test_first_access_latency(self):
+        """
+        Time of the first access to `num_classes` distinct classes
+        """
+        scale = float(os.environ.get("PYROOT_PYZ_OVERHEAD_SCALE", "1"))
+
+        ns = ROOT.PyzOverhead
+        pythonization_stats(reset=True)
+        start = time.perf_counter()
+        for i in range(self.num_classes):
+            getattr(ns, "C{}".format(i))
+        total = time.perf_counter() - start
+        stats = pythonization_stats(reset=True)
+
+        if self.verbose:
+            print(
+                "first access of {} classes: {:.3f} s, of which pythonizing: {:.3f} s".format(
+                    self.num_classes, total, stats["time"]
+                )
+            )
+
+        # The dispatcher runs once per class, and no pythonizor is registered
+        # for these classes
+        self.assertEqual(stats["classes"], self.num_classes)
+        self.assertEqual(stats["pythonizor_calls"], 0)
+        self.assertLess(stats["time"], self.threshold * scale)
+
+
+if __name__ == "__main__":
+    unittest.main()
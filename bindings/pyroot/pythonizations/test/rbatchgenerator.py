@@ -0,0 +1,200 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import ROOT
+
+
+class RBatchGeneratorBatches(unittest.TestCase):
+    """
+    Test the batches returned by the RBatchGenerator
+    """
+
+    tree_name = "tree"
+    file_name = "rbatchgenerator_batches.root"
+    n_entries = 250
+    batch_size = 10
+    chunk_size = 100
+
+    @classmethod
+    def setUpClass(cls):
+        df = ROOT.RDataFrame(cls.n_entries)
+        df.Define("x", "(float) rdfentry_").Define("y", "(float) (2 * rdfentry_)").Snapshot(
+            cls.tree_name, cls.file_name
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.file_name)
+
+    # Helpers
+    def create_generators(self, **kwargs):
+        return ROOT.TMVA.Experimental.CreateNumPyGenerators(
+            self.tree_name, self.file_name, self.batch_size, self.chunk_size, **kwargs
+        )
+
+    def get_epoch(self, generator):
+        return [np.array(batch) for batch in generator]
+
+    def check_sequential(self, batches):
+        # Every row of the file is returned once, in the order of the file
+        self.assertEqual(len(batches), self.n_entries // self.batch_size)
+        data = np.concatenate(batches)
+        x = np.arange(self.n_entries, dtype=np.float32)
+        np.testing.assert_array_equal(data[:, 0], x)
+        np.testing.assert_array_equal(data[:, 1], 2 * x)
+
+    # Tests
+    def test_sequential_batches(self):
+        """
+        Test that the batches contain the rows of the file in order if they are not shuffled
+        """
+        gen_train, _ = self.create_generators(shuffle=False)
+
+        for epoch in range(2):
+            batches = self.get_epoch(gen_train)
+            for batch in batches:
+                self.assertEqual(batch.shape, (self.batch_size, 2))
+            self.check_sequential(batches)
+
+    def test_sequential_batches_mt(self):
+        """
+        Test that filling the batches in parallel does not change their order
+        """
+        if not hasattr(ROOT.ROOT, "TThreadExecutor"):
+            self.skipTest("ROOT was built without IMT")
+
+        ROOT.TMVA.Config.Instance().EnableMT(4)
+        try:
+            gen_train, _ = self.create_generators(shuffle=False)
+            self.check_sequential(self.get_epoch(gen_train))
+        finally:
+            ROOT.TMVA.Config.Instance().DisableMT()
+
+    def test_shuffled_batches(self):
+        """
+        Test that shuffled batches contain every row of the file exactly once per epoch
+        """
+        gen_train, _ = self.create_generators(shuffle=True)
+
+        for epoch in range(2):
+            batches = self.get_epoch(gen_train)
+            self.assertEqual(len(batches), self.n_entries // self.batch_size)
+            data = np.concatenate(batches)
+            np.testing.assert_array_equal(data[:, 1], 2 * data[:, 0])
+            np.testing.assert_array_equal(np.sort(data[:, 0]), np.arange(self.n_entries, dtype=np.float32))
+
+    def test_validation_batches(self):
+        """
+        Test that the training and validation batches together contain every row of the file
+        """
+        gen_train, gen_validation = self.create_generators(shuffle=False, validation_split=0.2)
+
+        train = self.get_epoch(gen_train)
+        validation = self.get_epoch(gen_validation)
+
+        self.assertEqual(len(train), 20)
+        self.assertEqual(len(validation), 5)
+
+        # Without shuffling, the first rows of every chunk are used for validation
+        train_x = np.concatenate(train)[:, 0]
+        validation_x = np.concatenate(validation)[:, 0]
+        np.testing.assert_array_equal(validation_x[: self.batch_size * 2], np.arange(20, dtype=np.float32))
+        np.testing.assert_array_equal(
+            np.sort(np.concatenate([train_x, validation_x])), np.arange(self.n_entries, dtype=np.float32)
+        )
+
+        # The validation batches are the same in every epoch
+        self.get_epoch(gen_train)
+        for batch, previous in zip(self.get_epoch(gen_validation), validation):
+            np.testing.assert_array_equal(batch, previous)
+
+    def test_consumer_wait_time(self):
+        """
+        Test the metrics of the time spent waiting for the loading thread
+        """
+        gen_train, _ = self.create_generators(shuffle=False)
+
+        self.assertEqual(gen_train.consumer_wait_time, 0.0)
+        self.assertEqual(gen_train.consumer_waits, 0)
+
+        n_batches = len(self.get_epoch(gen_train))
+
+        # The consumer can wait at most once per batch, plus once for the end of the epoch
+        self.assertGreaterEqual(gen_train.consumer_wait_time, 0.0)
+        self.assertLessEqual(gen_train.consumer_waits, n_batches + 1)
+        if gen_train.consumer_waits == 0:
+            self.assertEqual(gen_train.consumer_wait_time, 0.0)
+
+        # The metrics accumulate over the epochs until they are reset
+        waits = gen_train.consumer_waits
+        self.get_epoch(gen_train)
+        self.assertGreaterEqual(gen_train.consumer_waits, waits)
+
+        gen_train.ResetConsumerWaitTime()
+        self.assertEqual(gen_train.consumer_wait_time, 0.0)
+        self.assertEqual(gen_train.consumer_waits, 0)
+
+    def check_same_epochs(self, n_epochs=3, **kwargs):
+        uncached_train, _ = self.create_generators(**kwargs)
+        cached_train, _ = self.create_generators(**kwargs, cache_chunks=True)
+
+        for epoch in range(n_epochs):
+            uncached = self.get_epoch(uncached_train)
+            cached = self.get_epoch(cached_train)
+            self.assertEqual(len(cached), len(uncached))
+            for batch, expected in zip(cached, uncached):
+                np.testing.assert_array_equal(batch, expected)
+
+        return cached_train
+
+    def test_chunk_cache(self):
+        """
+        Test that epochs read from the chunk cache return the same batches as uncached epochs
+        """
+        cached_train = self.check_same_epochs(shuffle=False)
+        self.assertEqual(cached_train.base_generator.cached_chunks, 3)
+        self.assertEqual(cached_train.base_generator.cache_memory_usage, self.n_entries * 2 * 4)
+
+        self.check_same_epochs(shuffle=True)
+        self.check_same_epochs(shuffle=True, validation_split=0.2)
+        self.check_same_epochs(shuffle=False, filters=["int(x) % 3 != 0"])
+
+    def test_chunk_cache_memory_limit(self):
+        """
+        Test that the chunk cache keeps no more than the given number of bytes in memory
+        """
+        chunk_bytes = self.chunk_size * 2 * 4
+
+        for max_memory, n_chunks in [(chunk_bytes - 1, 0), (chunk_bytes + 1, 1), (2 * chunk_bytes, 2)]:
+            cached_train = self.check_same_epochs(shuffle=True, cache_max_memory=max_memory)
+            self.assertEqual(cached_train.base_generator.cached_chunks, n_chunks)
+            self.assertEqual(cached_train.base_generator.cache_memory_usage, n_chunks * chunk_bytes)
+            self.assertLessEqual(cached_train.base_generator.cache_memory_usage, max_memory)
+
+    @unittest.skipIf(sys.platform == "win32", "File-backed chunk caching is not supported on Windows")
+    def test_chunk_cache_file(self):
+        """
+        Test that epochs read from the cache file return the same batches as uncached epochs
+        """
+        cache_file = "rbatchgenerator_cache.bin"
+
+        uncached_train, _ = self.create_generators(shuffle=True)
+        cached_train, _ = self.create_generators(shuffle=True, cache_file=cache_file)
+
+        for epoch in range(3):
+            uncached = self.get_epoch(uncached_train)
+            cached = self.get_epoch(cached_train)
+            self.assertEqual(len(cached), len(uncached))
+            for batch, expected in zip(cached, uncached):
+                np.testing.assert_array_equal(batch, expected)
+
+        self.assertTrue(os.path.exists(cache_file))
+        self.assertEqual(os.path.getsize(cache_file), self.n_entries * 2 * 4)
+        self.assertEqual(cached_train.base_generator.cached_chunks, 3)
+        self.assertEqual(cached_train.base_generator.cache_memory_usage, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
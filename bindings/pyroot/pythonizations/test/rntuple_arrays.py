@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import ROOT
+
+ROOT.gInterpreter.Declare("""
+#include <ROOT/RNTupleModel.hxx>
+#include <ROOT/RNTupleWriter.hxx>
+
+void rntuple_arrays_write(const char *path, int nEntries, int clusterSize)
+{
+   using namespace ROOT::Experimental;
+   auto model = RNTupleModel::Create();
+   auto i = model->MakeField<std::int32_t>("i");
+   auto x = model->MakeField<float>("x");
+   auto b = model->MakeField<bool>("b");
+   auto v = model->MakeField<std::vector<double>>("v");
+   auto r = model->MakeField<ROOT::RVec<std::uint16_t>>("r");
+   auto p = model->MakeField<std::pair<float, std::int64_t>>("p");
+   auto s = model->MakeField<std::string>("s");
+   auto writer = RNTupleWriter::Recreate(std::move(model), "ntpl", path);
+   for (int n = 0; n < nEntries; ++n) {
+      *i = n;
+      *x = 0.5f * n;
+      *b = (n % 3 == 0);
+      v->assign(n % 4, 1.5 * n);
+      r->resize(n % 3);
+      for (std::size_t k = 0; k < r->size(); ++k)
+         (*r)[k] = n + k;
+      *p = {-1.f * n, 2 * n};
+      *s = std::to_string(n);
+      writer->Fill();
+      if ((n + 1) % clusterSize == 0)
+         writer->CommitCluster();
+   }
+}
+""")
+
+
+def expected_arrays(first, last):
+    n = np.arange(first, last)
+    v = [np.full(k % 4, 1.5 * k) for k in n]
+    r = [np.arange(k, k + k % 3, dtype=np.uint16) for k in n]
+    return {
+        "i": n.astype(np.int32),
+        "x": 0.5 * n.astype(np.float32),
+        "b": n % 3 == 0,
+        "v": v,
+        "r": r,
+        "p._0": -1.0 * n.astype(np.float32),
+        "p._1": 2 * n,
+    }
+
+
+class RNTupleArrays(unittest.TestCase):
+    """
+    Tests for RNTupleReader.arrays and RNTupleReader.iterate, which read fields
+    of an RNTuple into NumPy arrays.
+    """
+
+    nentries = 1000
+    cluster_size = 300
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmpdir.name, "rntuple_arrays.root")
+        ROOT.rntuple_arrays_write(cls.path, cls.nentries, cls.cluster_size)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def setUp(self):
+        self.reader = ROOT.Experimental.RNTupleReader.Open("ntpl", self.path)
+
+    def check(self, arrays, first, last):
+        expected = expected_arrays(first, last)
+        for name, values in arrays.items():
+            if name in ("v", "r"):
+                offsets, content = values
+                self.assertEqual(len(offsets), last - first + 1)
+                self.assertEqual(offsets[0], 0)
+                self.assertEqual(offsets[-1], len(content))
+                self.assertEqual(offsets.dtype, np.int64)
+                for k, items in enumerate(expected[name]):
+                    np.testing.assert_array_equal(content[offsets[k] : offsets[k + 1]], items)
+            else:
+                self.assertEqual(values.dtype, expected[name].dtype)
+                np.testing.assert_array_equal(values, expected[name])
+
+    def test_scalars(self):
+        arrays = self.reader.arrays(["i", "x", "b"])
+        self.assertEqual(sorted(arrays), ["b", "i", "x"])
+        self.check(arrays, 0, self.nentries)
+
+    def test_collections(self):
+        arrays = self.reader.arrays(["v", "r"])
+        self.assertEqual(arrays["v"].content.dtype, np.float64)
+        self.assertEqual(arrays["r"].content.dtype, np.uint16)
+        self.check(arrays, 0, self.nentries)
+
+    def test_record_members(self):
+        self.check(self.reader.arrays(["p._0", "p._1"]), 0, self.nentries)
+
+    def test_all_fields(self):
+        # The string field is skipped
+        arrays = self.reader.arrays()
+        self.assertEqual(sorted(arrays), ["b", "i", "r", "v", "x"])
+        self.check(arrays, 0, self.nentries)
+
+    def test_entry_range(self):
+        for first, last in [(0, 10), (250, 650), (300, 600), (999, 1000), (500, 500)]:
+            self.check(self.reader.arrays(["i", "v", "r"], entry_range=(first, last)), first, last)
+        self.check(self.reader.arrays(["i"], entry_range=(900, None)), 900, self.nentries)
+
+    def test_iterate_clusters(self):
+        chunks = list(self.reader.iterate(["i", "v"], entry_range=(100, 1000)))
+        self.assertEqual([len(chunk["i"]) for chunk in chunks], [200, 300, 300, 100])
+        first = 100
+        for chunk in chunks:
+            last = first + len(chunk["i"])
+            self.check(chunk, first, last)
+            first = last
+
+    def test_iterate_step(self):
+        chunks = list(self.reader.iterate(["x", "r"], step=128))
+        self.assertEqual(len(chunks), 8)
+        for n, chunk in enumerate(chunks):
+            self.check(chunk, 128 * n, min(128 * (n + 1), self.nentries))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.reader.arrays(["missing"])
+        with self.assertRaises(TypeError):
+            self.reader.arrays(["s"])
+        with self.assertRaises(TypeError):
+            self.reader.arrays(["v._0"])
+        with self.assertRaises(TypeError):
+            self.reader.arrays("i")
+        with self.assertRaises(ValueError):
+            self.reader.arrays(["i"], entry_range=(10, self.nentries + 1))
+        with self.assertRaises(ValueError):
+            self.reader.iterate(["i"], step=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
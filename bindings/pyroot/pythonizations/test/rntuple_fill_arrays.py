@@ -0,0 +1,180 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+import ROOT
+
+RNTupleModel = ROOT.Experimental.RNTupleModel
+RNTupleReader = ROOT.Experimental.RNTupleReader
+RNTupleWriter = ROOT.Experimental.RNTupleWriter
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def make_columns(nentries):
+    n = np.arange(nentries)
+    sizes = n % 4
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    content = np.concatenate([np.full(k % 4, 1.5 * k) for k in n]) if nentries else np.zeros(0)
+    return {
+        "i": n.astype(np.int64),
+        "x": 0.5 * n.astype(np.float32),
+        "b": n % 3 == 0,
+        "v": (offsets, content),
+    }
+
+
+class RNTupleFillArrays(unittest.TestCase):
+    """
+    Tests for RNTupleWriter.fill_arrays and RNTupleWriter.write_table, which
+    write entries of an RNTuple from NumPy arrays.
+    """
+
+    nentries = 1000
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "rntuple_fill_arrays.root")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_writer(self):
+        model = RNTupleModel.CreateBare()
+        model.MakeField["std::int64_t"]("i")
+        model.MakeField["float"]("x")
+        model.MakeField["bool"]("b")
+        model.MakeField["std::vector<double>"]("v")
+        return RNTupleWriter.Recreate(ROOT.std.move(model), "ntpl", self.path)
+
+    def read(self, sort=False):
+        reader = RNTupleReader.Open("ntpl", self.path)
+        arrays = reader.arrays()
+        if sort:
+            # Entries written in parallel are not in order
+            order = np.argsort(arrays["i"])
+            offsets, content = arrays["v"]
+            arrays = {name: values[order] for name, values in arrays.items() if name != "v"}
+            sizes = np.diff(offsets)[order]
+            arrays["v"] = (
+                np.concatenate(([0], np.cumsum(sizes))),
+                np.concatenate([content[offsets[k] : offsets[k + 1]] for k in order]),
+            )
+        return arrays
+
+    def check(self, arrays, expected):
+        self.assertEqual(sorted(arrays), sorted(expected))
+        for name in ("i", "x", "b"):
+            np.testing.assert_array_equal(arrays[name], expected[name])
+        np.testing.assert_array_equal(arrays["v"][0], expected["v"][0])
+        np.testing.assert_array_equal(arrays["v"][1], expected["v"][1])
+
+    def test_fill_arrays(self):
+        columns = make_columns(self.nentries)
+        writer = self.make_writer()
+        writer.fill_arrays(columns)
+        del writer
+        self.check(self.read(), columns)
+
+    def test_fill_arrays_batches(self):
+        columns = make_columns(self.nentries)
+        writer = self.make_writer()
+        for first, last in [(0, 0), (0, 300), (300, 301), (301, self.nentries)]:
+            offsets, content = columns["v"]
+            batch = {name: columns[name][first:last] for name in ("i", "x", "b")}
+            batch["v"] = (offsets[first : last + 1] - offsets[first], content[offsets[first] : offsets[last]])
+            writer.fill_arrays(batch)
+        del writer
+        self.check(self.read(), columns)
+
+    def test_conversion(self):
+        # The arrays are converted to the types of the fields
+        columns = make_columns(self.nentries)
+        converted = dict(columns)
+        converted["i"] = columns["i"].astype(np.int16)
+        converted["x"] = columns["x"].astype(np.float64)
+        converted["v"] = (columns["v"][0].astype(np.int32), columns["v"][1].astype(np.float32))
+        writer = self.make_writer()
+        writer.fill_arrays(converted)
+        del writer
+        self.check(self.read(), columns)
+
+    def test_write_table(self):
+        columns = make_columns(self.nentries)
+        RNTupleWriter.write_table(columns, "ntpl", self.path)
+        arrays = self.read()
+        self.assertEqual(arrays["i"].dtype, np.int64)
+        self.assertEqual(arrays["x"].dtype, np.float32)
+        self.assertEqual(arrays["b"].dtype, np.bool_)
+        self.assertEqual(arrays["v"].content.dtype, np.float64)
+        self.check(arrays, columns)
+
+    def test_write_table_parallel(self):
+        columns = make_columns(self.nentries)
+        RNTupleWriter.write_table(columns, "ntpl", self.path, nthreads=4)
+        self.check(self.read(sort=True), columns)
+
+    def test_write_table_parallel_first_use(self):
+        # The filler code is declared by the first use in a process, which has
+        # to work when it is a parallel write
+        code = """
+import numpy as np
+import ROOT
+n = np.arange(10000)
+ROOT.Experimental.RNTupleWriter.write_table({{"i": n, "v": (np.arange(10001), np.zeros(10000))}}, "ntpl", {!r},
+                                            nthreads=8)
+print(ROOT.Experimental.RNTupleReader.Open("ntpl", {!r}).GetNEntries())
+""".format(self.path, self.path)
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(int(output.splitlines()[-1]), 10000)
+
+    def test_write_table_empty(self):
+        columns = make_columns(0)
+        RNTupleWriter.write_table(columns, "ntpl", self.path, nthreads=2)
+        reader = RNTupleReader.Open("ntpl", self.path)
+        self.assertEqual(reader.GetNEntries(), 0)
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_arrow(self):
+        columns = make_columns(self.nentries)
+        offsets, content = columns["v"]
+        table = pyarrow.table(
+            {
+                "i": columns["i"],
+                "x": columns["x"],
+                "b": columns["b"],
+                "v": pyarrow.ListArray.from_arrays(offsets.astype(np.int32), content),
+            }
+        )
+        RNTupleWriter.write_table(table, "ntpl", self.path)
+        self.check(self.read(), columns)
+
+    def test_invalid(self):
+        columns = make_columns(10)
+        writer = self.make_writer()
+        with self.assertRaises(ValueError):
+            writer.fill_arrays({name: values for name, values in columns.items() if name != "x"})
+        with self.assertRaises(ValueError):
+            writer.fill_arrays(dict(columns, y=columns["x"]))
+        with self.assertRaises(ValueError):
+            writer.fill_arrays(dict(columns, x=columns["x"][:5]))
+        with self.assertRaises(ValueError):
+            writer.fill_arrays(dict(columns, v=(columns["v"][0] + 100, columns["v"][1])))
+        with self.assertRaises(TypeError):
+            writer.fill_arrays(dict(columns, x=columns["v"]))
+        with self.assertRaises(TypeError):
+            writer.fill_arrays(dict(columns, v=columns["x"]))
+        with self.assertRaises(TypeError):
+            RNTupleWriter.write_table({"s": np.array(["a", "b"])}, "ntpl", self.path)
+        with self.assertRaises(ValueError):
+            RNTupleWriter.write_table(columns, "ntpl", self.path, nthreads=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
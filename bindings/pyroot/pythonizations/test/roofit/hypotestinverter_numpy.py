@@ -0,0 +1,68 @@
+import unittest
+
+import ROOT
+
+import numpy as np
+
+
+class TestHypoTestInverterNumpy(unittest.TestCase):
+    def _run_scan(self, n_workers, warm_start=False):
+        ws = ROOT.RooWorkspace("w")
+        ws.factory("Poisson::pdf(n[10, 0, 50], sum::mean(prod::sig(mu[1, 0, 10], s[4]), b[5, 0, 20]))")
+        ws.factory("Gaussian::bconstr(b0[5], b, 1.0)")
+        ws.factory("PROD::model(pdf, bconstr)")
+        ws["b0"].setConstant()
+
+        data = ROOT.RooDataSet("data", "data", {ws["n"]})
+        data.add({ws["n"]})
+
+        sb_model = ROOT.RooStats.ModelConfig("sb_model", ws)
+        sb_model.SetPdf(ws["model"])
+        sb_model.SetObservables({ws["n"]})
+        sb_model.SetParametersOfInterest({ws["mu"]})
+        sb_model.SetNuisanceParameters({ws["b"]})
+        sb_model.SetGlobalObservables({ws["b0"]})
+        sb_model.SetSnapshot({ws["mu"]})
+
+        b_model = sb_model.Clone("b_model")
+        ws["mu"].setVal(0)
+        b_model.SetSnapshot({ws["mu"]})
+        ws["mu"].setVal(1)
+
+        calc = ROOT.RooStats.AsymptoticCalculator(data, b_model, sb_model)
+        calc.SetOneSided(True)
+        calc.SetWarmStart(warm_start)
+
+        inverter = ROOT.RooStats.HypoTestInverter(calc, ws["mu"])
+        inverter.SetConfidenceLevel(0.95)
+        inverter.UseCLs(True)
+        inverter.SetNumWorkers(n_workers)
+        inverter.SetFixedScan(7, 0.5, 5)
+
+        result = inverter.GetInterval()
+        return result.to_numpy()
+
+    def test_to_numpy(self):
+        """Check the columns of the table returned by HypoTestInverterResult.to_numpy()."""
+
+        table = self._run_scan(0)
+
+        np.testing.assert_allclose(table["x"], np.linspace(0.5, 5, 7))
+        for key in ["cls", "cls_err", "clb", "clb_err", "clsplusb", "clsplusb_err"]:
+            self.assertEqual(len(table[key]), 7)
+        # CLs decreases with the signal strength
+        self.assertTrue(np.all(np.diff(table["cls"]) < 0))
+
+    def test_parallel_scan(self):
+        """Compare a scan with worker processes and warm starts to a serial scan."""
+
+        serial = self._run_scan(0)
+        parallel = self._run_scan(3, warm_start=True)
+
+        np.testing.assert_allclose(parallel["x"], serial["x"])
+        np.testing.assert_allclose(parallel["cls"], serial["cls"], rtol=1e-3)
+        np.testing.assert_allclose(parallel["clb"], serial["clb"], rtol=1e-3)
+
+
+if __name__ == "__main__":
+    unittest.main()
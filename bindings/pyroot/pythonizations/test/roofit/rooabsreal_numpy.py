@@ -0,0 +1,63 @@
+import unittest
+
+import ROOT
+
+import numpy as np
+
+
+class TestRooAbsRealNumpy(unittest.TestCase):
+    def _create_model(self):
+        x = ROOT.RooRealVar("x", "x", -10, 10)
+        mean = ROOT.RooRealVar("mean", "mean", 1.0, -5, 5)
+        sigma = ROOT.RooRealVar("sigma", "sigma", 2.0, 0.1, 10)
+        gauss = ROOT.RooGaussian("gauss", "gauss", x, mean, sigma)
+        return gauss, x, mean, sigma
+
+    def _reference(self, pdf, x, values, normSet=None):
+        out = []
+        for val in values:
+            x.setVal(val)
+            out.append(pdf.getVal(normSet))
+        return np.array(out)
+
+    def test_evaluate_numpy(self):
+        """Compare evaluate_numpy() to getVal() in a loop, with and without normalization."""
+
+        gauss, x, mean, sigma = self._create_model()
+
+        values = np.linspace(-9.5, 9.5, 101)
+
+        np.testing.assert_allclose(gauss.evaluate_numpy({"x": values}), self._reference(gauss, x, values))
+        np.testing.assert_allclose(
+            gauss.evaluate_numpy({"x": values}, {x}), self._reference(gauss, x, values, ROOT.RooArgSet(x))
+        )
+
+    def test_evaluate_numpy_parameter_change(self):
+        """Check that the cached evaluator picks up changed parameter values."""
+
+        gauss, x, mean, sigma = self._create_model()
+
+        values = np.linspace(-9.5, 9.5, 11)
+        gauss.evaluate_numpy({"x": values}, {x})
+
+        mean.setVal(-2.0)
+        sigma.setVal(3.0)
+
+        np.testing.assert_allclose(
+            gauss.evaluate_numpy({"x": values}, {x}), self._reference(gauss, x, values, ROOT.RooArgSet(x))
+        )
+
+    def test_evaluate_numpy_invalid_input(self):
+        """Check that inconsistent inputs are rejected."""
+
+        gauss, x, mean, sigma = self._create_model()
+
+        with self.assertRaises(ValueError):
+            gauss.evaluate_numpy({"y": np.zeros(3)})
+
+        with self.assertRaises(ValueError):
+            gauss.evaluate_numpy({"x": np.zeros(3), "mean": np.zeros(4)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,6 +44,31 @@ class TestRooDataHistNumpy(unittest.TestCase):
         compare_to_ref(datahist_1)
         compare_to_ref(datahist_2)
 
+    def test_from_numpy_2d(self):
+        """Test importing a two-dimensional histogram."""
+
+        x = ROOT.RooRealVar("x", "x", 0, 3)
+        y = ROOT.RooRealVar("y", "y", 0, 2)
+
+        hist = np.arange(6, dtype=np.float64).reshape(3, 2)
+
+        datahist = ROOT.RooDataHist.from_numpy(hist, [x, y], bins=[3, 2], ranges=[(0, 3), (0, 2)])
+
+        hist_new, _ = datahist.to_numpy()
+        np.testing.assert_allclose(hist_new, hist)
+        self.assertEqual(datahist.sumEntries(), hist.sum())
+
+    def test_to_numpy_no_copy(self):
+        """Test that the weights can be viewed without copying them."""
+
+        x = ROOT.RooRealVar("x", "x", 0, 4)
+
+        datahist = ROOT.RooDataHist.from_numpy(np.array([1.0, 2.0, 3.0, 4.0]), [x], bins=[4], ranges=[(0, 4)])
+
+        view, _ = datahist.to_numpy(copy=False)
+        datahist.set(0, 10.0, -1.0)
+        self.assertEqual(view[0], 10.0)
+
 
 if __name__ == "__main__":
     unittest.main()
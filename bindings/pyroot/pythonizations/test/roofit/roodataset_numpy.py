@@ -184,6 +184,31 @@ class TestRooDataSetNumpy(unittest.TestCase):
         np.testing.assert_equal(data["obs_1"], data_roundtripped["obs_1"])
         np.testing.assert_equal(data["obs_2"], data_roundtripped["obs_2"])
 
+    def test_from_numpy_no_copy(self):
+        """Test that the dataset can use the memory of the numpy arrays."""
+
+        data, x, cat = self._create_dataset()
+
+        np_data = data.to_numpy()
+        np_data["cat"] = np_data["cat"].astype(np.int32)
+
+        data_2 = ROOT.RooDataSet.from_numpy(np_data, (x, cat), name="data_2", title="data_2", copy=False)
+
+        # The dataset uses the same memory as the input arrays
+        np_data_2 = data_2.to_numpy(copy=False)
+        self.assertEqual(np_data_2["x"].ctypes.data, np_data["x"].ctypes.data)
+        self.assertEqual(np_data_2["cat"].ctypes.data, np_data["cat"].ctypes.data)
+
+        np.testing.assert_almost_equal(data_2.sumEntries(), data.sumEntries(), decimal=10)
+        self._check_value_equality(data_2, np_data)
+
+        # Modifying the dataset copies the data, and leaves the arrays untouched
+        x_first = np_data["x"][0]
+        x.setVal(1.0)
+        data_2.add(ROOT.RooArgSet(x, cat))
+        self.assertEqual(data_2.numEntries(), data.numEntries() + 1)
+        self.assertEqual(np_data["x"][0], x_first)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -172,6 +172,19 @@ class ArrayInterface(unittest.TestCase):
         y = np.copy(y)
         self.assertTrue(y.flags.owndata)
 
+    def test_reshapeInplace(self):
+        """
+        Test that the array interface follows an in-place reshape
+        """
+        shape = ROOT.std.vector("size_t")((2, 3))
+        x = RTensor("float")(shape)
+        self.assertEqual(np.asarray(x).shape, (2, 3))
+
+        x.ReshapeInplace(ROOT.std.vector("size_t")((3, 2)))
+        y = np.asarray(x)
+        self.assertEqual(y.shape, (3, 2))
+        self.assertTrue(y.flags.c_contiguous)
+
 
 class NumpyCompliance(unittest.TestCase):
     """
@@ -301,5 +314,96 @@ class NumpyCompliance(unittest.TestCase):
         self.assertEqual(x4[1], y4[1])
 
 
+    def test_element(self):
+        """
+        Test access to single elements, also with negative indices
+        """
+        shape = ROOT.std.vector("size_t")((4, 3))
+        x = RTensor("float")(shape)
+        y = np.asarray(x)
+        y[:] = np.arange(12).reshape(4, 3)
+
+        for idx in [(0, 0), (1, 2), (-1, 0), (3, -3), (-4, -1)]:
+            self.assertEqual(x[idx], y[idx])
+
+        for idx in [(4, 0), (0, 3), (-5, 0), (0, -4)]:
+            with self.assertRaises(IndexError):
+                x[idx]
+
+    def test_extended_slice(self):
+        """
+        Test slicing with steps, negative steps and ellipsis, which returns
+        numpy views on the RTensor memory
+        """
+        shape = ROOT.std.vector("size_t")((4, 3))
+        x = RTensor("float")(shape)
+        y = np.asarray(x)
+        y[:] = np.arange(12).reshape(4, 3)
+
+        for idx in [np.s_[::2, :], np.s_[::-1, 1], np.s_[..., 0], np.s_[1:, ::-2], np.s_[None, 1]]:
+            x1 = x[idx]
+            y1 = y[idx]
+            self.assertEqual(x1.shape, y1.shape)
+            self.assertTrue(np.array_equal(x1, y1))
+
+        # The slices are views: writing to them changes the RTensor
+        x2 = x[::2, 0]
+        x2[:] = -1
+        self.assertEqual(x[0, 0], -1)
+        self.assertEqual(x[2, 0], -1)
+        self.assertEqual(x[1, 0], 3)
+
+    def test_setitem(self):
+        """
+        Test assignment to elements and slices
+        """
+        shape = ROOT.std.vector("size_t")((2, 3))
+        x = RTensor("float")(shape)
+        x[0, 1] = 5
+        x[1, :] = [1, 2, 3]
+        y = np.asarray(x)
+        self.assertEqual(y[0, 1], 5)
+        self.assertTrue(np.array_equal(y[1], [1, 2, 3]))
+
+    def test_ufuncs(self):
+        """
+        Test ufuncs and in-place arithmetic on the RTensor memory
+        """
+        shape = ROOT.std.vector("size_t")((2, 2))
+        x = RTensor("float")(shape)
+        y = np.asarray(x)
+        y[:] = [[1, 2], [3, 4]]
+
+        # Out of place operations return numpy arrays
+        z = np.sqrt(x)
+        self.assertTrue(isinstance(z, np.ndarray))
+        self.assertTrue(np.allclose(z, np.sqrt(y)))
+        self.assertTrue(np.array_equal(x + 1, y + 1))
+        self.assertTrue(np.array_equal(2 * x, 2 * y))
+
+        # In place operations modify the RTensor
+        x_before = x
+        x *= 2
+        self.assertTrue(x is x_before)
+        self.assertTrue(np.array_equal(y, [[2, 4], [6, 8]]))
+
+        out = np.add(x, 1, out=x)
+        self.assertTrue(out is x)
+        self.assertTrue(np.array_equal(y, [[3, 5], [7, 9]]))
+
+    def test_array_copy(self):
+        """
+        Test conversion to numpy with and without copy
+        """
+        shape = ROOT.std.vector("size_t")((2, 2))
+        x = RTensor("float")(shape)
+        y = np.array(x, copy=True)
+        y[0, 0] = 1
+        self.assertEqual(x[0, 0], 0)
+
+        z = np.asarray(x, dtype="float64")
+        self.assertEqual(z.dtype, np.float64)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+
+import numpy as np
+import ROOT
+
+ROOT.gInterpreter.Declare("""
+double vectorize_add(double a, double b) { return a + b; }
+int vectorize_overloaded(int i) { return 1; }
+int vectorize_overloaded(double d) { return 2; }
+
+struct VectorizeScale {
+    double fFactor;
+    double Apply(double x) const { return fFactor * x; }
+};
+""")
+
+
+class Vectorize(unittest.TestCase):
+    """
+    Tests for ROOT.VecOps.Vectorize, which applies a C++ function element-wise
+    to Numpy arrays with a just-in-time compiled loop.
+    """
+
+    def test_free_function(self):
+        f = ROOT.VecOps.Vectorize(ROOT.vectorize_add)
+        a = np.arange(10, dtype=np.float64)
+        b = np.arange(10, 20, dtype=np.float64)
+        np.testing.assert_array_equal(f(a, b), a + b)
+
+    def test_namespace_function(self):
+        f = ROOT.VecOps.Vectorize(ROOT.Math.gaussian_pdf)
+        x = np.linspace(-3, 3, 101)
+        expected = np.array([ROOT.Math.gaussian_pdf(v, 2.0, 0.5) for v in x])
+        np.testing.assert_allclose(f(x, 2.0, 0.5), expected)
+
+    def test_name(self):
+        f = ROOT.VecOps.Vectorize("ROOT::Math::gaussian_pdf")
+        x = np.linspace(-3, 3, 11)
+        np.testing.assert_allclose(f(x), [ROOT.Math.gaussian_pdf(v) for v in x])
+
+    def test_broadcasting(self):
+        f = ROOT.VecOps.Vectorize(ROOT.vectorize_add)
+        a = np.arange(4, dtype=np.float64).reshape(4, 1)
+        b = np.arange(3, dtype=np.float64)
+        res = f(a, b)
+        self.assertEqual(res.shape, (4, 3))
+        np.testing.assert_array_equal(res, a + b)
+
+    def test_strided(self):
+        f = ROOT.VecOps.Vectorize(ROOT.vectorize_add)
+        a = np.arange(20, dtype=np.float64)[::2]
+        np.testing.assert_array_equal(f(a, 1.0), a + 1.0)
+
+    def test_out(self):
+        f = ROOT.VecOps.Vectorize(ROOT.vectorize_add)
+        a = np.arange(10, dtype=np.float64)
+        out = np.zeros(10, dtype=np.float32)
+        res = f(a, a, out=out)
+        self.assertIs(res, out)
+        np.testing.assert_array_equal(out, 2 * a)
+
+        with self.assertRaises(ValueError):
+            f(a, a, out=np.zeros(5))
+
+    def test_overload_resolution(self):
+        f = ROOT.VecOps.Vectorize(ROOT.vectorize_overloaded)
+        self.assertTrue((f(np.arange(5, dtype=np.int32)) == 1).all())
+        self.assertTrue((f(np.arange(5, dtype=np.float64)) == 2).all())
+
+        g = ROOT.VecOps.Vectorize(ROOT.vectorize_overloaded, signature="double")
+        self.assertTrue((g(np.arange(5, dtype=np.int32)) == 2).all())
+
+    def test_bound_method(self):
+        s = ROOT.VectorizeScale()
+        s.fFactor = 3.0
+        f = ROOT.VecOps.Vectorize(s.Apply)
+        a = np.arange(10, dtype=np.float64)
+        np.testing.assert_array_equal(f(a), 3.0 * a)
+
+    def test_threads(self):
+        f = ROOT.VecOps.Vectorize(ROOT.vectorize_add, nthreads=4, chunksize=1000)
+        a = np.arange(100000, dtype=np.float64)
+        np.testing.assert_array_equal(f(a, a), 2 * a)
+
+    def test_invalid(self):
+        f = ROOT.VecOps.Vectorize(ROOT.vectorize_add)
+        with self.assertRaises(TypeError):
+            f(np.arange(3, dtype=np.complex128), 1.0)
+
+    def test_not_viable(self):
+        # The failure to compile the call is reported as a TypeError, not as a C++ syntax error
+        f = ROOT.VecOps.Vectorize(ROOT.vectorize_add)
+        with self.assertRaisesRegex(TypeError, "no viable C\\+\\+ call"):
+            f(np.arange(3, dtype=np.float64))
+        with self.assertRaisesRegex(TypeError, "no viable C\\+\\+ call"):
+            f(np.arange(3, dtype=np.float64), 1.0, 2.0)
+
+        g = ROOT.VecOps.Vectorize("VectorizeScale::Apply")
+        with self.assertRaisesRegex(TypeError, "no viable C\\+\\+ call"):
+            g(np.arange(3, dtype=np.float64))
+
+
+if __name__ == "__main__":
+    unittest.main()
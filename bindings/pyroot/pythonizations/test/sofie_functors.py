@@ -0,0 +1,76 @@
+import unittest
+
+import ROOT
+
+# Stand-in for a Session class generated by SOFIE: the model sums its inputs,
+# one output per entry of a batch, and records the weights file it was
+# created with
+ROOT.gInterpreter.Declare(
+    """
+#include <numeric>
+#include <string>
+#include <vector>
+
+template <std::size_t InputSize, std::size_t BatchSize>
+struct SofieFunctorsTestSession {
+   static std::string& LastWeightsFile() { static std::string file; return file; }
+
+   SofieFunctorsTestSession() { LastWeightsFile() = "<none>"; }
+   SofieFunctorsTestSession(const std::string &weightsFile) { LastWeightsFile() = weightsFile; }
+
+   std::vector<float> infer(float *input)
+   {
+      std::vector<float> output(BatchSize);
+      for (std::size_t i = 0; i < BatchSize; ++i)
+         output[i] = std::accumulate(input + i * InputSize, input + (i + 1) * InputSize, 0.f);
+      return output;
+   }
+};
+"""
+)
+
+
+class SofieFunctors(unittest.TestCase):
+    """
+    Tests for the declaration of SOFIE functors usable in RDataFrame.
+    """
+
+    session3 = "SofieFunctorsTestSession<3, 1>"
+
+    def last_weights_file(self):
+        return str(ROOT.SofieFunctorsTestSession[3, 1].LastWeightsFile())
+
+    def test_functor(self):
+        name = ROOT.TMVA.Experimental.DeclareSofieFunctor(3, self.session3, nslots=2)
+        functor = getattr(ROOT, name)
+        self.assertAlmostEqual(functor(0, 1.0, 2.0, 3.0), 6.0)
+        self.assertAlmostEqual(functor(1, 1.0, 1.0, 1.0), 3.0)
+        self.assertEqual(self.last_weights_file(), "<none>")
+
+    def test_functor_in_rdataframe(self):
+        name = ROOT.TMVA.Experimental.DeclareSofieFunctor(3, self.session3)
+        df = ROOT.RDataFrame(10).Define("x", "float(rdfentry_)")
+        df = df.Define("y", "{}(rdfslot_, x, 2 * x, 1.f)".format(name))
+        self.assertAlmostEqual(df.Sum("y").GetValue(), 3 * 45 + 10)
+
+    def test_rvec_functor(self):
+        session = "SofieFunctorsTestSession<2, 4>"
+        name = ROOT.TMVA.Experimental.DeclareSofieRVecFunctor(session, 2, batch_size=4, nslots=1)
+        functor = getattr(ROOT, name)
+        # Five entries: one full batch and one padded batch
+        output = functor(0, ROOT.RVec["float"]([1, 2, 3, 4, 5, 6, 7, 8, 9, 10]))
+        self.assertEqual(list(output), [3, 7, 11, 15, 19])
+
+    def test_weights_file_escaping(self):
+        for weights_file in ["C:\\models\\model.dat", 'dir "with" quotes/model.dat', "newline\nmodel.dat"]:
+            name = ROOT.TMVA.Experimental.DeclareSofieFunctor(3, self.session3, nslots=1, weights_file=weights_file)
+            getattr(ROOT, name)(0, 1.0, 2.0, 3.0)
+            self.assertEqual(self.last_weights_file(), weights_file)
+
+    def test_invalid_session(self):
+        with self.assertRaisesRegex(RuntimeError, "SofieFunctor<3, SofieFunctorsTestMissingSession>"):
+            ROOT.TMVA.Experimental.DeclareSofieFunctor(3, "SofieFunctorsTestMissingSession", nslots=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
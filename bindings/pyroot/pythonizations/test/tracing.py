@@ -0,0 +1,77 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import ROOT
+
+
+class Tracing(unittest.TestCase):
+    """
+    Tests for ROOT.tracing, which records the time spent in lookups,
+    pythonizations, autoloading and JIT compilation.
+    """
+
+    def setUp(self):
+        ROOT.tracing.reset()
+        ROOT.tracing.enable()
+
+    def tearDown(self):
+        ROOT.tracing.disable()
+        ROOT.tracing.reset()
+
+    def categories(self):
+        return {c for c, _, _, _ in ROOT.tracing.events()}
+
+    def test_lookup_and_pythonization(self):
+        ROOT.TGraphErrors
+        events = ROOT.tracing.events()
+        self.assertIn(("lookup", "TGraphErrors"), [(c, n) for c, n, _, _ in events])
+        self.assertIn("pythonization", self.categories())
+
+    def test_wrapper_jit(self):
+        ROOT.gInterpreter.Declare("int tracing_test_function(int i) { return i + 1; }")
+        self.assertEqual(ROOT.tracing_test_function(1), 2)
+        names = [n for c, n, _, _ in ROOT.tracing.events() if c == "wrapper"]
+        self.assertIn("tracing_test_function", names)
+
+    def test_events_are_ordered(self):
+        ROOT.TH2F
+        starts = [s for _, _, s, _ in ROOT.tracing.events()]
+        self.assertEqual(starts, sorted(starts))
+        self.assertTrue(all(d >= 0 for _, _, _, d in ROOT.tracing.events()))
+
+    def test_disabled(self):
+        ROOT.tracing.disable()
+        ROOT.tracing.reset()
+        ROOT.TProfile
+        self.assertEqual(ROOT.tracing.events(), [])
+
+    def test_summary(self):
+        ROOT.TH3D
+        summary = ROOT.tracing.summary()
+        self.assertTrue(summary.startswith("category"))
+        self.assertIn("lookup", summary)
+
+    def test_environment(self):
+        """
+        PYROOT_TRACE writes a Chrome trace of the whole process at exit
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            trace_file = os.path.join(tmpdir, "trace.json")
+            env = dict(os.environ, PYROOT_TRACE=trace_file)
+            subprocess.check_call([sys.executable, "-c", "import ROOT; ROOT.TH1D"], env=env)
+            with open(trace_file) as f:
+                trace = json.load(f)
+
+        events = trace["traceEvents"]
+        self.assertTrue(all(e["ph"] == "X" for e in events))
+        self.assertIn(("import", "import ROOT"), [(e["cat"], e["name"]) for e in events])
+        self.assertIn(("lookup", "TH1D"), [(e["cat"], e["name"]) for e in events])
+        self.assertIn("setup", {e["cat"] for e in events})
+
+
+if __name__ == "__main__":
+    unittest.main()
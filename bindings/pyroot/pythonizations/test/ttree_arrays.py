@@ -0,0 +1,243 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import ROOT
+
+ROOT.gInterpreter.Declare("""
+#include <TFile.h>
+#include <TTree.h>
+
+#include <string>
+#include <vector>
+
+void ttree_arrays_fill(TTree &t, int nEntries)
+{
+   int i, n;
+   float x, f[3];
+   bool b;
+   unsigned short u;
+   double a[4];
+   std::vector<float> v;
+   std::string s;
+   t.Branch("i", &i, "i/I");
+   t.Branch("x", &x, "x/F");
+   t.Branch("b", &b, "b/O");
+   t.Branch("u", &u, "u/s");
+   t.Branch("f", f, "f[3]/F");
+   t.Branch("n", &n, "n/I");
+   t.Branch("a", a, "a[n]/D");
+   t.Branch("v", &v);
+   t.Branch("s", &s);
+   t.Branch("p", &x, "px/F:py/F");
+   for (i = 0; i < nEntries; ++i) {
+      x = 0.5f * i;
+      b = (i % 3 == 0);
+      u = i;
+      for (int k = 0; k < 3; ++k)
+         f[k] = i + k;
+      n = i % 4;
+      for (int k = 0; k < n; ++k)
+         a[k] = 1.5 * i + k;
+      v.assign(i % 3, -1.f * i);
+      s = std::to_string(i);
+      t.Fill();
+   }
+   // The addresses of the branches go out of scope
+   t.ResetBranchAddresses();
+}
+
+void ttree_arrays_write(const char *path, int nEntries, int clusterSize)
+{
+   TFile file(path, "RECREATE");
+   TTree t("tree", "tree");
+   t.SetAutoFlush(clusterSize);
+   ttree_arrays_fill(t, nEntries);
+   file.Write();
+}
+""")
+
+
+def expected_arrays(first, last):
+    n = np.arange(first, last)
+    return {
+        "i": n.astype(np.int32),
+        "x": 0.5 * n.astype(np.float32),
+        "b": n % 3 == 0,
+        "u": n.astype(np.uint16),
+        "f": (n[:, None] + np.arange(3)).astype(np.float32),
+        "n": (n % 4).astype(np.int32),
+        "a": [1.5 * k + np.arange(k % 4) for k in n],
+        "v": [np.full(k % 3, -1.0 * k, dtype=np.float32) for k in n],
+    }
+
+
+class TTreeArrays(unittest.TestCase):
+    """
+    Tests for TTree.arrays and TTree.iterate, which read branches of a TTree
+    into NumPy arrays.
+    """
+
+    nentries = 1000
+    cluster_size = 300
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmpdir.name, "ttree_arrays.root")
+        ROOT.ttree_arrays_write(cls.path, cls.nentries, cls.cluster_size)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def setUp(self):
+        self.file = ROOT.TFile.Open(self.path)
+        self.tree = self.file.Get("tree")
+
+    def tearDown(self):
+        self.file.Close()
+
+    def check(self, arrays, first, last, shift=0):
+        # The entries of the TTree, or of a TChain, with numbers shifted by
+        # `shift` with respect to the ones of the TTree
+        expected = expected_arrays(first - shift, last - shift)
+        for name, values in arrays.items():
+            if name in ("a", "v"):
+                offsets, content = values
+                self.assertEqual(len(offsets), last - first + 1)
+                self.assertEqual(offsets[0], 0)
+                self.assertEqual(offsets[-1], len(content))
+                self.assertEqual(offsets.dtype, np.int64)
+                for k, items in enumerate(expected[name]):
+                    np.testing.assert_array_equal(content[offsets[k] : offsets[k + 1]], items)
+            else:
+                self.assertEqual(values.dtype, expected[name].dtype)
+                np.testing.assert_array_equal(values, expected[name])
+
+    def test_scalars(self):
+        arrays = self.tree.arrays(["i", "x", "b", "u"])
+        self.assertEqual(sorted(arrays), ["b", "i", "u", "x"])
+        self.check(arrays, 0, self.nentries)
+
+    def test_fixed_size_arrays(self):
+        arrays = self.tree.arrays(["f"])
+        self.assertEqual(arrays["f"].shape, (self.nentries, 3))
+        self.check(arrays, 0, self.nentries)
+
+    def test_collections(self):
+        arrays = self.tree.arrays(["a", "v"])
+        self.assertEqual(arrays["a"].content.dtype, np.float64)
+        self.assertEqual(arrays["v"].content.dtype, np.float32)
+        self.check(arrays, 0, self.nentries)
+
+    def test_all_branches(self):
+        # The string and leaf list branches are skipped
+        arrays = self.tree.arrays()
+        self.assertEqual(sorted(arrays), ["a", "b", "f", "i", "n", "u", "v", "x"])
+        self.check(arrays, 0, self.nentries)
+
+    def test_entry_range(self):
+        for first, last in [(0, 10), (250, 650), (300, 600), (999, 1000), (500, 500)]:
+            arrays = self.tree.arrays(["i", "f", "a", "v"], entry_start=first, entry_stop=last)
+            self.check(arrays, first, last)
+        self.check(self.tree.arrays(["i"], entry_start=900), 900, self.nentries)
+        self.check(self.tree.arrays(["i"], entry_stop=100), 0, 100)
+
+    def test_iterate_clusters(self):
+        chunks = list(self.tree.iterate(["i", "a"], entry_start=100))
+        self.assertEqual([len(chunk["i"]) for chunk in chunks], [200, 300, 300, 100])
+        first = 100
+        for chunk in chunks:
+            last = first + len(chunk["i"])
+            self.check(chunk, first, last)
+            first = last
+
+    def test_iterate_step_size(self):
+        chunks = list(self.tree.iterate(["x", "v"], step_size=128))
+        self.assertEqual(len(chunks), 8)
+        for n, chunk in enumerate(chunks):
+            self.check(chunk, 128 * n, min(128 * (n + 1), self.nentries))
+
+    def test_chain(self):
+        chain = ROOT.TChain("tree")
+        chain.Add(self.path)
+        chain.Add(self.path)
+        arrays = chain.arrays(["i", "a", "v"], entry_start=900, entry_stop=1100)
+        self.check({name: values[:100] for name, values in arrays.items() if name == "i"}, 900, 1000)
+        self.check({name: values[100:] for name, values in arrays.items() if name == "i"}, 1000, 1100, shift=1000)
+        offsets, content = arrays["a"]
+        self.check({"a": (offsets[:101], content[: offsets[100]])}, 900, 1000)
+        self.check({"a": (offsets[100:] - offsets[100], content[offsets[100] :])}, 1000, 1100, shift=1000)
+
+        chunks = list(chain.iterate(["i"], step_size=150, entry_start=900, entry_stop=1200))
+        self.assertEqual([len(chunk["i"]) for chunk in chunks], [150, 150])
+        np.testing.assert_array_equal(np.concatenate([chunk["i"] for chunk in chunks]), np.arange(900, 1200) % 1000)
+
+    def test_tree_in_memory(self):
+        # The baskets that are not written to a file are read too
+        tree = ROOT.TTree("memtree", "memtree")
+        tree.SetDirectory(ROOT.nullptr)
+        ROOT.ttree_arrays_fill(tree, 100)
+        self.check(tree.arrays(["i", "f", "a", "v"]), 0, 100)
+
+    def test_implicit_mt(self):
+        if not hasattr(ROOT, "EnableImplicitMT"):
+            self.skipTest("ROOT was built without implicit multi-threading")
+        ROOT.EnableImplicitMT(2)
+        try:
+            self.check(self.tree.arrays(), 0, self.nentries)
+        finally:
+            ROOT.DisableImplicitMT()
+
+    def cache_state(self):
+        cache = self.tree.GetReadCache(self.file, True)
+        branches = sorted(str(branch.GetName()) for branch in cache.GetCachedBranches())
+        return branches, cache.IsLearning(), cache.GetEntryMin(), cache.GetEntryMax()
+
+    def test_cache_restored(self):
+        # The TTreeCache is set up for the bulk read only, the user's settings are kept
+        state = self.cache_state()
+        self.assertTrue(state[1])
+        self.check(self.tree.arrays(["i", "a"], entry_start=250, entry_stop=650), 250, 650)
+        self.assertEqual(self.cache_state(), state)
+
+        self.tree.AddBranchToCache("x", True)
+        self.tree.StopCacheLearningPhase()
+        self.tree.SetCacheEntryRange(100, 900)
+        state = self.cache_state()
+        self.assertEqual(state, (["x"], False, 100, 900))
+        self.check(self.tree.arrays(["i", "v"], entry_stop=10), 0, 10)
+        self.assertEqual(self.cache_state(), state)
+
+        # Also when the iteration is stopped early
+        chunks = self.tree.iterate(["i", "f"], step_size=100)
+        self.check(next(chunks), 0, 100)
+        chunks.close()
+        self.assertEqual(self.cache_state(), state)
+        for n, chunk in enumerate(self.tree.iterate(["i"], step_size=400)):
+            self.check(chunk, 400 * n, min(400 * (n + 1), self.nentries))
+        self.assertEqual(self.cache_state(), state)
+
+        # The values are read through the cache as before
+        self.tree.GetEntry(500)
+        self.assertEqual(self.tree.x, 250.0)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.tree.arrays(["missing"])
+        with self.assertRaises(TypeError):
+            self.tree.arrays(["s"])
+        with self.assertRaises(TypeError):
+            self.tree.arrays(["p"])
+        with self.assertRaises(TypeError):
+            self.tree.arrays("i")
+        with self.assertRaises(ValueError):
+            self.tree.arrays(["i"], entry_stop=self.nentries + 1)
+        with self.assertRaises(ValueError):
+            self.tree.iterate(["i"], step_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3562,8 +3562,9 @@ int TSystem::CompileMacro(const char *filename, Option_t *opt,
       if (verboseLevel > 3 && !AccessPathName(moduleMapFullPath))
          ::Info("ACLiC", "File %s already exists!", moduleMapFullPath.Data());
 
-      std::string curDir = ROOT::FoundationUtils::GetCurrentDir();
-      std::string relative_path = ROOT::FoundationUtils::MakePathRelative(filename_fullpath.Data(), curDir);
+      // The header path in the modulemap is resolved relative to the directory of the modulemap
+      std::string relative_path =
+         ROOT::FoundationUtils::MakePathRelative(filename_fullpath.Data(), std::string(build_loc.Data()) + "/");
       std::ofstream moduleMapFile(moduleMapFullPath, std::ios::out);
       moduleMapFile << "module \"" << moduleName << "\" {" << std::endl;
       moduleMapFile << "  header \"" << relative_path << "\"" << std::endl;
@@ -129,6 +129,14 @@ public:
       ~SuspendAutoLoadingRAII() { fInterp->SetClassAutoLoading(fOldValue); }
    };
 
+   /// An interval of interpreter activity, recorded while tracing is enabled (see SetTracing()).
+   struct TraceEvent_t {
+      std::string fCategory; ///< "autoload", "autoparse", "library", "pcm" or "wrapper"
+      std::string fName;     ///< Class, library, PCM file or wrapped function
+      Long64_t fStart;       ///< Start time in nanoseconds, on the clock of GetTraceTime()
+      Long64_t fDuration;    ///< Duration in nanoseconds
+   };
+
    typedef int (*AutoLoadCallBack_t)(const char*);
    typedef std::vector<std::pair<std::string, int> > FwdDeclArgsToKeepCollection_t;
 
@@ -269,6 +277,13 @@ public:
    virtual void   ReportDiagnosticsToErrorHandler(bool /*enable*/ = true) {}
    virtual void   SetTempLevel(int /* val */) const {}
    virtual int    UnloadFile(const char * /* path */) const {return 0;}
+   /// \brief Enable or disable the recording of TraceEvent_t, e.g. to profile start-up.
+   virtual void   SetTracing(Bool_t /* enable */) {}
+   virtual Bool_t IsTracing() const { return kFALSE; }
+   /// \brief Return the events recorded so far and forget them.
+   virtual std::vector<TraceEvent_t> TakeTraceEvents() { return {}; }
+   /// \brief Current time in nanoseconds on the (monotonic) clock of TraceEvent_t::fStart.
+   virtual Long64_t GetTraceTime() const { return 0; }
 
    /// The created temporary must be deleted by the caller.
    /// Deprecated! Please use MakeInterpreterValue().
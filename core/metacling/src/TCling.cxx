@@ -128,6 +128,7 @@ clang/LLVM technology.
 #include "llvm/Support/FileSystem.h"
 
 #include <algorithm>
+#include <chrono>
 #include <iostream>
 #include <cassert>
 #include <map>
@@ -1819,6 +1820,7 @@ void TCling::LoadPCMImpl(TFile &pcmFile)
 
 void TCling::LoadPCM(std::string pcmFileNameFullPath)
 {
+   TraceRAII trace(this, "pcm", pcmFileNameFullPath.c_str());
    SuspendAutoLoadingRAII autoloadOff(this);
    SuspendAutoParsing autoparseOff(this);
    assert(!pcmFileNameFullPath.empty());
@@ -3527,6 +3529,7 @@ Int_t TCling::Load(const char* filename, Bool_t system)
 
    // Used to return 0 on success, 1 on duplicate, -1 on failure, -2 on "fatal".
    R__LOCKGUARD_CLING(gInterpreterMutex);
+   TraceRAII trace(this, "library", filename);
    cling::DynamicLibraryManager* DLM = fInterpreter->getDynamicLibraryManager();
    std::string canonLib = DLM->lookupLibrary(filename);
    cling::DynamicLibraryManager::LoadLibResult res
@@ -6288,6 +6291,8 @@ Int_t TCling::AutoLoad(const char *cls, Bool_t knowDictNotLoaded /* = kFALSE */)
       return 0;
    }
 
+   TraceRAII trace(this, "autoload", cls);
+
    assert(IsClassAutoLoadingEnabled() && "Calling when AutoLoading is off!");
 
    R__WRITE_LOCKGUARD(ROOT::gCoreMutex);
@@ -6542,6 +6547,7 @@ Int_t TCling::AutoParse(const char *cls)
       }
    }
 
+   TraceRAII trace(this, "autoparse", cls);
    R__LOCKGUARD(gInterpreterMutex);
 
    if (gDebug > 1) {
@@ -7582,6 +7588,36 @@ int TCling::SetClassAutoLoading(int autoload) const
    return oldVal;
 }
 
+////////////////////////////////////////////////////////////////////////////////
+/// Current time in nanoseconds on the monotonic clock used for TraceEvent_t.
+
+Long64_t TCling::GetTraceTime() const
+{
+   return std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now().time_since_epoch())
+      .count();
+}
+
+////////////////////////////////////////////////////////////////////////////////
+/// Record an event that started at `start` and ends now.
+
+void TCling::AddTraceEvent(const char *category, const std::string &name, Long64_t start)
+{
+   const Long64_t end = GetTraceTime();
+   std::lock_guard<std::mutex> lock(fTraceMutex);
+   fTraceEvents.push_back({category, name, start, end - start});
+}
+
+////////////////////////////////////////////////////////////////////////////////
+/// Return the events recorded since the last call and forget them.
+
+std::vector<TInterpreter::TraceEvent_t> TCling::TakeTraceEvents()
+{
+   std::vector<TraceEvent_t> events;
+   std::lock_guard<std::mutex> lock(fTraceMutex);
+   std::swap(events, fTraceEvents);
+   return events;
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 /// Enable/Disable the Autoparsing of headers.
 /// Returns the old value, i.e whether it was enabled or not.
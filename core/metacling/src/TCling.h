@@ -26,8 +26,10 @@
 
 #include "TInterpreter.h"
 
+#include <atomic>
 #include <map>
 #include <memory>
+#include <mutex>
 #include <set>
 #include <tuple>
 #include <unordered_map>
@@ -186,6 +188,10 @@ private: // Data Members
 
    bool fIsShuttingDown = false;
 
+   std::atomic<bool> fTracing{false};
+   std::mutex fTraceMutex;                      // Protects fTraceEvents
+   std::vector<TraceEvent_t> fTraceEvents;
+
 protected:
    Bool_t SetSuspendAutoParsing(Bool_t value) final;
 
@@ -355,6 +361,11 @@ public: // Public Interface
    void   ReportDiagnosticsToErrorHandler(bool enable = true) final;
    void   SetTempLevel(int val) const final;
    int    UnloadFile(const char* path) const final;
+   void   SetTracing(Bool_t enable) final { fTracing = enable; }
+   Bool_t IsTracing() const final { return fTracing; }
+   std::vector<TraceEvent_t> TakeTraceEvents() final;
+   Long64_t GetTraceTime() const final;
+   void   AddTraceEvent(const char *category, const std::string &name, Long64_t start);
 
    void   CodeComplete(const std::string&, size_t&,
                        std::vector<std::string>&) final;
@@ -608,6 +619,30 @@ private: // Private Utility Functions and Classes
       ~SuspendAutoLoadingRAII() { fTCling->SetClassAutoLoading(fOldValue); }
    };
 
+public:
+   /// Records the lifetime of the object as a TraceEvent_t, if tracing is enabled.
+   class TraceRAII {
+      TCling *fTCling = nullptr;
+      const char *fCategory;
+      std::string fName;
+      Long64_t fStart = -1;
+
+   public:
+      TraceRAII(TCling *tcling, const char *category, const char *name) : fTCling(tcling), fCategory(category)
+      {
+         if (fTCling && fTCling->IsTracing()) {
+            fName = name;
+            fStart = fTCling->GetTraceTime();
+         }
+      }
+      ~TraceRAII()
+      {
+         if (fStart >= 0)
+            fTCling->AddTraceEvent(fCategory, fName, fStart);
+      }
+   };
+
+private:
    class TUniqueString {
    public:
       TUniqueString() = delete;
@@ -54,10 +54,12 @@ C++ interpreter and the Clang C++ compiler, not CINT.
 #include "clang/Sema/Lookup.h"
 
 #include "llvm/ADT/APInt.h"
+#include "llvm/ADT/StringExtras.h"
 #include "llvm/ExecutionEngine/ExecutionEngine.h"
 #include "llvm/ExecutionEngine/GenericValue.h"
 #include "llvm/Support/Casting.h"
 #include "llvm/Support/raw_ostream.h"
+#include "llvm/Support/xxhash.h"
 #include "llvm/IR/LLVMContext.h"
 #include "llvm/IR/DerivedTypes.h"
 #include "llvm/IR/Function.h"
@@ -82,6 +84,26 @@ static const string kIndentString("   ");
 static map<const Decl *, void *> gWrapperStore;
 static map<const Decl *, void *> gCtorWrapperStore;
 static map<const Decl *, void *> gDtorWrapperStore;
+static map<string, unsigned> gWrapperNameCount;
+
+////////////////////////////////////////////////////////////////////////////////
+/// Return the name of a new wrapper. It only depends on the given key, which
+/// identifies the wrapped function, and on the number of wrappers that were
+/// made for that key before, so that identical wrappers get identical names
+/// in different processes. Cling's object cache (see CLING_OBJECT_CACHE) can
+/// then reuse their compiled code.
+
+static string make_wrapper_name(const char *prefix, const string &key)
+{
+   ostringstream buf;
+   buf << prefix;
+   if (key.empty()) {
+      buf << '_' << gWrapperSerial++;
+   } else {
+      buf << '_' << llvm::utohexstr(llvm::xxHash64(key)) << '_' << gWrapperNameCount[prefix + key]++;
+   }
+   return buf.str();
+}
 
 static
 inline
@@ -137,8 +159,12 @@ size_t TClingCallFunc::CalculateMinRequiredArguments()
 }
 
 void *TClingCallFunc::compile_wrapper(const string &wrapper_name, const string &wrapper,
-                                      bool withAccessControl/*=true*/)
+                                      bool withAccessControl/*=true*/,
+                                      const string &description/*=""*/)
 {
+   // Wrapper compilation is a large part of the cost of a first call, make it visible when tracing.
+   TCling::TraceRAII trace((TCling *)gCling, "wrapper",
+                           description.empty() ? wrapper_name.c_str() : description.c_str());
    return fInterp->compileFunction(wrapper_name, wrapper, false /*ifUnique*/,
                                    withAccessControl);
 }
@@ -811,14 +837,13 @@ int TClingCallFunc::get_wrapper_code(std::string &wrapper_name, std::string &wra
    //  Make the wrapper name.
    //
    {
-      ostringstream buf;
-      buf << "__cf";
-      // const NamedDecl* ND = dyn_cast<NamedDecl>(FD);
-      // string mn;
-      // fInterp->maybeMangleDeclName(ND, mn);
-      // buf << '_' << mn;
-      buf << '_' << gWrapperSerial++;
-      wrapper_name = buf.str();
+      string key;
+      raw_string_ostream stream(key);
+      stream << class_name << ' ';
+      FD->getNameForDiagnostic(stream, Policy, /*Qualified=*/true);
+      stream << ' ' << FD->getType().getAsString(Policy);
+      stream.flush();
+      wrapper_name = make_wrapper_name("__cf", key);
    }
    //
    //  Write the wrapper code.
@@ -1005,7 +1030,10 @@ tcling_callfunc_Wrapper_t TClingCallFunc::make_wrapper()
    //
    //  Compile the wrapper code.
    //
-   void *F = compile_wrapper(wrapper_name, wrapper);
+   string description;
+   if (const NamedDecl *ND = dyn_cast<NamedDecl>(D))
+      description = ND->getQualifiedNameAsString();
+   void *F = compile_wrapper(wrapper_name, wrapper, /*withAccessControl=*/true, description);
    if (F) {
       gWrapperStore.insert(make_pair(D, F));
    } else {
@@ -1112,14 +1140,9 @@ tcling_callfunc_ctor_Wrapper_t TClingCallFunc::make_ctor_wrapper(const TClingCla
    //
    string wrapper_name;
    {
-      ostringstream buf;
-      buf << "__ctor";
-      //const NamedDecl* ND = dyn_cast<NamedDecl>(FD);
-      //string mn;
-      //fInterp->maybeMangleDeclName(ND, mn);
-      //buf << '_dtor_' << mn;
-      buf << '_' << gWrapperSerial++;
-      wrapper_name = buf.str();
+      ostringstream key;
+      key << class_name << ' ' << static_cast<int>(kind) << ' ' << type_name;
+      wrapper_name = make_wrapper_name("__ctor", key.str());
    }
 
    string constr_arg;
@@ -1215,7 +1238,7 @@ tcling_callfunc_ctor_Wrapper_t TClingCallFunc::make_ctor_wrapper(const TClingCla
    //  Compile the wrapper code.
    //
    void *F = compile_wrapper(wrapper_name, wrapper,
-                             /*withAccessControl=*/false);
+                             /*withAccessControl=*/false, class_name + " (constructor)");
    if (F) {
       gCtorWrapperStore.insert(make_pair(info->GetDecl(), F));
    } else {
@@ -1279,14 +1302,7 @@ TClingCallFunc::make_dtor_wrapper(const TClingClassInfo *info)
    //
    string wrapper_name;
    {
-      ostringstream buf;
-      buf << "__dtor";
-      //const NamedDecl* ND = dyn_cast<NamedDecl>(FD);
-      //string mn;
-      //fInterp->maybeMangleDeclName(ND, mn);
-      //buf << '_dtor_' << mn;
-      buf << '_' << gWrapperSerial++;
-      wrapper_name = buf.str();
+      wrapper_name = make_wrapper_name("__dtor", class_name);
    }
    //
    //  Write the wrapper code.
@@ -1379,7 +1395,7 @@ TClingCallFunc::make_dtor_wrapper(const TClingClassInfo *info)
    //  Compile the wrapper code.
    //
    void *F = compile_wrapper(wrapper_name, wrapper,
-                             /*withAccessControl=*/false);
+                             /*withAccessControl=*/false, class_name + " (destructor)");
    if (F) {
       gDtorWrapperStore.insert(make_pair(info->GetDecl(), F));
    } else {
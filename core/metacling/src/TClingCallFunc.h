@@ -85,7 +85,8 @@ private:
 
    void* compile_wrapper(const std::string& wrapper_name,
                          const std::string& wrapper,
-                         bool withAccessControl = true);
+                         bool withAccessControl = true,
+                         const std::string& description = "");
 
    void collect_type_info(clang::QualType& QT, std::ostringstream& typedefbuf,
                           std::ostringstream& callbuf, std::string& type_name,
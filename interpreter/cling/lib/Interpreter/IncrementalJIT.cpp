@@ -19,7 +19,10 @@
 #include <clang/Basic/TargetOptions.h>
 #include <clang/Frontend/CompilerInstance.h>
 
+#include <llvm/ADT/StringExtras.h>
 #include <llvm/ADT/Triple.h>
+#include <llvm/Config/llvm-config.h>
+#include <llvm/ExecutionEngine/ObjectCache.h>
 #include <llvm/ExecutionEngine/JITLink/EHFrameSupport.h>
 #include <llvm/ExecutionEngine/Orc/JITTargetMachineBuilder.h>
 #include <llvm/ExecutionEngine/Orc/ObjectLinkingLayer.h>
@@ -27,16 +30,26 @@
 #include <llvm/ExecutionEngine/SectionMemoryManager.h>
 #include <llvm/IR/LLVMContext.h>
 #include <llvm/MC/TargetRegistry.h>
+#include <llvm/Support/FileSystem.h>
+#include <llvm/Support/MemoryBuffer.h>
+#include <llvm/Support/Path.h>
+#include <llvm/Support/SHA1.h>
 #include <llvm/Support/raw_ostream.h>
 #include <llvm/Support/Host.h>
 #include <llvm/Target/TargetMachine.h>
 
+#include <mutex>
 #include <optional>
+#include <unordered_map>
 
 #ifdef __linux__
 #include <sys/stat.h>
 #endif
 
+#ifdef LLVM_ON_UNIX
+#include <dlfcn.h>
+#endif
+
 using namespace llvm;
 using namespace llvm::jitlink;
 using namespace llvm::orc;
@@ -411,6 +424,136 @@ CreateTargetMachine(const clang::CompilerInstance& CI, bool JITLink) {
   return cantFail(JTMB.createTargetMachine());
 }
 
+/// Return a string that changes whenever the library containing Cling is
+/// rebuilt, to invalidate the object cache.
+static std::string GetClingBuildId() {
+  std::string BuildId = LLVM_VERSION_STRING;
+#ifdef LLVM_ON_UNIX
+  Dl_info Info;
+  if (dladdr(reinterpret_cast<void*>(&GetClingBuildId), &Info) &&
+      Info.dli_fname) {
+    sys::fs::file_status Status;
+    if (!sys::fs::status(Info.dli_fname, Status)) {
+      BuildId += ";" + std::string(Info.dli_fname) + ";" +
+                 std::to_string(Status.getSize()) + ";" +
+                 std::to_string(Status.getLastModificationTime()
+                                    .time_since_epoch()
+                                    .count());
+    }
+  }
+#endif
+  return BuildId;
+}
+
+/// An object cache that keeps the object code of the JIT-compiled modules in
+/// a directory, so that processes compiling identical modules, for example the
+/// call wrappers of the same functions, can skip code generation. It is
+/// enabled by setting the CLING_OBJECT_CACHE environment variable to the
+/// directory. The modules are keyed by a hash of their IR, the target machine
+/// configuration and the Cling build, so any change of the headers, PCMs or
+/// libraries that affects the generated code results in a different key.
+/// If CLING_OBJECT_CACHE_STATS is set, the hit and miss counts are printed
+/// at the end of the process.
+class ClingObjectCache final : public ObjectCache {
+  std::string m_Dir;
+  std::string m_BuildId;
+  TargetMachine& m_TM;
+  std::mutex m_Mutex;
+  std::unordered_map<const Module*, std::string> m_Keys;
+  unsigned m_Hits = 0;
+  unsigned m_Misses = 0;
+  unsigned m_Stores = 0;
+  bool m_PrintStats;
+
+  std::string getKey(const Module& M) {
+    std::string IR;
+    raw_string_ostream OS(IR);
+    M.print(OS, /*AAW=*/nullptr);
+    OS.flush();
+
+    SHA1 Hasher;
+    Hasher.update(m_BuildId);
+    Hasher.update(m_TM.getTargetTriple().str());
+    Hasher.update(m_TM.getTargetCPU());
+    Hasher.update(m_TM.getTargetFeatureString());
+    Hasher.update(std::to_string(static_cast<int>(m_TM.getOptLevel())));
+    Hasher.update(std::to_string(static_cast<int>(m_TM.getRelocationModel())));
+    Hasher.update(std::to_string(static_cast<int>(m_TM.getCodeModel())));
+    // The module identifier and source file name contain a serial number of
+    // the transaction, which doesn't affect the generated code
+    for (StringRef Line : split(IR, '\n')) {
+      if (Line.startswith("; ModuleID") || Line.startswith("source_filename"))
+        continue;
+      Hasher.update(Line);
+      Hasher.update("\n");
+    }
+    return toHex(Hasher.final(), /*LowerCase=*/true);
+  }
+
+  std::string getPath(StringRef Key) const {
+    SmallString<256> Path(m_Dir);
+    sys::path::append(Path, Key + ".o");
+    return std::string(Path.str());
+  }
+
+public:
+  ClingObjectCache(std::string Dir, TargetMachine& TM)
+      : m_Dir(std::move(Dir)), m_BuildId(GetClingBuildId()), m_TM(TM),
+        m_PrintStats(std::getenv("CLING_OBJECT_CACHE_STATS")) {}
+
+  ~ClingObjectCache() override {
+    if (m_PrintStats)
+      cling::errs() << "cling object cache " << m_Dir << ": " << m_Hits
+                    << " hits, " << m_Misses << " misses, " << m_Stores
+                    << " stored\n";
+  }
+
+  std::unique_ptr<MemoryBuffer> getObject(const Module* M) override {
+    std::string Key = getKey(*M);
+    auto Buffer = MemoryBuffer::getFile(getPath(Key), /*IsText=*/false,
+                                        /*RequiresNullTerminator=*/false);
+
+    std::lock_guard<std::mutex> Lock(m_Mutex);
+    if (Buffer) {
+      ++m_Hits;
+      return std::move(*Buffer);
+    }
+    ++m_Misses;
+    m_Keys[M] = std::move(Key);
+    return nullptr;
+  }
+
+  void notifyObjectCompiled(const Module* M, MemoryBufferRef Obj) override {
+    std::string Key;
+    {
+      std::lock_guard<std::mutex> Lock(m_Mutex);
+      auto It = m_Keys.find(M);
+      if (It == m_Keys.end())
+        return;
+      Key = std::move(It->second);
+      m_Keys.erase(It);
+    }
+
+    // Write to a unique temporary file and rename it, so that concurrent
+    // processes never read partially written objects
+    const std::string Path = getPath(Key);
+    int FD;
+    SmallString<256> TmpPath;
+    if (sys::fs::createUniqueFile(Path + ".tmp%%%%%%", FD, TmpPath))
+      return;
+    {
+      raw_fd_ostream OS(FD, /*shouldClose=*/true);
+      OS << Obj.getBuffer();
+    }
+    if (sys::fs::rename(TmpPath, Path)) {
+      sys::fs::remove(TmpPath);
+      return;
+    }
+    std::lock_guard<std::mutex> Lock(m_Mutex);
+    ++m_Stores;
+  }
+};
+
 #if defined(__linux__) && defined(__GLIBC__)
 static SymbolMap GetListOfLibcNonsharedSymbols(const LLJIT& Jit) {
   // Inject a number of symbols that may be in libc_nonshared.a where they are
@@ -501,9 +644,17 @@ IncrementalJIT::IncrementalJIT(
     return Layer;
   });
 
+  if (const char* CacheDir = std::getenv("CLING_OBJECT_CACHE")) {
+    if (*CacheDir && !sys::fs::create_directories(CacheDir))
+      m_ObjectCache = std::make_unique<ClingObjectCache>(CacheDir, *m_TM);
+    else if (Verbose)
+      cling::errs() << "cling: cannot use object cache directory '"
+                    << CacheDir << "'\n";
+  }
+
   Builder.setCompileFunctionCreator([&](llvm::orc::JITTargetMachineBuilder)
   -> llvm::Expected<std::unique_ptr<llvm::orc::IRCompileLayer::IRCompiler>> {
-    return std::make_unique<SimpleCompiler>(*m_TM);
+    return std::make_unique<SimpleCompiler>(*m_TM, m_ObjectCache.get());
   });
 
   if (Expected<std::unique_ptr<LLJIT>> JitInstance = Builder.create()) {
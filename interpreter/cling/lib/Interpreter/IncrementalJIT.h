@@ -14,6 +14,7 @@
 #include "llvm/ADT/StringRef.h"
 #include "llvm/ADT/StringSet.h"
 #include "llvm/IR/Module.h"
+#include "llvm/ExecutionEngine/ObjectCache.h"
 #include "llvm/ExecutionEngine/Orc/Core.h"
 #include "llvm/ExecutionEngine/Orc/ExecutorProcessControl.h"
 #include "llvm/ExecutionEngine/Orc/LLJIT.h"
@@ -102,6 +103,9 @@ public:
   llvm::TargetMachine &getTargetMachine() { return *m_TM; }
 
 private:
+  /// Optional on-disk cache of the compiled object code, see CLING_OBJECT_CACHE.
+  /// Declared before Jit, because it has to outlive it.
+  std::unique_ptr<llvm::ObjectCache> m_ObjectCache;
   std::unique_ptr<llvm::orc::LLJIT> Jit;
   llvm::orc::SymbolMap m_InjectedSymbols;
   SharedAtomicFlag SkipHostProcessLookup;
@@ -0,0 +1,103 @@
+/*************************************************************************
+ * Copyright (C) 1995-2024, Rene Brun and Fons Rademakers.               *
+ * All rights reserved.                                                  *
+ *                                                                       *
+ * For the licensing terms see $ROOTSYS/LICENSE.                         *
+ * For the list of contributors see $ROOTSYS/README/CREDITS.             *
+ *************************************************************************/
+
+#ifndef ROOT_RAsyncReadEngine
+#define ROOT_RAsyncReadEngine
+
+#include <ROOT/RRawFile.hxx>
+
+#include <cstdint>
+#include <memory>
+#include <mutex>
+
+namespace ROOT {
+namespace Internal {
+
+/**
+ * \class RAsyncReadEngine RAsyncReadEngine.hxx
+ * \ingroup IO
+ *
+ * The RAsyncReadEngine serves vector reads from a file descriptor while keeping up to a given number of read requests
+ * in flight, so that the storage sees a deep queue instead of one request after the other. If ROOT is built with
+ * io_uring support and the ring can be set up, the requests are submitted to an io_uring instance owned by the engine.
+ * Otherwise, they are served by a process-wide pool of threads calling pread(). Short reads are continued until the
+ * requested size or the end of the file is reached.
+ *
+ * Concurrent vector reads through the same engine are serialized. The process-wide statistics returned by GetStats()
+ * summarize the achieved queue depth and throughput of all engines.
+ */
+class RAsyncReadEngine {
+public:
+   enum class EBackend {
+      kIoUring,
+      kThreadPool
+   };
+
+   /// Accumulated over all the engines of the process
+   struct RStats {
+      /// Number of vector reads
+      std::uint64_t fNReadV = 0;
+      /// Number of read requests
+      std::uint64_t fNRequests = 0;
+      /// Number of bytes read
+      std::uint64_t fNBytes = 0;
+      /// Sum over all the read requests of the number of requests in flight right after their submission
+      std::uint64_t fSumQueueDepth = 0;
+      /// Largest number of requests in flight at the same time
+      std::uint64_t fMaxQueueDepth = 0;
+      /// Wall-clock time spent in vector reads, in nanoseconds
+      std::uint64_t fReadTimeNs = 0;
+
+      /// The queue depth seen on average by a read request
+      double GetMeanQueueDepth() const { return fNRequests ? double(fSumQueueDepth) / fNRequests : 0.; }
+      /// The throughput in bytes per second while vector reads were ongoing
+      double GetThroughput() const { return fReadTimeNs ? 1e9 * fNBytes / fReadTimeNs : 0.; }
+   };
+
+private:
+   /// Maximum number of requests in flight
+   unsigned int fQueueDepth;
+   EBackend fBackend = EBackend::kThreadPool;
+   /// Wraps the io_uring instance, only set for the io_uring backend
+   struct RRing;
+   std::unique_ptr<RRing> fRing;
+   /// Serializes vector reads through this engine
+   std::mutex fLock;
+   /// Statistics of the ongoing vector read, added to the process-wide statistics on completion
+   RStats fReadVStats;
+
+   /// Account for a request submitted while nInFlight requests (including itself) are in flight
+   void OnSubmit(unsigned int nInFlight);
+   void ReadVIoUring(int fd, RRawFile::RIOVec *ioVec, unsigned int nReq);
+   void ReadVThreadPool(int fd, RRawFile::RIOVec *ioVec, unsigned int nReq);
+
+public:
+   /// Create an engine keeping up to queueDepth requests in flight. Falls back to the thread pool if the io_uring
+   /// setup fails.
+   explicit RAsyncReadEngine(unsigned int queueDepth);
+   RAsyncReadEngine(const RAsyncReadEngine &) = delete;
+   RAsyncReadEngine &operator=(const RAsyncReadEngine &) = delete;
+   ~RAsyncReadEngine();
+
+   unsigned int GetQueueDepth() const { return fQueueDepth; }
+   EBackend GetBackend() const { return fBackend; }
+
+   /// Read the nReq requests of ioVec from the file descriptor fd and wait for their completion. Sets the fOutBytes
+   /// member of each request, which is smaller than the requested size only at the end of the file. Throws an
+   /// std::runtime_error if a read fails.
+   void ReadV(int fd, RRawFile::RIOVec *ioVec, unsigned int nReq);
+
+   /// Returns the statistics of all the engines of the process
+   static RStats GetStats();
+   static void ResetStats();
+};
+
+} // namespace Internal
+} // namespace ROOT
+
+#endif
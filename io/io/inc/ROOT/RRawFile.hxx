@@ -52,6 +52,9 @@ public:
       ELineBreaks fLineBreak = ELineBreaks::kAuto;
       /// Read at least fBlockSize bytes at a time. A value of zero turns off I/O buffering.
       size_t fBlockSize = kUseDefaultBlockSize;
+      /// If larger than zero, vector reads keep up to that many requests in flight through an RAsyncReadEngine.
+      /// Only supported by local files on Unix; ignored otherwise.
+      unsigned int fAsyncReadDepth = 0;
       // Define an empty constructor to work around a bug in Clang: https://github.com/llvm/llvm-project/issues/36032
       ROptions() {}
    };
@@ -12,11 +12,13 @@
 #ifndef ROOT_RRawFileUnix
 #define ROOT_RRawFileUnix
 
+#include <ROOT/RAsyncReadEngine.hxx>
 #include <ROOT/RRawFile.hxx>
 #include <string_view>
 
 #include <cstddef>
 #include <cstdint>
+#include <memory>
 
 namespace ROOT {
 namespace Internal {
@@ -31,6 +33,8 @@ namespace Internal {
 class RRawFileUnix : public RRawFile {
 private:
    int fFileDes = -1;
+   /// Created on the first vector read if fOptions.fAsyncReadDepth is larger than zero
+   std::unique_ptr<RAsyncReadEngine> fAsyncReadEngine;
 
 protected:
    void OpenImpl() final;
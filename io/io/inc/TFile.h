@@ -49,6 +49,11 @@ class TFileCacheWrite;
 class TProcessID;
 class TStopwatch;
 class TFilePrefetch;
+namespace ROOT {
+namespace Internal {
+class RAsyncReadEngine;
+}
+} // namespace ROOT
 
 class TFile : public TDirectoryFile {
   friend class TDirectoryFile;
@@ -98,6 +103,7 @@ protected:
    TFileCacheRead  *fCacheRead{nullptr};      ///<!Pointer to the read cache (if any)
    TMap            *fCacheReadMap{nullptr};   ///<!Pointer to the read cache (if any)
    TFileCacheWrite *fCacheWrite{nullptr};     ///<!Pointer to the write cache (if any)
+   ROOT::Internal::RAsyncReadEngine *fAsyncReadEngine{nullptr}; ///<!Engine serving ReadBuffers() (if asynchronous reading is enabled)
    Long64_t         fArchiveOffset{0};        ///<!Offset at which file starts in archive
    Bool_t           fIsArchive{kFALSE};       ///<!True if this is a pure archive file
    Bool_t           fNoAnchorInName{kFALSE};  ///<!True if we don't want to force the anchor to be appended to the file name
@@ -219,6 +225,7 @@ public:
    virtual void        Flush();
          TArchiveFile *GetArchive() const { return fArchive; }
            Long64_t    GetArchiveOffset() const { return fArchiveOffset; }
+           Int_t       GetAsyncReadDepth() const;
            Int_t       GetBestBuffer() const;
    virtual Int_t       GetBytesToPrefetch() const;
        TFileCacheRead *GetCacheRead(const TObject* tree = nullptr) const;
@@ -279,6 +286,7 @@ public:
    virtual Int_t       Recover();
    virtual Int_t       ReOpen(Option_t *mode);
    virtual void        Seek(Long64_t offset, ERelativeTo pos = kBeg);
+           void        SetAsyncReadDepth(Int_t depth);
    virtual void        SetCacheRead(TFileCacheRead *cache, TObject *tree = nullptr, ECacheAction action = kDisconnect);
    virtual void        SetCacheWrite(TFileCacheWrite *cache);
    virtual void        SetCompressionAlgorithm(Int_t algorithm = ROOT::RCompressionSetting::EAlgorithm::kUseGlobal);
@@ -35,6 +35,7 @@ protected:
 
    Bool_t         fAsyncReading;
    Bool_t         fEnablePrefetching;///< reading by prefetching asynchronously
+   Int_t          fAsyncReadDepth;   ///<! Number of block reads kept in flight by the file (0 if disabled)
 
    Int_t          fNseek;            ///< Number of blocks to be prefetched
    Int_t          fNtot;             ///< Total size of prefetched blocks
@@ -85,6 +86,7 @@ public:
    virtual void        AddNoCacheBytesRead(Long64_t len) { fNoCacheBytesRead += len; }
    virtual void        AddNoCacheReadCalls(Int_t reads) { fNoCacheReadCalls += reads; }
    virtual void        Close(Option_t *option="");
+           Int_t       GetAsyncReadDepth() const { return fAsyncReadDepth; }
    virtual Int_t       GetBufferSize() const { return fBufferSize; };
    virtual Long64_t    GetBytesRead() const { return fBytesRead; }
    virtual Long64_t    GetNoCacheBytesRead() const { return fNoCacheBytesRead; }
@@ -97,6 +99,7 @@ public:
    virtual Int_t       GetUnzipBuffer(char ** /*buf*/, Long64_t /*pos*/, Int_t /*len*/, Bool_t * /*free*/) { return -1; }
            Long64_t    GetPrefetchedBlocks() const { return fPrefetchedBlocks; }
    virtual Bool_t      IsAsyncReading() const { return fAsyncReading; };
+   virtual void        SetAsyncReadDepth(Int_t depth);
    virtual void        SetEnablePrefetching(Bool_t setPrefetching = kFALSE);
    virtual Bool_t      IsEnablePrefetching() const { return fEnablePrefetching; };
    virtual Bool_t      IsLearning() const {return kFALSE;}
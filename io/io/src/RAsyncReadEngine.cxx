@@ -0,0 +1,384 @@
+/*************************************************************************
+ * Copyright (C) 1995-2024, Rene Brun and Fons Rademakers.               *
+ * All rights reserved.                                                  *
+ *                                                                       *
+ * For the licensing terms see $ROOTSYS/LICENSE.                         *
+ * For the list of contributors see $ROOTSYS/README/CREDITS.             *
+ *************************************************************************/
+
+#include "ROOT/RConfig.hxx"
+#include "ROOT/RAsyncReadEngine.hxx"
+
+#ifdef R__HAS_URING
+#include "ROOT/RIoUring.hxx"
+#endif
+
+#include "TError.h"
+
+#include <algorithm>
+#include <atomic>
+#include <cerrno>
+#include <chrono>
+#include <condition_variable>
+#include <cstdint>
+#include <cstring>
+#include <deque>
+#include <stdexcept>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include <unistd.h>
+
+namespace {
+
+/// The statistics of all the engines of the process
+struct RGlobalStats {
+   std::atomic<std::uint64_t> fNReadV{0};
+   std::atomic<std::uint64_t> fNRequests{0};
+   std::atomic<std::uint64_t> fNBytes{0};
+   std::atomic<std::uint64_t> fSumQueueDepth{0};
+   std::atomic<std::uint64_t> fMaxQueueDepth{0};
+   std::atomic<std::uint64_t> fReadTimeNs{0};
+};
+
+RGlobalStats gStats;
+
+/// Reads until nbytes are read or the end of the file is reached, like RRawFileUnix::ReadAtImpl()
+std::size_t ReadAt(int fd, void *buffer, std::size_t nbytes, std::uint64_t offset)
+{
+   std::size_t total_bytes = 0;
+   while (nbytes) {
+#ifdef R__SEEK64
+      ssize_t res = pread64(fd, buffer, nbytes, offset);
+#else
+      ssize_t res = pread(fd, buffer, nbytes, offset);
+#endif
+      if (res < 0) {
+         if (errno == EINTR)
+            continue;
+         throw std::runtime_error("Cannot read from file descriptor " + std::to_string(fd) +
+                                  ", error: " + std::string(strerror(errno)));
+      } else if (res == 0) {
+         return total_bytes;
+      }
+      buffer = reinterpret_cast<unsigned char *>(buffer) + res;
+      nbytes -= res;
+      total_bytes += res;
+      offset += res;
+   }
+   return total_bytes;
+}
+
+/// The threads serving the read requests of the engines that do not use io_uring. Shared by all the engines of the
+/// process; the number of threads grows with the largest queue depth requested so far, up to kMaxThreads.
+class RReaderPool {
+public:
+   /// The requests in flight of one vector read
+   struct RBatch {
+      std::mutex fLock;
+      std::condition_variable fCvDone;
+      unsigned int fNInFlight = 0;
+      /// The first error reported by a reader thread
+      std::string fError;
+   };
+
+   struct RTask {
+      int fFileDes = -1;
+      ROOT::Internal::RRawFile::RIOVec *fIOVec = nullptr;
+      RBatch *fBatch = nullptr;
+   };
+
+private:
+   static constexpr unsigned int kMaxThreads = 64;
+
+   std::mutex fLock;
+   std::condition_variable fCvTask;
+   std::deque<RTask> fTasks;
+   std::vector<std::thread> fThreads;
+   bool fTerminate = false;
+
+   void Work()
+   {
+      while (true) {
+         RTask task;
+         {
+            std::unique_lock<std::mutex> lock(fLock);
+            fCvTask.wait(lock, [this] { return fTerminate || !fTasks.empty(); });
+            if (fTasks.empty())
+               return;
+            task = fTasks.front();
+            fTasks.pop_front();
+         }
+
+         std::string error;
+         try {
+            task.fIOVec->fOutBytes = ReadAt(task.fFileDes, task.fIOVec->fBuffer, task.fIOVec->fSize,
+                                            task.fIOVec->fOffset);
+         } catch (const std::runtime_error &e) {
+            error = e.what();
+         }
+
+         std::lock_guard<std::mutex> lock(task.fBatch->fLock);
+         if (!error.empty() && task.fBatch->fError.empty())
+            task.fBatch->fError = error;
+         --task.fBatch->fNInFlight;
+         // Notify while holding the lock: the batch goes out of scope as soon as the waiting thread sees no more
+         // requests in flight
+         task.fBatch->fCvDone.notify_all();
+      }
+   }
+
+   RReaderPool() = default;
+
+public:
+   RReaderPool(const RReaderPool &) = delete;
+   RReaderPool &operator=(const RReaderPool &) = delete;
+
+   ~RReaderPool()
+   {
+      {
+         std::lock_guard<std::mutex> lock(fLock);
+         fTerminate = true;
+      }
+      fCvTask.notify_all();
+      for (auto &t : fThreads)
+         t.join();
+   }
+
+   static RReaderPool &Get()
+   {
+      static RReaderPool pool;
+      return pool;
+   }
+
+   void Reserve(unsigned int nThreads)
+   {
+      std::lock_guard<std::mutex> lock(fLock);
+      nThreads = std::min(nThreads, kMaxThreads);
+      while (fThreads.size() < nThreads)
+         fThreads.emplace_back(&RReaderPool::Work, this);
+   }
+
+   void Submit(const RTask &task)
+   {
+      {
+         std::lock_guard<std::mutex> lock(fLock);
+         fTasks.push_back(task);
+      }
+      fCvTask.notify_one();
+   }
+};
+
+} // anonymous namespace
+
+#ifdef R__HAS_URING
+struct ROOT::Internal::RAsyncReadEngine::RRing {
+   RIoUring fRing;
+   explicit RRing(unsigned int queueDepth) : fRing(queueDepth) {}
+};
+#else
+struct ROOT::Internal::RAsyncReadEngine::RRing {
+};
+#endif
+
+ROOT::Internal::RAsyncReadEngine::RAsyncReadEngine(unsigned int queueDepth) : fQueueDepth(std::max(queueDepth, 1u))
+{
+#ifdef R__HAS_URING
+   static std::atomic<bool> uringFailed{false};
+   if (!uringFailed) {
+      try {
+         fRing = std::make_unique<RRing>(fQueueDepth); // throws std::runtime_error
+         fBackend = EBackend::kIoUring;
+         return;
+      } catch (const std::runtime_error &e) {
+         if (!uringFailed.exchange(true)) {
+            Warning("RAsyncReadEngine", "io_uring setup failed, falling back to a pool of reader threads:\n%s",
+                    e.what());
+         }
+      }
+   }
+#endif
+   RReaderPool::Get().Reserve(fQueueDepth);
+}
+
+ROOT::Internal::RAsyncReadEngine::~RAsyncReadEngine() = default;
+
+void ROOT::Internal::RAsyncReadEngine::OnSubmit(unsigned int nInFlight)
+{
+   fReadVStats.fSumQueueDepth += nInFlight;
+   fReadVStats.fMaxQueueDepth = std::max<std::uint64_t>(fReadVStats.fMaxQueueDepth, nInFlight);
+}
+
+void ROOT::Internal::RAsyncReadEngine::ReadVIoUring(int fd, RRawFile::RIOVec *ioVec, unsigned int nReq)
+{
+#ifdef R__HAS_URING
+   auto ring = fRing->fRing.GetRawRing();
+   const auto depth = std::min(fQueueDepth, fRing->fRing.GetQueueDepth());
+
+   unsigned int nextReq = 0;
+   // Requests prepared in the submission queue but not yet submitted to the kernel
+   unsigned int nPending = 0;
+   // Requests submitted to the kernel and not yet completed
+   unsigned int nInFlight = 0;
+   // Requests that got a short read and need to be continued
+   std::vector<unsigned int> continued;
+   // After a failed read, no more requests are prepared, but the ones in flight are waited for before throwing:
+   // they write into the buffers of the caller, and their completions must not be left to the next vector read
+   std::string error;
+   bool submitFailed = false;
+
+   auto prepareRead = [&](unsigned int i) {
+      // Cannot fail, the submission queue holds at least depth entries
+      auto sqe = io_uring_get_sqe(ring);
+      R__ASSERT(sqe);
+      auto &req = ioVec[i];
+      io_uring_prep_read(sqe, fd, reinterpret_cast<unsigned char *>(req.fBuffer) + req.fOutBytes,
+                         req.fSize - req.fOutBytes, req.fOffset + req.fOutBytes);
+      sqe->flags |= IOSQE_ASYNC;
+      io_uring_sqe_set_data(sqe, reinterpret_cast<void *>(static_cast<std::uintptr_t>(i)));
+      ++nPending;
+   };
+
+   while (nInFlight > 0 || (!submitFailed && nPending > 0) ||
+          (error.empty() && (nextReq < nReq || !continued.empty()))) {
+      if (error.empty()) {
+         while (nPending + nInFlight < depth && !continued.empty()) {
+            prepareRead(continued.back());
+            continued.pop_back();
+         }
+         while (nPending + nInFlight < depth && nextReq < nReq) {
+            ioVec[nextReq].fOutBytes = 0;
+            prepareRead(nextReq++);
+            OnSubmit(nPending + nInFlight);
+         }
+      }
+
+      if (!submitFailed) {
+         int ret = io_uring_submit_and_wait(ring, 1);
+         if (ret >= 0) {
+            const auto nSubmitted = std::min(static_cast<unsigned int>(ret), nPending);
+            nPending -= nSubmitted;
+            nInFlight += nSubmitted;
+         } else if (ret != -EINTR) {
+            submitFailed = true;
+            if (error.empty())
+               error = "ring submit failed, error: " + std::string(std::strerror(-ret));
+         }
+      } else if (nInFlight > 0) {
+         // Only wait for the completions of the submitted requests
+         struct io_uring_cqe *cqe;
+         io_uring_wait_cqe(ring, &cqe);
+      }
+
+      struct io_uring_cqe *cqe;
+      while (nInFlight > 0 && io_uring_peek_cqe(ring, &cqe) == 0) {
+         const auto i = static_cast<unsigned int>(reinterpret_cast<std::uintptr_t>(io_uring_cqe_get_data(cqe)));
+         const int res = cqe->res;
+         io_uring_cqe_seen(ring, cqe);
+         --nInFlight;
+
+         if (res == -EINTR || res == -EAGAIN) {
+            continued.push_back(i);
+         } else if (res < 0) {
+            if (error.empty())
+               error = "read failed for request " + std::to_string(i) + ", error: " + std::string(std::strerror(-res));
+         } else {
+            ioVec[i].fOutBytes += res;
+            // A zero-byte read marks the end of the file
+            if (res > 0 && ioVec[i].fOutBytes < ioVec[i].fSize)
+               continued.push_back(i);
+         }
+      }
+   }
+
+   if (nPending > 0) {
+      // Requests that could not be submitted are still in the submission queue and would be submitted by the next
+      // vector read, into buffers of this one. The ring is given up in favor of the thread pool.
+      fRing.reset();
+      fBackend = EBackend::kThreadPool;
+      RReaderPool::Get().Reserve(fQueueDepth);
+   }
+
+   if (!error.empty())
+      throw std::runtime_error(error);
+#else
+   (void)fd;
+   (void)ioVec;
+   (void)nReq;
+   R__ASSERT(false && "io_uring support not available");
+#endif
+}
+
+void ROOT::Internal::RAsyncReadEngine::ReadVThreadPool(int fd, RRawFile::RIOVec *ioVec, unsigned int nReq)
+{
+   auto &pool = RReaderPool::Get();
+   RReaderPool::RBatch batch;
+
+   for (unsigned int i = 0; i < nReq; ++i) {
+      {
+         std::unique_lock<std::mutex> lock(batch.fLock);
+         batch.fCvDone.wait(lock, [&] { return batch.fNInFlight < fQueueDepth; });
+         if (!batch.fError.empty())
+            break;
+         OnSubmit(++batch.fNInFlight);
+      }
+      ioVec[i].fOutBytes = 0;
+      pool.Submit({fd, &ioVec[i], &batch});
+   }
+
+   std::unique_lock<std::mutex> lock(batch.fLock);
+   batch.fCvDone.wait(lock, [&batch] { return batch.fNInFlight == 0; });
+   if (!batch.fError.empty())
+      throw std::runtime_error(batch.fError);
+}
+
+void ROOT::Internal::RAsyncReadEngine::ReadV(int fd, RRawFile::RIOVec *ioVec, unsigned int nReq)
+{
+   std::lock_guard<std::mutex> guard(fLock);
+
+   fReadVStats = RStats();
+   const auto start = std::chrono::steady_clock::now();
+   if (fBackend == EBackend::kIoUring)
+      ReadVIoUring(fd, ioVec, nReq);
+   else
+      ReadVThreadPool(fd, ioVec, nReq);
+   const auto readTime =
+      std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now() - start).count();
+
+   std::uint64_t nBytes = 0;
+   for (unsigned int i = 0; i < nReq; ++i)
+      nBytes += ioVec[i].fOutBytes;
+
+   gStats.fNReadV++;
+   gStats.fNRequests += nReq;
+   gStats.fNBytes += nBytes;
+   gStats.fSumQueueDepth += fReadVStats.fSumQueueDepth;
+   gStats.fReadTimeNs += readTime;
+   auto maxQueueDepth = gStats.fMaxQueueDepth.load();
+   while (maxQueueDepth < fReadVStats.fMaxQueueDepth &&
+          !gStats.fMaxQueueDepth.compare_exchange_weak(maxQueueDepth, fReadVStats.fMaxQueueDepth)) {
+   }
+}
+
+ROOT::Internal::RAsyncReadEngine::RStats ROOT::Internal::RAsyncReadEngine::GetStats()
+{
+   RStats stats;
+   stats.fNReadV = gStats.fNReadV;
+   stats.fNRequests = gStats.fNRequests;
+   stats.fNBytes = gStats.fNBytes;
+   stats.fSumQueueDepth = gStats.fSumQueueDepth;
+   stats.fMaxQueueDepth = gStats.fMaxQueueDepth;
+   stats.fReadTimeNs = gStats.fReadTimeNs;
+   return stats;
+}
+
+void ROOT::Internal::RAsyncReadEngine::ResetStats()
+{
+   gStats.fNReadV = 0;
+   gStats.fNRequests = 0;
+   gStats.fNBytes = 0;
+   gStats.fSumQueueDepth = 0;
+   gStats.fMaxQueueDepth = 0;
+   gStats.fReadTimeNs = 0;
+}
@@ -94,6 +94,13 @@ void ROOT::Internal::RRawFileUnix::OpenImpl()
 
 void ROOT::Internal::RRawFileUnix::ReadVImpl(RIOVec *ioVec, unsigned int nReq)
 {
+   if (fOptions.fAsyncReadDepth > 0) {
+      if (!fAsyncReadEngine)
+         fAsyncReadEngine = std::make_unique<RAsyncReadEngine>(fOptions.fAsyncReadDepth);
+      fAsyncReadEngine->ReadV(fFileDes, ioVec, nReq);
+      return;
+   }
+
 #ifdef R__HAS_URING
    thread_local bool uring_failed = false;
    if (!uring_failed) {
@@ -152,6 +152,12 @@ The structure of a directory is shown in TDirectoryFile::TDirectoryFile
 #include "TGlobal.h"
 #include "ROOT/RConcurrentHashColl.hxx"
 #include <memory>
+#include <stdexcept>
+#include <vector>
+
+#ifndef WIN32
+#include "ROOT/RAsyncReadEngine.hxx"
+#endif
 
 #ifdef R__FBSD
 #include <sys/extattr.h>
@@ -580,6 +586,9 @@ TFile::~TFile()
    SafeDelete(fCacheRead);
    SafeDelete(fCacheReadMap);
    SafeDelete(fCacheWrite);
+#ifndef WIN32
+   SafeDelete(fAsyncReadEngine);
+#endif
    SafeDelete(fProcessIDs);
    SafeDelete(fFree);
    SafeDelete(fArchive);
@@ -1257,6 +1266,19 @@ void TFile::ResetErrno() const
    TSystem::ResetErrno();
 }
 
+////////////////////////////////////////////////////////////////////////////////
+/// Return the number of block reads that ReadBuffers() keeps in flight, or 0 if
+/// asynchronous reading is disabled.
+
+Int_t TFile::GetAsyncReadDepth() const
+{
+#ifndef WIN32
+   if (fAsyncReadEngine)
+      return fAsyncReadEngine->GetQueueDepth();
+#endif
+   return 0;
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 /// Return a pointer to the current read cache.
 
@@ -1817,6 +1839,8 @@ Bool_t TFile::ReadBuffer(char *buf, Int_t len)
 /// The value pos[i] is the seek position of block i of length len[i].
 /// Note that for nbuf=1, this call is equivalent to TFile::ReafBuffer.
 /// This function is overloaded by TNetFile, TWebFile, etc.
+/// If asynchronous reading is enabled with SetAsyncReadDepth(), the blocks
+/// are read with several requests in flight instead of one after the other.
 /// Returns kTRUE in case of failure.
 
 Bool_t TFile::ReadBuffers(char *buf, Long64_t *pos, Int_t *len, Int_t nbuf)
@@ -1831,6 +1855,47 @@ Bool_t TFile::ReadBuffers(char *buf, Long64_t *pos, Int_t *len, Int_t nbuf)
       return kFALSE;
    }
 
+#ifndef WIN32
+   // Keep up to GetAsyncReadDepth() blocks in flight, see SetAsyncReadDepth()
+   if (fAsyncReadEngine) {
+      Double_t start = 0;
+      if (gPerfStats) start = TTimeStamp();
+
+      std::vector<ROOT::Internal::RRawFile::RIOVec> ioVec(nbuf);
+      Long64_t nbytes = 0;
+      for (Int_t j = 0; j < nbuf; j++) {
+         ioVec[j].fBuffer = &buf[nbytes];
+         ioVec[j].fOffset = pos[j] + fArchiveOffset;
+         ioVec[j].fSize = len[j];
+         nbytes += len[j];
+      }
+      try {
+         fAsyncReadEngine->ReadV(fD, ioVec.data(), nbuf);
+      } catch (const std::runtime_error &e) {
+         Error("ReadBuffers", "error reading from file %s: %s", GetName(), e.what());
+         return kTRUE;
+      }
+      for (Int_t j = 0; j < nbuf; j++) {
+         if (ioVec[j].fOutBytes != ioVec[j].fSize) {
+            Error("ReadBuffers", "error reading all requested bytes from file %s, got %ld of %d",
+                  GetName(), (Long_t)ioVec[j].fOutBytes, len[j]);
+            return kTRUE;
+         }
+      }
+      fBytesRead  += nbytes;
+      fgBytesRead += nbytes;
+      fReadCalls  += nbuf;
+      fgReadCalls += nbuf;
+
+      if (gMonitoringWriter)
+         gMonitoringWriter->SendFileReadProgress(this);
+      if (gPerfStats) {
+         gPerfStats->FileReadEvent(this, (Int_t)nbytes, start);
+      }
+      return kFALSE;
+   }
+#endif
+
    Int_t k = 0;
    Bool_t result = kTRUE;
    TFileCacheRead *old = fCacheRead;
@@ -2341,6 +2406,39 @@ void TFile::SetCompressionSettings(Int_t settings)
    fCompress = settings;
 }
 
+////////////////////////////////////////////////////////////////////////////////
+/// Enable asynchronous reading of the vector reads of this file.
+///
+/// ReadBuffers(), which the TTreeCache uses to read the baskets of a cluster,
+/// then keeps up to `depth` block reads in flight instead of reading the blocks
+/// one after the other, so that fast storage (e.g. NVMe drives) sees a deep
+/// queue. The reads are submitted through io_uring if ROOT is built with
+/// io_uring support, and served by a pool of reader threads otherwise.
+/// A depth of 0 disables asynchronous reading again.
+///
+/// Only local files (TFile itself, not derived classes) are supported; the
+/// call is ignored with a warning otherwise. See also
+/// TFileCacheRead::SetAsyncReadDepth().
+
+void TFile::SetAsyncReadDepth(Int_t depth)
+{
+#ifndef WIN32
+   if (depth > 0 && IsA() != TFile::Class()) {
+      Warning("SetAsyncReadDepth", "asynchronous reading is only supported for local files, ignored for %s",
+              GetName());
+      return;
+   }
+   if (depth == GetAsyncReadDepth())
+      return;
+   SafeDelete(fAsyncReadEngine);
+   if (depth > 0)
+      fAsyncReadEngine = new ROOT::Internal::RAsyncReadEngine(depth);
+#else
+   if (depth > 0)
+      Warning("SetAsyncReadDepth", "asynchronous reading is not supported on Windows");
+#endif
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 /// Set a pointer to the read cache.
 ///
@@ -83,6 +83,7 @@ TFileCacheRead::TFileCacheRead() : TObject()
 
    fAsyncReading = kFALSE;
    fEnablePrefetching = kFALSE;
+   fAsyncReadDepth  = 0;
    fPrefetch        = 0;
    fPrefetchedBlocks= 0;
 }
@@ -146,6 +147,11 @@ TFileCacheRead::TFileCacheRead(TFile *file, Int_t buffersize, TObject *tree)
       SetEnablePrefetchingImpl(false);
    }
 
+   // keep several block reads in flight, only supported for local files
+   fAsyncReadDepth = gEnv->GetValue("TFile.AsyncReadDepth", 0);
+   if (fAsyncReadDepth > 0 && file && file->IsA() == TFile::Class())
+      file->SetAsyncReadDepth(fAsyncReadDepth);
+
    fIsSorted       = kFALSE;
    fIsTransferred  = kFALSE;
    fBIsSorted      = kFALSE;
@@ -555,6 +561,9 @@ void TFileCacheRead::SetFile(TFile *file, TFile::ECacheAction action)
       }
    }
 
+   if (fAsyncReadDepth > 0 && file && file->IsA() == TFile::Class())
+      file->SetAsyncReadDepth(fAsyncReadDepth);
+
    if (action == TFile::kDisconnect)
       Prefetch(0,0);
 
@@ -761,6 +770,23 @@ Int_t TFileCacheRead::SetBufferSize(Long64_t buffersize)
 }
 
 
+////////////////////////////////////////////////////////////////////////////////
+/// Keep up to 'depth' block reads in flight when the cache reads its blocks.
+///
+/// The blocks of a cache, e.g. the baskets of a cluster for a TTreeCache, are
+/// then read through io_uring or a pool of reader threads instead of one after
+/// the other; see TFile::SetAsyncReadDepth(). The setting follows the cache to
+/// the files it is attached to later. A depth of 0 disables asynchronous
+/// reading. The default depth is taken from the gEnv and rootrc variable
+/// TFile.AsyncReadDepth. Only local files are supported.
+
+void TFileCacheRead::SetAsyncReadDepth(Int_t depth)
+{
+   fAsyncReadDepth = depth;
+   if (fFile)
+      fFile->SetAsyncReadDepth(depth);
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 /// Set the prefetching mode of this file.
 ///
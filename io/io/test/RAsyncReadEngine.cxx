@@ -0,0 +1,112 @@
+#include "io_test.hxx"
+
+#include "ROOT/RAsyncReadEngine.hxx"
+
+#include <cstdint>
+#include <vector>
+
+#include <fcntl.h>
+#include <unistd.h>
+
+using RAsyncReadEngine = ROOT::Internal::RAsyncReadEngine;
+using RIOVec = RRawFile::RIOVec;
+
+namespace {
+
+constexpr std::size_t kFileSize = 1 << 20;
+
+/// The byte at offset i is i % 251
+std::string MakeContent(std::size_t size)
+{
+   std::string content(size, 0);
+   for (std::size_t i = 0; i < size; ++i)
+      content[i] = static_cast<char>(i % 251);
+   return content;
+}
+
+/// Fill the buffers of the requests with reads of 4kB at scattered offsets; the last one crosses the end of the file
+std::vector<RIOVec> MakeRequests(std::vector<std::vector<unsigned char>> &buffers)
+{
+   std::vector<RIOVec> ioVec(buffers.size());
+   for (std::size_t i = 0; i < buffers.size(); ++i) {
+      buffers[i].resize(4096);
+      ioVec[i].fBuffer = buffers[i].data();
+      ioVec[i].fOffset = (i * 7919) % (kFileSize - 4096);
+      ioVec[i].fSize = 4096;
+   }
+   ioVec.back().fOffset = kFileSize - 100;
+   return ioVec;
+}
+
+void CheckRequests(const std::vector<RIOVec> &ioVec)
+{
+   for (std::size_t i = 0; i < ioVec.size(); ++i) {
+      const auto expectedBytes = std::min<std::size_t>(ioVec[i].fSize, kFileSize - ioVec[i].fOffset);
+      ASSERT_EQ(expectedBytes, ioVec[i].fOutBytes);
+      const auto buffer = static_cast<const unsigned char *>(ioVec[i].fBuffer);
+      for (std::size_t k = 0; k < expectedBytes; ++k)
+         ASSERT_EQ((ioVec[i].fOffset + k) % 251, buffer[k]);
+   }
+}
+
+} // anonymous namespace
+
+TEST(RAsyncReadEngine, ReadV)
+{
+   FileRaii fileGuard("test_async_read_engine_readv", MakeContent(kFileSize));
+   int fd = open(fileGuard.GetPath().c_str(), O_RDONLY);
+   ASSERT_GE(fd, 0);
+
+   for (unsigned int depth : {1u, 8u, 64u}) {
+      RAsyncReadEngine engine(depth);
+      EXPECT_EQ(depth, engine.GetQueueDepth());
+      RAsyncReadEngine::ResetStats();
+
+      std::vector<std::vector<unsigned char>> buffers(1000);
+      auto ioVec = MakeRequests(buffers);
+      engine.ReadV(fd, ioVec.data(), ioVec.size());
+      CheckRequests(ioVec);
+
+      const auto stats = RAsyncReadEngine::GetStats();
+      EXPECT_EQ(1U, stats.fNReadV);
+      EXPECT_EQ(ioVec.size(), stats.fNRequests);
+      EXPECT_EQ(999U * 4096 + 100, stats.fNBytes);
+      EXPECT_GE(stats.fMaxQueueDepth, 1U);
+      EXPECT_LE(stats.fMaxQueueDepth, depth);
+      EXPECT_GE(stats.GetMeanQueueDepth(), 1.);
+      EXPECT_LE(stats.GetMeanQueueDepth(), depth);
+   }
+
+   close(fd);
+}
+
+TEST(RAsyncReadEngine, Error)
+{
+   RAsyncReadEngine engine(4);
+   char buffer[16];
+   RIOVec ioVec;
+   ioVec.fBuffer = buffer;
+   ioVec.fSize = sizeof(buffer);
+   EXPECT_THROW(engine.ReadV(-1, &ioVec, 1), std::runtime_error);
+}
+
+TEST(RAsyncReadEngine, RRawFile)
+{
+   FileRaii fileGuard("test_async_read_engine_rrawfile", MakeContent(kFileSize));
+   RRawFile::ROptions options;
+   options.fAsyncReadDepth = 16;
+   auto f = RRawFile::Create(fileGuard.GetPath(), options);
+   RAsyncReadEngine::ResetStats();
+
+   std::vector<std::vector<unsigned char>> buffers(100);
+   auto ioVec = MakeRequests(buffers);
+   f->ReadV(ioVec.data(), ioVec.size());
+   CheckRequests(ioVec);
+   EXPECT_EQ(ioVec.size(), RAsyncReadEngine::GetStats().fNRequests);
+
+   // Clones use the same options
+   auto clone = f->Clone();
+   clone->ReadV(ioVec.data(), ioVec.size());
+   CheckRequests(ioVec);
+   EXPECT_EQ(2 * ioVec.size(), RAsyncReadEngine::GetStats().fNRequests);
+}
@@ -1,8 +1,12 @@
 #include <memory>
+#include <numeric>
+#include <string>
 #include <vector>
 
 #include "gtest/gtest.h"
 
+#include <ROOT/TestSupport.hxx>
+
 #include "TFile.h"
 #include "TKey.h"
 #include "TNamed.h"
@@ -135,3 +139,53 @@ TEST(TFile, ReadWithoutGlobalRegistrationNet)
    const auto netFile = "root://eospublic.cern.ch//eos/root-eos/h1/dstarmb.root";
    TestReadWithoutGlobalRegistrationIfPossible(netFile);
 }
+
+#ifndef _WIN32
+TEST(TFile, ReadBuffersAsync)
+{
+   const auto filename = "TFileTestReadBuffersAsync.root";
+   {
+      TFile f(filename, "RECREATE");
+      for (int i = 0; i < 100; ++i) {
+         TNamed named(("named" + std::to_string(i)).c_str(), std::string(100 * i, 'a' + i % 26).c_str());
+         named.Write();
+      }
+   }
+
+   TFile f(filename);
+   std::vector<Long64_t> pos;
+   std::vector<Int_t> len;
+   for (auto key : TRangeDynCast<TKey>(f.GetListOfKeys())) {
+      pos.push_back(key->GetSeekKey());
+      len.push_back(key->GetNbytes());
+   }
+   const auto nbytes = std::accumulate(len.begin(), len.end(), 0);
+
+   std::vector<char> expected(nbytes);
+   EXPECT_FALSE(f.ReadBuffers(expected.data(), pos.data(), len.data(), pos.size()));
+
+   EXPECT_EQ(0, f.GetAsyncReadDepth());
+   f.SetAsyncReadDepth(4);
+   EXPECT_EQ(4, f.GetAsyncReadDepth());
+   const auto bytesRead = f.GetBytesRead();
+   std::vector<char> buffer(nbytes);
+   EXPECT_FALSE(f.ReadBuffers(buffer.data(), pos.data(), len.data(), pos.size()));
+   EXPECT_EQ(expected, buffer);
+   EXPECT_EQ(bytesRead + nbytes, f.GetBytesRead());
+
+   // Reading beyond the end of the file fails
+   {
+      ROOT::TestSupport::CheckDiagsRAII diag;
+      diag.requiredDiag(kError, "TFile::ReadBuffers", "error reading all requested bytes", /*matchFullMessage=*/false);
+      Long64_t badPos = f.GetSize() - 10;
+      Int_t badLen = 100;
+      EXPECT_TRUE(f.ReadBuffers(buffer.data(), &badPos, &badLen, 1));
+   }
+
+   f.SetAsyncReadDepth(0);
+   EXPECT_EQ(0, f.GetAsyncReadDepth());
+
+   f.Close();
+   gSystem->Unlink(filename);
+}
+#endif
@@ -21,8 +21,11 @@
 #include <RooWorkspace.h>
 
 #include <map>
+#include <memory>
 #include <stdexcept>
 #include <set>
+#include <utility>
+#include <vector>
 
 namespace RooFit {
 namespace JSONIO {
@@ -127,6 +130,13 @@ public:
    static std::unique_ptr<RooDataHist>
    readBinnedData(const RooFit::Detail::JSONNode &n, const std::string &namecomp, RooArgSet const &vars);
 
+   /// Only import the variables, snapshots, data and analyses, and import the
+   /// functions and distributions when they are requested.
+   void setLazyImport(bool flag = true) { _lazyImport = flag; }
+   bool lazyImport() const { return _lazyImport; }
+   /// Wall-clock time in seconds spent in the stages of the last import.
+   std::vector<std::pair<std::string, double>> const &importTimings() const { return _importTimings; }
+
    bool importJSON(std::string const &filename);
    bool importYML(std::string const &filename);
    bool importJSON(std::istream &os);
@@ -238,5 +248,10 @@ private:
    // objects to represent intermediate information
    std::unique_ptr<RooFit::JSONIO::Detail::Domains> _domains;
    std::vector<RooAbsArg const *> _serversToExport;
+
+   // lazy import
+   bool _lazyImport = false;
+   std::unique_ptr<RooFit::Detail::JSONTree> _inputTree;
+   std::vector<std::pair<std::string, double>> _importTimings;
 };
 #endif
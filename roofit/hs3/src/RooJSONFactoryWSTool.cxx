@@ -35,6 +35,7 @@
 #include <TROOT.h>
 
 #include <algorithm>
+#include <chrono>
 #include <fstream>
 #include <iostream>
 #include <stack>
@@ -68,6 +69,19 @@ tool.exportJSON("myjson.json")
 
 For more details, consult the tutorial <a href="rf515__hfJSON_8py.html">rf515_hfJSON</a>.
 
+Large workspaces can be imported lazily, in which case only the variables,
+snapshots, datasets and analyses are imported right away. The functions and
+distributions are imported when an analysis needs them or when they are
+requested from the tool, which has to be kept alive for that:
+
+~~~ {.py}
+tool = ROOT.RooJSONFactoryWSTool(ws)
+tool.setLazyImport(True)
+tool.importJSON("myjson.json")
+pdf = tool.request["RooAbsPdf"]("model_channel1", "")
+print(tool.importTimings())
+~~~
+
 In order to import and export YML files, `ROOT` needs to be compiled
 with the external dependency <a
 href="https://github.com/biojppm/rapidyaml">RapidYAML</a>, which needs
@@ -292,21 +306,6 @@ std::string genPrefix(const JSONNode &p, bool trailing_underscore)
    return prefix;
 }
 
-// helpers for serializing / deserializing binned datasets
-void genIndicesHelper(std::vector<std::vector<int>> &combinations, std::vector<int> &curr_comb,
-                      const std::vector<int> &vars_numbins, size_t curridx)
-{
-   if (curridx == vars_numbins.size()) {
-      // we have filled a combination. Copy it.
-      combinations.emplace_back(curr_comb);
-   } else {
-      for (int i = 0; i < vars_numbins[curridx]; ++i) {
-         curr_comb[curridx] = i;
-         ::genIndicesHelper(combinations, curr_comb, vars_numbins, curridx + 1);
-      }
-   }
-}
-
 /**
  * @brief Import attributes from a JSONNode into a RooAbsArg.
  *
@@ -365,29 +364,6 @@ std::string generate(const RooFit::JSONIO::ImportExpression &ex, const JSONNode
    return expression.str();
 }
 
-/**
- * @brief Generate bin indices for a set of RooRealVars.
- *
- * This function generates all possible combinations of bin indices for the provided RooArgSet 'vars' containing
- * RooRealVars. Each bin index represents a possible bin selection for the corresponding RooRealVar. The bin indices are
- * stored in a vector of vectors, where each inner vector represents a combination of bin indices for all RooRealVars.
- *
- * @param vars The RooArgSet containing the RooRealVars for which bin indices will be generated.
- * @return std::vector<std::vector<int>> A vector of vectors containing all possible combinations of bin indices.
- */
-std::vector<std::vector<int>> generateBinIndices(const RooArgSet &vars)
-{
-   std::vector<std::vector<int>> combinations;
-   std::vector<int> vars_numbins;
-   vars_numbins.reserve(vars.size());
-   for (const auto *absv : static_range_cast<RooRealVar *>(vars)) {
-      vars_numbins.push_back(absv->getBins());
-   }
-   std::vector<int> curr_comb(vars.size());
-   ::genIndicesHelper(combinations, curr_comb, vars_numbins, 0);
-   return combinations;
-}
-
 template <typename... Keys_t>
 JSONNode const *findRooFitInternal(JSONNode const &node, Keys_t const &...keys)
 {
@@ -582,14 +558,16 @@ std::unique_ptr<RooAbsData> loadData(const JSONNode &p, RooWorkspace &workspace)
  * @param analysisNode The JSONNode representing the analysis to be imported.
  * @param likelihoodsNode The JSONNode containing information about likelihoods associated with the analysis.
  * @param domainsNode The JSONNode containing information about domains associated with the analysis.
- * @param workspace The RooWorkspace to which the analysis will be imported.
+ * @param tool The RooJSONFactoryWSTool importing into the workspace, used to request the distributions.
  * @param datasets A vector of unique pointers to RooAbsData objects representing the data associated with the analysis.
  * @return void
  */
 void importAnalysis(const JSONNode &rootnode, const JSONNode &analysisNode, const JSONNode &likelihoodsNode,
-                    const JSONNode &domainsNode, RooWorkspace &workspace,
+                    const JSONNode &domainsNode, RooJSONFactoryWSTool &tool,
                     const std::vector<std::unique_ptr<RooAbsData>> &datasets)
 {
+   RooWorkspace &workspace = *tool.workspace();
+
    // if this is a toplevel pdf, also create a modelConfig for it
    std::string const &analysisName = RooJSONFactoryWSTool::name(analysisNode);
    JSONNode const *mcAuxNode = findRooFitInternal(rootnode, "ModelConfigs", analysisName);
@@ -599,6 +577,17 @@ void importAnalysis(const JSONNode &rootnode, const JSONNode &analysisNode, cons
    if (workspace.obj(mcname))
       return;
 
+   // In lazy mode, the distributions are only imported at this point
+   auto findPdf = [&](std::string const &pdfName) -> RooAbsPdf * {
+      if (RooAbsPdf *pdf = workspace.pdf(pdfName))
+         return pdf;
+      try {
+         return tool.request<RooAbsPdf>(pdfName, analysisName);
+      } catch (RooJSONFactoryWSTool::DependencyMissingError const &) {
+         return nullptr;
+      }
+   };
+
    workspace.import(RooStats::ModelConfig{mcname.c_str(), mcname.c_str()});
    auto *mc = static_cast<RooStats::ModelConfig *>(workspace.obj(mcname));
    mc->SetWS(workspace);
@@ -618,7 +607,7 @@ void importAnalysis(const JSONNode &rootnode, const JSONNode &analysisNode, cons
    std::vector<std::string> nllDistNames = valsToStringVec((*nllNode)["distributions"]);
    RooArgSet extConstraints;
    for (auto &nameNode : (*nllNode)["aux_distributions"].children()) {
-      if (RooAbsArg *extConstraint = workspace.arg(nameNode.val())) {
+      if (RooAbsArg *extConstraint = findPdf(nameNode.val())) {
          extConstraints.add(*extConstraint);
       }
    }
@@ -635,13 +624,13 @@ void importAnalysis(const JSONNode &rootnode, const JSONNode &analysisNode, cons
    JSONNode const *pdfNameNode = mcAuxNode ? mcAuxNode->find("pdfName") : nullptr;
    std::string const pdfName = pdfNameNode ? pdfNameNode->val() : "simPdf";
 
-   RooAbsPdf *pdf = static_cast<RooSimultaneous *>(workspace.pdf(pdfName));
+   RooAbsPdf *pdf = findPdf(pdfName);
 
    if (!pdf) {
       // if there is no simultaneous pdf, we can check whether there is only one pdf in the list
       if (nllDistNames.size() == 1) {
          // if so, we can use that one to populate the ModelConfig
-         pdf = workspace.pdf(nllDistNames[0]);
+         pdf = findPdf(nllDistNames[0]);
       } else {
          // otherwise, we have no choice but to build a simPdf by hand
          std::string simPdfName = analysisName + "_simPdf";
@@ -650,7 +639,7 @@ void importAnalysis(const JSONNode &rootnode, const JSONNode &analysisNode, cons
          std::map<std::string, RooAbsPdf *> pdfMap;
          for (std::size_t i = 0; i < nllDistNames.size(); ++i) {
             indexCat.defineType(nllDistNames[i], i);
-            pdfMap[nllDistNames[i]] = workspace.pdf(nllDistNames[i]);
+            pdfMap[nllDistNames[i]] = findPdf(nllDistNames[i]);
          }
          RooSimultaneous simPdf{simPdfName.c_str(), simPdfName.c_str(), pdfMap, indexCat};
          workspace.import(simPdf, RooFit::RecycleConflictNodes(true), RooFit::Silence(true));
@@ -715,8 +704,10 @@ void importAnalysis(const JSONNode &rootnode, const JSONNode &analysisNode, cons
    }
 }
 
-void combinePdfs(const JSONNode &rootnode, RooWorkspace &ws)
+void combinePdfs(const JSONNode &rootnode, RooJSONFactoryWSTool &tool)
 {
+   RooWorkspace &ws = *tool.workspace();
+
    auto *combinedPdfInfoNode = findRooFitInternal(rootnode, "combined_distributions");
 
    // If there is no info on combining pdfs
@@ -741,7 +732,8 @@ void combinePdfs(const JSONNode &rootnode, RooWorkspace &ws)
 
       for (std::size_t iChannel = 0; iChannel < labels.size(); ++iChannel) {
          indexCat.defineType(labels[iChannel], indices[iChannel]);
-         pdfMap[labels[iChannel]] = ws.pdf(pdfNames[iChannel]);
+         // request the pdfs, because they might not be imported yet in lazy mode
+         pdfMap[labels[iChannel]] = tool.request<RooAbsPdf>(pdfNames[iChannel], combinedName);
       }
 
       RooSimultaneous simPdf{combinedName.c_str(), combinedName.c_str(), pdfMap, indexCat};
@@ -869,6 +861,8 @@ RooRealVar *RooJSONFactoryWSTool::requestImpl<RooRealVar>(const std::string &obj
 {
    if (RooRealVar *retval = _workspace.var(objname))
       return retval;
+   if (!_rootnodeInput)
+      return nullptr;
    if (JSONNode const *vars = getVariablesNode(*_rootnodeInput)) {
       if (auto node = vars->find(objname)) {
          this->importVariable(*node);
@@ -884,6 +878,8 @@ RooAbsPdf *RooJSONFactoryWSTool::requestImpl<RooAbsPdf>(const std::string &objna
 {
    if (RooAbsPdf *retval = _workspace.pdf(objname))
       return retval;
+   if (!_rootnodeInput)
+      return nullptr;
    if (auto distributionsNode = _rootnodeInput->find("distributions")) {
       if (auto child = findNamedChild(*distributionsNode, objname)) {
          this->importFunction(*child, true);
@@ -905,6 +901,8 @@ RooAbsReal *RooJSONFactoryWSTool::requestImpl<RooAbsReal>(const std::string &obj
       return pdf;
    if (RooRealVar *var = requestImpl<RooRealVar>(objname))
       return var;
+   if (!_rootnodeInput)
+      return nullptr;
    if (auto functionNode = _rootnodeInput->find("functions")) {
       if (auto child = findNamedChild(*functionNode, objname)) {
          this->importFunction(*child, true);
@@ -1243,6 +1241,13 @@ void RooJSONFactoryWSTool::importFunction(const JSONNode &p, bool importAllDepen
       err << "something went wrong importing function '" << name << "'.";
       RooJSONFactoryWSTool::error(err.str());
    }
+
+   // Objects that are imported on request in lazy mode are created after the
+   // attributes were set in importAllNodes(), so they are set here
+   if (_lazyImport && _attributesNode) {
+      if (JSONNode const *attrNode = _attributesNode->find(name))
+         importAttributes(func, *attrNode);
+   }
 }
 
 /**
@@ -1593,29 +1598,33 @@ RooJSONFactoryWSTool::readBinnedData(const JSONNode &n, const std::string &name,
          RooJSONFactoryWSTool::error("errors are not in list form");
    }
 
-   auto bins = generateBinIndices(vars);
-   if (contents.num_children() != bins.size()) {
+   auto dh = std::make_unique<RooDataHist>(name, name, vars);
+   const std::size_t nBins = dh->numEntries();
+   if (contents.num_children() != nBins) {
       std::stringstream errMsg;
-      errMsg << "inconsistent bin numbers: contents=" << contents.num_children() << ", bins=" << bins.size();
+      errMsg << "inconsistent bin numbers: contents=" << contents.num_children() << ", bins=" << nBins;
       RooJSONFactoryWSTool::error(errMsg.str());
    }
-   auto dh = std::make_unique<RooDataHist>(name, name, vars);
-   std::vector<double> contentVals;
-   contentVals.reserve(contents.num_children());
-   for (auto const &cont : contents.children()) {
-      contentVals.push_back(cont.val_double());
+   if (errors && errors->num_children() != nBins) {
+      std::stringstream errMsg;
+      errMsg << "inconsistent bin numbers: errors=" << errors->num_children() << ", bins=" << nBins;
+      RooJSONFactoryWSTool::error(errMsg.str());
    }
-   std::vector<double> errorVals;
+
+   // Decode the arrays in one go and fill them directly into the RooDataHist storage
+   std::vector<double> contentVals = contents.val_double_seq();
+   std::vector<double> sumw2Vals;
    if (errors) {
-      errorVals.reserve(errors->num_children());
-      for (auto const &err : errors->children()) {
-         errorVals.push_back(err.val_double());
+      sumw2Vals = errors->val_double_seq();
+      // Like RooDataHist::set(), only track the sums of squared weights if there are non-zero errors
+      if (std::none_of(sumw2Vals.begin(), sumw2Vals.end(), [](double err) { return err > 0.; })) {
+         sumw2Vals.clear();
+      }
+      for (double &val : sumw2Vals) {
+         val *= val;
       }
    }
-   for (size_t ibin = 0; ibin < bins.size(); ++ibin) {
-      const double err = errors ? errorVals[ibin] : -1;
-      dh->set(ibin, contentVals[ibin], err);
-   }
+   dh->setWeights(contentVals, sumw2Vals);
    return dh;
 }
 
@@ -2085,6 +2094,13 @@ void RooJSONFactoryWSTool::importAllNodes(const JSONNode &n)
       error(ss.str());
    }
 
+   auto stageStart = std::chrono::steady_clock::now();
+   auto endStage = [&](std::string const &stage) {
+      auto now = std::chrono::steady_clock::now();
+      _importTimings.emplace_back(stage, std::chrono::duration<double>(now - stageStart).count());
+      stageStart = now;
+   };
+
    _domains = std::make_unique<RooFit::JSONIO::Detail::Domains>();
    if (auto domains = n.find("domains")) {
       _domains->readJSON(*domains);
@@ -2095,7 +2111,19 @@ void RooJSONFactoryWSTool::importAllNodes(const JSONNode &n)
 
    _attributesNode = findRooFitInternal(*_rootnodeInput, "attributes");
 
-   this->importDependants(n);
+   if (JSONNode const *varsNode = getVariablesNode(n)) {
+      for (const auto &p : varsNode->children()) {
+         importVariable(p);
+      }
+   }
+   endStage("variables");
+
+   // In lazy mode, the functions and distributions are imported on request,
+   // i.e. when they are needed by the analyses or requested by the user
+   if (!_lazyImport) {
+      this->importDependants(n);
+   }
+   endStage("functions");
 
    if (auto paramPointsNode = n.find("parameter_points")) {
       for (const auto &snsh : paramPointsNode->children()) {
@@ -2117,7 +2145,9 @@ void RooJSONFactoryWSTool::importAllNodes(const JSONNode &n)
       }
    }
 
-   combinePdfs(*_rootnodeInput, _workspace);
+   endStage("snapshots");
+
+   combinePdfs(*_rootnodeInput, *this);
 
    // Import attributes
    if (_attributesNode) {
@@ -2127,7 +2157,8 @@ void RooJSONFactoryWSTool::importAllNodes(const JSONNode &n)
       }
    }
 
-   _attributesNode = nullptr;
+   if (!_lazyImport)
+      _attributesNode = nullptr;
 
    // We delay the import of the data to after combineDatasets(), because it
    // might be that some datasets are merged to combined datasets there. In
@@ -2139,14 +2170,16 @@ void RooJSONFactoryWSTool::importAllNodes(const JSONNode &n)
          datasets.push_back(loadData(p, _workspace));
       }
    }
+   endStage("data");
 
    // Now, read in analyses and likelihoods if there are any
 
    if (auto analysesNode = n.find("analyses")) {
       for (JSONNode const &analysisNode : analysesNode->children()) {
-         importAnalysis(*_rootnodeInput, analysisNode, n["likelihoods"], n["domains"], _workspace, datasets);
+         importAnalysis(*_rootnodeInput, analysisNode, n["likelihoods"], n["domains"], *this, datasets);
       }
    }
+   endStage("analyses");
 
    combineDatasets(*_rootnodeInput, datasets);
 
@@ -2154,9 +2187,19 @@ void RooJSONFactoryWSTool::importAllNodes(const JSONNode &n)
       if (d)
          _workspace.import(*d);
    }
+   endStage("datasets");
 
-   _rootnodeInput = nullptr;
-   _domains.reset();
+   std::stringstream timings;
+   for (auto const &stage : _importTimings) {
+      timings << " " << stage.first << "=" << stage.second << "s";
+   }
+   oocoutI(nullptr, IO) << "RooJSONFactoryWSTool: import timings:" << timings.str() << std::endl;
+
+   // In lazy mode, the input stays available to import more objects on request
+   if (!_lazyImport) {
+      _rootnodeInput = nullptr;
+      _domains.reset();
+   }
 }
 
 /**
@@ -2168,8 +2211,13 @@ void RooJSONFactoryWSTool::importAllNodes(const JSONNode &n)
 bool RooJSONFactoryWSTool::importJSON(std::istream &is)
 {
    // import a JSON file to the workspace
+   _importTimings.clear();
+   auto start = std::chrono::steady_clock::now();
    std::unique_ptr<JSONTree> tree = JSONTree::create(is);
+   _importTimings.emplace_back("parse", std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count());
    this->importAllNodes(tree->rootnode());
+   // in lazy mode, the tree is kept to import the remaining objects on request
+   _inputTree = _lazyImport ? std::move(tree) : nullptr;
    if (this->workspace()->getSnapshot("default_values")) {
       this->workspace()->loadSnapshot("default_values");
    }
@@ -2204,8 +2252,12 @@ bool RooJSONFactoryWSTool::importJSON(std::string const &filename)
 bool RooJSONFactoryWSTool::importYML(std::istream &is)
 {
    // import a YML file to the workspace
+   _importTimings.clear();
+   auto start = std::chrono::steady_clock::now();
    std::unique_ptr<JSONTree> tree = JSONTree::create(is);
+   _importTimings.emplace_back("parse", std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count());
    this->importAllNodes(tree->rootnode());
+   _inputTree = _lazyImport ? std::move(tree) : nullptr;
    return true;
 }
 
@@ -140,6 +140,34 @@ TEST(RooFitHS3, AttributesIO)
    EXPECT_STREQ(pdf.getStringAttribute("key1"), nullptr) << "unexpected string attribute found!";
 }
 
+// Test that the functions and distributions are only imported on request in
+// the lazy import mode, including their attributes.
+TEST(RooFitHS3, LazyImport)
+{
+   std::string jsonString;
+
+   {
+      RooWorkspace ws{"workspace"};
+      ws.factory("Gaussian::pdf(x[0, 10], mean[5], sigma[1.0, 0.1, 10])");
+      ws.pdf("pdf")->setAttribute("attr0");
+      jsonString = RooJSONFactoryWSTool{ws}.exportJSONtoString();
+   }
+
+   RooWorkspace ws{"workspace"};
+   RooJSONFactoryWSTool tool{ws};
+   tool.setLazyImport(true);
+   tool.importJSONfromString(jsonString);
+
+   EXPECT_NE(ws.var("x"), nullptr);
+   EXPECT_EQ(ws.pdf("pdf"), nullptr) << "distribution was imported eagerly";
+   EXPECT_FALSE(tool.importTimings().empty());
+
+   RooAbsPdf *pdf = tool.request<RooAbsPdf>("pdf", "");
+   ASSERT_NE(pdf, nullptr);
+   EXPECT_EQ(pdf, ws.pdf("pdf"));
+   EXPECT_TRUE(pdf->getAttribute("attr0")) << "attributes of lazily imported objects are missing";
+}
+
 TEST(RooFitHS3, RooAddPdf)
 {
    int status = validate({"Gaussian::sig(x[5.20, 5.30], sigmean[5.28, 5.20, 5.30], sigwidth[0.0027, 0.001, 1.])",
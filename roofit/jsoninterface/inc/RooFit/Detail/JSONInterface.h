@@ -105,6 +105,7 @@ public:
    virtual int val_int() const { return atoi(this->val().c_str()); }
    virtual double val_double() const { return std::stod(this->val()); }
    virtual bool val_bool() const { return atoi(this->val().c_str()); }
+   virtual std::vector<double> val_double_seq() const;
    template <class T>
    T val_t() const;
    virtual bool has_key() const = 0;
@@ -62,6 +62,22 @@ JSONNode::const_children_view JSONNode::children() const
            const_child_iterator(std::make_unique<::ChildItImpl<const JSONNode>>(*this, this->num_children()))};
 }
 
+/// Return the values of all children of a sequence node as doubles. Backends
+/// should override this to avoid creating a node object for every element,
+/// which dominates the decoding time of large arrays like histogram contents.
+std::vector<double> JSONNode::val_double_seq() const
+{
+   if (!is_seq()) {
+      throw std::runtime_error("node " + key() + " is not of sequence type!");
+   }
+   std::vector<double> out;
+   out.reserve(num_children());
+   for (auto const &child : children()) {
+      out.push_back(child.val_double());
+   }
+   return out;
+}
+
 std::ostream &operator<<(std::ostream &os, JSONNode const &s)
 {
    s.writeJSON(os);
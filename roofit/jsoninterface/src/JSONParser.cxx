@@ -261,6 +261,21 @@ double TJSONTree::Node::val_double() const
 {
    return node->get().get<double>();
 }
+std::vector<double> TJSONTree::Node::val_double_seq() const
+{
+   auto const &nd = node->get();
+   if (!nd.is_array()) {
+      throw std::runtime_error("node " + node->key() + " is not of sequence type!");
+   }
+   // read the numbers directly, without going through a cached child node per element
+   std::vector<double> out;
+   out.reserve(nd.size());
+   for (auto const &elem : nd) {
+      out.push_back(elem.get<double>());
+   }
+   return out;
+}
+
 bool TJSONTree::Node::val_bool() const
 {
    auto const &nd = node->get();
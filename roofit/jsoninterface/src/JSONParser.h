@@ -61,6 +61,7 @@ public:
       int val_int() const override;
       double val_double() const override;
       bool val_bool() const override;
+      std::vector<double> val_double_seq() const override;
       bool has_key() const override;
       bool has_val() const override;
       bool has_child(std::string const &) const override;
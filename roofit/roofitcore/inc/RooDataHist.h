@@ -74,6 +74,7 @@ public:
   void set(std::size_t binNumber, double weight, double wgtErr);
   void set(const RooArgSet& row, double weight, double wgtErr=-1.) ;
   void set(const RooArgSet& row, double weight, double wgtErrLo, double wgtErrHi) ;
+  void setWeights(std::span<const double> weights, std::span<const double> sumw2={});
 
   void add(const RooAbsData& dset, const RooFormulaVar* cutVar=nullptr, double weight=1.0 ) ;
   void add(const RooAbsData& dset, const char* cut, double weight=1.0 ) ;
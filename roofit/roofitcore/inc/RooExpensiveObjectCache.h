@@ -19,17 +19,20 @@
 #include "TObject.h"
 #include "RooArgSet.h"
 #include "TString.h"
+
+#include <cstddef>
 #include <map>
+#include <string>
 
 class RooExpensiveObjectCache : public TObject {
 public:
 
-  RooExpensiveObjectCache() {}
-  RooExpensiveObjectCache(const RooExpensiveObjectCache& other) : TObject(other) {}
+  RooExpensiveObjectCache() ;
+  RooExpensiveObjectCache(const RooExpensiveObjectCache& other) ;
   ~RooExpensiveObjectCache() override ;
 
-  bool registerObject(const char* ownerName, const char* objectName, TObject& cacheObject, const RooArgSet& params) ;
-  const TObject* retrieveObject(const char* name, TClass* tclass, const RooArgSet& params) ;
+  bool registerObject(const char* ownerName, const char* objectName, TObject& cacheObject, const RooArgSet& params, const RooAbsArg* graph=nullptr) ;
+  const TObject* retrieveObject(const char* name, TClass* tclass, const RooArgSet& params, const RooAbsArg* graph=nullptr) ;
 
   const TObject* getObj(Int_t uniqueID) ;
   bool clearObj(Int_t uniqueID) ;
@@ -45,6 +48,12 @@ public:
 
   void print() const ;
 
+  void setPersistentDirectory(std::string const& directory, std::size_t maxSize=0) ;
+  /// Directory of the on-disk store, or an empty string if it is disabled.
+  std::string const& persistentDirectory() const { return _persistentDir ; }
+  /// Maximum total size of the on-disk store in bytes, or zero if it is unbounded.
+  std::size_t persistentMaxSize() const { return _persistentMaxSize ; }
+
    class ExpensiveObject {
    public:
       ExpensiveObject() = default;
@@ -73,10 +82,18 @@ public:
 
 protected:
 
+  std::string persistentPath(const char* name, TClass* tclass, const RooArgSet& params, const RooAbsArg& graph) const ;
+  const TObject* readPersistent(const char* name, TClass* tclass, const RooArgSet& params, const RooAbsArg& graph) ;
+  void writePersistent(const char* name, TObject& cacheObject, const RooArgSet& params, const RooAbsArg& graph) const ;
+  void evictPersistent() const ;
+
   Int_t _nextUID = 0;
 
   std::map<TString,ExpensiveObject*> _map ;
 
+  std::string _persistentDir ;         ///<! Directory of the on-disk store shared between processes
+  std::size_t _persistentMaxSize = 0 ; ///<! Maximum size of the on-disk store in bytes
+
 
   ClassDefOverride(RooExpensiveObjectCache,2) // Singleton class that serves as session repository for expensive objects
 };
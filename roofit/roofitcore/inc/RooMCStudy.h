@@ -99,6 +99,7 @@ protected:
   RooPlot* makeFrameAndPlotCmd(const RooRealVar& param, RooLinkedList& cmdList, bool symRange=false) const ;
 
   bool run(bool generate, bool fit, Int_t nSamples, Int_t nEvtPerSample, bool keepGenData, const char* asciiFilePat) ;
+  bool runParallel(bool fit, Int_t nSamples, Int_t nEvtPerSample, bool keepGenData, const char* asciiFilePat) ;
   bool fitSample(RooAbsData* genSample) ;
   RooFit::OwningPtr<RooFitResult> doFit(RooAbsData* genSample) ;
 
@@ -137,6 +138,8 @@ protected:
   bool      _verboseGen       ; ///< Verbose generation?
   bool      _perExptGenParams = false; ///< Do generation parameter change per event?
   bool      _silence          ; ///< Silent running mode?
+  Int_t     _nWorkers = 0;      ///< Number of worker processes to generate and fit the samples in parallel
+  Int_t     _firstSample = 0;   ///< Serial number of the first sample processed by run()
 
   std::list<RooAbsMCStudyModule*> _modList ; ///< List of additional study modules ;
 
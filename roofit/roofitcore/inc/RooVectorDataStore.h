@@ -89,6 +89,7 @@ public:
   /// @{
   ArraysStruct getArrays() const;
   void recomputeSumWeight();
+  bool hasExternalBuffers() const;
   /// @}
 
 private:
@@ -209,7 +210,7 @@ public:
     }
 
     RealVector(const RealVector& other, RooAbsReal* real=nullptr) :
-      _vec(other._vec), _nativeReal(real?real:other._nativeReal), _real(real?real:other._real), _buf(other._buf), _nativeBuf(other._nativeBuf) {
+      _vec(other.dataPtr(), other.dataPtr() + other.size()), _nativeReal(real?real:other._nativeReal), _real(real?real:other._real), _buf(other._buf), _nativeBuf(other._nativeBuf) {
       if (other._tracker) {
         _tracker = new RooChangeTracker(Form("track_%s",_nativeReal->GetName()),"tracker",other._tracker->parameters()) ;
       } else {
@@ -226,13 +227,15 @@ public:
       _real = other._real;
       _buf = other._buf;
       _nativeBuf = other._nativeBuf;
-      if (other._vec.size() <= _vec.capacity() / 2 && _vec.capacity() > (VECTOR_BUFFER_SIZE / sizeof(double))) {
+      _extBuf = nullptr;
+      _extSize = 0;
+      if (other.size() <= _vec.capacity() / 2 && _vec.capacity() > (VECTOR_BUFFER_SIZE / sizeof(double))) {
         std::vector<double> tmp;
-        tmp.reserve(std::max(other._vec.size(), VECTOR_BUFFER_SIZE / sizeof(double)));
-        tmp.assign(other._vec.begin(), other._vec.end());
+        tmp.reserve(std::max(other.size(), VECTOR_BUFFER_SIZE / sizeof(double)));
+        tmp.assign(other.dataPtr(), other.dataPtr() + other.size());
         _vec.swap(tmp);
       } else {
-        _vec = other._vec;
+        _vec.assign(other.dataPtr(), other.dataPtr() + other.size());
       }
 
       return *this;
@@ -270,34 +273,65 @@ public:
     }
 
     void fill() {
+      ownData();
       _vec.push_back(*_buf);
     }
 
     void write(Int_t i) {
+      ownData();
       assert(static_cast<std::size_t>(i) < _vec.size());
       _vec[i] = *_buf ;
     }
 
     void reset() {
+      _extBuf = nullptr;
+      _extSize = 0;
       _vec.clear();
     }
 
     inline void load(std::size_t idx) const {
-      assert(idx < _vec.size());
-      *_buf = *(_vec.begin() + idx) ;
+      assert(idx < size());
+      *_buf = dataPtr()[idx];
       *_nativeBuf = *_buf ;
     }
 
     std::span<const double> getRange(std::size_t first, std::size_t last) const {
-      auto beg = std::min(_vec.cbegin() + first, _vec.cend());
-      auto end = std::min(_vec.cbegin() + last,  _vec.cend());
+      const std::size_t n = size();
+      first = std::min(first, n);
+      last = std::min(last, n);
 
-      return std::span<const double>(&*beg, std::distance(beg, end));
+      return std::span<const double>(dataPtr() + first, last > first ? last - first : 0);
     }
 
-    std::size_t size() const { return _vec.size() ; }
+    std::size_t size() const { return _extBuf ? _extSize : _vec.size() ; }
+
+    /// Use the memory of an external array as the data of this vector,
+    /// without copying it. The array has to outlive this vector, or to stay
+    /// alive until the vector is modified, which makes it copy the data into
+    /// its own memory first.
+    void setExternalBuffer(std::span<const double> buf) {
+      std::vector<double>{}.swap(_vec);
+      _extBuf = buf.data();
+      _extSize = buf.size();
+    }
+
+    bool hasExternalBuffer() const { return _extBuf != nullptr; }
+
+    /// Copy the data from the external buffer into the memory of this
+    /// vector, if an external buffer is used.
+    void ownData() {
+      if (!_extBuf) return;
+      _vec.assign(_extBuf, _extBuf + _extSize);
+      _extBuf = nullptr;
+      _extSize = 0;
+    }
+
+    /// Pointer to the first value, either in the external buffer or in the
+    /// memory of this vector.
+    const double* dataPtr() const { return _extBuf ? _extBuf : _vec.data(); }
 
     void resize(Int_t newSize) {
+      ownData();
       if (newSize < Int_t(_vec.capacity()) / 2 && _vec.capacity() > (VECTOR_BUFFER_SIZE / sizeof(double))) {
         // do an expensive copy, if we save at least a factor 2 in size
         std::vector<double> tmp;
@@ -313,17 +347,22 @@ public:
     }
 
     void reserve(Int_t newSize) {
+      ownData();
       _vec.reserve(newSize);
     }
 
+    /// Data of this vector. It is empty if an external buffer is used, in
+    /// which case the data is accessed with dataPtr() or getRange().
     const std::vector<double>& data() const {
       return _vec;
     }
 
-    std::vector<double>& data() { return _vec; }
+    std::vector<double>& data() { ownData(); return _vec; }
 
   protected:
     std::vector<double> _vec;
+    const double* _extBuf = nullptr; ///<! External buffer used instead of _vec, if set
+    std::size_t _extSize = 0; ///<! Size of the external buffer
 
   private:
     friend class RooVectorDataStore ;
@@ -444,7 +483,7 @@ public:
     }
 
     CatVector(const CatVector& other, RooAbsCategory* cat = nullptr) :
-      _cat(cat?cat:other._cat), _buf(other._buf), _nativeBuf(other._nativeBuf), _vec(other._vec)
+      _cat(cat?cat:other._cat), _buf(other._buf), _nativeBuf(other._nativeBuf), _vec(other.dataPtr(), other.dataPtr() + other.size())
     {
 
     }
@@ -454,13 +493,15 @@ public:
       _cat = other._cat;
       _buf = other._buf;
       _nativeBuf = other._nativeBuf;
-      if (other._vec.size() <= _vec.capacity() / 2 && _vec.capacity() > VECTOR_BUFFER_SIZE) {
+      _extBuf = nullptr;
+      _extSize = 0;
+      if (other.size() <= _vec.capacity() / 2 && _vec.capacity() > VECTOR_BUFFER_SIZE) {
         std::vector<RooAbsCategory::value_type> tmp;
-        tmp.reserve(std::max(other._vec.size(), std::size_t(VECTOR_BUFFER_SIZE)));
-        tmp.assign(other._vec.begin(), other._vec.end());
+        tmp.reserve(std::max(other.size(), std::size_t(VECTOR_BUFFER_SIZE)));
+        tmp.assign(other.dataPtr(), other.dataPtr() + other.size());
         _vec.swap(tmp);
       } else {
-        _vec = other._vec;
+        _vec.assign(other.dataPtr(), other.dataPtr() + other.size());
       }
 
       return *this;
@@ -476,35 +517,60 @@ public:
     }
 
     void fill() {
+      ownData();
       _vec.push_back(*_buf) ;
     }
 
     void write(std::size_t i) {
+      ownData();
       _vec[i] = *_buf;
     }
 
     void reset() {
+      _extBuf = nullptr;
+      _extSize = 0;
       // make sure the vector releases the underlying memory
       std::vector<RooAbsCategory::value_type> tmp;
       _vec.swap(tmp);
     }
 
     inline void load(std::size_t idx) const {
-      *_buf = _vec[idx];
+      *_buf = dataPtr()[idx];
       *_nativeBuf = *_buf;
     }
 
     std::span<const RooAbsCategory::value_type> getRange(std::size_t first, std::size_t last) const {
-      auto beg = std::min(_vec.cbegin() + first, _vec.cend());
-      auto end = std::min(_vec.cbegin() + last,  _vec.cend());
+      const std::size_t n = size();
+      first = std::min(first, n);
+      last = std::min(last, n);
 
-      return std::span<const RooAbsCategory::value_type>(&*beg, std::distance(beg, end));
+      return std::span<const RooAbsCategory::value_type>(dataPtr() + first, last > first ? last - first : 0);
     }
 
 
-    std::size_t size() const { return _vec.size() ; }
+    std::size_t size() const { return _extBuf ? _extSize : _vec.size() ; }
+
+    /// Use the memory of an external array as the data of this vector,
+    /// without copying it. \see RealVector::setExternalBuffer()
+    void setExternalBuffer(std::span<const RooAbsCategory::value_type> buf) {
+      std::vector<RooAbsCategory::value_type>{}.swap(_vec);
+      _extBuf = buf.data();
+      _extSize = buf.size();
+    }
+
+    bool hasExternalBuffer() const { return _extBuf != nullptr; }
+
+    void ownData() {
+      if (!_extBuf) return;
+      _vec.assign(_extBuf, _extBuf + _extSize);
+      _extBuf = nullptr;
+      _extSize = 0;
+    }
+
+    const RooAbsCategory::value_type* dataPtr() const { return _extBuf ? _extBuf : _vec.data(); }
 
     void resize(Int_t newSize) {
+      ownData();
       if (newSize < Int_t(_vec.capacity()) / 2 && _vec.capacity() > VECTOR_BUFFER_SIZE) {
         // do an expensive copy, if we save at least a factor 2 in size
         std::vector<RooAbsCategory::value_type> tmp;
@@ -520,13 +586,14 @@ public:
     }
 
     void reserve(Int_t newSize) {
+      ownData();
       _vec.reserve(newSize);
     }
 
     void setBufArg(RooAbsCategory* arg) { _cat = arg; }
     const RooAbsCategory* bufArg() const { return _cat; }
 
-    std::vector<RooAbsCategory::value_type>& data() { return _vec; }
+    std::vector<RooAbsCategory::value_type>& data() { ownData(); return _vec; }
 
   private:
     friend class RooVectorDataStore ;
@@ -534,6 +601,8 @@ public:
     RooAbsCategory::value_type* _buf = nullptr;  ///<!
     RooAbsCategory::value_type* _nativeBuf = nullptr;  ///<!
     std::vector<RooAbsCategory::value_type> _vec;
+    const RooAbsCategory::value_type* _extBuf = nullptr; ///<! External buffer used instead of _vec, if set
+    std::size_t _extSize = 0; ///<! Size of the external buffer
     ClassDef(CatVector,2) // STL-vector-based Data Storage class
   } ;
 
@@ -17,6 +17,7 @@
 #include <RooAbsData.h>
 #include <RooRealVar.h>
 #include <RooSimultaneous.h>
+#include <RooVectorDataStore.h>
 
 #include "RooFitImplHelpers.h"
 #include "RooNLLVarNew.h"
@@ -36,7 +37,7 @@ void assignSpan(std::span<T> &to, std::span<T> const &from)
 
 std::map<RooFit::Detail::DataKey, std::span<const double>>
 getSingleDataSpans(RooAbsData const &data, std::string_view rangeName, std::string const &prefix,
-                   std::stack<std::vector<double>> &buffers, bool skipZeroWeights)
+                   std::stack<std::vector<double>> &buffers, bool skipZeroWeights, bool canUseDataMemory)
 {
    std::map<RooFit::Detail::DataKey, std::span<const double>> dataSpans; // output variable
 
@@ -65,33 +66,40 @@ getSingleDataSpans(RooAbsData const &data, std::string_view rangeName, std::stri
    // RooNLLVarNew. We also add the sumW2 weights here under a different name,
    // so we can apply the sumW2 correction by easily swapping the spans.
    {
-      buffers.emplace();
-      auto &buffer = buffers.top();
-      buffers.emplace();
-      auto &bufferSumW2 = buffers.top();
       if (weight.empty()) {
          // If the dataset has no weight, we fill the data spans with a scalar
          // unity weight so we don't need to check for the existence of weights
          // later in the likelihood.
-         buffer.push_back(1.0);
-         bufferSumW2.push_back(1.0);
-         assignSpan(weight, {buffer.data(), 1});
-         assignSpan(weightSumW2, {bufferSumW2.data(), 1});
+         buffers.emplace(1, 1.0);
+         assignSpan(weight, {buffers.top().data(), 1});
+         buffers.emplace(1, 1.0);
+         assignSpan(weightSumW2, {buffers.top().data(), 1});
          nNonZeroWeight = nEvents;
       } else {
-         buffer.reserve(nEvents);
-         bufferSumW2.reserve(nEvents);
          for (std::size_t i = 0; i < nEvents; ++i) {
             if (!skipZeroWeights || weight[i] != 0) {
-               buffer.push_back(weight[i]);
-               bufferSumW2.push_back(weightSumW2[i]);
                ++nNonZeroWeight;
             } else {
                hasZeroWeight[i] = true;
             }
          }
-         assignSpan(weight, {buffer.data(), nNonZeroWeight});
-         assignSpan(weightSumW2, {bufferSumW2.data(), nNonZeroWeight});
+         // If nothing was skipped, the weights can be used in place
+         if (nNonZeroWeight != nEvents || !canUseDataMemory) {
+            buffers.emplace();
+            auto &buffer = buffers.top();
+            buffers.emplace();
+            auto &bufferSumW2 = buffers.top();
+            buffer.reserve(nNonZeroWeight);
+            bufferSumW2.reserve(nNonZeroWeight);
+            for (std::size_t i = 0; i < nEvents; ++i) {
+               if (!hasZeroWeight[i]) {
+                  buffer.push_back(weight[i]);
+                  bufferSumW2.push_back(weightSumW2[i]);
+               }
+            }
+            assignSpan(weight, {buffer.data(), nNonZeroWeight});
+            assignSpan(weightSumW2, {bufferSumW2.data(), nNonZeroWeight});
+         }
       }
       insert(RooNLLVarNew::weightVarName, weight);
       insert(RooNLLVarNew::weightVarNameSumW2, weightSumW2);
@@ -103,6 +111,13 @@ getSingleDataSpans(RooAbsData const &data, std::string_view rangeName, std::stri
 
       std::span<const double> span{item.second};
 
+      // If no entry is skipped, the values are used directly from the
+      // dataset, which avoids copying all columns of large datasets.
+      if (nNonZeroWeight == nEvents && canUseDataMemory) {
+         insert(item.first->GetName(), span);
+         continue;
+      }
+
       buffers.emplace();
       auto &buffer = buffers.top();
       buffer.reserve(nNonZeroWeight);
@@ -177,6 +192,15 @@ getSingleDataSpans(RooAbsData const &data, std::string_view rangeName, std::stri
    return dataSpans;
 }
 
+/// The memory of a dataset can only be used without copying if it is borrowed
+/// from external buffers. The memory of the store itself gets reallocated
+/// when the dataset is modified, while the external buffers stay valid.
+bool usesExternalBuffers(RooAbsData const &data)
+{
+   auto store = dynamic_cast<RooVectorDataStore const *>(data.store());
+   return store && store->hasExternalBuffers();
+}
+
 } // namespace
 
 ////////////////////////////////////////////////////////////////////////////////
@@ -200,9 +224,11 @@ getSingleDataSpans(RooAbsData const &data, std::string_view rangeName, std::stri
 /// \param[in] takeGlobalObservablesFromData Take also the global observables
 ///            stored in the dataset.
 /// \param[in] buffers Pass here an empty stack of `double` vectors, which will
-///            be used as memory for the data if the memory in the dataset
-///            object can't be used directly (e.g. because you used the range
-///            selection or the splitting by categories).
+///            be used as memory for the data. Only if all columns of the
+///            dataset borrow external buffers (see
+///            RooVectorDataStore::hasExternalBuffers()) and no entry is
+///            skipped, the spans point to these buffers instead, which
+///            therefore have to outlive them.
 std::map<RooFit::Detail::DataKey, std::span<const double>>
 RooFit::Detail::BatchModeDataHelpers::getDataSpans(RooAbsData const &data, std::string const &rangeName,
                                                    RooSimultaneous const *simPdf, bool skipZeroWeights,
@@ -239,7 +265,7 @@ RooFit::Detail::BatchModeDataHelpers::getDataSpans(RooAbsData const &data, std::
       auto const &toAdd = datasets[iData];
       auto spans = getSingleDataSpans(
          *toAdd.second, RooHelpers::getRangeNameForSimComponent(rangeName, splitRange, toAdd.second->GetName()),
-         toAdd.first, buffers, skipZeroWeights && !isBinnedL[iData]);
+         toAdd.first, buffers, skipZeroWeights && !isBinnedL[iData], usesExternalBuffers(*toAdd.second));
       for (auto const &item : spans) {
          dataSpans.insert(item);
       }
@@ -1770,6 +1770,61 @@ void RooDataHist::set(std::size_t binNumber, double wgt, double wgtErr) {
 }
 
 
+////////////////////////////////////////////////////////////////////////////////
+/// Set the contents of all bins at once, which is much faster than calling
+/// set(std::size_t, double, double) for each bin.
+/// \param[in] weights New bin contents, one for each bin. \see getIndex()
+/// \param[in] sumw2 Optional sums of squared weights, one for each bin. If
+///            given, the sums of squared weights are tracked from now on and
+///            the errors of the bins are set to their square root. If empty,
+///            the bins have no errors and, if tracked, the sums of squared
+///            weights are set to the weights.
+void RooDataHist::setWeights(std::span<const double> weights, std::span<const double> sumw2)
+{
+  checkInit() ;
+
+  if (weights.size() != static_cast<std::size_t>(_arrSize)) {
+    std::stringstream errMsg;
+    errMsg << "RooDataHist::setWeights(" << GetName() << ") got " << weights.size()
+           << " weights for a histogram with " << _arrSize << " bins.";
+    coutE(InputArguments) << errMsg.str() << std::endl;
+    throw std::invalid_argument(errMsg.str());
+  }
+  if (!sumw2.empty() && sumw2.size() != weights.size()) {
+    std::stringstream errMsg;
+    errMsg << "RooDataHist::setWeights(" << GetName() << ") got " << sumw2.size()
+           << " sums of squared weights for a histogram with " << _arrSize << " bins.";
+    coutE(InputArguments) << errMsg.str() << std::endl;
+    throw std::invalid_argument(errMsg.str());
+  }
+
+  if (!sumw2.empty() && !_sumw2) {
+    // Receiving weighted entries. Need to track sumw2 from now on:
+    cloneArray(_sumw2, _wgt, _arrSize);
+
+    registerWeightArraysToDataStore();
+  }
+
+  std::copy(weights.begin(), weights.end(), _wgt);
+
+  if (sumw2.empty()) {
+    if (_errLo) std::fill(_errLo, _errLo + _arrSize, -1.);
+    if (_errHi) std::fill(_errHi, _errHi + _arrSize, -1.);
+    if (_sumw2) std::copy(weights.begin(), weights.end(), _sumw2);
+  } else {
+    std::copy(sumw2.begin(), sumw2.end(), _sumw2);
+    for (double *err : {_errLo, _errHi}) {
+      if (!err) continue;
+      for (std::size_t i = 0; i < sumw2.size(); ++i) {
+        err[i] = std::sqrt(sumw2[i]);
+      }
+    }
+  }
+
+  _cache_sum_valid = false ;
+}
+
+
 ////////////////////////////////////////////////////////////////////////////////
 /// Set bin content of bin that was last loaded with get(std::size_t).
 /// \param[in] wgt New bin content.
@@ -24,21 +24,74 @@ for objects that are expensive to calculate. Owners of such objects
 can registers these here with associated parameter values for which
 the object is valid, so that other instances can, at a later moment
 retrieve these precalculated objects.
+
+### On-disk store
+
+The cache can also be backed by an on-disk store in a directory that is
+shared by several processes, for example the fit jobs and toy workers running
+on one node. It is enabled with setPersistentDirectory(), or for all caches
+with the `RooFit.ExpensiveObjectCache.Directory` and
+`RooFit.ExpensiveObjectCache.MaxSize` (in bytes) entries of the `.rootrc` file.
+Only objects that are registered together with the computation graph they
+were computed from are stored, namely the numeric integrals cached by
+RooRealIntegral and the histograms of RooAbsCachedPdf and RooAbsCachedReal.
+They are keyed by a hash of the object name and class, the structure of the
+graph, the ranges and binnings of its variables and the values of the
+parameters. When the store grows beyond its maximum size, the least recently
+used objects are removed.
 **/
 
 #include "RooExpensiveObjectCache.h"
 
 #include "TClass.h"
+#include "TDirectory.h"
+#include "TEnv.h"
+#include "TFile.h"
+#include "TMD5.h"
+#include "TSystem.h"
+#include "RooAbsBinning.h"
 #include "RooAbsReal.h"
+#include "RooAbsRealLValue.h"
 #include "RooAbsCategory.h"
 #include "RooArgSet.h"
 #include "RooMsgService.h"
+
+#include <algorithm>
+#include <cstdint>
+#include <filesystem>
 #include <iostream>
+#include <memory>
+#include <sstream>
+#include <system_error>
+#include <vector>
 
 ClassImp(RooExpensiveObjectCache);
 ClassImp(RooExpensiveObjectCache::ExpensiveObject);
 
 
+////////////////////////////////////////////////////////////////////////////////
+/// Default constructor. The on-disk store is configured from the
+/// `RooFit.ExpensiveObjectCache.Directory` and `RooFit.ExpensiveObjectCache.MaxSize`
+/// entries of the ROOT environment, if present.
+
+RooExpensiveObjectCache::RooExpensiveObjectCache()
+{
+  std::string dir = gEnv->GetValue("RooFit.ExpensiveObjectCache.Directory", "");
+  if (!dir.empty()) {
+    setPersistentDirectory(dir, static_cast<std::size_t>(gEnv->GetValue("RooFit.ExpensiveObjectCache.MaxSize", 0.0)));
+  }
+}
+
+
+////////////////////////////////////////////////////////////////////////////////
+/// Copy constructor. Only the configuration of the on-disk store is copied.
+
+RooExpensiveObjectCache::RooExpensiveObjectCache(const RooExpensiveObjectCache& other)
+  : TObject(other), _persistentDir(other._persistentDir), _persistentMaxSize(other._persistentMaxSize)
+{
+}
+
+
 ////////////////////////////////////////////////////////////////////////////////
 /// Destructor.
 
@@ -67,9 +120,15 @@ RooExpensiveObjectCache& RooExpensiveObjectCache::instance()
 /// The cache will take _ownership_of_object_ and is indexed under the given name (which does not
 /// need to be the name of cacheObject and with given set of dependent parameters with validity for the
 /// current values of those parameters. It can be retrieved later by callin retrieveObject()
+/// If the on-disk store is enabled and the computation graph of the object is given, the
+/// object is also written to the store.
 
-bool RooExpensiveObjectCache::registerObject(const char* ownerName, const char* objectName, TObject& cacheObject, const RooArgSet& params)
+bool RooExpensiveObjectCache::registerObject(const char* ownerName, const char* objectName, TObject& cacheObject, const RooArgSet& params, const RooAbsArg* graph)
 {
+  if (graph && !_persistentDir.empty()) {
+    writePersistent(objectName, cacheObject, params, *graph) ;
+  }
+
   // Delete any previous object
   ExpensiveObject* eo = _map[objectName] ;
   Int_t olduid(-1) ;
@@ -88,27 +147,228 @@ bool RooExpensiveObjectCache::registerObject(const char* ownerName, const char*
 ////////////////////////////////////////////////////////////////////////////////
 /// Retrieve object from cache that was registered under given name with given parameters, _if_
 /// current parameter values match those that were stored in the registry for this object.
-/// The return object is owned by the cache instance.
+/// The return object is owned by the cache instance. If the object is not in memory, it is
+/// looked up in the on-disk store, provided that the computation graph of the object is given.
 
-const TObject* RooExpensiveObjectCache::retrieveObject(const char* name, TClass* tc, const RooArgSet& params)
+const TObject* RooExpensiveObjectCache::retrieveObject(const char* name, TClass* tc, const RooArgSet& params, const RooAbsArg* graph)
 {
   ExpensiveObject* eo = _map[name] ;
 
-  // If no cache element found, return 0 ;
-  if (!eo) {
-    return nullptr ;
-  }
-
   // If parameters also match, return payload ;
-  if (eo->matches(tc,params)) {
+  if (eo && eo->matches(tc,params)) {
     return eo->payload() ;
   }
 
+  // Otherwise, try the on-disk store
+  if (graph && !_persistentDir.empty()) {
+    return readPersistent(name, tc, params, *graph) ;
+  }
+
   return nullptr ;
 }
 
 
 
+////////////////////////////////////////////////////////////////////////////////
+/// Enable the on-disk store in the given directory, which is created if it
+/// doesn't exist. The directory can be shared by several processes. If
+/// `maxSize` is not zero, the least recently used objects are removed when the
+/// total size of the store exceeds `maxSize` bytes. An empty directory name
+/// disables the store.
+
+void RooExpensiveObjectCache::setPersistentDirectory(std::string const& directory, std::size_t maxSize)
+{
+  _persistentDir = directory ;
+  _persistentMaxSize = maxSize ;
+  if (_persistentDir.empty()) {
+    return ;
+  }
+
+  std::error_code ec ;
+  std::filesystem::create_directories(_persistentDir, ec) ;
+  if (ec) {
+    oocoutE(nullptr,Caching) << "RooExpensiveObjectCache::setPersistentDirectory() cannot create directory "
+                             << _persistentDir << ": " << ec.message() << ", on-disk store disabled" << std::endl ;
+    _persistentDir.clear() ;
+  }
+}
+
+
+
+////////////////////////////////////////////////////////////////////////////////
+/// Return the file in the on-disk store for the given object. The file name is
+/// a hash of the object name and class, the structure of the computation graph
+/// including the ranges and binnings of its variables and the values of its
+/// constants, and the values of the parameters.
+
+std::string RooExpensiveObjectCache::persistentPath(const char* name, TClass* tc, const RooArgSet& params, const RooAbsArg& graph) const
+{
+  std::ostringstream key ;
+  key << std::hexfloat << name << ";" << tc->GetName() << ";" ;
+
+  RooArgSet nodes ;
+  graph.treeNodeServerList(&nodes) ;
+  // The order of the nodes depends on the construction of the graph, so sort them by name
+  std::vector<RooAbsArg*> sortedNodes(nodes.begin(), nodes.end()) ;
+  std::sort(sortedNodes.begin(), sortedNodes.end(), [](RooAbsArg* a, RooAbsArg* b) { return std::string(a->GetName()) < b->GetName() ; }) ;
+  for (RooAbsArg* node : sortedNodes) {
+    key << node->ClassName() << "::" << node->GetName() << "(" ;
+    node->printArgs(key) ;
+    key << ")" ;
+    if (auto lvalue = dynamic_cast<RooAbsRealLValue*>(node)) {
+      for (std::string const& binningName : lvalue->getBinningNames()) {
+        const RooAbsBinning& binning = lvalue->getBinning(binningName.c_str()) ;
+        key << "[" << binningName << ":" << binning.lowBound() << "," << binning.highBound() << "," << binning.numBins() << "]" ;
+      }
+    } else if (node->isFundamental() && !params.find(*node)) {
+      if (auto real = dynamic_cast<RooAbsReal*>(node)) {
+        key << "=" << real->getVal() ;
+      }
+    }
+    key << ";" ;
+  }
+
+  for (RooAbsArg* arg : params) {
+    if (auto real = dynamic_cast<RooAbsReal*>(arg)) {
+      key << arg->GetName() << "=" << real->getVal() << ";" ;
+    } else if (auto cat = dynamic_cast<RooAbsCategory*>(arg)) {
+      key << arg->GetName() << "=" << cat->getCurrentIndex() << ";" ;
+    }
+  }
+
+  const std::string keyStr = key.str() ;
+  TMD5 md5 ;
+  md5.Update(reinterpret_cast<const UChar_t*>(keyStr.data()), keyStr.size()) ;
+  md5.Final() ;
+
+  return (std::filesystem::path(_persistentDir) / (std::string(md5.AsString()) + ".root")).string() ;
+}
+
+
+
+////////////////////////////////////////////////////////////////////////////////
+/// Read an object from the on-disk store and register it in memory.
+
+const TObject* RooExpensiveObjectCache::readPersistent(const char* name, TClass* tc, const RooArgSet& params, const RooAbsArg& graph)
+{
+  const std::string path = persistentPath(name, tc, params, graph) ;
+  std::error_code ec ;
+  if (!std::filesystem::exists(path, ec)) {
+    return nullptr ;
+  }
+
+  TObject* obj = nullptr ;
+  {
+    TDirectory::TContext ctx ;
+    std::unique_ptr<TFile> file{TFile::Open(path.c_str(), "READ")} ;
+    if (!file || file->IsZombie()) {
+      return nullptr ;
+    }
+    obj = file->Get<TObject>("payload") ;
+    if (!obj) {
+      return nullptr ;
+    }
+    file->GetList()->Remove(obj) ;
+  }
+  if (obj->IsA() != tc) {
+    delete obj ;
+    return nullptr ;
+  }
+
+  // Mark the object as recently used for the eviction
+  std::filesystem::last_write_time(path, std::filesystem::file_time_type::clock::now(), ec) ;
+
+  oocoutI(nullptr,Caching) << "RooExpensiveObjectCache::retrieveObject() reading " << name << " from " << path << std::endl ;
+
+  registerObject(graph.GetName(), name, *obj, params) ;
+  return obj ;
+}
+
+
+
+////////////////////////////////////////////////////////////////////////////////
+/// Write an object to the on-disk store. The object is written to a temporary
+/// file that is renamed afterwards, so other processes never see partially
+/// written files.
+
+void RooExpensiveObjectCache::writePersistent(const char* name, TObject& cacheObject, const RooArgSet& params, const RooAbsArg& graph) const
+{
+  const std::string path = persistentPath(name, cacheObject.IsA(), params, graph) ;
+  std::error_code ec ;
+  if (std::filesystem::exists(path, ec)) {
+    return ;
+  }
+
+  const std::string tmpPath = path + ".tmp" + std::to_string(gSystem->GetPid()) ;
+  {
+    TDirectory::TContext ctx ;
+    std::unique_ptr<TFile> file{TFile::Open(tmpPath.c_str(), "RECREATE")} ;
+    if (!file || file->IsZombie()) {
+      oocoutW(nullptr,Caching) << "RooExpensiveObjectCache::registerObject() cannot write " << tmpPath << std::endl ;
+      return ;
+    }
+    file->WriteTObject(&cacheObject, "payload") ;
+  }
+
+  std::filesystem::rename(tmpPath, path, ec) ;
+  if (ec) {
+    std::filesystem::remove(tmpPath, ec) ;
+    return ;
+  }
+
+  if (_persistentMaxSize > 0) {
+    evictPersistent() ;
+  }
+}
+
+
+
+////////////////////////////////////////////////////////////////////////////////
+/// Remove the least recently used objects from the on-disk store until its
+/// total size is below the maximum size. Files that were removed concurrently
+/// by other processes are skipped.
+
+void RooExpensiveObjectCache::evictPersistent() const
+{
+  struct Entry {
+    std::filesystem::path path ;
+    std::filesystem::file_time_type time ;
+    std::uintmax_t size ;
+  } ;
+
+  std::vector<Entry> entries ;
+  std::uintmax_t totalSize = 0 ;
+  std::error_code ec ;
+  for (auto const& dirEntry : std::filesystem::directory_iterator(_persistentDir, ec)) {
+    if (dirEntry.path().extension() != ".root") {
+      continue ;
+    }
+    std::error_code entryEc ;
+    Entry entry{dirEntry.path(), dirEntry.last_write_time(entryEc), dirEntry.file_size(entryEc)} ;
+    if (entryEc) {
+      continue ;
+    }
+    totalSize += entry.size ;
+    entries.push_back(entry) ;
+  }
+
+  if (totalSize <= _persistentMaxSize) {
+    return ;
+  }
+
+  std::sort(entries.begin(), entries.end(), [](Entry const& a, Entry const& b) { return a.time < b.time ; }) ;
+  for (Entry const& entry : entries) {
+    if (totalSize <= _persistentMaxSize) {
+      break ;
+    }
+    if (std::filesystem::remove(entry.path, ec)) {
+      totalSize -= entry.size ;
+    }
+  }
+}
+
+
+
 ////////////////////////////////////////////////////////////////////////////////
 /// Retrieve payload object of cache element with given unique ID
 
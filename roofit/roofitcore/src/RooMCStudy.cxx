@@ -73,7 +73,15 @@ for usage examples.
 #include <RooWorkspace.h>
 
 #include <snprintf.h>
+
+#include <algorithm>
 #include <iostream>
+#include <limits>
+
+#ifndef _WIN32
+#include <ROOT/TProcessExecutor.hxx>
+#include <ROOT/TSeq.hxx>
+#endif
 
 ClassImp(RooMCStudy);
 
@@ -100,6 +108,11 @@ fitting the PDF to data and accumulating the fit statistics.
          <td> Prototype data for the event generation. If the randOrder flag is set, the order of the dataset will be re-randomized for each generation
               cycle to protect against systematic biases if the number of generated events does not exactly match the number of events in the prototype dataset
               at the cost of reduced precision with mu equal to the specified number of events
+<tr><td> Parallelize(Int_t nWorkers)       <td> Generate and fit the samples in `nWorkers` forked processes. Each process gets
+                                                its own random seed, drawn from RooRandom::randomGenerator(), so the results are
+                                                reproducible for a given seed and number of workers. The fit results, generated
+                                                data and parameter datasets are merged at the end. Study modules run in the
+                                                worker processes. Not supported on Windows.
 </table>
 */
 RooMCStudy::RooMCStudy(const RooAbsPdf& model, const RooArgSet& observables,
@@ -129,6 +142,7 @@ RooMCStudy::RooMCStudy(const RooAbsPdf& model, const RooArgSet& observables,
   pc.defineInt("extendedGen","Extended",0,0) ;
   pc.defineInt("binGenData","Binned",0,0) ;
   pc.defineInt("dummy","FitOptArgs",0,0) ;
+  pc.defineInt("nWorkers","Parallelize",0,0) ;
 
   // Process and check varargs
   pc.process(cmdList) ;
@@ -152,6 +166,7 @@ RooMCStudy::RooMCStudy(const RooAbsPdf& model, const RooArgSet& observables,
   _extendedGen = pc.getInt("extendedGen") ;
   _binGenData = pc.getInt("binGenData") ;
   _randProto = pc.getInt("randProtoData") ;
+  _nWorkers = pc.getInt("nWorkers") ;
 
   // Process constraints specifications
   const RooArgSet* cParsTmp = pc.getSet("cPars") ;
@@ -320,6 +335,10 @@ void RooMCStudy::addModule(RooAbsMCStudyModule& module)
 
 bool RooMCStudy::run(bool doGenerate, bool DoFit, Int_t nSamples, Int_t nEvtPerSample, bool keepGenData, const char* asciiFilePat)
 {
+  if (doGenerate && _nWorkers > 1 && nSamples > 1) {
+    return runParallel(DoFit, nSamples, nEvtPerSample, keepGenData, asciiFilePat) ;
+  }
+
   RooFit::MsgLevel oldLevel(RooFit::FATAL) ;
   if (_silence) {
     oldLevel = RooMsgService::instance().globalKillBelow() ;
@@ -334,12 +353,15 @@ bool RooMCStudy::run(bool doGenerate, bool DoFit, Int_t nSamples, Int_t nEvtPerS
 
   while(nSamples--) {
 
+    // Serial number of this sample, which is only different from nSamples in the worker processes of runParallel()
+    const Int_t iSample = _firstSample + nSamples ;
+
     if (nSamples%prescale==0) {
       oocoutP(_fitModel,Generation) << "RooMCStudy::run: " ;
       if (doGenerate) ooccoutI(_fitModel,Generation) << "Generating " ;
       if (doGenerate && DoFit) ooccoutI(_fitModel,Generation) << "and " ;
       if (DoFit) ooccoutI(_fitModel,Generation) << "fitting " ;
-      ooccoutP(_fitModel,Generation) << "sample " << nSamples << std::endl ;
+      ooccoutP(_fitModel,Generation) << "sample " << iSample << std::endl ;
     }
 
     std::unique_ptr<RooAbsData> ownedGenSample;
@@ -364,7 +386,7 @@ bool RooMCStudy::run(bool doGenerate, bool DoFit, Int_t nSamples, Int_t nEvtPerS
 
       // Call module before-generation hook
       for (RooAbsMCStudyModule *mod : _modList) {
-         mod->processBeforeGen(nSamples) ;
+         mod->processBeforeGen(iSample) ;
       }
 
       if (_binGenData) {
@@ -431,20 +453,20 @@ bool RooMCStudy::run(bool doGenerate, bool DoFit, Int_t nSamples, Int_t nEvtPerS
 
     // Call module between generation and fitting hook
     for (RooAbsMCStudyModule *mod : _modList) {
-      mod->processBetweenGenAndFit(nSamples) ;
+      mod->processBetweenGenAndFit(iSample) ;
     }
 
     if (DoFit) fitSample(_genSample) ;
 
     // Call module between generation and fitting hook
     for (RooAbsMCStudyModule *mod : _modList) {
-      mod->processAfterFit(nSamples) ;
+      mod->processAfterFit(iSample) ;
     }
 
     // Optionally write to ascii file
     if (doGenerate && asciiFilePat && *asciiFilePat) {
       char asciiFile[1024] ;
-      snprintf(asciiFile,1024,asciiFilePat,nSamples) ;
+      snprintf(asciiFile,1024,asciiFilePat,iSample) ;
       if (RooDataSet* unbinnedData = dynamic_cast<RooDataSet*>(_genSample)) {
    unbinnedData->write(asciiFile) ;
       } else {
@@ -490,6 +512,137 @@ bool RooMCStudy::run(bool doGenerate, bool DoFit, Int_t nSamples, Int_t nEvtPerS
 
 
 
+////////////////////////////////////////////////////////////////////////////////
+/// Generate and optionally fit 'nSamples' samples in the number of forked
+/// worker processes requested with the Parallelize() command argument.
+/// Each worker processes a contiguous block of samples with run(), starting
+/// from its own random seed. The results of the workers are merged into this
+/// study afterwards, in the same order as for a sequential run.
+
+bool RooMCStudy::runParallel(bool DoFit, Int_t nSamples, Int_t nEvtPerSample, bool keepGenData, const char* asciiFilePat)
+{
+#ifdef _WIN32
+  oocoutW(_fitModel,Generation) << "RooMCStudy::runParallel: WARNING parallel processing is not supported on Windows, "
+                                << "processing the samples sequentially" << std::endl ;
+  const Int_t nWorkers = _nWorkers ;
+  _nWorkers = 0 ;
+  const bool ret = run(true,DoFit,nSamples,nEvtPerSample,keepGenData,asciiFilePat) ;
+  _nWorkers = nWorkers ;
+  return ret ;
+#else
+  const unsigned int nWorkers = std::min(_nWorkers, nSamples) ;
+
+  // Draw the seeds of the workers from the RooFit random generator, such
+  // that the results are reproducible for a given seed and number of workers
+  std::vector<UInt_t> seeds(nWorkers) ;
+  for (auto &seed : seeds) {
+    // A seed of zero would make TRandom3 pick a random seed
+    seed = 1 + RooRandom::integer(std::numeric_limits<UInt_t>::max() - 1) ;
+  }
+
+  oocoutP(_fitModel,Generation) << "RooMCStudy::runParallel: processing " << nSamples << " samples in "
+                                << nWorkers << " worker processes" << std::endl ;
+
+  // Executed in the forked worker processes, which have their own copy of this study
+  auto work = [&](unsigned int iWorker) -> TList* {
+    const Int_t first = nSamples * iWorker / nWorkers ;
+    const Int_t last = nSamples * (iWorker + 1) / nWorkers ;
+
+    RooRandom::randomGenerator()->SetSeed(seeds[iWorker]) ;
+
+    _nWorkers = 0 ;
+    _firstSample = first ;
+    _fitResList.Clear() ;
+    _genDataList.Clear() ;
+    _fitParData->reset() ;
+    if (_genParData) {
+      _genParData->reset() ;
+    }
+
+    run(true,DoFit,last-first,nEvtPerSample,keepGenData,asciiFilePat) ;
+
+    // The objects are serialized to send them to the parent process, so the
+    // lists don't need to own them
+    auto *fitResults = new TList ;
+    fitResults->SetName("fitResults") ;
+    fitResults->AddAll(&_fitResList) ;
+    auto *genData = new TList ;
+    genData->SetName("genData") ;
+    genData->AddAll(&_genDataList) ;
+
+    auto *out = new TList ;
+    out->Add(_fitParData.get()) ;
+    if (_genParData) {
+      out->Add(_genParData.get()) ;
+    }
+    out->Add(fitResults) ;
+    out->Add(genData) ;
+    return out ;
+  } ;
+
+  ROOT::TProcessExecutor pool(nWorkers) ;
+  std::vector<TList*> results = pool.Map(work, ROOT::TSeqU(nWorkers)) ;
+
+  std::unique_ptr<RooDataSet> fitParData ;
+  std::unique_ptr<RooDataSet> genParData ;
+  bool failed = false ;
+
+  auto mergeDataSet = [](std::unique_ptr<RooDataSet> &merged, RooDataSet *data) {
+    if (!data) {
+      return ;
+    }
+    if (merged) {
+      merged->append(*data) ;
+      delete data ;
+    } else {
+      merged.reset(data) ;
+    }
+  } ;
+
+  auto moveObjects = [](TList *from, TList &to) {
+    if (!from) {
+      return ;
+    }
+    to.AddAll(from) ;
+    delete from ;
+  } ;
+
+  // The samples of each worker are processed in reverse order by run(), so
+  // the workers are also merged in reverse order
+  for (auto it = results.rbegin() ; it != results.rend() ; ++it) {
+    std::unique_ptr<TList> result{*it} ;
+    if (!result) {
+      failed = true ;
+      continue ;
+    }
+    mergeDataSet(fitParData, static_cast<RooDataSet*>(result->FindObject(_fitParData->GetName()))) ;
+    if (_genParData) {
+      mergeDataSet(genParData, static_cast<RooDataSet*>(result->FindObject(_genParData->GetName()))) ;
+    }
+    moveObjects(static_cast<TList*>(result->FindObject("fitResults")), _fitResList) ;
+    moveObjects(static_cast<TList*>(result->FindObject("genData")), _genDataList) ;
+  }
+
+  if (fitParData) {
+    _fitParData = std::move(fitParData) ;
+  }
+  if (genParData) {
+    _genParData = std::move(genParData) ;
+  }
+
+  _canAddFitResults = false ;
+
+  if (failed) {
+    oocoutE(_fitModel,Generation) << "RooMCStudy::runParallel: ERROR not all worker processes returned their results" << std::endl ;
+    return true ;
+  }
+
+  return false ;
+#endif
+}
+
+
+
 ////////////////////////////////////////////////////////////////////////////////
 /// Generate and fit 'nSamples' samples of 'nEvtPerSample' events.
 /// If keepGenData is set, all generated data sets will be kept in memory and can be accessed
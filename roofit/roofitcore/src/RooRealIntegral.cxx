@@ -811,7 +811,7 @@ double RooRealIntegral::evaluate() const
       // Cache numeric integrals in >1d expensive object cache
       RooDouble const* cacheVal(nullptr) ;
       if ((_cacheNum && !_intList.empty()) || int(_intList.size())>=_cacheAllNDim) {
-        cacheVal = static_cast<RooDouble const*>(expensiveObjectCache().retrieveObject(GetName(),RooDouble::Class(),parameters()))  ;
+        cacheVal = static_cast<RooDouble const*>(expensiveObjectCache().retrieveObject(GetName(),RooDouble::Class(),parameters(),this))  ;
       }
 
       if (cacheVal) {
@@ -850,7 +850,7 @@ double RooRealIntegral::evaluate() const
         // Cache numeric integrals in >1d expensive object cache
         if ((_cacheNum && !_intList.empty()) || int(_intList.size())>=_cacheAllNDim) {
           RooDouble* val = new RooDouble(retVal) ;
-          expensiveObjectCache().registerObject(_function->GetName(),GetName(),*val,parameters())  ;
+          expensiveObjectCache().registerObject(_function->GetName(),GetName(),*val,parameters(),this)  ;
           //     cout << "### caching value of integral" << GetName() << " in " << &expensiveObjectCache() << std::endl ;
         }
 
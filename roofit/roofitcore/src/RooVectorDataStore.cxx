@@ -1073,9 +1073,9 @@ void RooVectorDataStore::dump()
   for (const auto elm : _realStoreList) {
     cout << "RealVector " << elm << " _nativeReal = " << elm->_nativeReal << " = " << elm->_nativeReal->GetName() << " bufptr = " << elm->_buf  << endl ;
     cout << " values : " ;
-    Int_t imax = elm->_vec.size()>10 ? 10 : elm->_vec.size() ;
+    Int_t imax = elm->size()>10 ? 10 : elm->size() ;
     for (Int_t i=0 ; i<imax ; i++) {
-      cout << elm->_vec[i] << " " ;
+      cout << elm->dataPtr()[i] << " " ;
     }
     cout << endl ;
   }
@@ -1085,9 +1085,9 @@ void RooVectorDataStore::dump()
     << " bufptr = " << elm->_buf  << " errbufptr = " << elm->bufE() << endl ;
 
     cout << " values : " ;
-    Int_t imax = elm->_vec.size()>10 ? 10 : elm->_vec.size() ;
+    Int_t imax = elm->size()>10 ? 10 : elm->size() ;
     for (Int_t i=0 ; i<imax ; i++) {
-      cout << elm->_vec[i] << " " ;
+      cout << elm->dataPtr()[i] << " " ;
     }
     cout << endl ;
     if (elm->bufE()) {
@@ -1124,6 +1124,11 @@ void RooVectorDataStore::Streamer(TBuffer &R__b)
     }
 
   } else {
+    // Data in external buffers is not streamed, so it has to be copied first
+    for (auto elm : _realStoreList) elm->ownData();
+    for (auto elm : _realfStoreList) elm->ownData();
+    for (auto elm : _catStoreList) elm->ownData();
+
     R__b.WriteClassBuffer(RooVectorDataStore::Class(),this);
   }
 }
@@ -1332,6 +1337,27 @@ RooVectorDataStore::RealFullVector* RooVectorDataStore::addRealFull(RooAbsReal*
 }
 
 
+/// Check whether all the real-valued columns of this store use the memory of
+/// external buffers, set with RealVector::setExternalBuffer(), and the weights
+/// come from such a column. Only then, the memory of the columns stays valid if
+/// the dataset is modified, because the modified data is copied to the memory
+/// of the store instead.
+bool RooVectorDataStore::hasExternalBuffers() const {
+  if (_extWgtArray || (_realStoreList.empty() && _realfStoreList.empty())) {
+    return false;
+  }
+  for (auto const* real : _realStoreList) {
+    if (!real->hasExternalBuffer())
+      return false;
+  }
+  for (auto const* real : _realfStoreList) {
+    if (!real->hasExternalBuffer())
+      return false;
+  }
+  return true;
+}
+
+
 /// Trigger a recomputation of the cached weight sums. Meant for use by RooFit
 /// dataset converter functions such as the NumPy converter functions
 /// implemented as pythonizations.
@@ -1344,11 +1370,11 @@ void RooVectorDataStore::recomputeSumWeight() {
     const std::string wgtName = _wgtVar->GetName();
     for(auto const* real : _realStoreList) {
       if(wgtName == real->_nativeReal->GetName())
-        arr = real->_vec.data();
+        arr = real->dataPtr();
     }
     for(auto const* real : _realfStoreList) {
       if(wgtName == real->_nativeReal->GetName())
-        arr = real->_vec.data();
+        arr = real->dataPtr();
     }
   }
   if(arr == nullptr) {
@@ -1368,17 +1394,17 @@ RooVectorDataStore::ArraysStruct  RooVectorDataStore::getArrays() const {
   out.size = size();
 
   for(auto const* real : _realStoreList) {
-    out.reals.emplace_back(real->_nativeReal->GetName(), real->_vec.data());
+    out.reals.emplace_back(real->_nativeReal->GetName(), real->dataPtr());
   }
   for(auto const* realf : _realfStoreList) {
     std::string name = realf->_nativeReal->GetName();
-    out.reals.emplace_back(name, realf->_vec.data());
+    out.reals.emplace_back(name, realf->dataPtr());
     if(realf->bufE()) out.reals.emplace_back(name + "Err", realf->dataE().data());
     if(realf->bufEL()) out.reals.emplace_back(name + "ErrLo", realf->dataEL().data());
     if(realf->bufEH()) out.reals.emplace_back(name + "ErrHi", realf->dataEH().data());
   }
   for(auto const* cat : _catStoreList) {
-    out.cats.emplace_back(cat->_cat->GetName(), cat->_vec.data());
+    out.cats.emplace_back(cat->_cat->GetName(), cat->dataPtr());
   }
 
   if(_extWgtArray) out.reals.emplace_back("weight", _extWgtArray);
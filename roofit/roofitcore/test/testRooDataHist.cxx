@@ -798,3 +798,39 @@ TEST(RooDataHist, SplitDataHistWithSumW2)
    EXPECT_DOUBLE_EQ(data2.weightSquared(), data1.weightSquared());
    EXPECT_DOUBLE_EQ(data2.weightError(), data1.weightError());
 }
+
+// Check that setting all the bin contents at once is equivalent to setting
+// them bin by bin.
+TEST(RooDataHist, SetWeights)
+{
+   RooRealVar x{"x", "x", 0, 10};
+   x.setBins(5);
+
+   std::vector<double> weights{1.0, 2.5, 0.0, 4.0, 3.0};
+   std::vector<double> sumw2{1.0, 1.5, 0.0, 4.5, 2.0};
+
+   RooDataHist dataBulk{"dataBulk", "dataBulk", RooArgSet{x}};
+   RooDataHist dataLoop{"dataLoop", "dataLoop", RooArgSet{x}};
+
+   dataBulk.setWeights(weights, sumw2);
+   for (std::size_t i = 0; i < weights.size(); ++i) {
+      dataLoop.set(i, weights[i], std::sqrt(sumw2[i]));
+   }
+
+   EXPECT_DOUBLE_EQ(dataBulk.sumEntries(), dataLoop.sumEntries());
+   for (std::size_t i = 0; i < weights.size(); ++i) {
+      EXPECT_DOUBLE_EQ(dataBulk.weight(i), dataLoop.weight(i));
+      EXPECT_DOUBLE_EQ(dataBulk.weightSquared(i), dataLoop.weightSquared(i));
+   }
+
+   // Without sums of squared weights, the weights are also the sums of squared weights
+   RooDataHist dataNoSumW2{"dataNoSumW2", "dataNoSumW2", RooArgSet{x}};
+   dataNoSumW2.setWeights(weights);
+   for (std::size_t i = 0; i < weights.size(); ++i) {
+      EXPECT_DOUBLE_EQ(dataNoSumW2.weight(i), weights[i]);
+      EXPECT_DOUBLE_EQ(dataNoSumW2.weightSquared(i), weights[i]);
+   }
+
+   std::vector<double> tooFewWeights{1.0, 2.0};
+   EXPECT_THROW(dataBulk.setWeights(tooFewWeights), std::invalid_argument);
+}
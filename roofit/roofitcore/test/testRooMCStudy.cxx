@@ -0,0 +1,46 @@
+// Tests for the RooMCStudy
+
+#include <RooDataSet.h>
+#include <RooFitResult.h>
+#include <RooGaussian.h>
+#include <RooGlobalFunc.h>
+#include <RooHelpers.h>
+#include <RooMCStudy.h>
+#include <RooRandom.h>
+#include <RooRealVar.h>
+
+#include <gtest/gtest.h>
+
+// Check that the results of a study with forked workers are merged
+// completely and in the same order as for a sequential study.
+TEST(RooMCStudy, Parallelize)
+{
+   RooHelpers::LocalChangeMsgLevel changeMsgLvl(RooFit::WARNING);
+
+   RooRealVar x("x", "x", -10, 10);
+   RooRealVar mean("mean", "mean", 1, -5, 5);
+   RooRealVar sigma("sigma", "sigma", 2, 0.1, 10);
+   RooGaussian gauss("gauss", "gauss", x, mean, sigma);
+
+   constexpr int nSamples = 7;
+   constexpr int nEvents = 100;
+
+   RooRandom::randomGenerator()->SetSeed(1337);
+   RooMCStudy mcstudy(gauss, x, RooFit::Silence(), RooFit::Parallelize(3),
+                      RooFit::FitOptions(RooFit::Save(), RooFit::PrintLevel(-1)));
+   mcstudy.generateAndFit(nSamples, nEvents, true);
+
+   const RooDataSet &fitParData = mcstudy.fitParDataSet();
+   ASSERT_EQ(fitParData.numEntries(), nSamples);
+   EXPECT_NE(fitParData.get()->find("meanpull"), nullptr);
+
+   for (int i = 0; i < nSamples; ++i) {
+      ASSERT_NE(mcstudy.fitResult(i), nullptr);
+      ASSERT_NE(mcstudy.genData(i), nullptr);
+      EXPECT_EQ(mcstudy.genData(i)->numEntries(), nEvents);
+
+      // The fitted parameters in the dataset must correspond to the fit result with the same index
+      auto *fittedMean = static_cast<RooRealVar *>(mcstudy.fitResult(i)->floatParsFinal().find("mean"));
+      EXPECT_DOUBLE_EQ(fitParData.get(i)->getRealValue("mean"), fittedMean->getVal());
+   }
+}
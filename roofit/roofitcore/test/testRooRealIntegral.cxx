@@ -4,6 +4,8 @@
 #include <RooConstVar.h>
 #include <RooDataHist.h>
 #include <RooDataSet.h>
+#include <RooDouble.h>
+#include <RooExpensiveObjectCache.h>
 #include <RooFormulaVar.h>
 #include <RooGenericPdf.h>
 #include <RooHelpers.h>
@@ -21,6 +23,7 @@
 
 #include "gtest_wrapper.h"
 
+#include <filesystem>
 #include <memory>
 
 namespace {
@@ -410,3 +413,46 @@ TEST(RooRealIntegral, GaussianWithSigmaDependingOnX)
 
    EXPECT_EQ(val1, val2);
 }
+
+// Check that numeric integrals are written to the on-disk store of the
+// RooExpensiveObjectCache and can be read back after the in-memory cache was
+// cleared, for example in another process.
+TEST(RooRealIntegral, PersistentExpensiveObjectCache)
+{
+   const std::string dir = "testRooRealIntegral_eocache";
+   std::filesystem::remove_all(dir);
+
+   RooExpensiveObjectCache &cache = RooExpensiveObjectCache::instance();
+   cache.setPersistentDirectory(dir);
+
+   RooRealVar x{"x", "x", 0.0, 1.0};
+   RooRealVar y{"y", "y", 0.0, 1.0};
+   RooRealVar a{"a", "a", 2.0, 0.0, 5.0};
+   RooGenericPdf pdf{"pdf", "pdf", "exp(-a*x*y)", {x, y, a}};
+
+   // Two-dimensional numeric integrals are cached by default
+   std::unique_ptr<RooAbsReal> integral{pdf.createIntegral({x, y})};
+   const double val = integral->getVal();
+   EXPECT_FALSE(std::filesystem::is_empty(dir));
+
+   RooArgSet params;
+   for (RooAbsArg *server : integral->servers()) {
+      if (server->isValueServer(*integral))
+         params.add(*server);
+   }
+
+   cache.clearAll();
+   auto cached =
+      static_cast<RooDouble const *>(cache.retrieveObject(integral->GetName(), RooDouble::Class(), params, integral.get()));
+   ASSERT_NE(cached, nullptr);
+   EXPECT_EQ(static_cast<double>(*cached), val);
+
+   // Different parameter values must not give a hit
+   cache.clearAll();
+   a.setVal(3.0);
+   EXPECT_EQ(cache.retrieveObject(integral->GetName(), RooDouble::Class(), params, integral.get()), nullptr);
+
+   cache.setPersistentDirectory("");
+   cache.clearAll();
+   std::filesystem::remove_all(dir);
+}
@@ -656,6 +656,41 @@ TEST_P(TestStatisticTest, HideOffset)
    RooAbsReal::setHideOffset(hideOffsetOrig);
 }
 
+// Modifying the dataset after creating the NLL reallocates the memory of its
+// columns, which must not be used directly by the NLL. After resetting the
+// data, the NLL has to agree with a new NLL on the modified dataset.
+TEST_P(TestStatisticTest, ModifyDataAfterCreateNLL)
+{
+   RooWorkspace ws;
+   ws.factory("Gaussian::model(x[0, 10], mean[6, 0, 10], sigma[2.0, 0.01, 10.0])");
+
+   RooRealVar &x = *ws.var("x");
+   RooRealVar &mean = *ws.var("mean");
+   RooAbsPdf &model = *ws.pdf("model");
+
+   std::unique_ptr<RooDataSet> data{model.generate(x, 100)};
+   std::unique_ptr<RooAbsReal> nll{model.createNLL(*data, _evalBackend)};
+   nll->getVal();
+
+   std::unique_ptr<RooDataSet> moreData{model.generate(x, 10000)};
+   data->append(*moreData);
+   nll->setData(*data);
+
+   std::unique_ptr<RooAbsReal> nllRef{model.createNLL(*data, _evalBackend)};
+   mean.setVal(5.0);
+   EXPECT_FLOAT_EQ(nll->getVal(), nllRef->getVal());
+
+   // Refill the dataset with different content
+   data->reset();
+   std::unique_ptr<RooDataSet> otherData{model.generate(x, 500)};
+   data->append(*otherData);
+   nll->setData(*data);
+
+   std::unique_ptr<RooAbsReal> nllOther{model.createNLL(*otherData, _evalBackend)};
+   mean.setVal(4.0);
+   EXPECT_FLOAT_EQ(nll->getVal(), nllOther->getVal());
+}
+
 INSTANTIATE_TEST_SUITE_P(RooNLLVar, TestStatisticTest, testing::Values(ROOFIT_EVAL_BACKENDS),
                          [](testing::TestParamInfo<TestStatisticTest::ParamType> const &paramInfo) {
                             std::stringstream ss;
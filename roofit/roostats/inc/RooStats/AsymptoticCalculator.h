@@ -86,6 +86,10 @@ namespace RooStats {
       /// set using of qtilde, by default is controlled if RoORealVar is limited or not
       void SetQTilde(bool on) { fUseQTilde = on; }
 
+      /// start the conditional fit of each hypothesis test from the result of the previous one
+      /// instead of the best fit values, which speeds up scans over neighbouring POI values
+      void SetWarmStart(bool on = true) { fWarmStart = on; }
+
       /// return snapshot of the best fit parameter
       const RooArgSet & GetBestFitPoi() const { return fBestFitPoi; }
       /// return best fit parameter (firs of poi)
@@ -136,6 +140,8 @@ namespace RooStats {
       mutable RooArgSet  fAsimovGlobObs;  ///< snapshot of Asimov global observables
       mutable RooArgSet  fBestFitPoi;     ///< snapshot of best fitted POI values
       mutable RooArgSet  fBestFitParams;  ///< snapshot of all best fitted Parameter values
+      bool fWarmStart = false;            ///<! start the conditional fits from the previous one
+      mutable RooArgSet  fWarmStartParams; ///<! snapshot of the parameters after the last conditional fit
 
 
    };
@@ -22,6 +22,7 @@ class TGraphErrors;
 
 #include <memory>
 #include <string>
+#include <vector>
 
 namespace RooStats {
 
@@ -146,6 +147,11 @@ public:
    /// set numerical error in test statistic evaluation (default is zero)
    void SetNumErr(double err) { fNumErr = err; }
 
+   /// set the number of forked worker processes used to evaluate the points of a fixed scan
+   /// (values smaller than two run the scan serially)
+   void SetNumWorkers(int nWorkers) { fNWorkers = nWorkers; }
+   int GetNumWorkers() const { return fNWorkers; }
+
    /// set flag to close proof for every new run
    static void SetCloseProof(bool flag);
 
@@ -163,6 +169,9 @@ protected:
    /// run the hybrid at a single point
    HypoTestResult * Eval( HypoTestCalculatorGeneric &hc, bool adaptive , double clsTarget) const;
 
+   /// run the given points of a fixed scan in forked worker processes
+   bool RunParallelScan(const std::vector<double> &xValues) const;
+
    /// helper functions
    static RooRealVar * GetVariableToScan(const HypoTestCalculatorGeneric &hc);
    static void CheckInputModels(const HypoTestCalculatorGeneric &hc, const RooRealVar & scanVar);
@@ -199,6 +208,7 @@ private:
    double fXmin;
    double fXmax;
    double fNumErr;
+   int fNWorkers = 0; ///<! number of worker processes for fixed scans
 
 protected:
 
@@ -80,6 +80,7 @@ class ToyMCSampler: public TestStatSampler {
       SamplingDistribution* GetSamplingDistribution(RooArgSet& paramPoint) override;
       virtual RooDataSet* GetSamplingDistributions(RooArgSet& paramPoint);
       virtual RooDataSet* GetSamplingDistributionsSingleWorker(RooArgSet& paramPoint);
+      virtual RooDataSet* GetSamplingDistributionsLocalWorkers(RooArgSet& paramPoint);
 
       virtual SamplingDistribution* AppendSamplingDistribution(
          RooArgSet& allParameters,
@@ -229,6 +230,11 @@ class ToyMCSampler: public TestStatSampler {
       /// calling with argument or nullptr deactivates proof
       void SetProofConfig(ProofConfig *pc = nullptr) { fProofConfig = pc; }
 
+      /// Number of local processes to fork for the toy generation when no
+      /// ProofConfig is set. Values smaller than two disable the local parallelization.
+      void SetNumWorkers(Int_t nWorkers) { fNWorkers = nWorkers; }
+      Int_t GetNumWorkers() const { return fNWorkers; }
+
       void SetProtoData(const RooDataSet* d) { fProtoData = d; }
 
    protected:
@@ -275,6 +281,7 @@ class ToyMCSampler: public TestStatSampler {
       const RooDataSet *fProtoData = nullptr; ///< in dev
 
       ProofConfig *fProofConfig = nullptr; ///<!
+      Int_t fNWorkers = 0; ///<! number of local worker processes
 
       mutable NuisanceParametersSampler *fNuisanceParametersSampler = nullptr; ///<!
 
@@ -183,6 +183,7 @@ bool AsymptoticCalculator::Initialize() const {
    fBestFitPoi.removeAll();
    fBestFitParams.removeAll();
    fAsimovGlobObs.removeAll();
+   fWarmStartParams.removeAll();
 
    // evaluate the unconditional nll for the full model on the  observed data
    if (verbose >= 0)
@@ -496,7 +497,8 @@ HypoTestResult* AsymptoticCalculator::GetHypoTest() const {
    }
 
    std::unique_ptr<RooArgSet> allParams{nullPdf->getParameters(*GetData() )};
-   allParams->assign(fBestFitParams);
+   // with warm starts, the fit starts from the conditional fit of the previous test
+   allParams->assign(fWarmStart && !fWarmStartParams.empty() ? fWarmStartParams : fBestFitParams);
 
    // set the one-side condition
    // (this works when we have only one params of interest
@@ -516,6 +518,11 @@ HypoTestResult* AsymptoticCalculator::GetHypoTest() const {
    // evaluate the conditional NLL on the observed data for the snapshot value
    double condNLL = EvaluateNLL(*GetNullModel(), const_cast<RooAbsData&>(*GetData()), &poiTest);
 
+   if (fWarmStart) {
+      fWarmStartParams.removeAll();
+      allParams->snapshot(fWarmStartParams);
+   }
+
    double qmu = 2.*(condNLL - fNLLObs);
 
 
@@ -30,6 +30,14 @@ optimally the curve. It will stop when the desired precision is obtained.
 ### CLs presciption
 The class can scan the CLs+b values or alternatively CLs. For the latter,
 call HypoTestInverter::UseCLs().
+
+### Parallel scans
+The points of a fixed scan are independent, so they can be evaluated in
+parallel without PROOF by calling HypoTestInverter::SetNumWorkers(). The
+points are then split in contiguous blocks over forked worker processes, each
+starting from a copy of the current state of the models. With an
+AsymptoticCalculator, AsymptoticCalculator::SetWarmStart() lets the workers
+start the fits of a point from the result of the previous one.
 */
 
 #include "RooStats/HypoTestInverter.h"
@@ -64,9 +72,16 @@ call HypoTestInverter::UseCLs().
 
 #include "RooStats/ProofConfig.h"
 
+#include <algorithm>
 #include <cassert>
 #include <cmath>
 #include <memory>
+#include <vector>
+
+#ifndef _WIN32
+#include "ROOT/TProcessExecutor.hxx"
+#include "ROOT/TSeq.hxx"
+#endif
 
 ClassImp(RooStats::HypoTestInverter);
 
@@ -408,6 +423,7 @@ HypoTestInverter & HypoTestInverter::operator= (const HypoTestInverter & rhs) {
    fXmin = rhs.fXmin;
    fXmax = rhs.fXmax;
    fNumErr = rhs.fNumErr;
+   fNWorkers = rhs.fNWorkers;
 
    return *this;
 }
@@ -648,6 +664,7 @@ bool HypoTestInverter::RunFixedScan( int nBins, double xMin, double xMax, bool s
      return false;
    }
 
+   std::vector<double> xValues;
    double thisX = xMin;
    for (int i=0; i<nBins; i++) {
 
@@ -658,18 +675,107 @@ bool HypoTestInverter::RunFixedScan( int nBins, double xMin, double xMax, bool s
             thisX = xMin + i * (xMax - xMin) / (nBins - 1); // linear scan in x
       }
       }
+      xValues.push_back(thisX);
+   }
 
-      const bool status = RunOnePoint(thisX);
+   if (fNWorkers > 1 && xValues.size() > 1) {
+      return RunParallelScan(xValues);
+   }
+
+   for (double x : xValues) {
+
+      const bool status = RunOnePoint(x);
 
       // check if failed status
       if ( status==false ) {
-        oocoutW(nullptr,Eval) << "HypoTestInverter::RunFixedScan - The hypo test for point " << thisX << " failed. Skipping." << std::endl;
+        oocoutW(nullptr,Eval) << "HypoTestInverter::RunFixedScan - The hypo test for point " << x << " failed. Skipping." << std::endl;
       }
    }
 
    return true;
 }
 
+////////////////////////////////////////////////////////////////////////////////
+/// Run the hypothesis tests for the given values of the scanned variable in
+/// the number of forked worker processes set with SetNumWorkers().
+/// Each worker evaluates a contiguous block of points in increasing order,
+/// starting from a copy of the current state of the models and with its own
+/// random seed. The results are merged in the result of this class afterwards.
+/// Runs serially on platforms without support for forking.
+
+bool HypoTestInverter::RunParallelScan(const std::vector<double> &xValues) const
+{
+#ifdef _WIN32
+   oocoutW(nullptr,Eval) << "HypoTestInverter::RunFixedScan - parallel scans are not supported on Windows, "
+                         << "running the points serially" << std::endl;
+   for (double x : xValues) {
+      if (!RunOnePoint(x)) {
+         oocoutW(nullptr,Eval) << "HypoTestInverter::RunFixedScan - The hypo test for point " << x << " failed. Skipping." << std::endl;
+      }
+   }
+   return true;
+#else
+   const unsigned int nPoints = xValues.size();
+   const unsigned int nWorkers = std::min<unsigned int>(fNWorkers, nPoints);
+
+   // draw the seeds in the parent process, such that toy based scans are
+   // reproducible for a given seed and number of workers
+   std::vector<UInt_t> seeds(nWorkers);
+   for (auto &seed : seeds) {
+      // a seed of zero would make TRandom3 pick a random seed
+      seed = 1 + RooRandom::integer(TMath::Limits<unsigned int>::Max() - 1);
+   }
+
+   oocoutP(nullptr,Eval) << "HypoTestInverter::RunFixedScan - running " << nPoints << " points in "
+                         << nWorkers << " worker processes" << std::endl;
+
+   // executed in the forked processes, which have their own copy of the models and calculator
+   auto work = [&](unsigned int iWorker) -> HypoTestInverterResult * {
+      const unsigned int first = nPoints * iWorker / nWorkers;
+      const unsigned int last = nPoints * (iWorker + 1) / nWorkers;
+
+      RooRandom::randomGenerator()->SetSeed(seeds[iWorker]);
+
+      // only send back the new points, the existing ones are kept by the parent
+      delete fResults;
+      fResults = nullptr;
+      CreateResults();
+
+      for (unsigned int i = first; i < last; ++i) {
+         oocoutP(nullptr,Eval) << "HypoTestInverter::RunFixedScan - point " << i + 1 << " of " << nPoints
+                               << " (" << fScannedVariable->GetName() << " = " << xValues[i] << ")" << std::endl;
+         if (!RunOnePoint(xValues[i])) {
+            oocoutW(nullptr,Eval) << "HypoTestInverter::RunFixedScan - The hypo test for point " << xValues[i] << " failed. Skipping." << std::endl;
+         }
+      }
+      return fResults;
+   };
+
+   ROOT::TProcessExecutor pool(nWorkers);
+   std::vector<HypoTestInverterResult *> results = pool.Map(work, ROOT::TSeqU(nWorkers));
+
+   bool ok = true;
+   for (HypoTestInverterResult *workerResult : results) {
+      std::unique_ptr<HypoTestInverterResult> result{workerResult};
+      if (!result) {
+         oocoutE(nullptr,Eval) << "HypoTestInverter::RunFixedScan - a worker process did not return its results" << std::endl;
+         ok = false;
+         continue;
+      }
+      for (int i = 0; i < result->ArraySize(); ++i) {
+         HypoTestResult *pointResult = result->GetResult(i);
+         if (!pointResult) continue;
+         if (pointResult->GetNullDistribution() && pointResult->GetAltDistribution()) {
+            fTotalToysRun += pointResult->GetNullDistribution()->GetSize() + pointResult->GetAltDistribution()->GetSize();
+         }
+         fResults->Add(result->GetXValue(i), *pointResult);
+      }
+   }
+
+   return ok;
+#endif
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 /// run only one point at the given POI value
 
@@ -50,6 +50,11 @@ ToyMCStudy with the RooStudyManager.
 
 #include "TMath.h"
 
+#ifndef _WIN32
+#include "ROOT/TProcessExecutor.hxx"
+#include "ROOT/TSeq.hxx"
+#endif
+
 
 using namespace RooFit;
 using std::endl;
@@ -266,6 +271,10 @@ SamplingDistribution* ToyMCSampler::GetSamplingDistribution(RooArgSet& paramPoin
 RooDataSet* ToyMCSampler::GetSamplingDistributions(RooArgSet& paramPointIn)
 {
 
+   // ======= L O C A L   P A R A L L E L   R U N ? =======
+   if(!fProofConfig && fNWorkers > 1 && fNToys > 1)
+      return GetSamplingDistributionsLocalWorkers(paramPointIn);
+
    // ======= S I N G L E   R U N ? =======
    if(!fProofConfig)
       return GetSamplingDistributionsSingleWorker(paramPointIn);
@@ -309,6 +318,70 @@ RooDataSet* ToyMCSampler::GetSamplingDistributions(RooArgSet& paramPointIn)
    return output;
 }
 
+////////////////////////////////////////////////////////////////////////////////
+/// Generate the toys in the number of forked local processes given with
+/// SetNumWorkers(). Every process generates its share of the toys with
+/// GetSamplingDistributionsSingleWorker(), starting from its own random seed,
+/// and the resulting datasets are merged. Falls back to a serial run on
+/// platforms without support for forking.
+
+RooDataSet* ToyMCSampler::GetSamplingDistributionsLocalWorkers(RooArgSet& paramPointIn)
+{
+#ifdef _WIN32
+   oocoutW(nullptr, InputArguments)
+      << "Parallel toy generation with local processes is not supported on Windows, running serially."
+      << endl;
+   return GetSamplingDistributionsSingleWorker(paramPointIn);
+#else
+   // turn adaptive sampling off if given
+   if(fToysInTails) {
+      fToysInTails = 0;
+      oocoutW(nullptr, InputArguments)
+         << "Adaptive sampling in ToyMCSampler is not supported for parallel runs."
+         << endl;
+   }
+
+   const unsigned int nWorkers = std::min(fNWorkers, fNToys);
+   const Int_t totToys = fNToys;
+
+   // draw the seeds in the parent process, such that the results are
+   // reproducible for a given seed and number of workers
+   std::vector<UInt_t> seeds(nWorkers);
+   for (auto &seed : seeds) {
+      // a seed of zero would make TRandom3 pick a random seed
+      seed = 1 + RooRandom::integer(TMath::Limits<unsigned int>::Max() - 1);
+   }
+
+   // executed in the forked processes, which have their own copy of the sampler
+   auto work = [&](unsigned int iWorker) -> RooDataSet* {
+      fNToys = totToys * (iWorker + 1) / nWorkers - totToys * iWorker / nWorkers;
+      RooRandom::randomGenerator()->SetSeed(seeds[iWorker]);
+      return GetSamplingDistributionsSingleWorker(paramPointIn);
+   };
+
+   ROOT::TProcessExecutor pool(nWorkers);
+   std::vector<RooDataSet*> results = pool.Map(work, ROOT::TSeqU(nWorkers));
+
+   RooDataSet* output = nullptr;
+   for (RooDataSet* result : results) {
+      if (!result) {
+         oocoutE(nullptr, Generation)
+            << "A worker process of the parallel toy generation did not return its result."
+            << endl;
+         continue;
+      }
+      if (output) {
+         output->append(*result);
+         delete result;
+      } else {
+         output = result;
+      }
+   }
+
+   return output;
+#endif
+}
+
 ////////////////////////////////////////////////////////////////////////////////
 /// This is the main function for serial runs. It is called automatically
 /// from inside GetSamplingDistribution when no ProofConfig is given.
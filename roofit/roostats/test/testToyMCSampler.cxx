@@ -0,0 +1,83 @@
+// Tests for the ToyMCSampler
+
+#include <RooDataSet.h>
+#include <RooGaussian.h>
+#include <RooHelpers.h>
+#include <RooRandom.h>
+#include <RooRealVar.h>
+#include <RooStats/ProfileLikelihoodTestStat.h>
+#include <RooStats/ToyMCSampler.h>
+
+#include <gtest/gtest.h>
+
+#include <memory>
+
+namespace {
+
+std::unique_ptr<RooDataSet>
+generateToys(RooAbsPdf &pdf, const RooArgSet &obs, const RooArgSet &poi, int nToys, int nWorkers)
+{
+   RooStats::ProfileLikelihoodTestStat testStat(pdf);
+   testStat.SetOneSided(false);
+
+   RooStats::ToyMCSampler sampler(testStat, nToys);
+   sampler.SetPdf(pdf);
+   sampler.SetObservables(obs);
+   sampler.SetParametersForTestStat(poi);
+   sampler.SetNEventsPerToy(50);
+   sampler.SetNumWorkers(nWorkers);
+
+   RooArgSet paramPoint;
+   poi.snapshot(paramPoint);
+   return std::unique_ptr<RooDataSet>{sampler.GetSamplingDistributions(paramPoint)};
+}
+
+} // namespace
+
+// Check that the toys generated by forked workers are merged completely,
+// as for a serial run.
+TEST(ToyMCSampler, SetNumWorkers)
+{
+   RooHelpers::LocalChangeMsgLevel changeMsgLvl(RooFit::WARNING);
+
+   RooRealVar x("x", "x", -10, 10);
+   RooRealVar mean("mean", "mean", 1, -5, 5);
+   RooRealVar sigma("sigma", "sigma", 2, 0.1, 10);
+   sigma.setConstant(true);
+   RooGaussian gauss("gauss", "gauss", x, mean, sigma);
+   RooArgSet obs(x);
+   RooArgSet poi(mean);
+
+   // not divisible by the number of workers, to test the splitting of the toys
+   constexpr int nToys = 7;
+
+   RooRandom::randomGenerator()->SetSeed(1337);
+   std::unique_ptr<RooDataSet> serial = generateToys(gauss, obs, poi, nToys, 1);
+   RooRandom::randomGenerator()->SetSeed(1337);
+   std::unique_ptr<RooDataSet> parallel = generateToys(gauss, obs, poi, nToys, 2);
+
+   ASSERT_NE(serial, nullptr);
+   ASSERT_NE(parallel, nullptr);
+
+   EXPECT_EQ(serial->numEntries(), nToys);
+   EXPECT_EQ(parallel->numEntries(), serial->numEntries());
+   EXPECT_DOUBLE_EQ(parallel->sumEntries(), serial->sumEntries());
+
+   // the merged dataset has the same columns as the serial one
+   ASSERT_EQ(parallel->get()->size(), serial->get()->size());
+   for (RooAbsArg *column : *serial->get()) {
+      EXPECT_NE(parallel->get()->find(column->GetName()), nullptr) << column->GetName();
+   }
+
+   // the toys of the workers are generated from seeds drawn in the parent, so the
+   // parallel run is reproducible
+   RooRandom::randomGenerator()->SetSeed(1337);
+   std::unique_ptr<RooDataSet> parallelAgain = generateToys(gauss, obs, poi, nToys, 2);
+   ASSERT_NE(parallelAgain, nullptr);
+   ASSERT_EQ(parallelAgain->numEntries(), nToys);
+
+   const char *tsName = parallel->get()->first()->GetName();
+   for (int i = 0; i < nToys; ++i) {
+      EXPECT_DOUBLE_EQ(parallelAgain->get(i)->getRealValue(tsName), parallel->get(i)->getRealValue(tsName));
+   }
+}
@@ -6,6 +6,11 @@
 #include <utility>
 #include <vector>
 #include <string>
+#include <memory>
+#include <algorithm>
+#include <stdexcept>
+
+#include "ROOT/RVec.hxx"
 
 
 namespace TMVA{
@@ -23,33 +28,116 @@ class SofieFunctorHelper<std::index_sequence<N...>, Session_t, T> {
    using AlwaysT = T;
 
    std::vector<std::vector<T>> fInput;
-   std::vector<Session_t> fSessions;
+   // Sessions are created only when a slot is used for the first time. They are held by
+   // shared pointers so that the functor stays copyable, as required by RDataFrame
+   std::vector<std::shared_ptr<Session_t>> fSessions;
+   std::string fWeightsFile;
+
+   Session_t &GetSession(unsigned slot)
+   {
+      if (!fSessions[slot]) {
+         if (fWeightsFile.empty())
+            fSessions[slot] = std::make_shared<Session_t>();
+         else
+            fSessions[slot] = std::make_shared<Session_t>(fWeightsFile);
+      }
+      return *fSessions[slot];
+   }
 
 public:
 
    SofieFunctorHelper(unsigned int nslots = 0, const std::string & filename = "") :
-      fInput(1)
+      fInput(1), fWeightsFile(filename)
    {
-      // create Sessions according to given number of slots.
-      // if number of slots is zero create a single session
+      // reserve Sessions according to given number of slots.
+      // if number of slots is zero use a single session
       if (nslots < 1) nslots = 1;
       fInput.resize(nslots);
-      fSessions.reserve(nslots);
-      for (unsigned int i = 0; i < nslots; i++) {
-         if (filename.empty())
-            fSessions.emplace_back();
-         else
-            fSessions.emplace_back(filename);
-      }
+      for (auto &input : fInput)
+         input.reserve(sizeof...(N));
+      fSessions.resize(nslots);
    }
 
    double operator()(unsigned slot, AlwaysT<N>... args) {
       fInput[slot] = {args...};
-      auto y =  fSessions[slot].infer(fInput[slot].data());
+      auto y =  GetSession(slot).infer(fInput[slot].data());
       return y[0];
    }
 };
 
+/// Helper class used by SofieRVecFunctor to evaluate a model generated by SOFIE on
+/// the RVec content of an RDataFrame column.
+/// The RVec contains the inputs of one or more entries of the model stored contiguously,
+/// e.g. the features of all the jets of an event. They are passed to the model in
+/// mini-batches of the batch size the model was generated for, without copying them.
+/// Only an incomplete last mini-batch is copied in a per-slot buffer and padded with zeros.
+template <typename Session_t, typename T>
+class SofieRVecFunctorHelper {
+   std::size_t fInputSize;
+   std::size_t fBatchSize;
+   std::string fWeightsFile;
+
+   std::vector<std::shared_ptr<Session_t>> fSessions;
+   std::vector<std::vector<T>> fPaddedInput;
+
+   Session_t &GetSession(unsigned slot)
+   {
+      if (!fSessions[slot]) {
+         if (fWeightsFile.empty())
+            fSessions[slot] = std::make_shared<Session_t>();
+         else
+            fSessions[slot] = std::make_shared<Session_t>(fWeightsFile);
+      }
+      return *fSessions[slot];
+   }
+
+public:
+   SofieRVecFunctorHelper(unsigned int nslots, std::size_t inputSize, std::size_t batchSize = 1,
+                          const std::string &filename = "")
+      : fInputSize(inputSize), fBatchSize(batchSize), fWeightsFile(filename)
+   {
+      if (fInputSize == 0 || fBatchSize == 0)
+         throw std::invalid_argument("SofieRVecFunctor: input size and batch size must be larger than zero");
+      if (nslots < 1) nslots = 1;
+      fSessions.resize(nslots);
+      fPaddedInput.resize(nslots);
+   }
+
+   ROOT::RVec<T> operator()(unsigned slot, const ROOT::RVec<T> &input)
+   {
+      if (input.size() % fInputSize != 0)
+         throw std::runtime_error("SofieRVecFunctor: input size " + std::to_string(input.size()) +
+                                  " is not a multiple of the model input size " + std::to_string(fInputSize));
+
+      auto &session = GetSession(slot);
+      const std::size_t nEntries = input.size() / fInputSize;
+      const std::size_t batchInputSize = fBatchSize * fInputSize;
+
+      ROOT::RVec<T> output;
+      // the generated infer() function does not modify its input, but takes a non-const pointer
+      T *data = const_cast<T *>(input.data());
+
+      std::size_t entry = 0;
+      for (; entry + fBatchSize <= nEntries; entry += fBatchSize) {
+         auto y = session.infer(data + entry * fInputSize);
+         output.insert(output.end(), y.begin(), y.end());
+      }
+
+      const std::size_t nRemaining = nEntries - entry;
+      if (nRemaining > 0) {
+         auto &padded = fPaddedInput[slot];
+         padded.assign(batchInputSize, T(0));
+         std::copy(data + entry * fInputSize, data + nEntries * fInputSize, padded.begin());
+         auto y = session.infer(padded.data());
+         // only keep the outputs of the entries that are not padding
+         const std::size_t outputSize = y.size() / fBatchSize;
+         output.insert(output.end(), y.begin(), y.begin() + nRemaining * outputSize);
+      }
+
+      return output;
+   }
+};
+
 /// SofieFunctor : used to wrap the infer function of the
 /// generated model by SOFIE in a RDF compatible signature.
 /// The number of slots is an optional parameter used to
@@ -66,6 +154,21 @@ auto SofieFunctor(unsigned int nslots = 0, const std::string & weightsFile = "")
    return SofieFunctorHelper<std::make_index_sequence<N>, Session_t, float>(nslots, weightsFile);
 }
 
+/// SofieRVecFunctor : used to wrap the infer function of the generated model by SOFIE,
+/// in a RDF compatible signature taking a single RVec column as input, for example
+/// a column built with `Define("x", "ROOT::RVecF{a, b, c}")` or a collection of objects
+/// with the same features. The RVec holds the `inputSize` input values of one or more
+/// entries of the model, and the returned RVec holds their outputs in the same order.
+/// If the model was generated with a batch size larger than one, pass it as `batchSize`
+/// so that several entries are evaluated per call of the model.
+/// As for SofieFunctor, one Session is created lazily for each of the `nslots` slots.
+template <typename Session_t, typename T = float>
+auto SofieRVecFunctor(unsigned int nslots, std::size_t inputSize, std::size_t batchSize = 1,
+                      const std::string &weightsFile = "") -> SofieRVecFunctorHelper<Session_t, T>
+{
+   return SofieRVecFunctorHelper<Session_t, T>(nslots, inputSize, batchSize, weightsFile);
+}
+
 }//Experimental
 }//TMVA
 
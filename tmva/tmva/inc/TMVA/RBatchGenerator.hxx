@@ -12,6 +12,7 @@
 #include "ROOT/RDF/RDatasetSpec.hxx"
 #include "TMVA/RChunkLoader.hxx"
 #include "TMVA/RBatchLoader.hxx"
+#include "TMVA/RChunkCache.hxx"
 #include "TMVA/Tools.h"
 #include "TRandom3.h"
 #include "TROOT.h"
@@ -44,6 +45,7 @@ private:
 
    std::unique_ptr<TMVA::Experimental::Internal::RChunkLoader<Args...>> fChunkLoader;
    std::unique_ptr<TMVA::Experimental::Internal::RBatchLoader> fBatchLoader;
+   std::unique_ptr<TMVA::Experimental::Internal::RChunkCache> fChunkCache;
 
    std::unique_ptr<std::thread> fLoadingThread;
 
@@ -69,7 +71,8 @@ public:
                    const std::size_t batchSize, const std::vector<std::string> &cols, const std::string &filters = "",
                    const std::vector<std::size_t> &vecSizes = {}, const float vecPadding = 0.0,
                    const float validationSplit = 0.0, const std::size_t maxChunks = 0, const std::size_t numColumns = 0,
-                   bool shuffle = true)
+                   bool shuffle = true, bool cacheChunks = false, const std::string &cacheFile = "",
+                   const std::size_t cacheMaxMemory = 0)
       : fTreeName(treeName),
         fFileNames(fileNames),
         fChunkSize(chunkSize),
@@ -104,6 +107,12 @@ public:
       // Create tensor to load the chunk into
       fChunkTensor =
          std::make_unique<TMVA::Experimental::RTensor<float>>(std::vector<std::size_t>{fChunkSize, fNumColumns});
+
+      // Keep the filtered chunks of the first epoch, so that later epochs don't have to read them again
+      if (cacheChunks || !cacheFile.empty()) {
+         fChunkCache =
+            std::make_unique<TMVA::Experimental::Internal::RChunkCache>(fNumColumns, cacheFile, cacheMaxMemory);
+      }
    }
 
    ~RBatchGenerator() { DeActivate(); }
@@ -178,10 +187,21 @@ public:
          }
 
          // A pair that consists the proccessed, and passed events while loading the chunk
-         std::pair<std::size_t, std::size_t> report = fChunkLoader->LoadChunk(*fChunkTensor, fCurrentRow);
-         fCurrentRow += report.first;
+         std::pair<std::size_t, std::size_t> report;
+
+         if (fChunkCache && fChunkCache->HasChunk(current_chunk)) {
+            // Only the splitting into batches is redone for chunks that were already read in a previous epoch
+            report = fChunkCache->GetReport(current_chunk);
+            auto cachedChunk = fChunkCache->GetChunk(current_chunk);
+            CreateBatches(cachedChunk, current_chunk, report.second);
+         } else {
+            report = fChunkLoader->LoadChunk(*fChunkTensor, fCurrentRow);
+            if (fChunkCache)
+               fChunkCache->StoreChunk(current_chunk, *fChunkTensor, report);
+            CreateBatches(*fChunkTensor, current_chunk, report.second);
+         }
 
-         CreateBatches(current_chunk, report.second);
+         fCurrentRow += report.first;
 
          // Stop loading if the number of processed events is smaller than the desired chunk size
          if (report.first < fChunkSize) {
@@ -193,19 +213,21 @@ public:
    }
 
    /// \brief Create batches for the current_chunk.
+   /// \param chunkTensor
    /// \param currentChunk
    /// \param processedEvents
-   void CreateBatches(std::size_t currentChunk, std::size_t processedEvents)
+   void CreateBatches(const TMVA::Experimental::RTensor<float> &chunkTensor, std::size_t currentChunk,
+                      std::size_t processedEvents)
    {
 
       // Check if the indices in this chunk where already split in train and validations
       if (fTrainingIdxs.size() > currentChunk) {
-         fBatchLoader->CreateTrainingBatches(*fChunkTensor, fTrainingIdxs[currentChunk], fShuffle);
+         fBatchLoader->CreateTrainingBatches(chunkTensor, fTrainingIdxs[currentChunk], fShuffle);
       } else {
          // Create the Validation batches if this is not the first epoch
          createIdxs(processedEvents);
-         fBatchLoader->CreateTrainingBatches(*fChunkTensor, fTrainingIdxs[currentChunk], fShuffle);
-         fBatchLoader->CreateValidationBatches(*fChunkTensor, fValidationIdxs[currentChunk]);
+         fBatchLoader->CreateTrainingBatches(chunkTensor, fTrainingIdxs[currentChunk], fShuffle);
+         fBatchLoader->CreateValidationBatches(chunkTensor, fValidationIdxs[currentChunk]);
       }
    }
 
@@ -234,6 +256,17 @@ public:
 
    void StartValidation() { fBatchLoader->StartValidation(); }
    bool IsActive() { return fIsActive; }
+
+   /// \brief Total time in seconds spent in GetTrainBatch waiting for the loading thread
+   double GetConsumerWaitTime() { return fBatchLoader->GetConsumerWaitTime(); }
+   /// \brief Number of calls to GetTrainBatch that had to wait for the loading thread
+   std::size_t GetNumConsumerWaits() { return fBatchLoader->GetNumConsumerWaits(); }
+   void ResetConsumerWaitTime() { fBatchLoader->ResetConsumerWaitTime(); }
+
+   /// \brief Number of bytes of filtered rows kept in memory by the chunk cache
+   std::size_t GetCacheMemoryUsage() { return fChunkCache ? fChunkCache->GetMemoryUsage() : 0; }
+   /// \brief Number of chunks that are read from the chunk cache instead of the files
+   std::size_t GetNumCachedChunks() { return fChunkCache ? fChunkCache->GetNumChunks() : 0; }
 };
 
 } // namespace Internal
@@ -4,6 +4,7 @@
 #include <iostream>
 #include <vector>
 #include <memory>
+#include <chrono>
 
 // Imports for threading
 #include <queue>
@@ -12,6 +13,8 @@
 
 #include "TMVA/RTensor.hxx"
 #include "TMVA/Tools.h"
+#include "TMVA/Config.h"
+#include "ROOT/TSeq.hxx"
 #include "TRandom3.h"
 
 namespace TMVA {
@@ -36,6 +39,14 @@ private:
 
    std::size_t fValidationIdx = 0;
 
+   // Pool of batch tensors that were handed out to the consumer and can be refilled
+   std::mutex fPoolLock;
+   std::vector<std::unique_ptr<TMVA::Experimental::RTensor<float>>> fBatchPool;
+
+   // Time the consumer spent waiting in GetTrainBatch for a batch to be published
+   std::chrono::steady_clock::duration fConsumerWaitTime{0};
+   std::size_t fNumConsumerWaits = 0;
+
    TMVA::Experimental::RTensor<float> fEmptyTensor = TMVA::Experimental::RTensor<float>({0});
 
 public:
@@ -52,8 +63,16 @@ public:
    /// \return Training batch
    const TMVA::Experimental::RTensor<float> &GetTrainBatch()
    {
+      // The previous batch is not used anymore by the consumer, so its memory can be reused
+      ReleaseBatch(std::move(fCurrentBatch));
+
       std::unique_lock<std::mutex> lock(fBatchLock);
-      fBatchCondition.wait(lock, [this]() { return !fTrainingBatchQueue.empty() || !fIsActive; });
+      if (fTrainingBatchQueue.empty() && fIsActive) {
+         auto start = std::chrono::steady_clock::now();
+         fBatchCondition.wait(lock, [this]() { return !fTrainingBatchQueue.empty() || !fIsActive; });
+         fConsumerWaitTime += std::chrono::steady_clock::now() - start;
+         fNumConsumerWaits++;
+      }
 
       if (fTrainingBatchQueue.empty()) {
          fCurrentBatch = std::make_unique<TMVA::Experimental::RTensor<float>>(std::vector<std::size_t>({0}));
@@ -123,20 +142,85 @@ public:
       fBatchCondition.notify_all();
    }
 
+   /// \brief Total time in seconds the consumer spent waiting for a training batch
+   /// \return
+   double GetConsumerWaitTime()
+   {
+      std::lock_guard<std::mutex> lock(fBatchLock);
+      return std::chrono::duration<double>(fConsumerWaitTime).count();
+   }
+
+   /// \brief Number of calls to GetTrainBatch that had to wait for a batch to be published
+   /// \return
+   std::size_t GetNumConsumerWaits()
+   {
+      std::lock_guard<std::mutex> lock(fBatchLock);
+      return fNumConsumerWaits;
+   }
+
+   /// \brief Reset the consumer wait time metrics
+   void ResetConsumerWaitTime()
+   {
+      std::lock_guard<std::mutex> lock(fBatchLock);
+      fConsumerWaitTime = std::chrono::steady_clock::duration{0};
+      fNumConsumerWaits = 0;
+   }
+
+   /// \brief Take a batch tensor from the pool, or allocate a new one if the pool is empty
+   /// \return
+   std::unique_ptr<TMVA::Experimental::RTensor<float>> AcquireBatch()
+   {
+      {
+         std::lock_guard<std::mutex> lock(fPoolLock);
+         if (!fBatchPool.empty()) {
+            auto batch = std::move(fBatchPool.back());
+            fBatchPool.pop_back();
+            return batch;
+         }
+      }
+
+      return std::make_unique<TMVA::Experimental::RTensor<float>>(std::vector<std::size_t>({fBatchSize, fNumColumns}));
+   }
+
+   /// \brief Give a batch tensor back to the pool so it can be refilled
+   /// Tensors that do not have the shape of a batch (e.g. the empty end-of-data tensor) are dropped.
+   /// \param batch
+   void ReleaseBatch(std::unique_ptr<TMVA::Experimental::RTensor<float>> batch)
+   {
+      if (!batch || batch->GetSize() != fBatchSize * fNumColumns)
+         return;
+
+      std::lock_guard<std::mutex> lock(fPoolLock);
+      fBatchPool.emplace_back(std::move(batch));
+   }
+
+   /// \brief Fill the given batch with the events on the given idx
+   /// \param batch
+   /// \param chunkTensor
+   /// \param idx first index of the batch
+   /// \param idxEnd
+   void FillBatch(TMVA::Experimental::RTensor<float> &batch, const TMVA::Experimental::RTensor<float> &chunkTensor,
+                  const std::size_t *idx, const std::size_t *idxEnd)
+   {
+      float *out = batch.GetData();
+      const float *in = chunkTensor.GetData();
+
+      for (; idx != idxEnd; ++idx, out += fNumColumns) {
+         std::copy(in + (*idx * fNumColumns), in + ((*idx + 1) * fNumColumns), out);
+      }
+   }
+
    /// \brief Create a batch filled with the events on the given idx
    /// \param chunkTensor
    /// \param idx
    /// \return
    std::unique_ptr<TMVA::Experimental::RTensor<float>>
-   CreateBatch(const TMVA::Experimental::RTensor<float> &chunkTensor, const std::vector<std::size_t> idx)
+   CreateBatch(const TMVA::Experimental::RTensor<float> &chunkTensor, const std::vector<std::size_t> &idx)
    {
       auto batch =
          std::make_unique<TMVA::Experimental::RTensor<float>>(std::vector<std::size_t>({fBatchSize, fNumColumns}));
 
-      for (std::size_t i = 0; i < fBatchSize; i++) {
-         std::copy(chunkTensor.GetData() + (idx[i] * fNumColumns), chunkTensor.GetData() + ((idx[i] + 1) * fNumColumns),
-                   batch->GetData() + i * fNumColumns);
-      }
+      FillBatch(*batch, chunkTensor, idx.data(), idx.data() + fBatchSize);
 
       return batch;
    }
@@ -162,29 +246,37 @@ public:
       if (shuffle)
          std::shuffle(eventIndices.begin(), eventIndices.end(), fRng); // Shuffle the order of idx
 
-      std::vector<std::unique_ptr<TMVA::Experimental::RTensor<float>>> batches;
+      const std::size_t numBatches = eventIndices.size() / fBatchSize;
+      if (numBatches == 0)
+         return;
 
-      // Create tasks of fBatchSize untill all idx are used
-      for (std::size_t start = 0; (start + fBatchSize) <= eventIndices.size(); start += fBatchSize) {
-
-         // Grab the first fBatchSize indices from the
-         std::vector<std::size_t> idx;
-         for (std::size_t i = start; i < (start + fBatchSize); i++) {
-            idx.push_back(eventIndices[i]);
-         }
+      // Batches are filled in parallel outside of fBatchLock, so the consumer is never blocked by the copies.
+      // Each batch is published as soon as all the batches before it are filled, which keeps the order of
+      // the batches independent of the number of threads.
+      std::vector<std::unique_ptr<TMVA::Experimental::RTensor<float>>> batches(numBatches);
+      std::vector<char> isFilled(numBatches, 0);
+      std::size_t nextToPublish = 0;
 
-         // Fill a batch
-         batches.emplace_back(CreateBatch(chunkTensor, idx));
-      }
+      auto fillAndPublish = [&](std::size_t i) {
+         auto batch = AcquireBatch();
+         const std::size_t *idx = eventIndices.data() + i * fBatchSize;
+         FillBatch(*batch, chunkTensor, idx, idx + fBatchSize);
 
-      {
-         std::unique_lock<std::mutex> lock(fBatchLock);
-         for (std::size_t i = 0; i < batches.size(); i++) {
-            fTrainingBatchQueue.push(std::move(batches[i]));
+         std::size_t published = 0;
+         {
+            std::lock_guard<std::mutex> lock(fBatchLock);
+            batches[i] = std::move(batch);
+            isFilled[i] = 1;
+            for (; nextToPublish < numBatches && isFilled[nextToPublish]; nextToPublish++, published++) {
+               fTrainingBatchQueue.push(std::move(batches[nextToPublish]));
+            }
          }
-      }
 
-      fBatchCondition.notify_one();
+         if (published > 0)
+            fBatchCondition.notify_all();
+      };
+
+      TMVA::Config::Instance().GetThreadExecutor().Foreach(fillAndPublish, ROOT::TSeqU(numBatches));
    }
 
    /// \brief Create validation batches from the given chunk based on the given event indices
@@ -197,15 +289,13 @@ public:
       // Create tasks of fBatchSize untill all idx are used
       for (std::size_t start = 0; (start + fBatchSize) <= eventIndices.size(); start += fBatchSize) {
 
-         std::vector<std::size_t> idx;
-
-         for (std::size_t i = start; i < (start + fBatchSize); i++) {
-            idx.push_back(eventIndices[i]);
-         }
+         auto batch =
+            std::make_unique<TMVA::Experimental::RTensor<float>>(std::vector<std::size_t>({fBatchSize, fNumColumns}));
+         FillBatch(*batch, chunkTensor, eventIndices.data() + start, eventIndices.data() + start + fBatchSize);
 
          {
             std::unique_lock<std::mutex> lock(fBatchLock);
-            fValidationBatches.emplace_back(CreateBatch(chunkTensor, idx));
+            fValidationBatches.emplace_back(std::move(batch));
          }
       }
    }
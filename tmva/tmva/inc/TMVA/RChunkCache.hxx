@@ -0,0 +1,192 @@
+#ifndef TMVA_RCHUNKCACHE
+#define TMVA_RCHUNKCACHE
+
+#include <cstdio>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#ifndef _WIN32
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <unistd.h>
+#endif
+
+#include "TMVA/RTensor.hxx"
+
+namespace TMVA {
+namespace Experimental {
+namespace Internal {
+
+/// Cache of the chunks loaded by the RChunkLoader, so that the event loop, decompression and filtering only
+/// have to run in the first epoch. Only the rows that passed the filters are stored, either in memory or in
+/// a local file that is memory-mapped for reading. The memory used by the in-memory storage can be limited:
+/// once a chunk does not fit anymore, it and all the chunks after it are not cached and are read again in
+/// every epoch.
+class RChunkCache {
+private:
+   struct RCachedChunk {
+      std::size_t fOffset;  ///< Offset of the first value of the chunk in the storage (in number of floats)
+      std::size_t fNumRows; ///< Number of rows that passed the filters
+      std::pair<std::size_t, std::size_t> fReport; ///< Processed and passed events reported by the RChunkLoader
+   };
+
+   std::size_t fNumColumns;
+   std::string fFileName;
+   std::size_t fMaxMemory;      ///< Maximum number of bytes of the in-memory storage, no limit if 0
+   std::size_t fMemoryUsage = 0; ///< Number of bytes used by the in-memory storage
+   bool fIsFull = false;         ///< Whether a chunk did not fit in the in-memory storage
+
+   std::vector<RCachedChunk> fChunks;
+
+   // In-memory storage
+   std::vector<std::vector<float>> fMemoryChunks;
+
+   // File storage
+   std::FILE *fFile = nullptr;
+   std::size_t fFileSize = 0; ///< Number of floats written to the file
+   float *fMapping = nullptr;
+   std::size_t fMappedSize = 0; ///< Number of floats currently mapped
+
+   void Unmap()
+   {
+#ifndef _WIN32
+      if (fMapping)
+         munmap(fMapping, fMappedSize * sizeof(float));
+#endif
+      fMapping = nullptr;
+      fMappedSize = 0;
+   }
+
+   /// \brief Map the file again if chunks were appended since the last mapping
+   void Map()
+   {
+#ifndef _WIN32
+      if (fMappedSize == fFileSize)
+         return;
+
+      Unmap();
+      std::fflush(fFile);
+
+      void *mapping = mmap(nullptr, fFileSize * sizeof(float), PROT_READ, MAP_SHARED, fileno(fFile), 0);
+      if (mapping == MAP_FAILED)
+         throw std::runtime_error("RChunkCache: could not memory-map the cache file " + fFileName);
+
+      fMapping = static_cast<float *>(mapping);
+      fMappedSize = fFileSize;
+#endif
+   }
+
+public:
+   /// \brief Constructor of the RChunkCache
+   /// \param numColumns number of floats per row
+   /// \param fileName local file to store the chunks in. The chunks are kept in memory if empty.
+   /// \param maxMemory maximum number of bytes kept in memory. No limit if 0. Not used for file storage.
+   RChunkCache(const std::size_t numColumns, const std::string &fileName = "", const std::size_t maxMemory = 0)
+      : fNumColumns(numColumns), fFileName(fileName), fMaxMemory(maxMemory)
+   {
+      if (fFileName.empty())
+         return;
+
+#ifdef _WIN32
+      throw std::runtime_error("RChunkCache: file-backed chunk caching is not supported on Windows");
+#else
+      fFile = std::fopen(fFileName.c_str(), "w+b");
+      if (!fFile)
+         throw std::runtime_error("RChunkCache: could not open the cache file " + fFileName);
+#endif
+   }
+
+   RChunkCache(const RChunkCache &) = delete;
+   RChunkCache &operator=(const RChunkCache &) = delete;
+
+   ~RChunkCache()
+   {
+      Unmap();
+      if (fFile) {
+         std::fclose(fFile);
+         std::remove(fFileName.c_str());
+      }
+   }
+
+   /// \brief Checks if the chunk with the given index was already stored
+   /// \param chunkIdx
+   /// \return
+   bool HasChunk(const std::size_t chunkIdx) const { return chunkIdx < fChunks.size(); }
+
+   /// \brief Store the filtered rows of a chunk. Chunks have to be stored in order.
+   /// The chunk is not stored if it does not fit in the memory limit, nor is any chunk after it.
+   /// \param chunkIdx
+   /// \param chunkTensor
+   /// \param report pair of processed and passed events returned by RChunkLoader::LoadChunk
+   void StoreChunk(const std::size_t chunkIdx, const TMVA::Experimental::RTensor<float> &chunkTensor,
+                   const std::pair<std::size_t, std::size_t> &report)
+   {
+      if (fIsFull)
+         return;
+
+      if (chunkIdx != fChunks.size())
+         throw std::runtime_error("RChunkCache: chunks have to be stored in order");
+
+      const std::size_t numValues = report.second * fNumColumns;
+      const float *data = chunkTensor.GetData();
+
+      if (fFile) {
+         if (std::fwrite(data, sizeof(float), numValues, fFile) != numValues)
+            throw std::runtime_error("RChunkCache: could not write to the cache file " + fFileName);
+         fChunks.push_back({fFileSize, report.second, report});
+         fFileSize += numValues;
+      } else {
+         const std::size_t numBytes = numValues * sizeof(float);
+         if (fMaxMemory > 0 && fMemoryUsage + numBytes > fMaxMemory) {
+            fIsFull = true;
+            return;
+         }
+         fChunks.push_back({0, report.second, report});
+         fMemoryChunks.emplace_back(data, data + numValues);
+         fMemoryUsage += numBytes;
+      }
+   }
+
+   /// \brief Return a tensor viewing the cached rows of the given chunk, without copying them
+   /// The view is valid until the next call to StoreChunk or the destruction of the cache.
+   /// \param chunkIdx
+   /// \return
+   TMVA::Experimental::RTensor<float> GetChunk(const std::size_t chunkIdx)
+   {
+      const auto &chunk = fChunks.at(chunkIdx);
+      const std::size_t numRows = chunk.fNumRows;
+
+      float *data = nullptr;
+      if (fFile) {
+         Map();
+         data = fMapping + chunk.fOffset;
+      } else {
+         data = fMemoryChunks[chunkIdx].data();
+      }
+
+      return TMVA::Experimental::RTensor<float>(data, {numRows, fNumColumns});
+   }
+
+   /// \brief Return the report of the RChunkLoader for the given chunk
+   /// \param chunkIdx
+   /// \return A pair of size_t defining the number of events processed and how many passed all filters
+   std::pair<std::size_t, std::size_t> GetReport(const std::size_t chunkIdx) const
+   {
+      return fChunks.at(chunkIdx).fReport;
+   }
+
+   /// \brief Number of bytes used by the in-memory storage
+   std::size_t GetMemoryUsage() const { return fMemoryUsage; }
+
+   /// \brief Number of chunks that are cached
+   std::size_t GetNumChunks() const { return fChunks.size(); }
+};
+
+} // namespace Internal
+} // namespace Experimental
+} // namespace TMVA
+
+#endif // TMVA_RCHUNKCACHE
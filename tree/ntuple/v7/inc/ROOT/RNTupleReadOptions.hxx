@@ -47,6 +47,9 @@ private:
    /// If true, the RNTupleReader will track metrics straight from its construction, as
    /// if calling `RNTupleReader::EnableMetrics()` before having created the object.
    bool fEnableMetrics = false;
+   /// If larger than zero, the vector reads of the pages of a cluster bunch from a local file keep up to that many
+   /// read requests in flight, submitted through io_uring or a pool of reader threads
+   unsigned int fAsyncReadDepth = 0;
 
 public:
    EClusterCache GetClusterCache() const { return fClusterCache; }
@@ -60,6 +63,9 @@ public:
 
    bool HasMetricsEnabled() const { return fEnableMetrics; }
    void SetMetricsEnabled(bool enable) { fEnableMetrics = enable; }
+
+   unsigned int GetAsyncReadDepth() const { return fAsyncReadDepth; }
+   void SetAsyncReadDepth(unsigned int val) { fAsyncReadDepth = val; }
 };
 
 } // namespace Experimental
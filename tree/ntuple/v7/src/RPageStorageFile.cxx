@@ -268,6 +268,17 @@ void ROOT::Experimental::Internal::RPageSinkFile::ReleasePage(RPage &page)
 
 ////////////////////////////////////////////////////////////////////////////////
 
+namespace {
+
+ROOT::Internal::RRawFile::ROptions MakeRawFileOptions(const ROOT::Experimental::RNTupleReadOptions &options)
+{
+   ROOT::Internal::RRawFile::ROptions rawFileOptions;
+   rawFileOptions.fAsyncReadDepth = options.GetAsyncReadDepth();
+   return rawFileOptions;
+}
+
+} // anonymous namespace
+
 ROOT::Experimental::Internal::RPageSourceFile::RPageSourceFile(std::string_view ntupleName,
                                                                const RNTupleReadOptions &options)
    : RPageSource(ntupleName, options),
@@ -288,7 +299,7 @@ ROOT::Experimental::Internal::RPageSourceFile::RPageSourceFile(std::string_view
 
 ROOT::Experimental::Internal::RPageSourceFile::RPageSourceFile(std::string_view ntupleName, std::string_view path,
                                                                const RNTupleReadOptions &options)
-   : RPageSourceFile(ntupleName, ROOT::Internal::RRawFile::Create(path), options)
+   : RPageSourceFile(ntupleName, ROOT::Internal::RRawFile::Create(path, MakeRawFileOptions(options)), options)
 {
 }
 
@@ -307,9 +318,9 @@ ROOT::Experimental::Internal::RPageSourceFile::CreateFromAnchor(const RNTuple &a
    auto url = anchor.fFile->GetEndpointUrl();
    auto protocol = std::string(url->GetProtocol());
    if (className == "TFile") {
-      rawFile = ROOT::Internal::RRawFile::Create(url->GetFile());
+      rawFile = ROOT::Internal::RRawFile::Create(url->GetFile(), MakeRawFileOptions(options));
    } else if (className == "TDavixFile" || className == "TNetXNGFile") {
-      rawFile = ROOT::Internal::RRawFile::Create(url->GetUrl());
+      rawFile = ROOT::Internal::RRawFile::Create(url->GetUrl(), MakeRawFileOptions(options));
    } else {
       rawFile.reset(new ROOT::Internal::RRawFileTFile(anchor.fFile));
    }
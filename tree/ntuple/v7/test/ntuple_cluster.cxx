@@ -367,6 +367,41 @@ TEST(PageStorageFile, LoadClusters)
    EXPECT_EQ(1U, clusters[1]->GetNOnDiskPages());
 }
 
+#ifndef _WIN32
+TEST(PageStorageFile, LoadClustersAsync)
+{
+   FileRaii fileGuard("test_pagestoragefile_loadclustersasync.root");
+
+   {
+      auto model = ROOT::Experimental::RNTupleModel::Create();
+      auto wrPt = model->MakeField<float>("pt", 0.0);
+      auto wrTag = model->MakeField<std::int32_t>("tag", 0);
+
+      auto writer = ROOT::Experimental::RNTupleWriter::Recreate(std::move(model), "myNTuple", fileGuard.GetPath());
+      for (int i = 0; i < 100; ++i) {
+         *wrPt = i;
+         *wrTag = -i;
+         writer->Fill();
+         if (i % 10 == 9)
+            writer->CommitCluster();
+      }
+   }
+
+   ROOT::Experimental::RNTupleReadOptions options;
+   options.SetAsyncReadDepth(8);
+   options.SetClusterBunchSize(3);
+   EXPECT_EQ(8U, options.GetAsyncReadDepth());
+   auto reader = ROOT::Experimental::RNTupleReader::Open("myNTuple", fileGuard.GetPath(), options);
+   auto ptView = reader->GetView<float>("pt");
+   auto tagView = reader->GetView<std::int32_t>("tag");
+   EXPECT_EQ(100U, reader->GetNEntries());
+   for (auto i : reader->GetEntryRange()) {
+      EXPECT_FLOAT_EQ(static_cast<float>(i), ptView(i));
+      EXPECT_EQ(-static_cast<std::int32_t>(i), tagView(i));
+   }
+}
+#endif
+
 #ifdef R__USE_IMT
 TEST(PageStorageFile, LoadClustersIMT)
 {
@@ -28,6 +28,8 @@ struct Data {
    std::vector<std::string> fBranchNames;
    /// If the branch names should use regex matching.
    bool fUseRegex = false;
+   /// If larger than zero, read the baskets through a TTreeCache that keeps this many basket reads in flight.
+   unsigned int fAsyncReadDepth = 0;
 };
 
 struct Result {
@@ -45,6 +47,14 @@ struct Result {
    ULong64_t fCompressedBytesRead;
    /// Size of ROOT's thread pool for the run (0 indicates a single-thread run with no thread pool present).
    unsigned int fThreadPoolSize;
+   /// Number of basket reads served with several reads in flight (0 unless Data::fAsyncReadDepth is set).
+   ULong64_t fAsyncReadRequests = 0;
+   /// Number of reads in flight seen on average by each of these basket reads.
+   double fAsyncMeanQueueDepth = 0.;
+   /// Largest number of basket reads in flight at the same time.
+   ULong64_t fAsyncMaxQueueDepth = 0;
+   /// Throughput of these basket reads in bytes per second, while they were ongoing.
+   double fAsyncThroughput = 0.;
 };
 
 struct EntryRange {
@@ -68,8 +78,9 @@ std::vector<std::string> GetMatchingBranchNames(const std::string &fileName, con
                                                 const std::vector<ReadSpeedRegex> &regexes);
 
 // Read branches listed in branchNames in tree treeName in file fileName, return number of uncompressed bytes read.
+// If asyncReadDepth is larger than zero, the baskets are read through a TTreeCache keeping that many reads in flight.
 ByteData ReadTree(TFile *file, const std::string &treeName, const std::vector<std::string> &branchNames,
-                  EntryRange range = {-1, -1});
+                  EntryRange range = {-1, -1}, unsigned int asyncReadDepth = 0);
 
 Result EvalThroughputST(const Data &d);
 
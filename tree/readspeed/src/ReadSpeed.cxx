@@ -19,9 +19,13 @@
 #endif
 
 #include <ROOT/InternalTreeUtils.hxx> // for ROOT::Internal::TreeUtils::GetTopLevelBranchNames
+#ifndef _WIN32
+#include <ROOT/RAsyncReadEngine.hxx>
+#endif
 #include <TBranch.h>
 #include <TStopwatch.h>
 #include <TTree.h>
+#include <TTreeCache.h>
 
 #include <algorithm>
 #include <cassert>
@@ -128,7 +132,7 @@ ByteData SumBytes(const std::vector<ByteData> &bytesData) {
 
 // Read branches listed in branchNames in tree treeName in file fileName, return number of uncompressed bytes read.
 ByteData ReadSpeed::ReadTree(TFile *f, const std::string &treeName, const std::vector<std::string> &branchNames,
-                             EntryRange range)
+                             EntryRange range, unsigned int asyncReadDepth)
 {
    std::unique_ptr<TTree> t(f->Get<TTree>(treeName.c_str()));
    if (t == nullptr)
@@ -155,11 +159,26 @@ ByteData ReadSpeed::ReadTree(TFile *f, const std::string &treeName, const std::v
                                t->GetName() + "' in file '" + t->GetCurrentFile()->GetName() + "' with " +
                                std::to_string(nEntries) + " entries.");
 
+   if (asyncReadDepth > 0) {
+      // The TTreeCache reads the baskets of each cluster with a vector read, served with several reads in flight
+      t->SetCacheSize();
+      t->SetCacheEntryRange(range.fStart, range.fEnd);
+      for (auto *b : branches)
+         t->AddBranchToCache(b, /*subbranches=*/true);
+      t->StopCacheLearningPhase();
+      if (auto *cache = t->GetReadCache(f))
+         cache->SetAsyncReadDepth(asyncReadDepth);
+   }
+
    ULong64_t bytesRead = 0;
    const ULong64_t fileStartBytes = f->GetBytesRead();
-   for (auto e = range.fStart; e < range.fEnd; ++e)
+   for (auto e = range.fStart; e < range.fEnd; ++e) {
+      // The TTreeCache fills its buffer with the cluster of the entry loaded in the tree
+      if (asyncReadDepth > 0)
+         t->LoadTree(e);
       for (auto *b : branches)
          bytesRead += b->GetEntry(e);
+   }
 
    const ULong64_t fileBytesRead = f->GetBytesRead() - fileStartBytes;
    return {bytesRead, fileBytesRead};
@@ -182,7 +201,8 @@ Result ReadSpeed::EvalThroughputST(const Data &d)
 
       sw.Start(false);
 
-      const auto byteData = ReadTree(f.get(), d.fTreeNames[treeIdx], fileBranchNames[fileIdx]);
+      const auto byteData =
+         ReadTree(f.get(), d.fTreeNames[treeIdx], fileBranchNames[fileIdx], {-1, -1}, d.fAsyncReadDepth);
       uncompressedBytesRead += byteData.fUncompressedBytesRead;
       compressedBytesRead += byteData.fCompressedBytesRead;
 
@@ -311,7 +331,7 @@ Result ReadSpeed::EvalThroughputMT(const Data &d, unsigned nThreads)
          if (file == nullptr || file->IsZombie())
             throw std::runtime_error("Could not open file '" + fileName + '\'');
 
-         auto result = ReadTree(file.get(), treeName, branchNames, range);
+         auto result = ReadTree(file.get(), treeName, branchNames, range, d.fAsyncReadDepth);
 
          return result;
       };
@@ -359,14 +379,29 @@ Result ReadSpeed::EvalThroughput(const Data &d, unsigned nThreads)
       std::terminate();
    }
 
+#ifndef _WIN32
+   ROOT::Internal::RAsyncReadEngine::ResetStats();
+#endif
+
 #ifdef R__USE_IMT
-   return nThreads > 0 ? EvalThroughputMT(d, nThreads) : EvalThroughputST(d);
+   auto result = nThreads > 0 ? EvalThroughputMT(d, nThreads) : EvalThroughputST(d);
 #else
    if (nThreads > 0) {
       std::cerr << nThreads
                 << " threads were requested, but ROOT was built without implicit multi-threading (IMT) support.\n";
       std::terminate();
    }
-   return EvalThroughputST(d);
+   auto result = EvalThroughputST(d);
+#endif
+
+#ifndef _WIN32
+   if (d.fAsyncReadDepth > 0) {
+      const auto stats = ROOT::Internal::RAsyncReadEngine::GetStats();
+      result.fAsyncReadRequests = stats.fNRequests;
+      result.fAsyncMeanQueueDepth = stats.GetMeanQueueDepth();
+      result.fAsyncMaxQueueDepth = stats.fMaxQueueDepth;
+      result.fAsyncThroughput = stats.GetThroughput();
+   }
 #endif
+   return result;
 }
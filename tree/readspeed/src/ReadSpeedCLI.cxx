@@ -15,6 +15,7 @@
 #endif
 
 #include <iostream>
+#include <cctype>
 #include <cstring>
 
 using namespace ReadSpeed;
@@ -26,6 +27,7 @@ const auto usageText = "Usage:\n"
                        "[bregex2 ...])\n"
                        "               [--threads nthreads]\n"
                        "               [--tasks-per-worker ntasks]\n"
+                       "               [--async-read-depth ndepth]\n"
                        " rootreadspeed (--help|-h)\n"
                        " \n"
                        " Use -h for usage help, --help for detailed information.\n";
@@ -57,7 +59,11 @@ const auto argUsageText =
    "      The number of threads to use for file reading. Will automatically cap to the number of available threads on "
    "the machine.\n"
    "    --tasks-per-worker ntasks\n"
-   "      The number of tasks to generate for each worker thread when using multithreading.";
+   "      The number of tasks to generate for each worker thread when using multithreading.\n"
+   "    --async-read-depth ndepth\n"
+   "      Read the baskets of each cluster through a TTreeCache that keeps up to ndepth basket reads in flight, "
+   "using io_uring where available and a pool of reader threads otherwise. Only supported for local files. The "
+   "achieved queue depth and throughput of these reads are reported.";
 
 const auto fullUsageText =
    "Description:\n"
@@ -150,6 +156,13 @@ void ReadSpeed::PrintThroughput(const Result &r)
    std::cout << "\t\t\t\t" << r.fCompressedBytesRead / r.fRealTime / 1024 / 1024 / effectiveThreads
              << " MB/s/thread for " << effectiveThreads << " threads\n\n";
 
+   if (r.fAsyncReadRequests > 0) {
+      std::cout << "Asynchronous basket reads:\t" << r.fAsyncReadRequests << '\n';
+      std::cout << "Mean queue depth:\t\t" << r.fAsyncMeanQueueDepth << '\n';
+      std::cout << "Max queue depth:\t\t" << r.fAsyncMaxQueueDepth << '\n';
+      std::cout << "Asynchronous read throughput:\t" << r.fAsyncThroughput / 1024 / 1024 << " MB/s\n\n";
+   }
+
    const float cpuEfficiency = (r.fCpuTime / effectiveThreads) / r.fRealTime;
 
    std::cout << "CPU Efficiency: \t\t" << (cpuEfficiency * 100) << "%\n";
@@ -185,10 +198,19 @@ Args ReadSpeed::ParseArgs(const std::vector<std::string> &args)
    Data d;
    unsigned int nThreads = 0;
 
-   enum class EArgState { kNone, kTrees, kFiles, kBranches, kThreads, kTasksPerWorkerHint } argState = EArgState::kNone;
+   enum class EArgState {
+      kNone,
+      kTrees,
+      kFiles,
+      kBranches,
+      kThreads,
+      kTasksPerWorkerHint,
+      kAsyncReadDepth
+   } argState = EArgState::kNone;
    enum class EBranchState { kNone, kRegular, kRegex, kAll } branchState = EBranchState::kNone;
    const auto branchOptionsErrMsg =
       "Options --all-branches, --branches, and --branches-regex are mutually exclusive. You can use only one.\n";
+   const auto asyncReadDepthErrMsg = "Option --async-read-depth requires a non-negative integer.\n";
 
    for (size_t i = 1; i < args.size(); ++i) {
       const auto &arg = args[i];
@@ -225,6 +247,11 @@ Args ReadSpeed::ParseArgs(const std::vector<std::string> &args)
          argState = EArgState::kThreads;
       } else if (arg == "--tasks-per-worker") {
          argState = EArgState::kTasksPerWorkerHint;
+      } else if (arg == "--async-read-depth") {
+         argState = EArgState::kAsyncReadDepth;
+      } else if (argState == EArgState::kAsyncReadDepth && arg.size() > 1 && arg[0] == '-' && std::isdigit(arg[1])) {
+         std::cerr << asyncReadDepthErrMsg;
+         return {};
       } else if (arg[0] == '-') {
          std::cerr << "Unrecognized option '" << arg << "'\n";
          return {};
@@ -246,6 +273,16 @@ Args ReadSpeed::ParseArgs(const std::vector<std::string> &args)
                          "will be ignored.\n";
 #endif
             break;
+         case EArgState::kAsyncReadDepth: {
+            const auto depth = std::stoi(arg);
+            if (depth < 0) {
+               std::cerr << asyncReadDepthErrMsg;
+               return {};
+            }
+            d.fAsyncReadDepth = depth;
+            argState = EArgState::kNone;
+            break;
+         }
          default: std::cerr << "Unrecognized option '" << arg << "'\n"; return {};
          }
       }
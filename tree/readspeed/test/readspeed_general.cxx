@@ -138,6 +138,21 @@ TEST_F(ReadSpeedIntegration, AllBranches)
    EXPECT_EQ(result.fCompressedBytesRead, 1316837) << "Wrong number of compressed bytes read";
 }
 
+#ifndef _WIN32
+TEST_F(ReadSpeedIntegration, AsyncReadDepth)
+{
+   Data d{{"t"}, {"readspeedinput1.root", "readspeedinput2.root"}, {"x"}};
+   d.fAsyncReadDepth = 8;
+   const auto result = EvalThroughput(d, 0);
+
+   EXPECT_EQ(result.fUncompressedBytesRead, 80000000) << "Wrong number of uncompressed bytes read";
+   EXPECT_GT(result.fAsyncReadRequests, 0u) << "No basket was read asynchronously";
+   EXPECT_GE(result.fAsyncMeanQueueDepth, 1.) << "Wrong mean queue depth";
+   EXPECT_LE(result.fAsyncMaxQueueDepth, 8u) << "More basket reads in flight than requested";
+   EXPECT_GT(result.fAsyncThroughput, 0.) << "Wrong asynchronous read throughput";
+}
+#endif
+
 TEST(ReadSpeedCLI, CheckFilenames)
 {
    const std::vector<std::string> baseArgs{"root-readspeed", "--trees", "t", "--branches", "x", "--files"};
@@ -266,6 +281,29 @@ TEST(ReadSpeedCLI, MultipleThreads)
    EXPECT_EQ(parsedArgs.fNThreads, threads) << "Program not using the correct amount of threads";
 }
 
+TEST(ReadSpeedCLI, AsyncReadDepth)
+{
+   const std::vector<std::string> allArgs{
+      "root-readspeed", "--files", "doesnotexist.root", "--trees", "t", "--branches", "x", "--async-read-depth", "32",
+   };
+
+   const auto parsedArgs = ParseArgs(allArgs);
+
+   EXPECT_TRUE(parsedArgs.fShouldRun) << "Program not running when given valid arguments";
+   EXPECT_EQ(parsedArgs.fData.fAsyncReadDepth, 32u) << "Program not using the correct asynchronous read depth";
+}
+
+TEST(ReadSpeedCLI, NegativeAsyncReadDepth)
+{
+   const std::vector<std::string> allArgs{
+      "root-readspeed", "--files", "doesnotexist.root", "--trees", "t", "--branches", "x", "--async-read-depth", "-8",
+   };
+
+   const auto parsedArgs = ParseArgs(allArgs);
+
+   EXPECT_TRUE(!parsedArgs.fShouldRun) << "Program running when given a negative asynchronous read depth";
+}
+
 #ifdef R__USE_IMT
 TEST(ReadSpeedCLI, WorkerThreadsHint)
 {